@@ -7,6 +7,7 @@ __all__ = ["AIAgentAdapter"]
 """AI agent-specific adapter for signal extraction."""
 
 from adapters.ai_agent.signal_extractor import AIAgentAdapter
+from adapters.ai_agent.sources import JsonlSource
 
-__all__ = ["AIAgentAdapter"]
+__all__ = ["AIAgentAdapter", "JsonlSource"]
 
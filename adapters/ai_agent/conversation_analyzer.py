@@ -19,97 +19,289 @@ class ConversationAnalyzer:
 
 """Analyzer for conversation logs."""
 
-from typing import Any, Dict, List, Optional
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from core.models.signals import SignalType, StabilitySignal
+from core.models.signals import Fact, SignalType, StabilitySignal
 from core.models.test_results import TestResults
 
+# Conversation fields used for the per-group breakdowns (metadata key -> record field).
+GROUP_FIELDS = {"by_session": "session_id", "by_channel": "channel"}
+DEFAULT_MAX_GROUPS = 1000
+OTHER_GROUP = "(other)"
+
+
+@dataclass(slots=True)
+class LengthMoments:
+    """
+    Online mean/variance of integer response lengths.
+
+    Keeps count, sum and sum of squares as Python ints: one pass, constant memory, and
+    merging slices is exact (the result does not depend on how the data was split).
+    """
+
+    count: int = 0
+    total: int = 0
+    total_sq: int = 0
+
+    def add(self, n: int) -> None:
+        self.count += 1
+        self.total += n
+        self.total_sq += n * n
+
+    def merge_in(self, other: "LengthMoments") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    @property
+    def variance(self) -> float:
+        # Population variance (n*Q - S^2) / n^2, rounded once.
+        n = self.count
+        return (n * self.total_sq - self.total**2) / (n * n)
+
+    def consistency(self) -> float:
+        """1 - coefficient of variation, clamped to [0, 1] (lower variation = higher consistency)."""
+        avg_length = self.mean
+        coefficient_of_variation = self.variance**0.5 / avg_length if avg_length > 0 else 0.0
+        return max(0.0, 1.0 - min(1.0, coefficient_of_variation))
+
+
+@dataclass(slots=True)
+class GroupStats:
+    total: int = 0
+    completed: int = 0
+    lengths: LengthMoments = field(default_factory=LengthMoments)
+
+    def merge_in(self, other: "GroupStats") -> None:
+        self.total += other.total
+        self.completed += other.completed
+        self.lengths.merge_in(other.lengths)
+
+    def to_dict(self) -> Dict[str, Any]:
+        has_lengths = self.lengths.count > 0
+        return {
+            "conversations": self.total,
+            "completion_rate": self.completed / self.total if self.total else 0.0,
+            "responses": self.lengths.count,
+            "avg_response_length": self.lengths.mean if has_lengths else None,
+            "response_consistency": self.lengths.consistency() if has_lengths else None,
+        }
+
+
+@dataclass(slots=True)
+class GroupTable:
+    """
+    GroupStats per key with bounded memory, keeping the most frequent keys (space-saving):
+    at most `max_groups` keys are tracked, each with a weight that over-estimates how many
+    conversations it had. A new key replaces the lightest tracked key, whose stats are
+    folded into OTHER_GROUP, and inherits its weight, so a key with more than
+    1/max_groups of the conversations is always tracked. A tracked key's stats cover the
+    conversations since it was admitted; everything else is in OTHER_GROUP.
+
+    Merging adds weights and stats per key and keeps the `max_groups` heaviest keys.
+    """
+
+    max_groups: int = DEFAULT_MAX_GROUPS
+    groups: Dict[str, GroupStats] = field(default_factory=dict)
+    other: GroupStats = field(default_factory=GroupStats)
+    _weights: Dict[str, int] = field(default_factory=dict)
+    _heap: List[Tuple[int, str]] = field(default_factory=list)  # (weight, key), one per key; may lag _weights
+
+    def observe(self, key: str) -> GroupStats:
+        """Stats to add one conversation under `key` to."""
+        g = self.groups.get(key)
+        if g is not None:
+            self._weights[key] += 1
+            return g
+        if self.max_groups <= 0:
+            return self.other
+        weight = 0
+        if len(self.groups) >= self.max_groups:
+            evicted, weight = self._pop_lightest()
+            self.other.merge_in(self.groups.pop(evicted))
+        return self._track(key, weight + 1, GroupStats())
+
+    def merge_in(self, other: "GroupTable") -> None:
+        for key, g in other.groups.items():
+            mine = self.groups.get(key)
+            if mine is None:
+                mine = self.groups[key] = GroupStats()
+                self._weights[key] = 0
+            mine.merge_in(g)
+            self._weights[key] += other._weights[key]
+        self.other.merge_in(other.other)
+        ranked = sorted(self.groups, key=lambda k: (-self._weights[k], k))
+        for key in ranked[self.max_groups :]:
+            self.other.merge_in(self.groups.pop(key))
+            del self._weights[key]
+        self._heap = [(self._weights[k], k) for k in self.groups]
+        heapq.heapify(self._heap)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Tracked keys, heaviest first, then OTHER_GROUP when anything was folded."""
+        ranked = sorted(self.groups, key=lambda k: (-self._weights[k], k))
+        out = {key: self.groups[key].to_dict() for key in ranked}
+        if self.other.total:
+            out[OTHER_GROUP] = self.other.to_dict()
+        return out
+
+    def _track(self, key: str, weight: int, g: GroupStats) -> GroupStats:
+        self.groups[key] = g
+        self._weights[key] = weight
+        heapq.heappush(self._heap, (weight, key))
+        return g
+
+    def _pop_lightest(self) -> Tuple[str, int]:
+        # Heap entries only lag behind (weights grow): refresh stale ones until the top is current.
+        while True:
+            weight, key = heapq.heappop(self._heap)
+            current = self._weights[key]
+            if current == weight:
+                del self._weights[key]
+                return key, weight
+            heapq.heappush(self._heap, (current, key))
+
+
+@dataclass(slots=True)
+class ConversationStats:
+    """Mergeable partial statistics over a slice of conversations."""
+
+    total: int = 0
+    completed: int = 0
+    all_have_responses: bool = True
+    lengths: LengthMoments = field(default_factory=LengthMoments)
+    max_groups: int = DEFAULT_MAX_GROUPS
+    breakdowns: Dict[str, GroupTable] = field(default_factory=dict)  # GROUP_FIELDS key -> table
+
+    def merge(self, other: "ConversationStats") -> "ConversationStats":
+        merged = ConversationStats(
+            total=self.total + other.total,
+            completed=self.completed + other.completed,
+            all_have_responses=self.all_have_responses and other.all_have_responses,
+            max_groups=self.max_groups,
+        )
+        for part in (self, other):
+            merged.lengths.merge_in(part.lengths)
+            for name, table in part.breakdowns.items():
+                merged.table(name).merge_in(table)
+        return merged
+
+    def table(self, name: str) -> GroupTable:
+        t = self.breakdowns.get(name)
+        if t is None:
+            t = self.breakdowns[name] = GroupTable(max_groups=self.max_groups)
+        return t
+
 
 class ConversationAnalyzer:
-    """Analyzes conversation logs for behavioral patterns."""
+    """Analyzes conversation logs for behavioral patterns.
+
+    One pass over the conversations with constant memory (per-group breakdowns keep the
+    `max_groups` most frequent keys each), so a generator or JsonlSource of any length works.
+    analyze() is accumulate() over one slice followed by finalize(); slices of a large
+    artifact set can be accumulated separately (e.g. in worker processes) and merged.
+    """
+
+    def __init__(self, max_groups: int = DEFAULT_MAX_GROUPS):
+        self.max_groups = max_groups
 
     def analyze(
         self,
         test_results: TestResults,
-        conversations: Optional[List[Dict[str, Any]]] = None,
+        conversations: Optional[Iterable[Dict[str, Any]]] = None,
     ) -> List[StabilitySignal]:
         """Analyze conversation logs and extract stability signals.
 
         Args:
             test_results: Test results (for context)
-            conversations: Optional list of conversation logs
+            conversations: Optional conversation logs (list, iterable or JsonlSource)
 
         Returns:
             List of stability signals (empty if no conversations provided)
         """
-        signals: List[StabilitySignal] = []
+        if conversations is None:
+            return []  # Graceful degradation
+        return self.finalize(self.accumulate(self.new_stats(), conversations))
 
-        if conversations is None or len(conversations) == 0:
+    def new_stats(self) -> ConversationStats:
+        return ConversationStats(max_groups=self.max_groups)
+
+    def accumulate(self, stats: ConversationStats, conversations: Iterable[Dict[str, Any]]) -> ConversationStats:
+        """Add conversations to `stats` in one pass (mutates and returns it)."""
+        for conv in conversations:
+            completed = conv.get("status") == "completed" or bool(conv.get("completed", False))
+            lengths = [len(str(r)) for r in conv["responses"]] if "responses" in conv else None
+
+            stats.total += 1
+            stats.completed += completed
+            if lengths is None:
+                stats.all_have_responses = False
+            else:
+                for n in lengths:
+                    stats.lengths.add(n)
+
+            for name, record_field in GROUP_FIELDS.items():
+                key = conv.get(record_field)
+                if key is None:
+                    continue
+                g = stats.table(name).observe(str(key))
+                g.total += 1
+                g.completed += completed
+                for n in lengths or ():
+                    g.lengths.add(n)
+        return stats
+
+    def finalize(self, stats: ConversationStats) -> List[StabilitySignal]:
+        signals: List[StabilitySignal] = []
+        total = stats.total
+        if total == 0:
             return signals  # Graceful degradation
 
         # Analyze conversation completion rates
-        completed_conversations = sum(
-            1
-            for conv in conversations
-            if conv.get("status") == "completed" or conv.get("completed", False)
-        )
-        completion_rate = (
-            completed_conversations / len(conversations)
-            if conversations
-            else 0.0
-        )
+        completion_rate = stats.completed / total
+        metadata: Dict[str, Any] = {"completion_rate": completion_rate, "total": total}
+        # Per-session / per-channel breakdowns, only when conversations carry those fields.
+        for name, table in stats.breakdowns.items():
+            metadata[name] = table.to_dict()
 
         signals.append(
             StabilitySignal(
                 signal_type=SignalType.STABILITY,
                 name="conversation_completion_rate",
                 value=completion_rate * 100.0,
-                description=f"Conversation completion rate: {completed_conversations}/{len(conversations)}",
+                description=f"Conversation completion rate: {stats.completed}/{total}",
                 evidence=[
-                    f"Completed conversations: {completed_conversations}",
-                    f"Total conversations: {len(conversations)}",
-                    f"Completion rate: {completion_rate:.2%}",
+                    Fact("Completed conversations", stats.completed),
+                    Fact("Total conversations", total),
+                    Fact("Completion rate", completion_rate, ".2%"),
                 ],
-                metadata={"completion_rate": completion_rate, "total": len(conversations)},
+                metadata=metadata,
             )
         )
 
         # Analyze response consistency (if response data available)
-        if all("responses" in conv for conv in conversations):
-            response_lengths = []
-            for conv in conversations:
-                if "responses" in conv:
-                    response_lengths.extend(
-                        len(str(r)) for r in conv["responses"]
-                    )
-
-            if response_lengths:
-                avg_length = sum(response_lengths) / len(response_lengths)
-                variance = (
-                    sum((l - avg_length) ** 2 for l in response_lengths)
-                    / len(response_lengths)
-                )
-                std_dev = variance ** 0.5
-                coefficient_of_variation = (
-                    std_dev / avg_length if avg_length > 0 else 0.0
-                )
+        if stats.all_have_responses and stats.lengths.count:
+            avg_length = stats.lengths.mean
+            consistency = stats.lengths.consistency()
 
-                # Lower variation = higher consistency
-                consistency = max(0.0, 1.0 - min(1.0, coefficient_of_variation))
-
-                signals.append(
-                    StabilitySignal(
-                        signal_type=SignalType.STABILITY,
-                        name="response_consistency",
-                        value=consistency * 100.0,
-                        description="Consistency of response patterns across conversations",
-                        evidence=[
-                            f"Average response length: {avg_length:.1f}",
-                            f"Response consistency: {consistency:.2%}",
-                        ],
-                        metadata={"consistency": consistency, "avg_length": avg_length},
-                    )
+            signals.append(
+                StabilitySignal(
+                    signal_type=SignalType.STABILITY,
+                    name="response_consistency",
+                    value=consistency * 100.0,
+                    description="Consistency of response patterns across conversations",
+                    evidence=[
+                        Fact("Average response length", avg_length, ".1f"),
+                        Fact("Response consistency", consistency, ".2%"),
+                    ],
+                    metadata={"consistency": consistency, "avg_length": avg_length},
                 )
+            )
 
         return signals
-
@@ -19,86 +19,188 @@ class FlowAnalyzer:
 
 """Analyzer for conversation flow patterns."""
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 
-from core.models.signals import RegressionSignal, SignalType, StabilitySignal
+from adapters.ai_agent.flow_paths import DEFAULT_MAX_DEPTH, FlowPathIndex
+from core.models.signals import Fact, RegressionSignal, SignalType, StabilitySignal
 from core.models.test_results import TestResults
 
 
+@dataclass(slots=True)
+class FlowStats:
+    """Mergeable partial statistics over a slice of flows."""
+
+    total: int = 0
+    completed: int = 0
+    all_have_steps: bool = True
+    anomaly_count: int = 0
+    paths: Optional[FlowPathIndex] = None  # only with FlowAnalyzer(index_paths=True)
+
+    def merge(self, other: "FlowStats") -> "FlowStats":
+        merged = FlowStats(
+            total=self.total + other.total,
+            completed=self.completed + other.completed,
+            all_have_steps=self.all_have_steps and other.all_have_steps,
+            anomaly_count=self.anomaly_count + other.anomaly_count,
+        )
+        for part in (self, other):
+            if part.paths is not None:
+                if merged.paths is None:
+                    merged.paths = FlowPathIndex(part.paths.max_depth)
+                merged.paths.merge_in(part.paths)
+        return merged
+
+
 class FlowAnalyzer:
-    """Analyzes conversation flow patterns for behavioral issues."""
+    """Analyzes conversation flow patterns for behavioral issues.
+
+    analyze() is accumulate() over one slice followed by finalize(); slices of a large
+    artifact set can be accumulated separately (e.g. in worker processes) and merged.
+
+    With `index_paths` (implied by `baseline`), step sequences also go into a
+    FlowPathIndex: the flow_completion_rate signal gains a `paths` summary (top failing
+    paths, dead-end steps, loop hotspots) and, against a baseline index, a
+    flow_path_regressions signal is added.
+    """
+
+    def __init__(
+        self,
+        index_paths: bool = False,
+        baseline: Optional[FlowPathIndex] = None,
+        top_k: int = 10,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ):
+        self.index_paths = index_paths or baseline is not None
+        self.baseline = baseline
+        self.top_k = top_k
+        self.max_depth = max_depth
 
     def analyze(
         self,
         test_results: TestResults,
-        flows: Optional[List[Dict[str, Any]]] = None,
+        flows: Optional[Iterable[Dict[str, Any]]] = None,
     ) -> List[StabilitySignal | RegressionSignal]:
         """Analyze flow data and extract signals.
 
         Args:
             test_results: Test results (for context)
-            flows: Optional list of conversation flow records
+            flows: Optional conversation flow records (list, iterable or JsonlSource)
 
         Returns:
             List of signals (empty if no flows provided)
         """
+        if flows is None:
+            return []  # Graceful degradation
+        return self.finalize(self.accumulate(self.new_stats(), flows))
+
+    def new_stats(self) -> FlowStats:
+        return FlowStats(paths=FlowPathIndex(self.max_depth) if self.index_paths else None)
+
+    def accumulate(self, stats: FlowStats, flows: Iterable[Dict[str, Any]]) -> FlowStats:
+        """Add flows to `stats` in one pass (mutates and returns it)."""
+        for flow in flows:
+            stats.total += 1
+            completed = bool(
+                flow.get("status") == "completed"
+                or flow.get("completed", False)
+                or flow.get("reached_end", False)
+            )
+            if completed:
+                stats.completed += 1
+            if "steps" not in flow:
+                stats.all_have_steps = False
+                continue
+            steps = flow.get("steps", [])
+            if stats.paths is not None:
+                stats.paths.add(steps, failed=not completed)
+            # Check for loops (repeated steps)
+            if len(steps) > len(set(steps)):
+                stats.anomaly_count += 1
+            # Check for unexpected terminations
+            if flow.get("status") != "completed" and len(steps) > 0:
+                stats.anomaly_count += 1
+        return stats
+
+    def finalize(self, stats: FlowStats) -> List[StabilitySignal | RegressionSignal]:
         signals: List[StabilitySignal | RegressionSignal] = []
-
-        if flows is None or len(flows) == 0:
+        total = stats.total
+        if total == 0:
             return signals  # Graceful degradation
 
         # Analyze flow completion rates
-        completed_flows = sum(
-            1
-            for flow in flows
-            if flow.get("status") == "completed"
-            or flow.get("completed", False)
-            or flow.get("reached_end", False)
-        )
-        completion_rate = completed_flows / len(flows) if flows else 0.0
+        completion_rate = stats.completed / total
 
         signals.append(
             StabilitySignal(
                 signal_type=SignalType.STABILITY,
                 name="flow_completion_rate",
                 value=completion_rate * 100.0,
-                description=f"Flow completion rate: {completed_flows}/{len(flows)}",
+                description=f"Flow completion rate: {stats.completed}/{total}",
                 evidence=[
-                    f"Completed flows: {completed_flows}",
-                    f"Total flows: {len(flows)}",
-                    f"Completion rate: {completion_rate:.2%}",
+                    Fact("Completed flows", stats.completed),
+                    Fact("Total flows", total),
+                    Fact("Completion rate", completion_rate, ".2%"),
                 ],
-                metadata={"completion_rate": completion_rate, "total": len(flows)},
+                metadata=self._completion_metadata(stats, completion_rate),
             )
         )
 
         # Analyze flow anomalies (if step data available)
-        if all("steps" in flow for flow in flows):
-            anomaly_count = 0
-            for flow in flows:
-                steps = flow.get("steps", [])
-                # Check for loops (repeated steps)
-                if len(steps) > len(set(steps)):
-                    anomaly_count += 1
-                # Check for unexpected terminations
-                if flow.get("status") != "completed" and len(steps) > 0:
-                    anomaly_count += 1
-
-            anomaly_rate = anomaly_count / len(flows) if flows else 0.0
+        if stats.all_have_steps:
+            anomaly_count = stats.anomaly_count
+            anomaly_rate = anomaly_count / total
 
             signals.append(
                 RegressionSignal(
                     signal_type=SignalType.REGRESSION,
                     name="flow_anomalies",
                     value=(1.0 - anomaly_rate) * 100.0,
-                    description=f"Flow anomalies detected: {anomaly_count}/{len(flows)}",
+                    description=f"Flow anomalies detected: {anomaly_count}/{total}",
                     evidence=[
-                        f"Anomalous flows: {anomaly_count}",
-                        f"Anomaly rate: {anomaly_rate:.2%}",
+                        Fact("Anomalous flows", anomaly_count),
+                        Fact("Anomaly rate", anomaly_rate, ".2%"),
                     ],
                     metadata={"anomaly_count": anomaly_count, "anomaly_rate": anomaly_rate},
                 )
             )
 
+        if stats.paths is not None and self.baseline is not None:
+            signals.append(self._path_regression_signal(stats.paths, self.baseline))
+
         return signals
 
+    def _completion_metadata(self, stats: FlowStats, completion_rate: float) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {"completion_rate": completion_rate, "total": stats.total}
+        if stats.paths is not None:
+            index = stats.paths
+            metadata["paths"] = {
+                "indexed_flows": index.flows,
+                "trie_nodes": len(index),
+                "top_failing_paths": [p.to_dict() for p in index.top_failing_paths(self.top_k)],
+                "dead_end_steps": [s.to_dict() for s in index.dead_end_steps(self.top_k)],
+                "loop_hotspots": [s.to_dict() for s in index.loop_hotspots(self.top_k)],
+            }
+        return metadata
+
+    def _path_regression_signal(self, index: FlowPathIndex, baseline: FlowPathIndex) -> RegressionSignal:
+        regressions = index.diff(baseline)
+        # Extra share of flows abandoning on paths that got worse than in the baseline.
+        extra_share = sum(r.current_share - r.baseline_share for r in regressions if r.kind == "failing_path")
+        new_transitions = sum(1 for r in regressions if r.kind == "new_transition")
+        return RegressionSignal(
+            signal_type=SignalType.REGRESSION,
+            name="flow_path_regressions",
+            value=max(0.0, 1.0 - extra_share) * 100.0,
+            description=f"Flow path regressions vs baseline: {len(regressions)}",
+            evidence=[
+                f"{r.kind}: {' > '.join(r.path)} ({r.baseline_share:.2%} -> {r.current_share:.2%})"
+                for r in regressions[: self.top_k]
+            ]
+            or ["No failing path or transition regressed vs baseline"],
+            metadata={
+                "extra_failing_share": extra_share,
+                "new_transitions": new_transitions,
+                "regressions": [r.to_dict() for r in regressions[: self.top_k]],
+            },
+        )
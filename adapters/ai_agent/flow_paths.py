@@ -0,0 +1,331 @@
+"""
+Flow path index: a prefix trie of step sequences plus a step transition graph.
+
+Built in one pass (add() per flow); memory grows with the number of distinct step
+prefixes and transitions, not with the number of flows. Node and per-step counters live
+in flat `array('q')` columns, and trie children are found through one dict keyed by
+(parent, step) packed into an int.
+
+From the index:
+  top_failing_paths()  full step sequences that most often end without completion
+  dead_end_steps()     steps where abandoned flows stop, relative to flows visiting them
+  loop_hotspots()      steps revisited within a flow
+  diff(baseline)       failing paths / transitions that got worse than a baseline index
+
+Indexes merge (merge_in) and round-trip through JSON (to_dict / from_dict, save / load).
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from core.models.errors import IngestionError, ValidationError
+
+FLOW_INDEX_SCHEMA_VERSION = 1
+DEFAULT_MAX_DEPTH = 64
+
+# Reserved step ids for transitions into the first step and out of the last one.
+START, END = 0, 1
+_STEP_BITS = 32
+
+
+@dataclass(frozen=True, slots=True)
+class PathCount:
+    path: Tuple[str, ...]
+    failed: int
+    total: int  # flows whose (possibly truncated) path ends here
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"path": list(self.path), "failed": self.failed, "total": self.total}
+
+
+@dataclass(frozen=True, slots=True)
+class StepCount:
+    step: str
+    count: int  # dead ends / flows with a loop at this step
+    flows: int  # flows visiting the step
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.flows if self.flows else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"step": self.step, "count": self.count, "flows": self.flows, "rate": self.rate}
+
+
+@dataclass(frozen=True, slots=True)
+class PathRegression:
+    path: Tuple[str, ...]  # a failing path, or a (from, to) transition
+    kind: str  # "failing_path" | "new_transition"
+    baseline_share: float  # share of all flows in the baseline
+    current_share: float
+    current_count: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "path": list(self.path),
+            "baseline_share": self.baseline_share,
+            "current_share": self.current_share,
+            "current_count": self.current_count,
+        }
+
+
+class FlowPathIndex:
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH):
+        self.max_depth = max_depth
+        self.flows = 0
+        self.failed = 0
+        self._labels: List[str] = ["(start)", "(end)"]
+        self._step_ids: Dict[str, int] = {}
+        # Trie columns; node 0 is the root (empty path).
+        self._parent = array("q", [-1])
+        self._step = array("q", [-1])
+        self._ends = array("q", [0])
+        self._failed_ends = array("q", [0])
+        self._children: Dict[int, int] = {}  # (parent << 32) | step -> node
+        # Per-step columns (indexed by step id).
+        self._step_flows = array("q", [0, 0])
+        self._step_loops = array("q", [0, 0])
+        self._step_dead_ends = array("q", [0, 0])
+        # Transitions: (from << 32) | to -> [count, failed]
+        self._transitions: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add(self, steps: Sequence[Any], failed: bool) -> None:
+        """Index one flow's step sequence; `failed` marks a flow that did not complete."""
+        self.flows += 1
+        if failed:
+            self.failed += 1
+
+        ids = [self._intern(str(s)) for s in steps]
+        node = 0
+        for step_id in ids[: self.max_depth]:
+            key = (node << _STEP_BITS) | step_id
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_node(node, step_id)
+                self._children[key] = child
+            node = child
+        self._ends[node] += 1
+        if failed:
+            self._failed_ends[node] += 1
+
+        prev = START
+        seen: Dict[int, int] = {}
+        for step_id in ids:
+            self._count_transition(prev, step_id, failed)
+            seen[step_id] = seen.get(step_id, 0) + 1
+            prev = step_id
+        self._count_transition(prev, END, failed)
+        for step_id, n in seen.items():
+            self._step_flows[step_id] += 1
+            if n > 1:
+                self._step_loops[step_id] += 1
+        if failed and ids:
+            self._step_dead_ends[ids[-1]] += 1
+
+    def merge_in(self, other: FlowPathIndex) -> None:
+        """Add `other`'s counts (same result as indexing both flow sets into one index)."""
+        step_map = [START, END] + [self._intern(label) for label in other._labels[2:]]
+        node_map = [0] * len(other._parent)
+        for n in range(1, len(other._parent)):  # parents always precede their children
+            parent = node_map[other._parent[n]]
+            step_id = step_map[other._step[n]]
+            key = (parent << _STEP_BITS) | step_id
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_node(parent, step_id)
+                self._children[key] = child
+            node_map[n] = child
+        for n in range(len(other._parent)):
+            self._ends[node_map[n]] += other._ends[n]
+            self._failed_ends[node_map[n]] += other._failed_ends[n]
+        for s in range(2, len(other._labels)):
+            t = step_map[s]
+            self._step_flows[t] += other._step_flows[s]
+            self._step_loops[t] += other._step_loops[s]
+            self._step_dead_ends[t] += other._step_dead_ends[s]
+        for key, (count, failed) in other._transitions.items():
+            a, b = step_map[key >> _STEP_BITS], step_map[key & ((1 << _STEP_BITS) - 1)]
+            acc = self._transitions.setdefault((a << _STEP_BITS) | b, [0, 0])
+            acc[0] += count
+            acc[1] += failed
+        self.flows += other.flows
+        self.failed += other.failed
+
+    def path(self, node: int) -> Tuple[str, ...]:
+        steps: List[str] = []
+        while node > 0:
+            steps.append(self._labels[self._step[node]])
+            node = self._parent[node]
+        return tuple(reversed(steps))
+
+    def top_failing_paths(self, k: int = 10) -> List[PathCount]:
+        """Paths with the most abandoned flows ending on them (ties by path)."""
+        best = heapq.nsmallest(
+            k,
+            (n for n in range(len(self._parent)) if self._failed_ends[n] > 0),
+            key=lambda n: (-self._failed_ends[n], self.path(n)),
+        )
+        return [PathCount(self.path(n), self._failed_ends[n], self._ends[n]) for n in best]
+
+    def dead_end_steps(self, k: int = 10) -> List[StepCount]:
+        """Steps where abandoned flows stop most often."""
+        return self._top_steps(self._step_dead_ends, k)
+
+    def loop_hotspots(self, k: int = 10) -> List[StepCount]:
+        """Steps revisited within a flow, by number of flows with such a loop."""
+        return self._top_steps(self._step_loops, k)
+
+    def transitions(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """(from, to) -> (count, failed); "(start)" / "(end)" mark flow boundaries."""
+        mask = (1 << _STEP_BITS) - 1
+        return {
+            (self._labels[key >> _STEP_BITS], self._labels[key & mask]): (c, f)
+            for key, (c, f) in self._transitions.items()
+        }
+
+    def diff(
+        self,
+        baseline: FlowPathIndex,
+        *,
+        min_count: int = 5,
+        min_share_increase: float = 0.01,
+    ) -> List[PathRegression]:
+        """
+        Regressions against `baseline`, compared as shares of all flows in each index:
+          failing_path    an abandoning path whose share grew by more than `min_share_increase`
+          new_transition  a transition absent from the baseline, seen at least `min_count` times
+        Worst (largest share increase) first.
+        """
+        out: List[PathRegression] = []
+        if self.flows == 0:
+            return out
+        base_failing = {p.path: p.failed for p in baseline.top_failing_paths(len(baseline))}
+        for p in self.top_failing_paths(len(self)):
+            if p.failed < min_count:
+                continue
+            current = p.failed / self.flows
+            before = base_failing.get(p.path, 0) / baseline.flows if baseline.flows else 0.0
+            if current - before > min_share_increase:
+                out.append(PathRegression(p.path, "failing_path", before, current, p.failed))
+
+        base_edges = baseline.transitions()
+        for edge, (count, _) in self.transitions().items():
+            if count >= min_count and edge not in base_edges:
+                out.append(PathRegression(edge, "new_transition", 0.0, count / self.flows, count))
+
+        out.sort(key=lambda r: (-(r.current_share - r.baseline_share), r.kind, r.path))
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        mask = (1 << _STEP_BITS) - 1
+        return {
+            "schema_version": FLOW_INDEX_SCHEMA_VERSION,
+            "max_depth": self.max_depth,
+            "flows": self.flows,
+            "failed": self.failed,
+            "steps": self._labels[2:],
+            "nodes": [
+                [self._parent[n], self._step[n], self._ends[n], self._failed_ends[n]]
+                for n in range(1, len(self._parent))
+            ],
+            "step_counts": [
+                [self._step_flows[s], self._step_loops[s], self._step_dead_ends[s]]
+                for s in range(2, len(self._labels))
+            ],
+            "root": [self._ends[0], self._failed_ends[0]],
+            "transitions": [[key >> _STEP_BITS, key & mask, c, f] for key, (c, f) in self._transitions.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], source: str = "<flow index>") -> FlowPathIndex:
+        if not isinstance(raw, dict) or raw.get("schema_version") != FLOW_INDEX_SCHEMA_VERSION:
+            raise ValidationError(f"{source}: not a flow path index (schema_version {FLOW_INDEX_SCHEMA_VERSION})")
+        try:
+            index = cls(max_depth=int(raw["max_depth"]))
+            index.flows = int(raw["flows"])
+            index.failed = int(raw["failed"])
+            for label in raw["steps"]:
+                index._intern(str(label))
+            for (flows, loops, dead_ends), s in zip(raw["step_counts"], range(2, len(index._labels))):
+                index._step_flows[s] = flows
+                index._step_loops[s] = loops
+                index._step_dead_ends[s] = dead_ends
+            index._ends[0], index._failed_ends[0] = raw["root"]
+            for parent, step_id, ends, failed_ends in raw["nodes"]:
+                if not 0 <= parent < len(index._parent) or not 2 <= step_id < len(index._labels):
+                    raise ValueError(f"node references unknown parent {parent} / step {step_id}")
+                node = index._new_node(parent, step_id)
+                index._children[(parent << _STEP_BITS) | step_id] = node
+                index._ends[node] = ends
+                index._failed_ends[node] = failed_ends
+            for a, b, count, failed in raw["transitions"]:
+                if not (0 <= a < len(index._labels) and 0 <= b < len(index._labels)) or a == END or b == START:
+                    raise ValueError(f"transition references unknown step {a} -> {b}")
+                index._transitions[(a << _STEP_BITS) | b] = [count, failed]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"{source}: malformed flow path index ({e})") from e
+        return index
+
+    def save(self, path: str | Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), separators=(",", ":")) + "\n", encoding="utf-8")
+        return p
+
+    @classmethod
+    def load(cls, path: str | Path) -> FlowPathIndex:
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise IngestionError(f"Flow index '{path}': file not found") from e
+        except (OSError, json.JSONDecodeError) as e:
+            raise IngestionError(f"Flow index '{path}': unable to read ({e})") from e
+        return cls.from_dict(raw, f"Flow index '{path}'")
+
+    def _intern(self, label: str) -> int:
+        step_id = self._step_ids.get(label)
+        if step_id is None:
+            step_id = self._step_ids[label] = len(self._labels)
+            self._labels.append(label)
+            self._step_flows.append(0)
+            self._step_loops.append(0)
+            self._step_dead_ends.append(0)
+        return step_id
+
+    def _new_node(self, parent: int, step_id: int) -> int:
+        self._parent.append(parent)
+        self._step.append(step_id)
+        self._ends.append(0)
+        self._failed_ends.append(0)
+        return len(self._parent) - 1
+
+    def _count_transition(self, a: int, b: int, failed: bool) -> None:
+        key = (a << _STEP_BITS) | b
+        acc = self._transitions.get(key)
+        if acc is None:
+            acc = self._transitions[key] = [0, 0]
+        acc[0] += 1
+        if failed:
+            acc[1] += 1
+
+    def _top_steps(self, column: array, k: int) -> List[StepCount]:
+        best = heapq.nsmallest(
+            k,
+            (s for s in range(2, len(self._labels)) if column[s] > 0),
+            key=lambda s: (-column[s], self._labels[s]),
+        )
+        return [StepCount(self._labels[s], column[s], self._step_flows[s]) for s in best]
@@ -19,94 +19,187 @@ class IntentAnalyzer:
 
 """Analyzer for intent classification data."""
 
-from typing import Any, Dict, List, Optional
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
 
-from core.models.signals import RegressionSignal, SignalType, StabilitySignal
+from adapters.ai_agent.intent_matrix import IntentConfusionMatrix
+from core.models.signals import Fact, RegressionSignal, SignalType, StabilitySignal
 from core.models.test_results import TestResults
 
 
+@dataclass(slots=True)
+class IntentStats:
+    """Mergeable partial statistics over a slice of intent records."""
+
+    total: int = 0
+    all_labeled: bool = True  # every record has both "predicted" and "actual"
+    correct: int = 0
+    # Intent type -> count, in first-seen order (merging slices in order keeps that order).
+    intent_counts: Dict[str, int] = field(default_factory=dict)
+    # (actual, predicted) counts over the records that carry both labels.
+    matrix: IntentConfusionMatrix = field(default_factory=IntentConfusionMatrix)
+
+    def merge(self, other: "IntentStats") -> "IntentStats":
+        merged = IntentStats(
+            total=self.total + other.total,
+            all_labeled=self.all_labeled and other.all_labeled,
+            correct=self.correct + other.correct,
+            intent_counts=dict(self.intent_counts),
+        )
+        for intent_type, n in other.intent_counts.items():
+            merged.intent_counts[intent_type] = merged.intent_counts.get(intent_type, 0) + n
+        for part in (self, other):
+            merged.matrix.merge_in(part.matrix)
+        return merged
+
+
 class IntentAnalyzer:
-    """Analyzes intent classification data for behavioral patterns."""
+    """Analyzes intent classification data for behavioral patterns.
+
+    analyze() is accumulate() over one slice followed by finalize(); slices of a large
+    artifact set can be accumulated separately (e.g. in worker processes) and merged.
+
+    Labeled records also go into an IntentConfusionMatrix: the accuracy signal carries
+    macro F1, the weakest intents and the most-confused pairs, and against a `baseline`
+    matrix an intent_confusion_regressions signal is added.
+    """
+
+    def __init__(self, baseline: Optional[IntentConfusionMatrix] = None, top_k: int = 10):
+        self.baseline = baseline
+        self.top_k = top_k
 
     def analyze(
         self,
         test_results: TestResults,
-        intents: Optional[List[Dict[str, Any]]] = None,
+        intents: Optional[Iterable[Dict[str, Any]]] = None,
     ) -> List[StabilitySignal | RegressionSignal]:
         """Analyze intent data and extract signals.
 
         Args:
             test_results: Test results (for context)
-            intents: Optional list of intent classification records
+            intents: Optional intent classification records (list, iterable or JsonlSource)
 
         Returns:
             List of signals (empty if no intents provided)
         """
+        if intents is None:
+            return []  # Graceful degradation
+        return self.finalize(self.accumulate(self.new_stats(), intents))
+
+    def new_stats(self) -> IntentStats:
+        return IntentStats()
+
+    def accumulate(self, stats: IntentStats, intents: Iterable[Dict[str, Any]]) -> IntentStats:
+        """Add intent records to `stats` in one pass (mutates and returns it)."""
+        counts = stats.intent_counts
+        matrix = stats.matrix
+        for intent in intents:
+            stats.total += 1
+            if "predicted" in intent and "actual" in intent:
+                # Labels compare as strings, the way the matrix interns them.
+                actual, predicted = str(intent["actual"]), str(intent["predicted"])
+                if predicted == actual:
+                    stats.correct += 1
+                matrix.add(actual, predicted)
+            else:
+                stats.all_labeled = False
+            intent_type = intent.get("predicted") or intent.get("type", "unknown")
+            counts[intent_type] = counts.get(intent_type, 0) + 1
+        return stats
+
+    def finalize(self, stats: IntentStats) -> List[StabilitySignal | RegressionSignal]:
         signals: List[StabilitySignal | RegressionSignal] = []
-
-        if intents is None or len(intents) == 0:
+        total = stats.total
+        if total == 0:
             return signals  # Graceful degradation
 
         # Analyze intent classification accuracy (if ground truth available)
-        if all("predicted" in i and "actual" in i for i in intents):
-            correct = sum(
-                1 for i in intents if i["predicted"] == i["actual"]
-            )
-            accuracy = correct / len(intents) if intents else 0.0
+        if stats.all_labeled:
+            correct = stats.correct
+            accuracy = correct / total
 
             signals.append(
                 StabilitySignal(
                     signal_type=SignalType.STABILITY,
                     name="intent_classification_accuracy",
                     value=accuracy * 100.0,
-                    description=f"Intent classification accuracy: {correct}/{len(intents)}",
+                    description=f"Intent classification accuracy: {correct}/{total}",
                     evidence=[
-                        f"Correct classifications: {correct}",
-                        f"Total classifications: {len(intents)}",
-                        f"Accuracy: {accuracy:.2%}",
+                        Fact("Correct classifications", correct),
+                        Fact("Total classifications", total),
+                        Fact("Accuracy", accuracy, ".2%"),
                     ],
-                    metadata={"accuracy": accuracy, "total": len(intents)},
+                    metadata=self._accuracy_metadata(stats.matrix, accuracy, total),
                 )
             )
+            if self.baseline is not None:
+                signals.append(self._confusion_regression_signal(stats.matrix, self.baseline))
 
         # Analyze intent drift (if historical data available)
-        if len(intents) > 1:
-            # Group by intent type and check distribution changes
-            intent_counts: Dict[str, int] = {}
-            for intent in intents:
-                intent_type = intent.get("predicted") or intent.get("type", "unknown")
-                intent_counts[intent_type] = intent_counts.get(intent_type, 0) + 1
+        if total > 1:
+            intent_counts = stats.intent_counts
 
             # Calculate entropy as a measure of distribution
-            total = sum(intent_counts.values())
-            if total > 0:
-                import math
-
-                entropy = -sum(
-                    (count / total) * math.log2(count / total)
-                    for count in intent_counts.values()
-                    if count > 0
-                )
-                max_entropy = math.log2(len(intent_counts)) if intent_counts else 1.0
-                normalized_entropy = (
-                    entropy / max_entropy if max_entropy > 0 else 0.0
-                )
+            entropy = -sum(
+                (count / total) * math.log2(count / total)
+                for count in intent_counts.values()
+                if count > 0
+            )
+            max_entropy = math.log2(len(intent_counts)) if intent_counts else 1.0
+            normalized_entropy = (
+                entropy / max_entropy if max_entropy > 0 else 0.0
+            )
 
-                # High entropy = diverse intents (good), low entropy = drift (concerning)
-                # Convert to stability signal (higher entropy = higher score)
-                signals.append(
-                    StabilitySignal(
-                        signal_type=SignalType.STABILITY,
-                        name="intent_distribution_diversity",
-                        value=normalized_entropy * 100.0,
-                        description="Diversity of intent classifications",
-                        evidence=[
-                            f"Unique intent types: {len(intent_counts)}",
-                            f"Intent distribution entropy: {entropy:.2f}",
-                        ],
-                        metadata={"entropy": entropy, "unique_types": len(intent_counts)},
-                    )
+            # High entropy = diverse intents (good), low entropy = drift (concerning)
+            # Convert to stability signal (higher entropy = higher score)
+            signals.append(
+                StabilitySignal(
+                    signal_type=SignalType.STABILITY,
+                    name="intent_distribution_diversity",
+                    value=normalized_entropy * 100.0,
+                    description="Diversity of intent classifications",
+                    evidence=[
+                        Fact("Unique intent types", len(intent_counts)),
+                        Fact("Intent distribution entropy", entropy, ".2f"),
+                    ],
+                    metadata={"entropy": entropy, "unique_types": len(intent_counts)},
                 )
+            )
 
         return signals
 
+    def _accuracy_metadata(self, matrix: IntentConfusionMatrix, accuracy: float, total: int) -> Dict[str, Any]:
+        scores = [s for s in matrix.per_intent() if s.support]
+        weakest = sorted(scores, key=lambda s: (s.f1, s.intent))[: self.top_k]
+        return {
+            "accuracy": accuracy,
+            "total": total,
+            "macro_f1": matrix.macro_f1(),
+            "weakest_intents": [s.to_dict() for s in weakest],
+            "most_confused": [c.to_dict() for c in matrix.most_confused(self.top_k)],
+        }
+
+    def _confusion_regression_signal(
+        self, matrix: IntentConfusionMatrix, baseline: IntentConfusionMatrix
+    ) -> RegressionSignal:
+        shifts = matrix.diff(baseline)
+        # Share of all utterances misread beyond the baseline confusion rates.
+        extra_share = sum(s.extra_errors for s in shifts) / matrix.total if matrix.total else 0.0
+        return RegressionSignal(
+            signal_type=SignalType.REGRESSION,
+            name="intent_confusion_regressions",
+            value=max(0.0, 1.0 - extra_share) * 100.0,
+            description=f"Intent confusions worse than baseline: {len(shifts)}",
+            evidence=[
+                f"{s.actual} -> {s.predicted}: {s.baseline_rate:.2%} -> {s.current_rate:.2%}"
+                for s in shifts[: self.top_k]
+            ]
+            or ["No intent confusion regressed vs baseline"],
+            metadata={
+                "extra_error_share": extra_share,
+                "baseline_macro_f1": baseline.macro_f1(),
+                "macro_f1": matrix.macro_f1(),
+                "shifts": [s.to_dict() for s in shifts[: self.top_k]],
+            },
+        )
@@ -0,0 +1,251 @@
+"""
+Intent confusion matrix: labeled (actual, predicted) pairs counted in a sparse dict.
+
+Intent labels are interned to integer ids; only non-empty cells are stored, keyed by
+(actual, predicted) packed into an int, with per-intent support and prediction totals
+kept alongside. add() is a few dict lookups and increments, so millions of utterances
+stay cheap, and memory is bounded by the number of distinct confusions that occur, not
+by the number of utterances or the square of the number of intents.
+
+From the matrix:
+  per_intent()     precision, recall and F1 per intent (plus support)
+  most_confused()  off-diagonal cells with the most utterances
+  diff(baseline)   confusions whose rate (share of the actual intent) grew vs a baseline
+
+Matrices merge (merge_in) and round-trip through JSON (to_dict / from_dict, save / load).
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.models.errors import IngestionError, ValidationError
+
+INTENT_MATRIX_SCHEMA_VERSION = 1
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+
+
+@dataclass(frozen=True, slots=True)
+class IntentScore:
+    intent: str
+    support: int  # utterances whose actual intent is this one
+    predicted: int  # utterances predicted as this intent
+    true_positives: int
+
+    @property
+    def precision(self) -> float:
+        return self.true_positives / self.predicted if self.predicted else 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.true_positives / self.support if self.support else 0.0
+
+    @property
+    def f1(self) -> float:
+        p, r = self.precision, self.recall
+        return 2 * p * r / (p + r) if p + r else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "intent": self.intent,
+            "support": self.support,
+            "precision": self.precision,
+            "recall": self.recall,
+            "f1": self.f1,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ConfusedPair:
+    actual: str
+    predicted: str
+    count: int
+    support: int  # utterances of the actual intent
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.support if self.support else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"actual": self.actual, "predicted": self.predicted, "count": self.count, "rate": self.rate}
+
+
+@dataclass(frozen=True, slots=True)
+class ConfusionShift:
+    actual: str
+    predicted: str
+    baseline_rate: float  # share of the actual intent misread as `predicted` in the baseline
+    current_rate: float
+    current_count: int
+    support: int  # current utterances of the actual intent
+
+    @property
+    def extra_errors(self) -> float:
+        """Utterances misread beyond the baseline rate."""
+        return (self.current_rate - self.baseline_rate) * self.support
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "actual": self.actual,
+            "predicted": self.predicted,
+            "baseline_rate": self.baseline_rate,
+            "current_rate": self.current_rate,
+            "current_count": self.current_count,
+            "support": self.support,
+        }
+
+
+class IntentConfusionMatrix:
+    def __init__(self) -> None:
+        self.total = 0
+        self.correct = 0
+        self._labels: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._cells: Dict[int, int] = {}  # (actual << 32) | predicted -> utterances
+        self._support: List[int] = []  # per label id: utterances with that actual intent
+        self._predicted: List[int] = []  # per label id: utterances predicted as it
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @property
+    def labels(self) -> List[str]:
+        return list(self._labels)
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.total if self.total else 0.0
+
+    def add(self, actual: Any, predicted: Any, n: int = 1) -> None:
+        a = self._intern(str(actual))
+        p = self._intern(str(predicted))
+        self._add(a, p, n)
+
+    def count(self, actual: str, predicted: str) -> int:
+        a, p = self._ids.get(actual), self._ids.get(predicted)
+        if a is None or p is None:
+            return 0
+        return self._cells.get((a << _ID_BITS) | p, 0)
+
+    def merge_in(self, other: IntentConfusionMatrix) -> None:
+        """Add `other`'s counts (same result as adding both sets of pairs to one matrix)."""
+        id_map = [self._intern(label) for label in other._labels]
+        for key, n in other._cells.items():
+            self._add(id_map[key >> _ID_BITS], id_map[key & _ID_MASK], n)
+
+    def per_intent(self) -> List[IntentScore]:
+        """One score per intent seen as actual or predicted, sorted by intent."""
+        return sorted(
+            (
+                IntentScore(label, self._support[i], self._predicted[i], self._cells.get((i << _ID_BITS) | i, 0))
+                for i, label in enumerate(self._labels)
+            ),
+            key=lambda s: s.intent,
+        )
+
+    def macro_f1(self) -> float:
+        """Mean F1 over intents that occur as an actual label."""
+        scores = [s.f1 for s in self.per_intent() if s.support]
+        return sum(scores) / len(scores) if scores else 0.0
+
+    def most_confused(self, k: int = 10) -> List[ConfusedPair]:
+        """Off-diagonal (actual, predicted) cells with the most utterances (ties by labels)."""
+        return heapq.nsmallest(
+            k,
+            self._confusions(),
+            key=lambda c: (-c.count, c.actual, c.predicted),
+        )
+
+    def diff(
+        self,
+        baseline: IntentConfusionMatrix,
+        *,
+        min_count: int = 5,
+        min_rate_increase: float = 0.02,
+    ) -> List[ConfusionShift]:
+        """
+        Confusions that got worse than in `baseline`. Rates are shares of the actual
+        intent's utterances, so matrices of different sizes compare directly; a cell must
+        hold at least `min_count` utterances and its rate must grow by more than
+        `min_rate_increase`. Worst (largest rate increase) first.
+        """
+        base = {(c.actual, c.predicted): c.rate for c in baseline._confusions()}
+        out = [
+            ConfusionShift(c.actual, c.predicted, base.get((c.actual, c.predicted), 0.0), c.rate, c.count, c.support)
+            for c in self._confusions()
+            if c.count >= min_count and c.rate - base.get((c.actual, c.predicted), 0.0) > min_rate_increase
+        ]
+        out.sort(key=lambda s: (-(s.current_rate - s.baseline_rate), s.actual, s.predicted))
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema_version": INTENT_MATRIX_SCHEMA_VERSION,
+            "labels": list(self._labels),
+            "cells": [[key >> _ID_BITS, key & _ID_MASK, n] for key, n in sorted(self._cells.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], source: str = "<intent matrix>") -> IntentConfusionMatrix:
+        if not isinstance(raw, dict) or raw.get("schema_version") != INTENT_MATRIX_SCHEMA_VERSION:
+            raise ValidationError(
+                f"{source}: not an intent confusion matrix (schema_version {INTENT_MATRIX_SCHEMA_VERSION})"
+            )
+        matrix = cls()
+        try:
+            labels = [matrix._intern(str(label)) for label in raw["labels"]]
+            for a, p, n in raw["cells"]:
+                if not (0 <= a < len(labels) and 0 <= p < len(labels)) or int(n) < 0:
+                    raise ValueError(f"cell ({a}, {p}) = {n} is out of range")
+                if int(n):
+                    matrix._add(labels[a], labels[p], int(n))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"{source}: malformed intent confusion matrix ({e})") from e
+        return matrix
+
+    def save(self, path: str | Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), separators=(",", ":")) + "\n", encoding="utf-8")
+        return p
+
+    @classmethod
+    def load(cls, path: str | Path) -> IntentConfusionMatrix:
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise IngestionError(f"Intent matrix '{path}': file not found") from e
+        except (OSError, json.JSONDecodeError) as e:
+            raise IngestionError(f"Intent matrix '{path}': unable to read ({e})") from e
+        return cls.from_dict(raw, f"Intent matrix '{path}'")
+
+    def _confusions(self) -> List[ConfusedPair]:
+        out: List[ConfusedPair] = []
+        for key, c in sorted(self._cells.items()):
+            a, p = key >> _ID_BITS, key & _ID_MASK
+            if p != a:
+                out.append(ConfusedPair(self._labels[a], self._labels[p], c, self._support[a]))
+        return out
+
+    def _add(self, a: int, p: int, n: int) -> None:
+        key = (a << _ID_BITS) | p
+        self._cells[key] = self._cells.get(key, 0) + n
+        self._support[a] += n
+        self._predicted[p] += n
+        self.total += n
+        if a == p:
+            self.correct += n
+
+    def _intern(self, label: str) -> int:
+        i = self._ids.get(label)
+        if i is None:
+            i = self._ids[label] = len(self._labels)
+            self._labels.append(label)
+            self._support.append(0)
+            self._predicted.append(0)
+        return i
@@ -32,24 +32,35 @@ class AIAgentAdapter(BaseAdapter):
 
 """AI agent adapter that extracts signals from AI-specific artifacts."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from adapters.ai_agent.conversation_analyzer import ConversationAnalyzer
 from adapters.ai_agent.flow_analyzer import FlowAnalyzer
 from adapters.ai_agent.intent_analyzer import IntentAnalyzer
+from adapters.ai_agent.sources import JsonlSource
 from adapters.base import BaseAdapter
-from core.models.signals import RegressionSignal, Signal, SignalType, StabilitySignal
+from core.models.signals import Signal
 from core.models.test_results import TestResults
 
+# Artifact keys, in signal order.
+_ARTIFACTS = ("conversations", "intents", "flows")
+
 
 class AIAgentAdapter(BaseAdapter):
-    """Adapter for AI agent-specific signal extraction."""
+    """Adapter for AI agent-specific signal extraction.
 
-    def __init__(self):
+    Artifacts may be lists, any iterable of dicts (consumed once), or JsonlSource files.
+    With `workers` > 1, JsonlSource artifacts are split into byte-range slices that are
+    accumulated in a process pool (the three analyzers run concurrently); partial
+    statistics are merged in file order, so signals match a single-process run.
+    """
+
+    def __init__(self, workers: int = 1):
         """Initialize AI agent adapter with analyzers."""
         self.conversation_analyzer = ConversationAnalyzer()
         self.intent_analyzer = IntentAnalyzer()
         self.flow_analyzer = FlowAnalyzer()
+        self.workers = max(1, workers)
 
     def extract_signals(
         self,
@@ -65,31 +76,57 @@ class AIAgentAdapter(BaseAdapter):
         Returns:
             List of extracted signals (empty if no artifacts available)
         """
-        signals: List[Signal] = []
-
         if optional_artifacts is None:
             optional_artifacts = {}
 
-        # Extract conversation signals (graceful degradation)
-        conversation_signals = self.conversation_analyzer.analyze(
-            test_results, optional_artifacts.get("conversations")
-        )
-        signals.extend(conversation_signals)
-
-        # Extract intent signals (graceful degradation)
-        intent_signals = self.intent_analyzer.analyze(
-            test_results, optional_artifacts.get("intents")
-        )
-        signals.extend(intent_signals)
-
-        # Extract flow signals (graceful degradation)
-        flow_signals = self.flow_analyzer.analyze(
-            test_results, optional_artifacts.get("flows")
-        )
-        signals.extend(flow_signals)
+        analyzers = {
+            "conversations": self.conversation_analyzer,
+            "intents": self.intent_analyzer,
+            "flows": self.flow_analyzer,
+        }
+        # Graceful degradation: missing artifacts produce no signals.
+        present = {key: optional_artifacts[key] for key in _ARTIFACTS if optional_artifacts.get(key) is not None}
+
+        if self.workers > 1 and any(isinstance(v, JsonlSource) for v in present.values()):
+            states = self._accumulate_parallel(present, analyzers)
+        else:
+            states = {
+                key: analyzers[key].accumulate(analyzers[key].new_stats(), records) for key, records in present.items()
+            }
 
+        signals: List[Signal] = []
+        for key in _ARTIFACTS:
+            if key in states:
+                signals.extend(analyzers[key].finalize(states[key]))
         return signals
 
+    def _accumulate_parallel(
+        self,
+        present: Dict[str, Iterable[Dict[str, Any]]],
+        analyzers: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {}
+            for key, records in present.items():
+                if isinstance(records, JsonlSource):
+                    futures[key] = [
+                        pool.submit(_accumulate_slice, analyzers[key], part) for part in records.split(self.workers)
+                    ]
+            # In-memory iterables are consumed here while the pool works on the files.
+            states = {
+                key: analyzers[key].accumulate(analyzers[key].new_stats(), records)
+                for key, records in present.items()
+                if key not in futures
+            }
+            for key, parts in futures.items():
+                merged = analyzers[key].new_stats()
+                for f in parts:
+                    merged = merged.merge(f.result())
+                states[key] = merged
+        return states
+
     def get_name(self) -> str:
         """Get adapter name.
 
@@ -98,3 +135,7 @@ class AIAgentAdapter(BaseAdapter):
         """
         return "ai_agent"
 
+
+def _accumulate_slice(analyzer: Any, source: JsonlSource) -> Any:
+    # Runs in a worker process: the analyzer and slice bounds go in, partial stats come back.
+    return analyzer.accumulate(analyzer.new_stats(), source)
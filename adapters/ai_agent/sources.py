@@ -0,0 +1,69 @@
+"""File-backed artifact sources: JSON Lines files read lazily and split by byte range."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.models.errors import IngestionError
+
+
+@dataclass(frozen=True, slots=True)
+class JsonlSource:
+    """
+    Records of a JSON Lines file (one object per line; blank lines are skipped).
+
+    Iterating streams the file, so millions of records never sit in memory at once.
+    `start`/`end` restrict the source to the lines that *begin* in [start, end); split()
+    uses this to hand disjoint, in-order slices to worker processes.
+    """
+
+    path: str
+    start: int = 0
+    end: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            f = open(self.path, "rb")
+        except OSError as e:
+            raise IngestionError(f"JSONL '{self.path}': unable to read file ({e})") from e
+        with f:
+            pos = self.start
+            if pos > 0:
+                # Skip the line that straddles `start`; the previous slice owns it.
+                f.seek(pos - 1)
+                pos += len(f.readline()) - 1
+            end = self.end
+            while end is None or pos < end:
+                line = f.readline()
+                if not line:
+                    break
+                line_start = pos
+                pos += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    raise IngestionError(f"JSONL '{self.path}': invalid JSON at byte {line_start} ({e})") from e
+                if not isinstance(record, dict):
+                    raise IngestionError(f"JSONL '{self.path}': line at byte {line_start} is not an object")
+                yield record
+
+    def split(self, parts: int) -> List[JsonlSource]:
+        """Up to `parts` consecutive slices covering this source, in file order."""
+        start = self.start
+        end = self.end if self.end is not None else _file_size(self.path)
+        parts = max(1, min(parts, end - start))
+        step = (end - start) // parts
+        bounds = [start + i * step for i in range(parts)] + [end]
+        return [JsonlSource(self.path, bounds[i], bounds[i + 1]) for i in range(parts)]
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError as e:
+        raise IngestionError(f"JSONL '{path}': unable to read file ({e})") from e
@@ -28,7 +28,7 @@ from typing import Any, Dict, List, Optional
 
 from adapters.base import BaseAdapter
 from core.models.readiness import BehavioralRisk, RiskLevel
-from core.models.signals import RegressionSignal, SignalType, StabilitySignal
+from core.models.signals import Fact, RegressionSignal, SignalType, StabilitySignal
 from core.models.test_results import TestResults
 from core.scoring.regression import (
     calculate_failure_rate_trend,
@@ -62,11 +62,8 @@ class GenericAdapter(BaseAdapter):
         # Stability signals
         pass_rate_consistency = calculate_pass_rate_consistency(test_results)
         flaky_tests = detect_flaky_tests(test_results)
-        flakiness_rate = (
-            len(flaky_tests) / len(test_results.unique_test_ids)
-            if test_results.unique_test_ids
-            else 0.0
-        )
+        total_tests = len(test_results.unique_test_ids)  # walks every run; computed once
+        flakiness_rate = len(flaky_tests) / total_tests if total_tests else 0.0
 
         # Calculate average pass rate across all runs
         avg_pass_rate = (
@@ -84,8 +81,8 @@ class GenericAdapter(BaseAdapter):
                 value=pass_rate_consistency * 100.0,
                 description=f"Consistency of pass rates across {test_results.total_runs} runs",
                 evidence=[
-                    f"Pass rate consistency: {pass_rate_consistency:.2%}",
-                    f"Average pass rate: {avg_pass_rate:.2%}",
+                    Fact("Pass rate consistency", pass_rate_consistency, ".2%"),
+                    Fact("Average pass rate", avg_pass_rate, ".2%"),
                 ],
                 metadata={"consistency": pass_rate_consistency, "avg_pass_rate": avg_pass_rate},
             )
@@ -97,12 +94,12 @@ class GenericAdapter(BaseAdapter):
                 signal_type=SignalType.STABILITY,
                 name="test_flakiness",
                 value=(1.0 - flakiness_rate) * 100.0,
-                description=f"Test flakiness rate: {len(flaky_tests)} flaky test(s) out of {len(test_results.unique_test_ids)} total",
+                description=f"Test flakiness rate: {len(flaky_tests)} flaky test(s) out of {total_tests} total",
                 evidence=[
-                    f"Flaky tests detected: {len(flaky_tests)}",
-                    f"Flakiness rate: {flakiness_rate:.2%}",
+                    Fact("Flaky tests detected", len(flaky_tests)),
+                    Fact("Flakiness rate", flakiness_rate, ".2%"),
                 ]
-                + ([f"Flaky test IDs: {', '.join(flaky_tests)}"] if flaky_tests else []),
+                + ([Fact("Flaky test IDs", flaky_tests)] if flaky_tests else []),
                 metadata={"flaky_tests": flaky_tests, "flakiness_rate": flakiness_rate},
             )
         )
@@ -110,7 +107,6 @@ class GenericAdapter(BaseAdapter):
         # Regression signals
         failure_rate_trend = calculate_failure_rate_trend(test_results)
         new_failures = identify_new_failures(test_results)
-        total_tests = len(test_results.unique_test_ids)
         current_failure_rate = (
             sum(run.failed_count for run in test_results.test_runs[-3:])
             / sum(run.total_tests for run in test_results.test_runs[-3:])
@@ -127,7 +123,7 @@ class GenericAdapter(BaseAdapter):
                 description=f"Trend in failure rate across {test_results.total_runs} runs",
                 evidence=[
                     f"Failure rate trend: {failure_rate_trend:.2f} ({'improving' if failure_rate_trend > 0 else 'worsening' if failure_rate_trend < 0 else 'stable'})",
-                    f"Current failure rate: {current_failure_rate:.2%}",
+                    Fact("Current failure rate", current_failure_rate, ".2%"),
                 ],
                 metadata={"trend": failure_rate_trend, "current_failure_rate": current_failure_rate},
             )
@@ -141,8 +137,8 @@ class GenericAdapter(BaseAdapter):
                 value=max(0.0, 100.0 - (len(new_failures) / total_tests * 100.0) if total_tests > 0 else 100.0),
                 description=f"New failures detected: {len(new_failures)} test(s)",
                 evidence=(
-                    [f"New failures: {len(new_failures)}"]
-                    + ([f"New failure test IDs: {', '.join(new_failures)}"] if new_failures else [])
+                    [Fact("New failures", len(new_failures))]
+                    + ([Fact("New failure test IDs", new_failures)] if new_failures else [])
                 ),
                 metadata={"new_failures": new_failures, "total_tests": total_tests},
             )
@@ -5,7 +5,7 @@ from typing import Any, Literal
 
 from adapters.llm_readiness.extractors import extract_all_signals
 from adapters.llm_readiness.load_transcript import load_transcript
-from adapters.llm_readiness.models import AiSignal
+from adapters.llm_readiness.models import AiSignal, Transcript
 
 
 DriftSeverity = Literal["high", "medium", "low", "info"]
@@ -39,7 +39,10 @@ class DriftReport:
 
 
 def analyze_transcript(path: str) -> LlmSignals:
-    transcript = load_transcript(path)
+    return signals_from_transcript(load_transcript(path))
+
+
+def signals_from_transcript(transcript: Transcript) -> LlmSignals:
     signals = extract_all_signals(transcript)
 
     turns_total = len(transcript.turns)
@@ -27,7 +27,13 @@ def load_transcript(path: str) -> Transcript:
     """
     p = Path(path)
     raw = json.loads(p.read_text(encoding="utf-8"))
+    return transcript_from_obj(raw, source_path=str(p))
 
+
+def transcript_from_obj(raw: Any, source_path: str | None = None) -> Transcript:
+    """
+    Build a Transcript from already-decoded JSON (same shape and rules as load_transcript()).
+    """
     if not isinstance(raw, dict):
         raise ValueError("Transcript JSON must be an object")
     turns_raw = raw.get("turns")
@@ -52,7 +58,7 @@ def load_transcript(path: str) -> Transcript:
 
         turns.append(_turn_from_dict(item))
 
-    return Transcript(turns=turns, source_path=str(p))
+    return Transcript(turns=turns, source_path=source_path)
 
 
 def _turn_from_dict(d: dict[str, Any]) -> TranscriptTurn:
@@ -3,27 +3,122 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from adapters.llm_readiness.drift import DriftReport, analyze_transcript, compare_signals
+from adapters.llm_readiness.drift import DriftReport, LlmSignals, analyze_transcript, compare_signals
 from adapters.llm_readiness.summarize import signals_to_markdown
+from core.reporting.document import ReportExtension
+
+EXTENSION_KEY = "llm_readiness"
+SECTION_TITLE = "AI/LLM Stability Signals (optional)"
 
 
 def build_stability_section(*, transcript_path: str | Path, baseline_transcript_path: str | Path | None = None) -> str:
     """
     Build the optional markdown section appended at CLI layer.
     """
+    current, drift = analyze_stability(
+        transcript_path=transcript_path,
+        baseline_transcript_path=baseline_transcript_path,
+    )
+    return render_stability_section(current, drift)
+
+
+def build_stability_extension(
+    *, transcript_path: str | Path, baseline_transcript_path: str | Path | None = None
+) -> ReportExtension:
+    """
+    Analyze the transcript(s) once and package the result for every report format.
+    """
+    current, drift = analyze_stability(
+        transcript_path=transcript_path,
+        baseline_transcript_path=baseline_transcript_path,
+    )
+    return stability_extension(current, drift)
+
+
+def stability_extension(current: LlmSignals, drift: DriftReport | None) -> ReportExtension:
+    """
+    Package already-analyzed signals (e.g. cached baselines) as a report extension.
+    """
+    return ReportExtension(
+        key=EXTENSION_KEY,
+        title=SECTION_TITLE,
+        markdown=render_stability_section(current, drift),
+        data=stability_to_dict(current, drift),
+    )
+
+
+def analyze_stability(
+    *, transcript_path: str | Path, baseline_transcript_path: str | Path | None = None
+) -> tuple[LlmSignals, DriftReport | None]:
     current = analyze_transcript(str(transcript_path))
+    drift = None
+    if baseline_transcript_path:
+        baseline = analyze_transcript(str(baseline_transcript_path))
+        drift = compare_signals(baseline, current)
+    return current, drift
 
+
+def stability_to_dict(current: LlmSignals, drift: DriftReport | None) -> dict[str, Any]:
+    """
+    JSON-serializable form of the AI/LLM stability signals (advisory; does not affect the core score).
+    """
+    out: dict[str, Any] = {
+        "advisory_only": True,
+        "source_path": current.source_path,
+        "metrics": dict(current.metrics),
+        "signals": [{"severity": s.severity, "title": s.title, "evidence": dict(s.evidence)} for s in current.signals],
+        "drift": None,
+    }
+    if drift is not None:
+        out["drift"] = {
+            "baseline_source_path": drift.baseline.source_path,
+            "baseline_metrics": dict(drift.baseline.metrics),
+            "deltas": dict(drift.deltas),
+            "findings": [
+                {"severity": f.severity, "explanation": f.explanation, "evidence": dict(f.evidence)}
+                for f in drift.findings
+            ],
+        }
+    return out
+
+
+# Highest severity first; drift "info" findings never raise the transcript risk above low.
+_SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2, "info": 3}
+
+
+def stability_summary(current: LlmSignals, drift: DriftReport | None) -> dict[str, Any]:
+    """
+    stability_to_dict() plus `risk_level` (highest signal/drift severity; low when nothing is
+    raised) and `findings`: signals and drift findings in one list, highest severity first.
+    Transcripts have no readiness score: they are advisory in every pipeline.
+    """
+    findings = [
+        {"source": "signal", "severity": s.severity, "message": s.title, "evidence": dict(s.evidence)}
+        for s in current.signals
+    ]
+    if drift is not None:
+        findings.extend(
+            {"source": "drift", "severity": f.severity, "message": f.explanation, "evidence": dict(f.evidence)}
+            for f in drift.findings
+        )
+    findings.sort(key=lambda f: _SEVERITY_ORDER.get(f["severity"], len(_SEVERITY_ORDER)))
+    top = findings[0]["severity"] if findings else "low"
+    out = stability_to_dict(current, drift)
+    out["risk_level"] = top if top in ("high", "medium") else "low"
+    out["findings"] = findings
+    return out
+
+
+def render_stability_section(current: LlmSignals, drift: DriftReport | None) -> str:
     lines: list[str] = []
-    lines.append("## AI/LLM Stability Signals (optional)")
+    lines.append(f"## {SECTION_TITLE}")
     lines.append("")
     lines.append("_Advisory only: does not modify the deterministic core readiness score._")
     lines.append("")
     lines.append(signals_to_markdown(current.signals).rstrip())
     lines.append("")
 
-    if baseline_transcript_path:
-        baseline = analyze_transcript(str(baseline_transcript_path))
-        drift = compare_signals(baseline, current)
+    if drift is not None:
         lines.extend(_drift_markdown(drift))
 
     return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,260 @@
+"""
+Adapter registry: which adapters exist, which artifact kinds each consumes, and dispatch.
+
+An AdapterSpec names its adapter class as "module:Class" and is only imported (and the
+adapter only instantiated) when the spec is selected for a run, i.e. when at least one
+artifact kind it consumes is present (or, for adapters that only read the multi-run
+TestResults history, when test results are given). A run without AI artifacts never
+imports the AI agent analyzers.
+
+Built-in specs are listed in BUILTIN_ADAPTERS. Installed packages can add their own
+through the `readiness.adapters` entry point group; each entry point must resolve to an
+AdapterSpec (keep it in a module that does not import the adapter itself):
+
+    [project.entry-points."readiness.adapters"]
+    my_adapter = "my_pkg.readiness_spec:SPEC"
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.signals import DEFAULT_EVIDENCE_ITEMS
+
+if TYPE_CHECKING:
+    from adapters.base import BaseAdapter
+    from core.models.signals import Signal
+    from core.models.test_results import TestResults
+    from core.reporting.document import ReportExtension
+
+ENTRY_POINT_GROUP = "readiness.adapters"
+EXTENSION_KEY = "adapter_signals"
+SECTION_TITLE = "Adapter Signals (optional)"
+
+
+@dataclass(frozen=True, slots=True)
+class AdapterSpec:
+    name: str
+    target: str  # "module:Class", imported on first use
+    artifacts: tuple[str, ...] = ()  # artifact kinds passed to extract_signals()
+    requires_results: bool = False  # needs the multi-run TestResults history
+
+    def accepts(self, artifacts: Mapping[str, Any], *, has_results: bool) -> bool:
+        if self.requires_results and not has_results:
+            return False
+        if not self.artifacts:
+            return self.requires_results
+        return any(artifacts.get(kind) is not None for kind in self.artifacts)
+
+    def load(self) -> type[BaseAdapter]:
+        from adapters.base import BaseAdapter
+
+        module_name, _, attr = self.target.partition(":")
+        try:
+            cls = getattr(importlib.import_module(module_name), attr)
+        except (ImportError, AttributeError) as e:
+            raise ValidationError(f"Adapter '{self.name}': cannot import {self.target} ({e})") from e
+        if not (isinstance(cls, type) and issubclass(cls, BaseAdapter)):
+            raise ValidationError(f"Adapter '{self.name}': {self.target} is not a BaseAdapter subclass")
+        return cls
+
+    def create(self) -> BaseAdapter:
+        return self.load()()
+
+
+BUILTIN_ADAPTERS: tuple[AdapterSpec, ...] = (
+    AdapterSpec("generic", "adapters.generic.signal_extractor:GenericAdapter", requires_results=True),
+    AdapterSpec(
+        "ai_agent",
+        "adapters.ai_agent.signal_extractor:AIAgentAdapter",
+        artifacts=("conversations", "intents", "flows"),
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AdapterOutput:
+    name: str
+    signals: list[Signal]
+
+
+class AdapterRegistry:
+    """
+    Specs by name, in registration order. Adapter instances are created on first
+    selection and reused, so analyzer settings (e.g. worker counts) can be tuned on them.
+    `adapter_workers` is set on every created adapter that has a `workers` setting
+    (AIAgentAdapter: processes per JSONL artifact).
+    """
+
+    def __init__(self, specs: Iterable[AdapterSpec] = BUILTIN_ADAPTERS, *, adapter_workers: int = 1):
+        self.adapter_workers = max(1, adapter_workers)
+        self._specs: dict[str, AdapterSpec] = {}
+        self._instances: dict[str, BaseAdapter] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    @property
+    def specs(self) -> list[AdapterSpec]:
+        return list(self._specs.values())
+
+    @property
+    def artifact_kinds(self) -> set[str]:
+        return {kind for spec in self._specs.values() for kind in spec.artifacts}
+
+    def register(self, spec: AdapterSpec, *, replace: bool = False) -> None:
+        if spec.name in self._specs and not replace:
+            raise ValidationError(f"Adapter '{spec.name}' is already registered")
+        self._specs[spec.name] = spec
+        self._instances.pop(spec.name, None)
+
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> list[AdapterSpec]:
+        """Register the specs published by installed packages under `group`."""
+        from importlib.metadata import entry_points
+
+        found: list[AdapterSpec] = []
+        for ep in entry_points(group=group):
+            try:
+                spec = ep.load()
+            except Exception as e:  # plugin code can raise anything on import; report which plugin
+                raise ValidationError(f"Adapter entry point '{ep.name}': cannot load {ep.value} ({e})") from e
+            if not isinstance(spec, AdapterSpec):
+                raise ValidationError(f"Adapter entry point '{ep.name}': {ep.value} is not an AdapterSpec")
+            self.register(spec)
+            found.append(spec)
+        return found
+
+    def adapter(self, name: str) -> BaseAdapter:
+        instance = self._instances.get(name)
+        if instance is None:
+            spec = self._specs.get(name)
+            if spec is None:
+                raise ValidationError(f"Unknown adapter '{name}'")
+            instance = self._instances[name] = spec.create()
+            if hasattr(instance, "workers"):
+                instance.workers = self.adapter_workers
+        return instance
+
+    def select(self, artifacts: Mapping[str, Any], *, has_results: bool = False) -> list[AdapterSpec]:
+        """Specs to run for these artifacts; unknown artifact kinds are an error."""
+        unknown = sorted(set(artifacts) - self.artifact_kinds)
+        if unknown:
+            raise ValidationError(
+                f"No adapter consumes artifact kind(s) {', '.join(unknown)} "
+                f"(known: {', '.join(sorted(self.artifact_kinds)) or 'none'})"
+            )
+        return [spec for spec in self._specs.values() if spec.accepts(artifacts, has_results=has_results)]
+
+    def run(
+        self,
+        artifacts: Mapping[str, Any],
+        test_results: TestResults | None = None,
+        *,
+        workers: int = 1,
+    ) -> list[AdapterOutput]:
+        """
+        Run every selected adapter, each on its own artifact kinds only. Adapters are
+        independent, so with `workers` > 1 they run concurrently on threads; outputs keep
+        registration order either way.
+        """
+        specs = self.select(artifacts, has_results=test_results is not None)
+        if workers > 1 and len(specs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(specs)), thread_name_prefix="readiness-adapter") as pool:
+                futures = [pool.submit(self._run_one, spec, artifacts, test_results) for spec in specs]
+                return [f.result() for f in futures]
+        return [self._run_one(spec, artifacts, test_results) for spec in specs]
+
+    def _run_one(
+        self, spec: AdapterSpec, artifacts: Mapping[str, Any], test_results: TestResults | None
+    ) -> AdapterOutput:
+        own = {kind: artifacts[kind] for kind in spec.artifacts if artifacts.get(kind) is not None}
+        signals = self.adapter(spec.name).extract_signals(test_results, own or None)
+        return AdapterOutput(spec.name, list(signals))
+
+
+def default_registry(*, adapter_workers: int = 1) -> AdapterRegistry:
+    """Built-in adapters plus those published through entry points."""
+    registry = AdapterRegistry(adapter_workers=adapter_workers)
+    registry.discover()
+    return registry
+
+
+def load_artifact(path: str | Path) -> Any:
+    """
+    Artifact records from a file: `.jsonl` is streamed lazily (JsonlSource), anything
+    else is read as one JSON document: a list of record objects, or a single object, which
+    is one record (ValueError otherwise).
+    """
+    p = Path(path)
+    if p.suffix == ".jsonl":
+        from adapters.ai_agent.sources import JsonlSource
+
+        if not p.is_file():
+            raise IngestionError(f"Artifact '{p}': file not found")
+        return JsonlSource(str(p))
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except FileNotFoundError as e:
+        raise IngestionError(f"Artifact '{p}': file not found") from e
+    except (OSError, json.JSONDecodeError) as e:
+        raise IngestionError(f"Artifact '{p}': unable to read ({e})") from e
+    if isinstance(data, list):
+        for i, record in enumerate(data):
+            if not isinstance(record, dict):
+                raise ValueError(f"Artifact '{p}': record {i} is {type(record).__name__}, expected an object")
+    elif isinstance(data, dict):
+        data = [data]
+    else:
+        raise ValueError(f"Artifact '{p}': expected a list of records or an object, got {type(data).__name__}")
+    return data
+
+
+def signals_extension(outputs: list[AdapterOutput], *, max_items: int = DEFAULT_EVIDENCE_ITEMS) -> ReportExtension:
+    """
+    Adapter signals as an advisory report section (does not change the core score).
+    Evidence is rendered here, with list-valued evidence capped to `max_items` entries.
+    """
+    from core.reporting.document import ReportExtension
+
+    lines = [f"## {SECTION_TITLE}", "", "_Advisory only: does not modify the deterministic core readiness score._", ""]
+    lines.append("| Adapter | Signal | Type | Value | Description |")
+    lines.append("|---|---|---|---:|---|")
+    for out in outputs:
+        for s in out.signals:
+            lines.append(f"| {out.name} | {s.name} | {s.signal_type.value} | {s.value:.1f} | {s.description} |")
+    if not any(out.signals for out in outputs):
+        lines.append("| — | — | — | — | No signals (artifacts were empty) |")
+    return ReportExtension(
+        key=EXTENSION_KEY,
+        title=SECTION_TITLE,
+        markdown="\n".join(lines) + "\n",
+        data={
+            "advisory_only": True,
+            "adapters": [
+                {
+                    "name": out.name,
+                    "signals": [
+                        {
+                            "type": s.signal_type.value,
+                            "name": s.name,
+                            "value": s.value,
+                            "description": s.description,
+                            "evidence": s.render_evidence(max_items),
+                            "metadata": dict(s.metadata or {}),
+                        }
+                        for s in out.signals
+                    ],
+                }
+                for out in outputs
+            ],
+        },
+    )
@@ -0,0 +1 @@
+"""Developer benchmarks (not shipped with the package)."""
@@ -0,0 +1,105 @@
+"""
+Pipeline benchmark suite.
+
+  python -m benchmarks                                   # sizes 1e3,1e4,1e5
+  python -m benchmarks --sizes 1e3,1e6 --stages load_junit,normalize
+  python -m benchmarks --save-baseline benchmarks/baseline.json
+  python -m benchmarks --baseline benchmarks/baseline.json --tolerance 0.25   # exit 1 on slowdown
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.baseline import compare_to_baseline, load_baseline, save_baseline
+from benchmarks.harness import STAGES, BenchResult, run_suite
+
+
+def parse_sizes(value: str) -> list[int]:
+    """'1e3,10000,1e7' -> [1000, 10000, 10000000]."""
+    sizes: list[int] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            n = int(float(part))
+        except ValueError as e:
+            raise ValueError(f"invalid size '{part}'") from e
+        if n < 1:
+            raise ValueError(f"size must be >= 1 (got '{part}')")
+        sizes.append(n)
+    if not sizes:
+        raise ValueError("no sizes given")
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description="Synthetic-data benchmarks per pipeline stage.")
+    p.add_argument("--sizes", default="1e3,1e4,1e5", help="Comma-separated record counts (default: 1e3,1e4,1e5).")
+    p.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated stages (default: all: {', '.join(STAGES)}).")
+    p.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best is kept (default: 3).")
+    p.add_argument("--shards", type=int, default=4, help="JUnit shard files per size (default: 4).")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0).")
+    p.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run.")
+    p.add_argument("--workdir", default=None, help="Keep generated inputs here (default: a temp dir, removed after).")
+    p.add_argument("--json", default=None, help="Write results as JSON to this path.")
+    p.add_argument("--save-baseline", default=None, help="Store results as the new baseline at this path.")
+    p.add_argument("--baseline", default=None, help="Compare against a stored baseline; exit 1 on regressions.")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (default: 0.25 = 25%%).")
+    args = p.parse_args(argv)
+
+    try:
+        sizes = parse_sizes(args.sizes)
+    except ValueError as e:
+        raise SystemExit(f"--sizes: {e}") from e
+    stages = tuple(s.strip() for s in args.stages.split(",") if s.strip())
+
+    def _print(r: BenchResult) -> None:
+        peak = f"{r.peak_kib / 1024:.1f}" if r.peak_kib is not None else "-"
+        print(f"{r.name:<24} {r.records:>10} {r.seconds * 1000:>12.2f} {r.records_per_sec:>14,.0f} {peak:>10}", flush=True)
+
+    print(f"{'stage':<24} {'records':>10} {'best ms':>12} {'records/s':>14} {'peak MiB':>10}")
+    try:
+        if args.workdir:
+            results = _run(sizes, stages, args, Path(args.workdir), _print)
+        else:
+            with tempfile.TemporaryDirectory(prefix="readiness-bench-") as tmp:
+                results = _run(sizes, stages, args, Path(tmp), _print)
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
+
+    if args.json:
+        Path(args.json).write_text(json.dumps([r.to_dict() for r in results], indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        print(f"Baseline saved to: {save_baseline(args.save_baseline, results)}")
+    if args.baseline:
+        regressions = compare_to_baseline(results, load_baseline(args.baseline), tolerance=args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:", file=sys.stderr)
+            for reg in regressions:
+                print(f"  {reg.describe()}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%} vs {args.baseline}.")
+    return 0
+
+
+def _run(sizes, stages, args, workdir: Path, on_result) -> list[BenchResult]:
+    return run_suite(
+        sizes,
+        workdir=workdir,
+        stages=stages,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        shards=args.shards,
+        seed=args.seed,
+        on_result=on_result,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Stored benchmark baselines and slowdown detection."""
+
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.harness import BenchResult
+
+BASELINE_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    records: int
+    metric: str  # "seconds" | "peak_kib"
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def describe(self) -> str:
+        return (
+            f"{self.name} @ {self.records}: {self.metric} {self.baseline:.6g} -> {self.current:.6g} "
+            f"({(self.ratio - 1) * 100:+.1f}%)"
+        )
+
+
+def save_baseline(path: str | Path, results: list[BenchResult]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "python": sys.version.split()[0],
+        "results": [r.to_dict() for r in results],
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load_baseline(path: str | Path) -> dict[tuple[str, int], BenchResult]:
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if raw.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        raise ValueError(f"Baseline '{path}': unsupported schema_version {raw.get('schema_version')!r}")
+    out: dict[tuple[str, int], BenchResult] = {}
+    for r in raw.get("results", []):
+        result = BenchResult(
+            name=str(r["name"]),
+            records=int(r["records"]),
+            seconds=float(r["seconds"]),
+            peak_kib=float(r["peak_kib"]) if r.get("peak_kib") is not None else None,
+        )
+        out[(result.name, result.records)] = result
+    return out
+
+
+def compare_to_baseline(
+    results: list[BenchResult],
+    baseline: dict[tuple[str, int], BenchResult],
+    *,
+    tolerance: float = 0.25,
+    memory_tolerance: float | None = None,
+    min_seconds: float = 0.01,
+) -> list[Regression]:
+    """
+    Flag stages that got slower (or allocate more) than `baseline` by more than the tolerance.
+
+    Stages not present in the baseline are ignored. Timings below `min_seconds` in both runs
+    are too noisy to compare and are skipped.
+    """
+    memory_tolerance = tolerance if memory_tolerance is None else memory_tolerance
+    regressions: list[Regression] = []
+    for r in results:
+        b = baseline.get((r.name, r.records))
+        if b is None:
+            continue
+        if max(r.seconds, b.seconds) >= min_seconds and r.seconds > b.seconds * (1 + tolerance):
+            regressions.append(Regression(r.name, r.records, "seconds", b.seconds, r.seconds))
+        if r.peak_kib is not None and b.peak_kib is not None and r.peak_kib > b.peak_kib * (1 + memory_tolerance):
+            regressions.append(Regression(r.name, r.records, "peak_kib", b.peak_kib, r.peak_kib))
+    return regressions
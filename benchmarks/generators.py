@@ -0,0 +1,129 @@
+"""
+Deterministic synthetic inputs (case CSV, multi-shard JUnit XML, LLM transcripts).
+
+Every generator is seeded and streams to disk row by row, so 10^7-record inputs never
+exist in memory as a whole; the same (size, seed) always produces byte-identical files.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+COMPONENTS = ("auth", "payments", "support", "search", "catalog", "checkout", "profile", "notifications")
+PRIORITIES = ("high", "medium", "low", "")
+LABELS = ("summary_ok", "json_ok", "json_missing_fields", "refusal", "tool_error", "handoff")
+TOOLS = ("compute_metrics", "fetch_artifacts", "lookup_order", "search_kb")
+
+# Share of generated results whose id is not in the catalog (exercises the unmapped path).
+UNMAPPED_SHARE = 0.02
+
+
+def case_id(i: int) -> str:
+    return f"TC-{i:07d}"
+
+
+def write_cases_csv(path: str | Path, n: int, *, seed: int = 0) -> Path:
+    """Case catalog with ids TC-0000001..TC-<n>."""
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["id", "title", "description", "priority", "component"])
+        for i in range(1, n + 1):
+            component = rng.choice(COMPONENTS)
+            w.writerow(
+                [
+                    case_id(i),
+                    f"{component} scenario {i}",
+                    f"Synthetic case {i} for {component}.",
+                    rng.choice(PRIORITIES),
+                    component,
+                ]
+            )
+    return path
+
+
+def write_junit_shards(
+    directory: str | Path,
+    n_results: int,
+    *,
+    catalog_size: int | None = None,
+    shards: int = 1,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    `n_results` testcases split round-robin over `shards` files (shard-000.xml, ...).
+
+    Status mix is roughly 85% passed / 10% failed / 5% skipped; UNMAPPED_SHARE of results
+    reference ids outside the catalog.
+    """
+    rng = random.Random(seed)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    catalog_size = catalog_size or n_results
+    shards = max(1, min(shards, max(1, n_results)))
+
+    paths = [directory / f"shard-{k:03d}.xml" for k in range(shards)]
+    files = [p.open("w", encoding="utf-8") for p in paths]
+    try:
+        for k, f in enumerate(files):
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(f'<testsuite name="synthetic-{k:03d}">\n')
+        for i in range(n_results):
+            if rng.random() < UNMAPPED_SHARE:
+                tc = f"TC-{9_000_000 + i:07d}"
+            else:
+                tc = case_id(rng.randint(1, catalog_size))
+            name = quoteattr(f"{tc} test_synthetic_{i}")
+            duration = f"{rng.expovariate(2.0):.3f}"
+            roll = rng.random()
+            f = files[i % shards]
+            if roll < 0.85:
+                f.write(f'  <testcase classname="synthetic" name={name} time="{duration}" />\n')
+            elif roll < 0.95:
+                f.write(f'  <testcase classname="synthetic" name={name} time="{duration}">\n')
+                f.write('    <failure message="assertion failed">synthetic failure</failure>\n')
+                f.write("  </testcase>\n")
+            else:
+                f.write(f'  <testcase classname="synthetic" name={name} time="0.000">\n')
+                f.write("    <skipped />\n")
+                f.write("  </testcase>\n")
+        for f in files:
+            f.write("</testsuite>\n")
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def write_transcript(path: str | Path, n_turns: int, *, seed: int = 0) -> Path:
+    """
+    Transcript JSON ({"turns": [...]}) with repeated prompts, refusals, schema errors and tool calls.
+    """
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    prompts = max(1, n_turns // 4)  # ~4 turns per distinct prompt -> label variability
+    with path.open("w", encoding="utf-8") as f:
+        f.write('{"turns": [\n')
+        for i in range(n_turns):
+            turn: dict = {
+                "user_text": f"Synthetic prompt {rng.randrange(prompts)}",
+                "assistant_text": f"Synthetic answer {i}" if rng.random() > 0.01 else "",
+                "assistant_label": rng.choice(LABELS),
+                "expected_schema_valid": rng.random() > 0.05,
+                "refusal": rng.random() < 0.03,
+            }
+            if rng.random() < 0.3:
+                turn["tool_calls"] = [
+                    {"name": rng.choice(TOOLS), "status": "error" if rng.random() < 0.1 else "ok"}
+                    for _ in range(rng.randint(1, 3))
+                ]
+            f.write(("  " if i == 0 else ",\n  ") + json.dumps(turn, sort_keys=True))
+        f.write("\n]}\n")
+    return path
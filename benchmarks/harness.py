@@ -0,0 +1,172 @@
+"""
+Stdlib-timed benchmark harness for the pipeline stages.
+
+Each stage is timed best-of-`repeat` with perf_counter (tracemalloc off), then run once more
+under tracemalloc for its peak allocation. Inputs are produced by benchmarks.generators and
+cached per (size, seed) in a work directory.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.generators import write_cases_csv, write_junit_shards, write_transcript
+
+STAGES = (
+    "load_csv",
+    "load_junit",
+    "normalize",
+    "compute_metrics",
+    "load_transcript",
+    "extractors",
+    "signals_from_transcript",
+    "compare_signals",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    name: str
+    records: int
+    seconds: float  # best of `repeat`
+    peak_kib: float | None = None
+
+    @property
+    def records_per_sec(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "records": self.records,
+            "seconds": self.seconds,
+            "records_per_sec": self.records_per_sec,
+            "peak_kib": self.peak_kib,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchInputs:
+    cases_csv: Path
+    junit_shards: list[Path]
+    transcript: Path
+    baseline_transcript: Path
+
+
+def prepare_inputs(workdir: str | Path, size: int, *, shards: int = 4, seed: int = 0) -> BenchInputs:
+    """Generate (or reuse) the inputs for one size under `workdir/n<size>-s<seed>/`."""
+    base = Path(workdir) / f"n{size}-s{seed}"
+    marker = base / ".complete"
+    cases = base / "cases.csv"
+    junit_dir = base / "junit"
+    transcript = base / "transcript.json"
+    baseline = base / "baseline_transcript.json"
+
+    if not marker.is_file():
+        write_cases_csv(cases, size, seed=seed)
+        write_junit_shards(junit_dir, size, catalog_size=size, shards=shards, seed=seed + 1)
+        write_transcript(transcript, size, seed=seed + 2)
+        write_transcript(baseline, size, seed=seed + 3)
+        marker.write_text("ok\n", encoding="utf-8")
+
+    return BenchInputs(
+        cases_csv=cases,
+        junit_shards=sorted(junit_dir.glob("shard-*.xml")),
+        transcript=transcript,
+        baseline_transcript=baseline,
+    )
+
+
+def measure(name: str, records: int, fn: Callable[[], Any], *, repeat: int = 3, memory: bool = True) -> BenchResult:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+
+    peak_kib = None
+    if memory:
+        import tracemalloc
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            peak_kib = tracemalloc.get_traced_memory()[1] / 1024.0
+        finally:
+            tracemalloc.stop()
+
+    return BenchResult(name=name, records=records, seconds=best, peak_kib=peak_kib)
+
+
+def run_suite(
+    sizes: list[int],
+    *,
+    workdir: str | Path,
+    stages: tuple[str, ...] = STAGES,
+    repeat: int = 3,
+    memory: bool = True,
+    shards: int = 4,
+    seed: int = 0,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    """
+    Benchmark every selected stage at every size. Later stages reuse earlier stages' outputs
+    (parsed dicts, normalized data, transcripts) as their inputs, outside the timed region.
+    """
+    from adapters.llm_readiness.drift import compare_signals, signals_from_transcript
+    from adapters.llm_readiness.extractors import extract_all_signals
+    from adapters.llm_readiness.load_transcript import load_transcript
+    from core.models.normalizer import normalize
+    from core.parsers.csv_loader import load_test_cases_csv
+    from core.parsers.junit_loader import load_junit_results
+    from core.scoring.scorer import compute_metrics
+
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark stage(s): {sorted(unknown)} (expected: {', '.join(STAGES)})")
+
+    results: list[BenchResult] = []
+
+    def _add(result: BenchResult) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    for size in sizes:
+        inputs = prepare_inputs(workdir, size, shards=shards, seed=seed)
+
+        def _load_junit() -> list[dict]:
+            out: list[dict] = []
+            for p in inputs.junit_shards:
+                out.extend(load_junit_results(str(p)))
+            return out
+
+        case_dicts = load_test_cases_csv(str(inputs.cases_csv))
+        result_dicts = _load_junit()
+        data = normalize(case_dicts, result_dicts)
+        transcript = load_transcript(str(inputs.transcript))
+        current = signals_from_transcript(transcript)
+        baseline = signals_from_transcript(load_transcript(str(inputs.baseline_transcript)))
+
+        benches: dict[str, Callable[[], Any]] = {
+            "load_csv": lambda: load_test_cases_csv(str(inputs.cases_csv)),
+            "load_junit": _load_junit,
+            "normalize": lambda: normalize(case_dicts, result_dicts),
+            "compute_metrics": lambda: compute_metrics(data),
+            "load_transcript": lambda: load_transcript(str(inputs.transcript)),
+            "extractors": lambda: extract_all_signals(transcript),
+            "signals_from_transcript": lambda: signals_from_transcript(transcript),
+            "compare_signals": lambda: compare_signals(baseline, current),
+        }
+        for name in stages:
+            _add(measure(name, size, benches[name], repeat=repeat, memory=memory))
+
+        del case_dicts, result_dicts, data, transcript
+
+    return results
@@ -0,0 +1,133 @@
+"""
+Import-time and cold-start benchmark for the CLI.
+
+  python -m benchmarks.importtime                      # profile `cli.main --demo`
+  python -m benchmarks.importtime --top 15 --repeat 5
+  python -m benchmarks.importtime --budget 0.5         # exit 1 if best cold start > 0.5s
+  python -m benchmarks.importtime -- --cases samples/test_cases.csv --junit samples/junit.xml
+
+Import costs come from `python -X importtime`; cold start is the wall time of a fresh
+interpreter running the CLI end to end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """
+    Parse `-X importtime` lines ("import time: self [us] | cumulative | imported package").
+    Other stderr lines are ignored.
+    """
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=(len(name) - len(stripped)) // 2,
+            )
+        )
+    return timings
+
+
+def cli_command(cli_args: list[str], out_dir: Path) -> list[str]:
+    """`python -m cli.main` with the given args (default: --demo into `out_dir`)."""
+    args = cli_args or ["--demo"]
+    if "--out" not in args:
+        args = [*args, "--out", str(out_dir / "report.md")]
+    return [sys.executable, "-m", "cli.main", *args]
+
+
+def measure_imports(cli_args: list[str] | None = None) -> list[ImportTiming]:
+    with tempfile.TemporaryDirectory() as tmp:
+        cmd = cli_command(cli_args or [], Path(tmp))
+        proc = subprocess.run(
+            [cmd[0], "-X", "importtime", *cmd[1:]],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return parse_importtime(proc.stderr)
+
+
+def measure_cold_start(cli_args: list[str] | None = None, *, repeat: int = 5) -> list[float]:
+    """Wall time (seconds) of `repeat` fresh CLI runs."""
+    samples: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cmd = cli_command(cli_args or [], Path(tmp))
+        for _ in range(repeat):
+            started = time.perf_counter()
+            subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, check=True)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def measure_interpreter_start(*, repeat: int = 5) -> list[float]:
+    """Wall time (seconds) of `repeat` fresh interpreters doing nothing (`python -c pass`)."""
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], cwd=REPO_ROOT, capture_output=True, check=True)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Import-time / cold-start benchmark for `python -m cli.main`.")
+    p.add_argument("--top", type=int, default=20, help="Show the N most expensive imports (cumulative).")
+    p.add_argument("--repeat", type=int, default=5, help="Cold-start runs to time.")
+    p.add_argument("--budget", type=float, default=None, help="Fail (exit 1) if the best cold start exceeds SECONDS.")
+    p.add_argument("cli_args", nargs="*", help="CLI arguments after `--` (default: --demo).")
+    args = p.parse_args(argv)
+
+    timings = measure_imports(args.cli_args)
+    total_us = sum(t.self_us for t in timings)
+    print(f"{'cumulative ms':>13} {'self ms':>8}  module")
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[: args.top]:
+        print(f"{t.cumulative_us / 1000:>13.1f} {t.self_us / 1000:>8.1f}  {t.module}")
+    print(f"\n{len(timings)} modules imported, {total_us / 1000:.1f} ms total import time")
+
+    samples = measure_cold_start(args.cli_args, repeat=max(1, args.repeat))
+    best = min(samples)
+    print(f"Cold start: best={best:.3f}s median={statistics.median(samples):.3f}s ({len(samples)} runs)")
+
+    if args.budget is not None and best > args.budget:
+        print(f"Cold start {best:.3f}s exceeds budget {args.budget:.3f}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,310 @@
+"""Manifest-driven batch mode: many readiness runs in one process with shared, parse-once inputs."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from adapters.llm_readiness.drift import LlmSignals, analyze_transcript, compare_signals
+from adapters.llm_readiness.reporting import stability_extension
+from cli._defaults import DEFAULT_MAX_WORKERS
+from cli._pipeline import output_paths, run_normalized
+from core.models.errors import IngestionError, ValidationError
+from core.models.normalized import NormalizedData
+from core.models.normalizer import normalize_results, normalize_test_cases
+from core.models.test_case import TestCaseModel
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results
+from core.reporting.details import DEFAULT_TOP_N, SIDECAR_NAMES, sidecar_path_for
+from core.reporting.exporter import ExportOptions, final_path
+
+if TYPE_CHECKING:
+    from core.history.store import HistoryStore
+    from core.scoring.policy import ScoringPolicy
+
+_ENTRY_KEYS = {"name", "cases", "junit", "transcript", "baseline", "out"}
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    name: str
+    cases: Path
+    junit: Path
+    out: Path
+    transcript: Path | None = None
+    baseline: Path | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOutcome:
+    entry: ManifestEntry
+    ok: bool
+    score: int | None = None
+    risk_level: str | None = None
+    recommendation: str | None = None
+    error: str | None = None
+
+
+def load_manifest(
+    path: str | Path,
+    *,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+) -> list[ManifestEntry]:
+    """
+    Load a batch manifest (JSON).
+
+    Shape:
+      {
+        "defaults": {"cases": "catalog.csv", "baseline": "golden.json"},   # optional
+        "runs": [
+          {"name": "svc-a", "junit": "svc-a/junit.xml", "out": "reports/svc-a.md", "transcript": "..."},
+          ...
+        ]
+      }
+    A bare list of runs is accepted as well. Relative paths resolve against the manifest directory.
+    Each run needs cases, junit and out (directly or via defaults). Two runs may not write the
+    same file: report paths for every format in `formats` and their sidecar CSVs are checked.
+    Run names (`name`, default: the out file stem) must be unique as well.
+    """
+    p = Path(path)
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+    except FileNotFoundError as e:
+        raise IngestionError(f"Manifest '{path}': file not found") from e
+    except OSError as e:
+        raise IngestionError(f"Manifest '{path}': unable to read file ({e})") from e
+    except json.JSONDecodeError as e:
+        raise IngestionError(f"Manifest '{path}': invalid JSON ({e})") from e
+
+    defaults: dict[str, Any] = {}
+    if isinstance(raw, list):
+        runs = raw
+    elif isinstance(raw, dict) and isinstance(raw.get("runs"), list):
+        runs = raw["runs"]
+        defaults = raw.get("defaults") or {}
+        if not isinstance(defaults, dict):
+            raise IngestionError(f"Manifest '{path}': 'defaults' must be an object")
+    else:
+        raise IngestionError(f"Manifest '{path}': expected a list of runs or an object with 'runs'")
+
+    base_dir = p.parent
+    entries: list[ManifestEntry] = []
+    seen_out: set[Path] = set()
+    seen_names: set[str] = set()
+    for idx, item in enumerate(runs, start=1):
+        if not isinstance(item, dict):
+            raise IngestionError(f"Manifest '{path}': run #{idx} must be an object")
+        unknown = set(item) - _ENTRY_KEYS
+        if unknown:
+            raise IngestionError(f"Manifest '{path}': run #{idx} has unknown keys: {sorted(unknown)}")
+
+        merged = {**defaults, **item}
+        for key in ("cases", "junit", "out"):
+            if not merged.get(key):
+                raise IngestionError(f"Manifest '{path}': run #{idx} is missing '{key}'")
+        if item.get("baseline") and not merged.get("transcript"):
+            raise IngestionError(f"Manifest '{path}': run #{idx} has 'baseline' without 'transcript'")
+
+        out = _resolve(base_dir, merged["out"])
+        # Every file the run writes: one report per format plus its sidecar CSVs.
+        try:
+            claimed = output_paths(out, formats, export)
+        except ValueError as e:
+            raise IngestionError(f"Manifest '{path}': run #{idx}: {e}") from e
+        claimed += [final_path(sidecar_path_for(out, name), export) for name in SIDECAR_NAMES]
+        clash = next((p for p in claimed if p in seen_out), None)
+        if clash is not None:
+            raise IngestionError(f"Manifest '{path}': run #{idx} reuses output path {clash}")
+        seen_out.update(claimed)
+
+        name = str(merged.get("name") or out.stem)
+        if name in seen_names:
+            raise IngestionError(
+                f"Manifest '{path}': run #{idx} reuses name '{name}' (runs are summarized and stored in "
+                "history by name); give each run a distinct 'name'"
+            )
+        seen_names.add(name)
+
+        entries.append(
+            ManifestEntry(
+                name=name,
+                cases=_resolve(base_dir, merged["cases"]),
+                junit=_resolve(base_dir, merged["junit"]),
+                out=out,
+                transcript=_resolve(base_dir, merged["transcript"]) if merged.get("transcript") else None,
+                # A default baseline only applies to runs that have a transcript.
+                baseline=(
+                    _resolve(base_dir, merged["baseline"])
+                    if merged.get("baseline") and merged.get("transcript")
+                    else None
+                ),
+            )
+        )
+
+    return entries
+
+
+class _SharedInputs:
+    """
+    Thread-safe parse-once cache keyed by (kind, resolved path).
+
+    The first caller parses; concurrent callers for the same key wait on the same future.
+    Parse errors are cached too, so every run referencing a broken file reports the same error.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[tuple[str, Path], Future] = {}
+        self.parse_count = 0
+
+    def get(self, kind: str, path: Path, loader: Callable[[Path], Any]) -> Any:
+        key = (kind, path.resolve())
+        with self._lock:
+            fut = self._futures.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._futures[key] = fut
+                self.parse_count += 1
+        if owner:
+            try:
+                fut.set_result(loader(path))
+            except BaseException as e:
+                fut.set_exception(e)
+        return fut.result()
+
+    def catalog(self, path: Path) -> dict[str, TestCaseModel]:
+        return self.get("cases", path, lambda p: normalize_test_cases(load_test_cases_csv(str(p))))
+
+    def transcript(self, path: Path) -> LlmSignals:
+        return self.get("transcript", path, lambda p: analyze_transcript(str(p)))
+
+
+def run_manifest(
+    manifest_path: str | Path,
+    *,
+    workers: int | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+) -> list[BatchOutcome]:
+    """
+    Run every manifest entry through the shared pipeline tail (cli._pipeline.run_normalized).
+
+    Catalog CSVs and transcripts referenced by several runs are parsed once. Runs execute on a
+    thread pool; a failing run is reported in its outcome and does not stop the batch.
+    Outcomes are returned in manifest order.
+    """
+    entries = load_manifest(manifest_path, formats=formats, export=export)
+    shared = _SharedInputs()
+    if workers is None:
+        workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    workers = max(1, workers)
+
+    def _run(entry: ManifestEntry) -> BatchOutcome:
+        try:
+            test_cases = shared.catalog(entry.cases)
+            results = normalize_results(load_junit_results(str(entry.junit)))
+            extensions = []
+            if entry.transcript is not None:
+                current = shared.transcript(entry.transcript)
+                drift = None
+                if entry.baseline is not None:
+                    drift = compare_signals(shared.transcript(entry.baseline), current)
+                extensions.append(stability_extension(current, drift))
+
+            doc = run_normalized(
+                NormalizedData(test_cases=test_cases, results=results),
+                entry.out,
+                extensions=extensions,
+                top_n=top_n,
+                formats=formats,
+                export=export,
+                policy=policy,
+                history=history,
+                history_name=entry.name,
+            )
+        except (IngestionError, ValidationError, ValueError, OSError) as e:
+            return BatchOutcome(entry=entry, ok=False, error=f"{type(e).__name__}: {e}")
+
+        score = doc.report.score
+        return BatchOutcome(
+            entry=entry,
+            ok=True,
+            score=int(score.overall_score),
+            risk_level=score.risk_level.value,
+            recommendation=score.recommendation.value,
+        )
+
+    if workers == 1:
+        return [_run(e) for e in entries]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="readiness-batch") as pool:
+        return list(pool.map(_run, entries))
+
+
+def summarize_outcomes(outcomes: list[BatchOutcome]) -> dict[str, Any]:
+    """
+    Aggregate batch outcomes (JSON-serializable).
+    """
+    ok = [o for o in outcomes if o.ok]
+    by_risk: dict[str, int] = {}
+    by_recommendation: dict[str, int] = {}
+    for o in ok:
+        by_risk[o.risk_level or ""] = by_risk.get(o.risk_level or "", 0) + 1
+        by_recommendation[o.recommendation or ""] = by_recommendation.get(o.recommendation or "", 0) + 1
+
+    scores = [o.score for o in ok if o.score is not None]
+    return {
+        "runs_total": len(outcomes),
+        "runs_ok": len(ok),
+        "runs_failed": len(outcomes) - len(ok),
+        "by_risk_level": dict(sorted(by_risk.items())),
+        "by_recommendation": dict(sorted(by_recommendation.items())),
+        "min_score": min(scores) if scores else None,
+        "mean_score": (sum(scores) / len(scores)) if scores else None,
+        "runs": [
+            {
+                "name": o.entry.name,
+                "out": str(o.entry.out),
+                "ok": o.ok,
+                "score": o.score,
+                "risk_level": o.risk_level,
+                "recommendation": o.recommendation,
+                "error": o.error,
+            }
+            for o in outcomes
+        ],
+    }
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    lines: list[str] = []
+    lines.append(f"{'run':<32} {'score':>5}  {'risk':<8} {'recommendation':<14}")
+    for r in summary["runs"]:
+        if r["ok"]:
+            lines.append(f"{r['name']:<32} {r['score']:>5}  {r['risk_level']:<8} {r['recommendation']:<14}")
+        else:
+            lines.append(f"{r['name']:<32} {'-':>5}  {'ERROR':<8} {r['error']}")
+    lines.append("")
+    lines.append(
+        f"Runs: {summary['runs_total']} total, {summary['runs_ok']} ok, {summary['runs_failed']} failed"
+    )
+    if summary["by_recommendation"]:
+        parts = ", ".join(f"{k}={v}" for k, v in summary["by_recommendation"].items())
+        lines.append(f"Recommendations: {parts}")
+    if summary["mean_score"] is not None:
+        lines.append(f"Score: min={summary['min_score']} mean={summary['mean_score']:.1f}")
+    return "\n".join(lines)
+
+
+def _resolve(base_dir: Path, value: Any) -> Path:
+    p = Path(str(value))
+    return p if p.is_absolute() else base_dir / p
@@ -0,0 +1,8 @@
+"""CLI defaults shared by argument parsing and the modes that use them (kept import-free)."""
+
+from __future__ import annotations
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_WORKERS = 8
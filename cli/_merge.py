@@ -0,0 +1,144 @@
+"""`merge` sub-command: combine shard summaries (see `partial`) into one readiness report."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cli._pipeline import output_paths, render_report
+from core.models.errors import IngestionError, ValidationError
+from core.models.readiness import build_readiness_report
+from core.reporting.details import (
+    DEFAULT_TOP_N,
+    FAILED_TESTS_COLUMNS,
+    DetailTable,
+    components_table_from_stats,
+    sidecar_path_for,
+)
+from core.reporting.document import ReportDocument, parse_formats
+from core.reporting.exporter import ExportOptions
+from core.scoring.federated import ShardSummary, load_summary, merge_summaries
+from core.scoring.subscores import coverage_only
+
+if TYPE_CHECKING:
+    from core.history.store import HistoryStore
+    from core.scoring.policy import ScoringPolicy
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="ai-agent-release-readiness-qa merge",
+        description="Merge shard summaries written by `partial` and render the readiness report.",
+    )
+    p.add_argument("summaries", nargs="+", metavar="SUMMARY", help="Shard summary files (.json or .json.gz).")
+    p.add_argument("--out", default="reports/report.md", help="Output report path (default: reports/report.md).")
+    p.add_argument("--format", default="md", help="Comma-separated output formats: md, json, html (default: md).")
+    p.add_argument(
+        "--top-n",
+        type=int,
+        default=DEFAULT_TOP_N,
+        help=f"Rows shown per detail table (default: {DEFAULT_TOP_N}).",
+    )
+    p.add_argument("--gzip", action="store_true", help="Write gzip-compressed outputs (<path>.gz).")
+    p.add_argument("--deterministic", action="store_true", help="Pin generated_at and skip unchanged outputs.")
+    p.add_argument("--policy", default=None, metavar="PATH", help="Scoring policy file (.toml or .json).")
+    p.add_argument("--history", default=None, metavar="DIR", help="Append the merged run to DIR/runs.jsonl.")
+    p.add_argument(
+        "--history-name",
+        default=None,
+        metavar="NAME",
+        help="Name the merged run is stored under in --history (default: the --out file stem).",
+    )
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.top_n < 0:
+        raise SystemExit("--top-n must be >= 0.")
+    try:
+        formats = parse_formats(args.format)
+    except ValueError as e:
+        raise SystemExit(f"--format: {e}") from e
+    export = ExportOptions(gzip_output=args.gzip, deterministic=args.deterministic)
+    if args.history_name is not None and not args.history:
+        raise SystemExit("--history-name requires --history.")
+    try:
+        output_paths(args.out, formats, export)
+    except ValueError as e:
+        raise SystemExit(f"--out: {e}") from e
+
+    policy = None
+    history = None
+    try:
+        if args.policy:
+            from core.scoring.policy import load_policy
+
+            policy = load_policy(args.policy)
+        if args.history:
+            from core.history.store import HistoryStore
+
+            history = HistoryStore(args.history)
+        summary = merge_summaries((load_summary(p) for p in args.summaries), top_n=args.top_n)
+    except (IngestionError, ValidationError) as e:
+        raise SystemExit(f"merge: {e}") from e
+
+    render_merged(
+        summary,
+        args.out,
+        top_n=args.top_n,
+        formats=formats,
+        export=export,
+        policy=policy,
+        history=history,
+        history_name=args.history_name,
+    )
+    for path in output_paths(args.out, formats, export):
+        print(f"OK: saved report to {path} ({len(summary.shards)} shard(s))")
+    return 0
+
+
+def render_merged(
+    summary: ShardSummary,
+    out_path: str | Path,
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+    history_name: str | None = None,
+) -> ReportDocument:
+    """
+    Merged summary -> build_readiness_report -> report document -> render each format.
+
+    Metrics, coverage and the Components table are exact; Failed Tests shows the rows the
+    shards kept (no sidecar). Summaries carry no per-test outcomes, so stability and
+    regression fall back to the overall score.
+    """
+    out_path = Path(out_path)
+    dimensions = coverage_only(
+        summary.executed_cases, summary.total_cases, "per-test outcomes are not kept in shard summaries"
+    )
+    report = build_readiness_report(summary.metrics(), policy=policy, dimensions=dimensions)
+    report.assumptions.append(f"Merged from {len(summary.shards)} shard summary file(s).")
+
+    details = [
+        DetailTable(
+            title="Failed Tests",
+            columns=FAILED_TESTS_COLUMNS,
+            rows=summary.failed_rows[:top_n],
+            total_rows=summary.failed_total,
+        ),
+        components_table_from_stats(
+            summary.components,
+            top_n=top_n,
+            sidecar_path=sidecar_path_for(out_path, "components"),
+            export=export,
+        ),
+    ]
+    doc = render_report(report, out_path, details=details, formats=formats, export=export)
+    if history is not None:
+        history.record_report(report, name=history_name or out_path.stem)
+    return doc
@@ -0,0 +1,55 @@
+"""`partial` sub-command: reduce one JUnit shard to a small shard summary file (see `merge`)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.normalizer import normalize_results, normalize_test_cases
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results
+from core.reporting.details import DEFAULT_TOP_N
+from core.reporting.exporter import ExportOptions, final_path, write_report
+from core.scoring.federated import summarize_shard
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="ai-agent-release-readiness-qa partial",
+        description="Reduce a JUnit shard to a shard summary (counts + sketches) for `merge`.",
+    )
+    p.add_argument("--cases", required=True, help="Path to the test cases CSV (same catalog on every node).")
+    p.add_argument("--junit", required=True, help="Path to the shard's JUnit XML.")
+    p.add_argument("--out", required=True, help="Output summary path (JSON).")
+    p.add_argument("--name", default=None, help="Shard name recorded in the summary (default: JUnit file name).")
+    p.add_argument(
+        "--top-n",
+        type=int,
+        default=DEFAULT_TOP_N,
+        help=f"Failed Tests rows kept in the summary (default: {DEFAULT_TOP_N}).",
+    )
+    p.add_argument("--gzip", action="store_true", help="Write a gzip-compressed summary (<path>.gz).")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.top_n < 0:
+        raise SystemExit("--top-n must be >= 0.")
+
+    try:
+        test_cases = normalize_test_cases(load_test_cases_csv(args.cases))
+        results = normalize_results(load_junit_results(args.junit))
+    except (IngestionError, ValidationError) as e:
+        raise SystemExit(f"partial: {e}") from e
+
+    summary = summarize_shard(test_cases, results, shard=args.name or Path(args.junit).name, top_n=args.top_n)
+    export = ExportOptions(gzip_output=args.gzip)
+    write_report(args.out, [json.dumps(summary.to_dict(), separators=(",", ":"), sort_keys=True) + "\n"], export)
+    print(
+        f"OK: saved shard summary to {final_path(args.out, export)} "
+        f"(results={summary.counts.total_results}, failed={summary.counts.failed})"
+    )
+    return 0
@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Mapping
 
-from adapters.llm_readiness.reporting import build_stability_section
+from cli._profile import StageProfiler, stage
+from core.models.errors import IngestionError
 from core.models.normalized import NormalizedData
-from core.models.normalizer import normalize
-from core.models.readiness import build_readiness_report
+from core.models.readiness import ReadinessReport, build_readiness_report
 from core.models.test_case import TestCaseModel
 from core.models.test_result import TestResultModel
-from core.parsers.csv_loader import load_test_cases_csv
-from core.parsers.junit_loader import load_junit_results
-from core.reporting.exporter import save_markdown_report
-from core.reporting.markdown_builder import build_markdown_report
-from core.scoring.scorer import compute_metrics
+from core.reporting.details import (
+    DEFAULT_TOP_N,
+    DetailTable,
+    build_detail_tables,
+    build_duration_regressions_table,
+    build_failure_clusters_table,
+    build_suggested_mappings_table,
+    sidecar_path_for,
+)
+from core.reporting.document import (
+    FORMAT_SUFFIXES,
+    ReportDocument,
+    ReportExtension,
+    build_report_document,
+    pinned_generated_at,
+)
+from core.reporting.exporter import ExportOptions, WriteResult, final_path, write_report
+from core.scoring.subscores import RunAggregate, compute_subscores, measure_run
+
+if TYPE_CHECKING:
+    from core.history.store import HistoryStore
+    from core.scoring.policy import ScoringPolicy
+
+# Parsers, renderers and the optional AI/LLM layer are imported where they are used, so a
+# run only loads what it needs (e.g. --demo never imports the XML parser or the drift code).
 
 
 def _build_demo_data() -> NormalizedData:
@@ -59,23 +81,41 @@ def run_demo(
     *,
     transcript_path: str | Path | None = None,
     baseline_transcript_path: str | Path | None = None,
+    artifact_paths: Mapping[str, str | Path] | None = None,
+    adapter_workers: int = 1,
+    top_n: int = DEFAULT_TOP_N,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    profiler: StageProfiler | None = None,
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+    history_name: str | None = None,
 ) -> Path:
     """
     Deterministic demo pipeline:
-      demo data -> compute_metrics -> build_readiness_report -> build_markdown_report -> save_markdown_report
+      demo data -> compute_metrics -> build_readiness_report -> report document -> render each format
+
+    With `history`, the run is stored under `history_name` (default: the `out_path` stem).
     """
     out_path = Path(out_path)
 
-    data = _build_demo_data()
-    metrics = compute_metrics(data)
-    report = build_readiness_report(metrics)
-    markdown = build_markdown_report(report)
-    markdown = _maybe_append_transcript_section(
-        markdown,
+    with stage(profiler, "demo_data"):
+        data = _build_demo_data()
+    _write_report(
+        data,
+        out_path,
         transcript_path=transcript_path,
         baseline_transcript_path=baseline_transcript_path,
+        artifact_paths=artifact_paths,
+        adapter_workers=adapter_workers,
+        top_n=top_n,
+        formats=formats,
+        export=export,
+        profiler=profiler,
+        policy=policy,
+        history=history,
+        history_name=history_name,
     )
-    save_markdown_report(str(out_path), markdown)
 
     return out_path
 
@@ -85,45 +125,359 @@ def run_from_files(
     cases_path: str | Path,
     junit_path: str | Path,
     out_path: str | Path,
+    aliases_path: str | Path | None = None,
+    catalog_index_path: str | Path | None = None,
     transcript_path: str | Path | None = None,
     baseline_transcript_path: str | Path | None = None,
+    artifact_paths: Mapping[str, str | Path] | None = None,
+    adapter_workers: int = 1,
+    top_n: int = DEFAULT_TOP_N,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    profiler: StageProfiler | None = None,
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+    history_name: str | None = None,
 ) -> Path:
     """
     Deterministic file-based pipeline:
-      parse CSV + JUnit -> normalize -> compute_metrics -> build_readiness_report -> build_markdown_report -> save_markdown_report
+      parse CSV + JUnit -> normalize -> compute_metrics -> build_readiness_report -> report document -> render each format
+
+    With `aliases_path`, unmapped results are re-pointed through the alias file first.
+    With `catalog_index_path`, the CSV is synced into that SQLite index (incrementally)
+    and only the cases the results refer to are loaded; see core.parsers.catalog_index.
+    With `history`, the run is stored under `history_name` (default: the `out_path` stem).
+    """
+    from core.models.normalizer import normalize_results, normalize_test_cases
+    from core.parsers.csv_loader import load_test_cases_csv
+    from core.parsers.junit_loader import load_junit_results
+
+    out_path = Path(out_path)
+
+    index = None
+    with stage(profiler, "load_csv"):
+        if catalog_index_path:
+            from core.parsers.catalog_index import CatalogIndex
+
+            index = CatalogIndex(catalog_index_path)
+            index.sync(cases_path)
+        else:
+            test_case_dicts = load_test_cases_csv(str(cases_path))
+    with stage(profiler, "load_junit"):
+        result_dicts = load_junit_results(str(junit_path))
+    with stage(profiler, "normalize"):
+        results = normalize_results(result_dicts)
+        if index is not None:
+            test_cases = index.for_run(r.id for r in results)
+        else:
+            test_cases = normalize_test_cases(test_case_dicts)
+        data = NormalizedData(test_cases=test_cases, results=results)
+        if aliases_path:
+            from core.mapping.aliases import apply_aliases, load_aliases
+
+            data = NormalizedData(
+                test_cases=data.test_cases,
+                results=apply_aliases(data.results, load_aliases(aliases_path), data.test_cases),
+            )
+
+    try:
+        _write_report(
+            data,
+            out_path,
+            transcript_path=transcript_path,
+            baseline_transcript_path=baseline_transcript_path,
+            artifact_paths=artifact_paths,
+            adapter_workers=adapter_workers,
+            top_n=top_n,
+            formats=formats,
+            export=export,
+            profiler=profiler,
+            policy=policy,
+            history=history,
+            history_name=history_name,
+        )
+    finally:
+        if index is not None:
+            index.close()
+
+    return out_path
+
+
+def output_paths(
+    out_path: str | Path,
+    formats: tuple[str, ...],
+    export: ExportOptions = ExportOptions(),
+) -> list[Path]:
+    """
+    Output file per format. Markdown keeps `out_path` as given; other formats swap the suffix
+    (reports/report.md -> reports/report.json, reports/report.html). Gzip output appends `.gz`.
+
+    Raises ValueError when two formats would be written to the same file
+    (e.g. `--out report.json --format md,json`).
+    """
+    out_path = Path(out_path)
+    paths = [out_path if fmt == "md" else out_path.with_suffix(FORMAT_SUFFIXES[fmt]) for fmt in formats]
+    by_path: dict[Path, str] = {}
+    for fmt, p in zip(formats, paths):
+        other = by_path.setdefault(p, fmt)
+        if other != fmt:
+            raise ValueError(f"formats '{other}' and '{fmt}' would both be written to {p}; use an --out path ending in .md")
+    return [final_path(p, export) for p in paths]
+
+
+@dataclass(frozen=True, slots=True)
+class ScoredRun:
+    """Everything score_normalized() computes: the report, its detail tables and the run's raw data."""
+
+    report: ReadinessReport
+    details: list[DetailTable]
+    run: RunAggregate
+    durations: dict[str, float] | None  # test id -> seconds; only with history
+
+
+def score_normalized(
+    data: NormalizedData,
+    *,
+    out_path: str | Path | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    export: ExportOptions = ExportOptions(),
+    profiler: StageProfiler | None = None,
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+    history_name: str | None = None,
+) -> ScoredRun:
+    """
+    Scoring half of the shared tail (already-normalized inputs):
+      compute_metrics + sub-scores -> build_readiness_report -> detail tables
+
+    Writes nothing but CSV sidecars next to `out_path`; without `out_path` the detail tables
+    keep their top rows only (the scoring service uses this). `history` is read, not updated.
+    """
+
+    def _sidecar(name: str) -> Path | None:
+        return sidecar_path_for(out_path, name) if out_path is not None else None
+
+    with stage(profiler, "compute_metrics"):
+        metrics, run = measure_run(data)
+    with stage(profiler, "subscores"):
+        dimensions = compute_subscores(run, history.index(history_name) if history is not None else None)
+    with stage(profiler, "build_readiness_report"):
+        report = build_readiness_report(metrics, policy=policy, dimensions=dimensions)
+    durations = None
+    with stage(profiler, "detail_tables"):
+        details = build_detail_tables(data, out_path=out_path, top_n=top_n, export=export)
+        if any(r.failure_text for r in data.results):
+            details.append(
+                build_failure_clusters_table(
+                    data, top_n=top_n, sidecar_path=_sidecar("failure_clusters"), export=export
+                )
+            )
+        if history is not None:
+            from core.history.durations import run_durations
+
+            durations = run_durations(data.results)
+            details.append(
+                build_duration_regressions_table(
+                    history.durations(history_name).regressions(durations),
+                    top_n=top_n,
+                    sidecar_path=_sidecar("duration_regressions"),
+                    export=export,
+                )
+            )
+        if metrics["unmapped_results"]:
+            details.append(
+                build_suggested_mappings_table(data, top_n=top_n, sidecar_path=_sidecar("aliases"), export=export)
+            )
+    return ScoredRun(report=report, details=details, run=run, durations=durations)
+
+
+def run_normalized(
+    data: NormalizedData,
+    out_path: str | Path,
+    *,
+    extensions: list[ReportExtension] | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    profiler: StageProfiler | None = None,
+    policy: ScoringPolicy | None = None,
+    history: HistoryStore | None = None,
+    history_name: str | None = None,
+) -> ReportDocument:
+    """
+    Shared tail of every pipeline (already-normalized inputs):
+      score_normalized (metrics, sub-scores, report, detail tables) -> report document -> render each format
+
+    Used directly by batch mode, where catalogs and transcripts are parsed once and reused.
+    With `history`, sub-scores use the runs stored under `history_name`, tests slower than
+    their duration baselines are reported, and this run is appended to the store afterwards.
     """
     out_path = Path(out_path)
 
-    test_case_dicts = load_test_cases_csv(str(cases_path))
-    result_dicts = load_junit_results(str(junit_path))
-    data = normalize(test_case_dicts, result_dicts)
+    scored = score_normalized(
+        data,
+        out_path=out_path,
+        top_n=top_n,
+        export=export,
+        profiler=profiler,
+        policy=policy,
+        history=history,
+        history_name=history_name,
+    )
+
+    extensions = list(extensions or [])
+    if profiler is not None and profiler.appendix:
+        extensions.append(profiler.extension())
+    doc = render_report(
+        scored.report,
+        out_path,
+        details=scored.details,
+        extensions=extensions,
+        formats=formats,
+        export=export,
+        profiler=profiler,
+    )
+    if history is not None:
+        history.record_report(scored.report, name=history_name, tests=scored.run.outcomes)
+        history.record_durations(scored.durations, name=history_name)
+    return doc
+
 
-    metrics = compute_metrics(data)
-    report = build_readiness_report(metrics)
-    markdown = build_markdown_report(report)
-    markdown = _maybe_append_transcript_section(
-        markdown,
+def render_report(
+    report: ReadinessReport,
+    out_path: str | Path,
+    *,
+    details: list[DetailTable] | None = None,
+    extensions: list[ReportExtension] | None = None,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    profiler: StageProfiler | None = None,
+) -> ReportDocument:
+    """
+    Build the report document once and write every selected format.
+    """
+    # Everything is computed once into the document; renderers only format it.
+    with stage(profiler, "build_document"):
+        doc = build_report_document(
+            report,
+            details=details or [],
+            extensions=extensions or [],
+            generated_at=pinned_generated_at() if export.deterministic else None,
+        )
+    _render_outputs(doc, Path(out_path), formats=formats, export=export, profiler=profiler)
+    return doc
+
+
+def _write_report(
+    data: NormalizedData,
+    out_path: Path,
+    *,
+    transcript_path: str | Path | None,
+    baseline_transcript_path: str | Path | None,
+    artifact_paths: Mapping[str, str | Path] | None,
+    adapter_workers: int,
+    top_n: int,
+    formats: tuple[str, ...],
+    export: ExportOptions,
+    profiler: StageProfiler | None,
+    policy: ScoringPolicy | None,
+    history: HistoryStore | None,
+    history_name: str | None,
+) -> ReportDocument:
+    extensions = _transcript_extensions(
         transcript_path=transcript_path,
         baseline_transcript_path=baseline_transcript_path,
+        profiler=profiler,
+    )
+    extensions += _adapter_extensions(
+        artifact_paths, adapter_workers=adapter_workers, max_items=top_n, profiler=profiler
+    )
+    return run_normalized(
+        data,
+        out_path,
+        extensions=extensions,
+        top_n=top_n,
+        formats=formats,
+        export=export,
+        profiler=profiler,
+        policy=policy,
+        history=history,
+        history_name=history_name or out_path.stem,
     )
-    save_markdown_report(str(out_path), markdown)
 
-    return out_path
 
+def _render_outputs(
+    doc: ReportDocument,
+    out_path: Path,
+    *,
+    formats: tuple[str, ...],
+    export: ExportOptions,
+    profiler: StageProfiler | None = None,
+) -> list[WriteResult]:
+    # Plain paths here: the writer appends `.gz` itself when gzip output is enabled.
+    results: list[WriteResult] = []
+    for fmt, path in zip(formats, output_paths(out_path, formats)):
+        with stage(profiler, f"render_{fmt}"):
+            if fmt == "md":
+                from core.reporting.markdown_builder import iter_markdown_document
+
+                results.append(write_report(str(path), iter_markdown_document(doc), export))
+            elif fmt == "json":
+                from core.reporting.json_builder import build_json_report
+
+                results.append(write_report(str(path), [build_json_report(doc)], export))
+            elif fmt == "html":
+                from core.reporting.html_builder import iter_html_document
+
+                results.append(write_report(str(path), iter_html_document(doc), export))
+    return results
 
-def _maybe_append_transcript_section(
-    markdown: str,
+
+def _transcript_extensions(
     *,
     transcript_path: str | Path | None,
     baseline_transcript_path: str | Path | None,
-) -> str:
+    profiler: StageProfiler | None = None,
+) -> list[ReportExtension]:
     if not transcript_path:
-        return markdown
+        return []
 
-    section = build_stability_section(
-        transcript_path=transcript_path,
-        baseline_transcript_path=baseline_transcript_path,
-    )
-    return markdown.rstrip() + "\n\n" + section.rstrip() + "\n"
+    # Same steps as adapters.llm_readiness.reporting.build_stability_extension, staged for profiling.
+    from adapters.llm_readiness.drift import analyze_transcript, compare_signals
+    from adapters.llm_readiness.reporting import stability_extension
+
+    with stage(profiler, "transcript_analysis"):
+        current = analyze_transcript(str(transcript_path))
+    drift = None
+    if baseline_transcript_path:
+        with stage(profiler, "baseline_transcript_analysis"):
+            baseline = analyze_transcript(str(baseline_transcript_path))
+        with stage(profiler, "drift"):
+            drift = compare_signals(baseline, current)
+    return [stability_extension(current, drift)]
+
+
+def _adapter_extensions(
+    artifact_paths: Mapping[str, str | Path] | None,
+    *,
+    adapter_workers: int = 1,
+    max_items: int = DEFAULT_TOP_N,
+    profiler: StageProfiler | None = None,
+) -> list[ReportExtension]:
+    if not artifact_paths:
+        return []
 
+    # Only runs with --artifact import the registry; it imports just the adapters selected.
+    from adapters.registry import default_registry, load_artifact, signals_extension
 
+    registry = default_registry(adapter_workers=adapter_workers)
+    with stage(profiler, "load_artifacts"):
+        artifacts = {}
+        for kind, path in artifact_paths.items():
+            try:
+                artifacts[kind] = load_artifact(path)
+            except ValueError as e:
+                raise IngestionError(str(e)) from e
+    with stage(profiler, "adapters"):
+        outputs = registry.run(artifacts, workers=len(artifacts))
+    return [signals_extension(outputs, max_items=max_items)]
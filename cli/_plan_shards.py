@@ -0,0 +1,133 @@
+"""`plan-shards` sub-command: split the case catalog into duration-balanced CI shards."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+from pathlib import Path
+from typing import Iterator, Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.normalizer import normalize_results, normalize_test_cases
+from core.models.test_case import TestCaseModel
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results
+from core.planning.shards import ShardPlan, estimate_durations, imbalance, plan_shards
+
+PLAN_COLUMNS = ("shard", "id", "component", "estimated_sec")
+DEFAULT_HISTORY_NAME = "report"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="ai-agent-release-readiness-qa plan-shards",
+        description="Split the case catalog into N shards of similar duration (LPT bin packing) "
+        "from current JUnit times and/or stored duration baselines.",
+    )
+    p.add_argument("--cases", required=True, help="Path to the test cases CSV.")
+    p.add_argument("--shards", type=int, required=True, help="Number of shards to plan.")
+    p.add_argument(
+        "--junit",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="JUnit XML of the current run, one file per current shard (repeatable). "
+        "Supplies current durations and the current imbalance.",
+    )
+    p.add_argument("--history", default=None, metavar="DIR", help="History directory with duration baselines.")
+    p.add_argument(
+        "--name",
+        default=DEFAULT_HISTORY_NAME,
+        help="History name whose baselines to use: the --history-name (else the --out file stem) of the "
+        f"--history runs, or the manifest run name (default: '{DEFAULT_HISTORY_NAME}', matching the default "
+        "--out reports/report.md).",
+    )
+    p.add_argument("--affinity", action="store_true", help="Keep each component on one shard where balance allows.")
+    p.add_argument(
+        "--default-sec",
+        type=float,
+        default=None,
+        help="Estimate for cases without any duration (default: median of the measured cases).",
+    )
+    p.add_argument("--out", default="reports/shard_plan.csv", help="Plan CSV (default: reports/shard_plan.csv).")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.shards < 1:
+        raise SystemExit("--shards must be >= 1.")
+    if args.default_sec is not None and args.default_sec < 0:
+        raise SystemExit("--default-sec must be >= 0.")
+
+    try:
+        test_cases = normalize_test_cases(load_test_cases_csv(args.cases))
+        current: dict[str, float] = {}
+        current_loads: list[float] = []
+        for path in args.junit:
+            load = 0.0
+            for r in normalize_results(load_junit_results(path)):
+                if r.duration_sec is not None:
+                    current[r.id] = r.duration_sec
+                    load += r.duration_sec
+            current_loads.append(load)
+        baselines = None
+        if args.history:
+            from core.history.store import HistoryStore
+
+            store = HistoryStore(args.history)
+            path = store.durations_path(args.name)
+            if not path.is_file():
+                raise SystemExit(
+                    f"plan-shards: no duration baselines for history name '{args.name}' ({path}); "
+                    "pass --name with the --history-name (or --out file stem) of the --history runs."
+                )
+            baselines = store.durations(args.name)
+        estimates, measured = estimate_durations(test_cases, current, baselines, default_sec=args.default_sec)
+        plan = plan_shards(test_cases, estimates, args.shards, affinity=args.affinity, measured=measured)
+    except (IngestionError, ValidationError) as e:
+        raise SystemExit(f"plan-shards: {e}") from e
+
+    from core.reporting.exporter import write_report
+
+    write_report(args.out, plan_csv(plan, test_cases))
+    print(format_plan_summary(plan, current_loads))
+    print(f"\nOK: saved plan for {len(test_cases)} cases to {Path(args.out)}")
+    return 0
+
+
+def format_plan_summary(plan: ShardPlan, current_loads: list[float]) -> str:
+    lines = [
+        f"Cases: {len(plan.estimates)} ({plan.estimated} with measured durations); "
+        f"estimated total: {plan.total_sec:.1f}s",
+    ]
+    if current_loads:
+        lines.append(
+            f"Current:   {len(current_loads)} shard(s), makespan {max(current_loads):.1f}s, "
+            f"imbalance {imbalance(current_loads):.2f}"
+        )
+    lines.append(
+        f"Planned:   {len(plan.shards)} shard(s), makespan {plan.makespan_sec:.1f}s, "
+        f"imbalance {plan.imbalance:.2f} (lower bound {plan.lower_bound_sec:.1f}s)"
+    )
+    if plan.split_components:
+        lines.append(f"Components split across shards: {plan.split_components}")
+    lines.append("")
+    lines.append(f"{'shard':>5} {'cases':>7} {'load_sec':>10}")
+    for s in plan.shards:
+        lines.append(f"{s.index:>5} {len(s.tests):>7} {s.load_sec:>10.1f}")
+    return "\n".join(lines)
+
+
+def plan_csv(plan: ShardPlan, test_cases: Mapping[str, TestCaseModel]) -> Iterator[str]:
+    """Plan rows (PLAN_COLUMNS), one chunk per shard."""
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator="\n")
+    w.writerow(PLAN_COLUMNS)
+    for s in plan.shards:
+        for case_id in s.tests:
+            w.writerow((s.index, case_id, test_cases[case_id].component or "", round(plan.estimates[case_id], 3)))
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
@@ -0,0 +1,169 @@
+"""Per-stage pipeline profiling: wall/CPU time, peak traced memory and optional cProfile dumps."""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+from core.reporting.document import ReportExtension
+from core.reporting.exporter import WriteResult, write_report
+
+PROFILE_SCHEMA_VERSION = 1
+EXTENSION_KEY = "profile"
+SECTION_TITLE = "Appendix: Pipeline Profile"
+
+
+@dataclass(frozen=True, slots=True)
+class StageTiming:
+    name: str
+    wall_ms: float
+    cpu_ms: float
+    peak_alloc_kib: float | None = None  # None when memory tracking is off
+    cprofile_path: str | None = None
+
+
+class StageProfiler:
+    """
+    Collects one StageTiming per pipeline stage (load CSV, load JUnit, normalize, ...).
+
+    Stages are flat (no nesting). With `track_memory`, tracemalloc runs for the profiler's
+    lifetime and each stage reports its peak allocation above the level at stage start;
+    tracing slows the run, so wall/CPU times are inflated relative to an unprofiled run.
+    With `cprofile_dir`, each stage is also run under cProfile and dumped to
+    `<dir>/<NN>-<stage>.prof` (open with `python -m pstats` or snakeviz).
+    """
+
+    def __init__(self, *, track_memory: bool = True, cprofile_dir: str | Path | None = None, appendix: bool = False):
+        self.track_memory = track_memory
+        self.cprofile_dir = Path(cprofile_dir) if cprofile_dir is not None else None
+        self.appendix = appendix
+        self.stages: list[StageTiming] = []
+        self._active: str | None = None
+        self._tracing_started = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self._active is not None:
+            raise RuntimeError(f"Profiler stage '{name}' started inside stage '{self._active}' (stages are flat)")
+        self._active = name
+
+        tracemalloc = None
+        if self.track_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing_started = True
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+
+        prof = None
+        if self.cprofile_dir is not None:
+            import cProfile
+
+            prof = cProfile.Profile()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            if prof is not None:
+                prof.enable()
+            try:
+                yield
+            finally:
+                if prof is not None:
+                    prof.disable()
+        finally:
+            wall_ms = (time.perf_counter() - wall_start) * 1000.0
+            cpu_ms = (time.process_time() - cpu_start) * 1000.0
+            peak_kib = None
+            if tracemalloc is not None:
+                peak_kib = max(0, tracemalloc.get_traced_memory()[1] - mem_start) / 1024.0
+            cprofile_path = None
+            if prof is not None:
+                cprofile_path = str(self._dump(prof, name))
+            self.stages.append(
+                StageTiming(
+                    name=name,
+                    wall_ms=wall_ms,
+                    cpu_ms=cpu_ms,
+                    peak_alloc_kib=peak_kib,
+                    cprofile_path=cprofile_path,
+                )
+            )
+            self._active = None
+
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._tracing_started:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._tracing_started = False
+
+    def to_dict(self) -> dict[str, Any]:
+        peaks = [s.peak_alloc_kib for s in self.stages if s.peak_alloc_kib is not None]
+        return {
+            "schema_version": PROFILE_SCHEMA_VERSION,
+            "python": sys.version.split()[0],
+            "memory_tracked": self.track_memory,
+            "stages": [
+                {
+                    "name": s.name,
+                    "wall_ms": round(s.wall_ms, 3),
+                    "cpu_ms": round(s.cpu_ms, 3),
+                    "peak_alloc_kib": round(s.peak_alloc_kib, 1) if s.peak_alloc_kib is not None else None,
+                    "cprofile": s.cprofile_path,
+                }
+                for s in self.stages
+            ],
+            "total": {
+                "wall_ms": round(sum(s.wall_ms for s in self.stages), 3),
+                "cpu_ms": round(sum(s.cpu_ms for s in self.stages), 3),
+                "max_stage_peak_alloc_kib": round(max(peaks), 1) if peaks else None,
+            },
+        }
+
+    def write_json(self, path: str | Path) -> WriteResult:
+        payload = json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n"
+        return write_report(str(path), [payload])
+
+    def extension(self) -> ReportExtension:
+        """
+        Report appendix with the stages recorded so far (rendering itself is only in the JSON).
+        """
+        lines: list[str] = []
+        lines.append(f"## {SECTION_TITLE}")
+        lines.append("")
+        lines.append("_Stages completed before rendering; see the profile JSON for the full run._")
+        lines.append("")
+        lines.append("| Stage | Wall (ms) | CPU (ms) | Peak alloc (KiB) |")
+        lines.append("|---|---:|---:|---:|")
+        for s in self.stages:
+            peak = f"{s.peak_alloc_kib:.1f}" if s.peak_alloc_kib is not None else "-"
+            lines.append(f"| `{s.name}` | {s.wall_ms:.2f} | {s.cpu_ms:.2f} | {peak} |")
+        return ReportExtension(
+            key=EXTENSION_KEY,
+            title=SECTION_TITLE,
+            markdown="\n".join(lines) + "\n",
+            data=self.to_dict(),
+        )
+
+    def _dump(self, prof: Any, name: str) -> Path:
+        assert self.cprofile_dir is not None
+        self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        path = self.cprofile_dir / f"{len(self.stages) + 1:02d}-{safe}.prof"
+        prof.dump_stats(str(path))
+        return path
+
+
+def stage(profiler: StageProfiler | None, name: str) -> ContextManager[None]:
+    """`profiler.stage(name)`, or a no-op when profiling is off."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
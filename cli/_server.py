@@ -0,0 +1,229 @@
+"""Local readiness scoring service: warm catalogs/baselines, JSON over HTTP (stdlib only)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import parse_qs, urlsplit
+
+from adapters.llm_readiness.drift import LlmSignals, analyze_transcript, compare_signals, signals_from_transcript
+from adapters.llm_readiness.load_transcript import transcript_from_obj
+from adapters.llm_readiness.reporting import stability_summary
+from cli._pipeline import score_normalized
+from cli._defaults import DEFAULT_HOST, DEFAULT_MAX_CONCURRENCY, DEFAULT_PORT
+from core.models.errors import IngestionError, ValidationError
+from core.models.normalized import NormalizedData
+from core.models.normalizer import normalize_results, normalize_test_cases
+from core.models.test_case import TestCaseModel
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results_from_bytes
+from core.reporting.details import DEFAULT_TOP_N
+from core.reporting.document import build_report_document, document_to_dict
+
+if TYPE_CHECKING:
+    from core.scoring.policy import ScoringPolicy
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class ScoringService:
+    """
+    In-memory state shared by all requests: parsed case catalogs and analyzed baseline transcripts.
+
+    JUnit scoring runs the CLI's shared tail (cli._pipeline.score_normalized: metrics,
+    sub-scores, report, detail tables) and builds the same report document, so responses match
+    `--format json` except that nothing is written: detail tables keep their top `top_n` rows
+    and have no CSV sidecar, and history-based sub-scores are not available.
+    Transcript scoring returns the advisory stability signals the CLI embeds under
+    extensions.llm_readiness, plus a risk level and findings (stability_summary); transcripts
+    have no readiness score.
+    """
+
+    def __init__(
+        self,
+        catalogs: Mapping[str, Mapping[str, TestCaseModel]],
+        baselines: Mapping[str, LlmSignals] | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        policy: ScoringPolicy | None = None,
+        top_n: int = DEFAULT_TOP_N,
+    ):
+        self.catalogs = dict(catalogs)
+        self.baselines = dict(baselines or {})
+        self.max_concurrency = max_concurrency
+        self.policy = policy
+        self.top_n = top_n
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    @classmethod
+    def from_files(
+        cls,
+        catalog_paths: Mapping[str, str | Path],
+        baseline_paths: Mapping[str, str | Path] | None = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        policy: ScoringPolicy | None = None,
+        top_n: int = DEFAULT_TOP_N,
+    ) -> ScoringService:
+        catalogs = {name: normalize_test_cases(load_test_cases_csv(str(p))) for name, p in catalog_paths.items()}
+        baselines = {name: analyze_transcript(str(p)) for name, p in (baseline_paths or {}).items()}
+        return cls(catalogs, baselines, max_concurrency=max_concurrency, policy=policy, top_n=top_n)
+
+    def try_acquire(self) -> bool:
+        return self._slots.acquire(blocking=False)
+
+    def release(self) -> None:
+        self._slots.release()
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "catalogs": {name: len(tc) for name, tc in sorted(self.catalogs.items())},
+            "baselines": sorted(self.baselines),
+            "max_concurrency": self.max_concurrency,
+            "policy": self.policy.name if self.policy is not None else "default",
+        }
+
+    def score_junit(self, payload: bytes, *, catalog: str | None = None) -> dict[str, Any]:
+        test_cases = self._catalog(catalog)
+        results = normalize_results(load_junit_results_from_bytes(payload, source="<request body>"))
+        data = NormalizedData(test_cases=test_cases, results=results)
+        scored = score_normalized(data, top_n=self.top_n, policy=self.policy)
+        return document_to_dict(build_report_document(scored.report, details=scored.details))
+
+    def score_transcript(self, payload: bytes, *, baseline: str | None = None) -> dict[str, Any]:
+        try:
+            raw = json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Transcript payload is not valid JSON ({e})") from e
+        current = signals_from_transcript(transcript_from_obj(raw, source_path="<request body>"))
+
+        drift = None
+        if baseline is not None:
+            if baseline not in self.baselines:
+                raise LookupError(f"Unknown baseline '{baseline}' (loaded: {sorted(self.baselines)})")
+            drift = compare_signals(self.baselines[baseline], current)
+        return stability_summary(current, drift)
+
+    def _catalog(self, name: str | None) -> Mapping[str, TestCaseModel]:
+        if name is None:
+            if len(self.catalogs) != 1:
+                raise LookupError(f"Query parameter 'catalog' is required (loaded: {sorted(self.catalogs)})")
+            return next(iter(self.catalogs.values()))
+        if name not in self.catalogs:
+            raise LookupError(f"Unknown catalog '{name}' (loaded: {sorted(self.catalogs)})")
+        return self.catalogs[name]
+
+
+def make_server(service: ScoringService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Build (but do not start) the HTTP server.
+
+    Endpoints:
+      GET  /health
+      POST /v1/score/junit[?catalog=NAME]          body: JUnit XML
+      POST /v1/score/transcript[?baseline=NAME]    body: transcript JSON
+    More than `max_concurrency` in-flight scoring requests get 503 + Retry-After.
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        server_version = "ai-agent-release-readiness-qa"
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+            if urlsplit(self.path).path == "/health":
+                self._send_json(HTTPStatus.OK, service.health())
+            else:
+                self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+
+        def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+            url = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            if url.path not in {"/v1/score/junit", "/v1/score/transcript"}:
+                self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+                return
+
+            raw_length = self.headers.get("Content-Length")
+            if raw_length is None:
+                self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length header is required")
+                self.close_connection = True
+                return
+            try:
+                length = int(raw_length)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {raw_length!r}")
+                self.close_connection = True
+                return
+            if length > MAX_BODY_BYTES:
+                self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {MAX_BODY_BYTES} bytes")
+                self.close_connection = True
+                return
+            body = self.rfile.read(length)
+
+            if not service.try_acquire():
+                self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Concurrency limit reached", retry_after=1)
+                return
+            # The slot is released before responding, so a client's next request never sees
+            # its own finished request as in flight.
+            try:
+                if url.path == "/v1/score/junit":
+                    status, result = HTTPStatus.OK, service.score_junit(body, catalog=query.get("catalog"))
+                else:
+                    status, result = HTTPStatus.OK, service.score_transcript(body, baseline=query.get("baseline"))
+            except LookupError as e:
+                status, result = HTTPStatus.NOT_FOUND, {"error": str(e)}
+            except (IngestionError, ValidationError, ValueError) as e:
+                status, result = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+            finally:
+                service.release()
+            self._send_json(status, result)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Keep stdout clean under load; errors are reported in responses.
+            pass
+
+        def _send_error(self, status: HTTPStatus, message: str, *, retry_after: int | None = None) -> None:
+            headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+            self._send_json(status, {"error": message}, headers=headers)
+
+        def _send_json(self, status: HTTPStatus, payload: Any, *, headers: dict[str, str] | None = None) -> None:
+            body = json.dumps(payload, sort_keys=True).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return _Server((host, port), _Handler)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Default backlog (5) drops connections under bursty pipeline traffic.
+    request_queue_size = 128
+
+
+def parse_named_paths(values: list[str] | None, option: str) -> dict[str, str]:
+    """
+    Parse repeated NAME=PATH options; a bare PATH is named "default".
+    """
+    out: dict[str, str] = {}
+    for v in values or []:
+        name, sep, path = v.partition("=")
+        if not sep:
+            name, path = "default", v
+        name, path = name.strip(), path.strip()
+        if name == "" or path == "":
+            raise ValueError(f"{option}: expected NAME=PATH (got '{v}')")
+        if name in out:
+            raise ValueError(f"{option}: duplicate name '{name}'")
+        out[name] = path
+    return out
@@ -0,0 +1,116 @@
+"""`sweep` sub-command: decision flips of stored runs under candidate weights/thresholds."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+
+from core.history.store import HistoryStore
+from core.models.errors import IngestionError, ValidationError
+from core.scoring.sweep import DECISIONS, SweepGrid, SweepResult, SweepRow, parse_axis, sweep
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog="ai-agent-release-readiness-qa sweep",
+        description="What-if sweep over stored runs (--history). Axes take a value, a list (a,b,c) "
+        "or START:STOP:COUNT.",
+    )
+    p.add_argument("--history", required=True, metavar="DIR", help="History directory written by --history runs.")
+    p.add_argument("--failure-weight", default="1.0", help="Points per 1%% failed (default: 1.0).")
+    p.add_argument("--skip-weight", default="0.5", help="Points per 1%% skipped (default: 0.5).")
+    p.add_argument("--unmapped-weight", default="0.5", help="Points per 1%% unmapped (default: 0.5).")
+    p.add_argument("--approve-at", default="85", help="Approve (low risk) threshold (default: 85).")
+    p.add_argument("--conditional-at", default="70", help="Conditional (medium risk) threshold (default: 70).")
+    p.add_argument(
+        "--policy",
+        default=None,
+        metavar="PATH",
+        help="Baseline policy the flips are counted against (default: built-in policy).",
+    )
+    p.add_argument("--top", type=int, default=20, help="Rows to print (default: 20; --csv gets every row).")
+    p.add_argument(
+        "--sort",
+        choices=("grid", "flipped", "approve", "reject"),
+        default="grid",
+        help="Row order for the printed table (default: grid order).",
+    )
+    p.add_argument("--csv", default=None, metavar="PATH", help="Write the full flip table as CSV.")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    try:
+        grid = SweepGrid(
+            failure_weights=parse_axis(args.failure_weight),
+            skip_weights=parse_axis(args.skip_weight),
+            unmapped_weights=parse_axis(args.unmapped_weight),
+            approve_thresholds=parse_axis(args.approve_at),
+            conditional_thresholds=parse_axis(args.conditional_at),
+        )
+    except ValueError as e:
+        raise SystemExit(f"sweep: {e}") from e
+
+    try:
+        baseline = None
+        if args.policy:
+            from core.scoring.policy import load_policy
+
+            baseline = load_policy(args.policy)
+        metrics = (r.metrics for r in HistoryStore(args.history).iter_records())
+        result = sweep(metrics, grid, baseline=baseline)
+    except (IngestionError, ValidationError) as e:
+        raise SystemExit(f"sweep: {e}") from e
+
+    if result.runs == 0:
+        raise SystemExit(f"sweep: no stored runs in '{args.history}' (record runs with --history).")
+
+    print(format_flip_table(result, top=args.top, sort=args.sort))
+    if args.csv:
+        from core.reporting.exporter import write_report
+
+        write_report(args.csv, [flip_table_csv(result.rows)])
+        print(f"\nOK: saved {len(result.rows)} rows to {args.csv}")
+    return 0
+
+
+def format_flip_table(result: SweepResult, *, top: int = 20, sort: str = "grid") -> str:
+    rows = list(result.rows)
+    if sort == "flipped":
+        rows.sort(key=lambda r: r.flipped, reverse=True)
+    elif sort == "approve":
+        rows.sort(key=lambda r: r.counts[0], reverse=True)
+    elif sort == "reject":
+        rows.sort(key=lambda r: r.counts[2], reverse=True)
+
+    base = ", ".join(f"{d}={n}" for d, n in zip(DECISIONS, result.baseline_counts))
+    lines = [f"Runs: {result.runs} ({base}); grid points: {len(result.rows)}", ""]
+    lines.append(
+        f"{'fail_w':>6} {'skip_w':>6} {'unmap_w':>7} {'appr@':>6} {'cond@':>6} "
+        f"{'approve':>7} {'cond':>6} {'reject':>6} {'flipped':>7}  A>C  A>R  C>A  C>R  R>A  R>C"
+    )
+    for r in rows[: max(0, top)]:
+        f = r.flips
+        lines.append(
+            f"{r.failure_weight:>6g} {r.skip_weight:>6g} {r.unmapped_weight:>7g} "
+            f"{r.approve_threshold:>6g} {r.conditional_threshold:>6g} "
+            f"{r.counts[0]:>7} {r.counts[1]:>6} {r.counts[2]:>6} {r.flipped:>7} "
+            f"{f[0][1]:>4} {f[0][2]:>4} {f[1][0]:>4} {f[1][2]:>4} {f[2][0]:>4} {f[2][1]:>4}"
+        )
+    if len(rows) > top:
+        lines.append(f"... {len(rows) - top} more row(s) (use --top or --csv)")
+    return "\n".join(lines)
+
+
+def flip_table_csv(rows: list[SweepRow]) -> str:
+    buf = io.StringIO()
+    w = None
+    for r in rows:
+        d = r.to_dict()
+        if w is None:
+            w = csv.DictWriter(buf, fieldnames=list(d), lineterminator="\n")
+            w.writeheader()
+        w.writerow(d)
+    return buf.getvalue()
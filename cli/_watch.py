@@ -0,0 +1,170 @@
+"""Watch mode: provisional readiness that updates as JUnit shard files land in a directory."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping
+
+from cli._pipeline import render_report
+from core.models.errors import IngestionError, ValidationError
+from core.models.normalizer import normalize_results
+from core.models.readiness import ReadinessReport, build_readiness_report
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+from core.parsers.junit_loader import load_junit_results
+from core.reporting.details import (
+    DEFAULT_TOP_N,
+    FAILED_TESTS_COLUMNS,
+    DetailTable,
+    components_table_from_stats,
+    sidecar_path_for,
+)
+from core.reporting.exporter import ExportOptions
+from core.scoring.ledger import ShardLedger
+from core.scoring.subscores import coverage_only
+
+if TYPE_CHECKING:
+    from core.scoring.policy import ScoringPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class ShardChange:
+    name: str
+    kind: str  # "added" | "replaced" | "removed" | "unreadable"
+    detail: str | None = None
+
+
+class ShardWatcher:
+    """
+    Keeps the case catalog and a ShardLedger (one contribution per shard file) in memory.
+
+    poll() stats the directory and re-parses only shards that were added or replaced
+    (by mtime/size); removed shards are dropped. The ledger swaps the shard's old
+    contribution for the new one, so an update costs one shard parse and is independent
+    of the number and size of the other shards.
+
+    A shard that fails to parse (e.g. still being written) is reported as "unreadable",
+    keeps its previous partial (if any) and is retried once its mtime/size changes.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        test_cases: Mapping[str, TestCaseModel],
+        *,
+        pattern: str = "*.xml",
+        policy: ScoringPolicy | None = None,
+        top_n: int = DEFAULT_TOP_N,
+    ):
+        self.directory = Path(directory)
+        self.test_cases = test_cases
+        self.pattern = pattern
+        self.policy = policy
+        self.ledger = ShardLedger(test_cases, top_n=top_n)
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._unreadable: dict[str, tuple[int, int]] = {}
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.ledger)
+
+    def poll(self) -> list[ShardChange]:
+        changes: list[ShardChange] = []
+        seen: set[str] = set()
+
+        for path in sorted(self.directory.glob(self.pattern)):
+            if not path.is_file():
+                continue
+            name = path.name
+            seen.add(name)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            sig = (st.st_mtime_ns, st.st_size)
+            if self._stats.get(name) == sig or self._unreadable.get(name) == sig:
+                continue
+
+            try:
+                results = self._load_shard(path)
+            except (IngestionError, ValidationError) as e:
+                self._unreadable[name] = sig
+                changes.append(ShardChange(name=name, kind="unreadable", detail=str(e)))
+                continue
+
+            self._unreadable.pop(name, None)
+            kind = "replaced" if name in self.ledger else "added"
+            self._stats[name] = sig
+            self.ledger.put(name, results)
+            changes.append(ShardChange(name=name, kind=kind))
+
+        for name in set(self._unreadable) - seen:
+            del self._unreadable[name]
+        for name in sorted(set(self.ledger.shards) - seen):
+            self.ledger.remove(name)
+            self._stats.pop(name, None)
+            changes.append(ShardChange(name=name, kind="removed"))
+
+        return changes
+
+    def metrics(self) -> dict:
+        return self.ledger.metrics()
+
+    def report(self) -> ReadinessReport:
+        dimensions = coverage_only(self.ledger.executed_cases, len(self.test_cases), "no run history")
+        report = build_readiness_report(self.metrics(), policy=self.policy, dimensions=dimensions)
+        report.assumptions.append(
+            f"Provisional: computed from {self.shard_count} shard file(s) received so far in '{self.directory}'."
+        )
+        return report
+
+    def details(self, out_path: str | Path | None = None, export: ExportOptions = ExportOptions()) -> list[DetailTable]:
+        """Failed Tests (sampled per shard, no sidecar) and Components (exact) from the ledger."""
+        rows, total = self.ledger.failed_rows()
+        return [
+            DetailTable(title="Failed Tests", columns=FAILED_TESTS_COLUMNS, rows=rows, total_rows=total),
+            components_table_from_stats(
+                self.ledger.component_stats(),
+                top_n=self.ledger.top_n,
+                sidecar_path=sidecar_path_for(out_path, "components") if out_path is not None else None,
+                export=export,
+            ),
+        ]
+
+    def _load_shard(self, path: Path) -> list[TestResultModel]:
+        return normalize_results(load_junit_results(str(path)))
+
+
+def watch(
+    watcher: ShardWatcher,
+    out_path: str | Path,
+    *,
+    interval: float = 1.0,
+    max_polls: int | None = None,
+    formats: tuple[str, ...] = ("md",),
+    export: ExportOptions = ExportOptions(),
+    on_update: Callable[[list[ShardChange], ReadinessReport, float], None] | None = None,
+) -> None:
+    """
+    Poll the shard directory and rewrite the provisional report whenever shards change.
+
+    Runs until interrupted (or for `max_polls` polls). `on_update` receives the changes,
+    the new report and the update time in milliseconds.
+    """
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        started = time.perf_counter()
+        changes = watcher.poll()
+        if changes:
+            report = watcher.report()
+            if any(c.kind != "unreadable" for c in changes):
+                details = watcher.details(out_path, export)
+                render_report(report, out_path, details=details, formats=formats, export=export)
+            if on_update is not None:
+                on_update(changes, report, (time.perf_counter() - started) * 1000.0)
+
+        polls += 1
+        if max_polls is None or polls < max_polls:
+            time.sleep(interval)
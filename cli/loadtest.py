@@ -0,0 +1,95 @@
+"""Local load-test client for the readiness scoring service (stdlib only).
+
+Example:
+    python -m cli.loadtest --url "http://127.0.0.1:8765/v1/score/junit" --body samples/junit.xml \
+        --requests 1000 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def run_load_test(url: str, body: bytes, *, requests: int, concurrency: int, timeout: float = 30.0) -> dict:
+    """
+    POST `body` to `url` `requests` times from `concurrency` threads.
+
+    Returns throughput, latency percentiles (ms) and a count per HTTP status (0 = connection error).
+    """
+    content_type = "application/xml" if body.lstrip().startswith(b"<") else "application/json"
+
+    def _one(_: int) -> tuple[int, float]:
+        req = urllib.request.Request(url, data=body, method="POST", headers={"Content-Type": content_type})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                resp.read()
+                status = resp.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            status = e.code
+        except (urllib.error.URLError, OSError):
+            status = 0
+        return status, (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(_one, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(ms for _, ms in samples)
+    statuses: dict[str, int] = {}
+    for status, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_sec": elapsed,
+        "requests_per_sec": requests / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": _percentile(latencies, 0.50),
+            "p95": _percentile(latencies, 0.95),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(prog="python -m cli.loadtest", description="Load-test the local scoring service.")
+    p.add_argument("--url", required=True, help="Endpoint URL, e.g. http://127.0.0.1:8765/v1/score/junit")
+    p.add_argument("--body", required=True, help="Path to the request body (JUnit XML or transcript JSON).")
+    p.add_argument("--requests", type=int, default=500, help="Total requests (default: 500).")
+    p.add_argument("--concurrency", type=int, default=8, help="Client threads (default: 8).")
+    args = p.parse_args()
+
+    if args.requests < 1 or args.concurrency < 1:
+        raise SystemExit("--requests and --concurrency must be >= 1.")
+
+    result = run_load_test(
+        args.url,
+        Path(args.body).read_bytes(),
+        requests=args.requests,
+        concurrency=args.concurrency,
+    )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cli._pipeline import run_demo, run_from_files
+from cli._defaults import DEFAULT_HOST, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_WORKERS, DEFAULT_PORT
+from cli._pipeline import output_paths, run_demo, run_from_files
+from cli._profile import StageProfiler
+from core.reporting.details import DEFAULT_TOP_N
+from core.reporting.document import parse_formats
+from core.reporting.exporter import ExportOptions, write_report
 
+if TYPE_CHECKING:
+    from core.history.store import HistoryStore
+    from core.scoring.policy import ScoringPolicy
 
-def parse_args() -> argparse.Namespace:
+# Batch, watch and server modes (and the AI/LLM layer) are imported lazily inside their
+# branches: a plain run must not pay their import cost. See tests/test_startup_budget.py.
+
+
+# Sub-commands (first argument) -> module with `main(argv) -> int`, imported on demand.
+SUBCOMMANDS = {
+    "sweep": "cli._sweep",
+    "partial": "cli._partial",
+    "merge": "cli._merge",
+    "plan-shards": "cli._plan_shards",
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="ai-agent-release-readiness-qa",
         description="Deterministic release readiness score + markdown report (no LLM).",
+        epilog=f"Sub-commands: {', '.join(SUBCOMMANDS)} (run `<sub-command> --help`).",
     )
     p.add_argument(
         "--out",
@@ -30,20 +56,266 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional baseline AI/LLM transcript JSON for drift comparison (requires --transcript).",
     )
+    p.add_argument(
+        "--artifact",
+        action="append",
+        default=[],
+        metavar="KIND=PATH",
+        help="Optional adapter artifact, e.g. flows=flows.jsonl (repeatable; .jsonl is streamed). "
+        "Only the adapters consuming the given kinds are loaded.",
+    )
+    p.add_argument(
+        "--top-n",
+        type=int,
+        default=DEFAULT_TOP_N,
+        help=f"Rows shown per detail table in the markdown report; full tables go to CSV sidecars (default: {DEFAULT_TOP_N}).",
+    )
+    p.add_argument(
+        "--format",
+        default="md",
+        help="Comma-separated output formats: md, json, html (default: md). "
+        "JSON/HTML are written next to --out with the matching suffix.",
+    )
+    p.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write gzip-compressed outputs (<path>.gz).",
+    )
+    p.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Pin generated_at (SOURCE_DATE_EPOCH or the Unix epoch) and skip writing outputs whose content is unchanged.",
+    )
+    p.add_argument(
+        "--policy",
+        default=None,
+        metavar="PATH",
+        help="Scoring policy file (.toml or .json) with penalty weights, caps and risk rules "
+        "(default: built-in policy; see samples/scoring_policy.toml).",
+    )
+    p.add_argument(
+        "--history",
+        default=None,
+        metavar="DIR",
+        help="Append each run's metrics and decision to DIR/runs.jsonl (input for `sweep`).",
+    )
+    p.add_argument(
+        "--history-name",
+        default=None,
+        metavar="NAME",
+        help="Demo/file runs: name the run is stored and compared under in --history "
+        "(default: the --out file stem; manifest runs use each entry's 'name').",
+    )
+    p.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help="Demo/file runs: write per-stage wall/CPU time and peak traced memory as JSON to PATH.",
+    )
+    p.add_argument(
+        "--profile-appendix",
+        action="store_true",
+        help="With --profile: also append the stage table to the report.",
+    )
+    p.add_argument(
+        "--profile-cprofile",
+        default=None,
+        metavar="DIR",
+        help="With --profile: dump a cProfile file per stage into DIR (NN-<stage>.prof).",
+    )
+    p.add_argument(
+        "--profile-no-memory",
+        action="store_true",
+        help="With --profile: skip tracemalloc (lower overhead, no peak memory).",
+    )
+    p.add_argument(
+        "--adapter-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --artifact: worker processes the AI agent adapter splits each .jsonl artifact "
+        "across (default: 1; signals match a single-process run).",
+    )
     p.add_argument("--junit", default=None, help="Path to JUnit XML.")
     p.add_argument("--cases", default=None, help="Path to test cases CSV.")
-    return p.parse_args()
+    p.add_argument(
+        "--aliases",
+        default=None,
+        help="File mode: alias CSV (alias,case_id) mapping unmapped result names to cases, "
+        "e.g. a reviewed <report>.aliases.csv from a previous run.",
+    )
+    p.add_argument(
+        "--catalog-index",
+        default=None,
+        help="File mode: SQLite index of the --cases catalog, created on first use and updated "
+        "incrementally; each run then loads only the cases its results refer to.",
+    )
+    p.add_argument(
+        "--manifest",
+        default=None,
+        help="Batch mode: JSON manifest of runs (cases, junit, transcript, baseline, out). "
+        "Shared inputs are parsed once; runs execute on a worker pool.",
+    )
+    p.add_argument(
+        "--watch",
+        default=None,
+        metavar="DIR",
+        help="Watch mode: re-score as JUnit shard files (*.xml) are added/replaced in DIR (requires --cases).",
+    )
+    p.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Watch mode: polling interval in seconds (default: 1.0).",
+    )
+    p.add_argument(
+        "--serve",
+        action="store_true",
+        help="Server mode: keep catalogs/baselines warm and score JUnit/transcript payloads over HTTP.",
+    )
+    p.add_argument("--host", default=DEFAULT_HOST, help=f"Server mode: bind address (default: {DEFAULT_HOST}).")
+    p.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Server mode: port (default: {DEFAULT_PORT}).")
+    p.add_argument(
+        "--serve-catalog",
+        action="append",
+        default=None,
+        metavar="NAME=PATH",
+        help="Server mode: test case catalog CSV to preload (repeatable; a bare PATH is named 'default').",
+    )
+    p.add_argument(
+        "--serve-baseline",
+        action="append",
+        default=None,
+        metavar="NAME=PATH",
+        help="Server mode: baseline transcript JSON to preload for drift (repeatable).",
+    )
+    p.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Server mode: max in-flight scoring requests; extra requests get 503 "
+        f"(default: {DEFAULT_MAX_CONCURRENCY}).",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Batch mode: worker threads (default: min({DEFAULT_MAX_WORKERS}, CPU count)).",
+    )
+    p.add_argument(
+        "--summary-out",
+        default=None,
+        help="Batch mode: optional path for the aggregate summary JSON.",
+    )
+    return p.parse_args(argv)
+
 
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        module = importlib.import_module(SUBCOMMANDS[argv[0]])
+        return module.main(argv[1:])
 
-def main() -> int:
-    args = parse_args()
+    args = parse_args(argv)
 
     if args.baseline_transcript and not args.transcript:
         raise SystemExit("--baseline-transcript requires --transcript.")
 
+    if args.top_n < 0:
+        raise SystemExit("--top-n must be >= 0.")
+    artifact_paths = _parse_artifacts(args.artifact)
+
+    try:
+        formats = parse_formats(args.format)
+    except ValueError as e:
+        raise SystemExit(f"--format: {e}") from e
+    export = ExportOptions(gzip_output=args.gzip, deterministic=args.deterministic)
+    if not (args.serve or args.manifest):
+        try:
+            output_paths(args.out, formats, export)
+        except ValueError as e:
+            raise SystemExit(f"--out: {e}") from e
+
+    if (args.profile_appendix or args.profile_cprofile or args.profile_no_memory) and not args.profile:
+        raise SystemExit("--profile-appendix, --profile-cprofile and --profile-no-memory require --profile.")
+    if args.profile and (args.serve or args.manifest or args.watch):
+        raise SystemExit("--profile applies to --demo and --cases/--junit runs only.")
+    if args.aliases and (args.demo or args.serve or args.manifest or args.watch):
+        raise SystemExit("--aliases applies to --cases/--junit runs only.")
+    if args.catalog_index and (args.demo or args.serve or args.manifest or args.watch):
+        raise SystemExit("--catalog-index applies to --cases/--junit runs only.")
+    if artifact_paths and (args.serve or args.manifest or args.watch):
+        raise SystemExit("--artifact applies to --demo and --cases/--junit runs only.")
+    if args.adapter_workers < 1:
+        raise SystemExit("--adapter-workers must be >= 1.")
+    if args.adapter_workers > 1 and not artifact_paths:
+        raise SystemExit("--adapter-workers requires --artifact.")
+
+    policy = _load_policy(args.policy)
+    history = None
+    if args.history:
+        if args.serve or args.watch:
+            raise SystemExit("--history applies to --demo, --cases/--junit and --manifest runs.")
+        from core.history.store import HistoryStore
+
+        history = HistoryStore(args.history)
+    if args.history_name is not None:
+        if not args.history:
+            raise SystemExit("--history-name requires --history.")
+        if args.manifest:
+            raise SystemExit("--history-name applies to --demo and --cases/--junit runs; set 'name' per manifest run.")
+
+    if args.serve:
+        if args.demo or args.cases or args.junit or args.transcript or args.manifest or args.watch:
+            raise SystemExit("--serve cannot be combined with other input modes.")
+        if args.max_concurrency < 1:
+            raise SystemExit("--max-concurrency must be >= 1.")
+        return _run_server(args, policy=policy)
+
+    if args.manifest:
+        if args.demo or args.cases or args.junit or args.transcript:
+            raise SystemExit("--manifest cannot be combined with --demo, --cases, --junit or --transcript.")
+        if args.workers is not None and args.workers < 1:
+            raise SystemExit("--workers must be >= 1.")
+        return _run_batch(args, formats=formats, export=export, policy=policy, history=history)
+
+    if args.watch:
+        if args.cases is None or args.demo or args.junit or args.transcript:
+            raise SystemExit("--watch requires --cases and cannot be combined with --demo, --junit or --transcript.")
+        if args.watch_interval <= 0:
+            raise SystemExit("--watch-interval must be > 0.")
+        return _run_watch(args, formats=formats, export=export, policy=policy)
+
+    profiler = None
+    if args.profile:
+        profiler = StageProfiler(
+            track_memory=not args.profile_no_memory,
+            cprofile_dir=args.profile_cprofile,
+            appendix=args.profile_appendix,
+        )
+
+    from core.models.errors import IngestionError
+
     if args.demo:
-        saved = run_demo(args.out, transcript_path=args.transcript, baseline_transcript_path=args.baseline_transcript)
-        print(f"OK: saved report to {saved}")
+        try:
+            saved = run_demo(
+                args.out,
+                transcript_path=args.transcript,
+                baseline_transcript_path=args.baseline_transcript,
+                artifact_paths=artifact_paths,
+                adapter_workers=args.adapter_workers,
+                top_n=args.top_n,
+                formats=formats,
+                export=export,
+                profiler=profiler,
+                policy=policy,
+                history=history,
+                history_name=args.history_name,
+            )
+        except IngestionError as e:
+            raise SystemExit(str(e)) from e
+        _print_saved(saved, formats, export)
+        _finish_profile(args.profile, profiler)
         return 0
 
     if (args.cases is None) != (args.junit is None):
@@ -57,16 +329,161 @@ def main() -> int:
             "  python -m cli.main --cases <path> --junit <path> --out reports/report.md"
         )
 
-    saved = run_from_files(
-        cases_path=args.cases,
-        junit_path=args.junit,
-        out_path=args.out,
-        transcript_path=args.transcript,
-        baseline_transcript_path=args.baseline_transcript,
+    try:
+        saved = run_from_files(
+            cases_path=args.cases,
+            junit_path=args.junit,
+            out_path=args.out,
+            aliases_path=args.aliases,
+            catalog_index_path=args.catalog_index,
+            transcript_path=args.transcript,
+            baseline_transcript_path=args.baseline_transcript,
+            artifact_paths=artifact_paths,
+            adapter_workers=args.adapter_workers,
+            top_n=args.top_n,
+            formats=formats,
+            export=export,
+            profiler=profiler,
+            policy=policy,
+            history=history,
+            history_name=args.history_name,
+        )
+    except IngestionError as e:
+        raise SystemExit(str(e)) from e
+    _print_saved(saved, formats, export)
+    _finish_profile(args.profile, profiler)
+    return 0
+
+
+def _run_batch(
+    args: argparse.Namespace,
+    *,
+    formats: tuple[str, ...],
+    export: ExportOptions,
+    policy: ScoringPolicy | None,
+    history: HistoryStore | None,
+) -> int:
+    import json
+
+    from cli._batch import format_summary, run_manifest, summarize_outcomes
+    from core.models.errors import IngestionError
+
+    try:
+        outcomes = run_manifest(
+            args.manifest,
+            workers=args.workers,
+            top_n=args.top_n,
+            formats=formats,
+            export=export,
+            policy=policy,
+            history=history,
+        )
+    except IngestionError as e:
+        raise SystemExit(str(e)) from e
+    summary = summarize_outcomes(outcomes)
+    print(format_summary(summary))
+    if args.summary_out:
+        write_report(args.summary_out, [json.dumps(summary, indent=2, sort_keys=True) + "\n"], export)
+    return 0 if summary["runs_failed"] == 0 else 1
+
+
+def _run_watch(
+    args: argparse.Namespace,
+    *,
+    formats: tuple[str, ...],
+    export: ExportOptions,
+    policy: ScoringPolicy | None,
+) -> int:
+    from cli._watch import ShardChange, ShardWatcher, watch
+    from core.models.normalizer import normalize_test_cases
+    from core.models.readiness import ReadinessReport
+    from core.parsers.csv_loader import load_test_cases_csv
+
+    test_cases = normalize_test_cases(load_test_cases_csv(args.cases))
+    watcher = ShardWatcher(args.watch, test_cases, policy=policy, top_n=args.top_n)
+
+    def _on_update(changes: list[ShardChange], report: ReadinessReport, elapsed_ms: float) -> None:
+        for c in changes:
+            suffix = f" ({c.detail})" if c.detail else ""
+            print(f"{c.kind}: {c.name}{suffix}")
+        score = report.score
+        print(
+            f"OK: shards={watcher.shard_count} score={int(score.overall_score)} "
+            f"risk={score.risk_level.value} recommendation={score.recommendation.value} "
+            f"({elapsed_ms:.1f} ms) -> {args.out}"
+        )
+
+    print(f"Watching {args.watch} (Ctrl+C to stop)")
+    try:
+        watch(watcher, args.out, interval=args.watch_interval, formats=formats, export=export, on_update=_on_update)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_server(args: argparse.Namespace, *, policy: ScoringPolicy | None) -> int:
+    from cli._server import ScoringService, make_server, parse_named_paths
+
+    try:
+        catalogs = parse_named_paths(args.serve_catalog, "--serve-catalog")
+        baselines = parse_named_paths(args.serve_baseline, "--serve-baseline")
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
+    if not catalogs:
+        raise SystemExit("--serve requires at least one --serve-catalog.")
+
+    service = ScoringService.from_files(
+        catalogs, baselines, max_concurrency=args.max_concurrency, policy=policy, top_n=args.top_n
     )
-    print(f"OK: saved report to {saved}")
+    server = make_server(service, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"Serving readiness scoring on http://{host}:{port} (catalogs: {', '.join(sorted(catalogs))}; Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
     return 0
 
 
+def _parse_artifacts(values: list[str]) -> dict[str, str]:
+    artifacts: dict[str, str] = {}
+    for value in values:
+        kind, sep, path = value.partition("=")
+        if not sep or not kind or not path:
+            raise SystemExit(f"--artifact expects KIND=PATH, got '{value}'.")
+        if kind in artifacts:
+            raise SystemExit(f"--artifact: kind '{kind}' given twice.")
+        artifacts[kind] = path
+    return artifacts
+
+
+def _load_policy(path: str | None) -> ScoringPolicy | None:
+    if path is None:
+        return None
+    from core.models.errors import IngestionError, ValidationError
+    from core.scoring.policy import load_policy
+
+    try:
+        return load_policy(path)
+    except (IngestionError, ValidationError) as e:
+        raise SystemExit(f"--policy: {e}") from e
+
+
+def _finish_profile(path: str | None, profiler: StageProfiler | None) -> None:
+    if path is None or profiler is None:
+        return
+    profiler.close()
+    profiler.write_json(path)
+    total = profiler.to_dict()["total"]
+    print(f"Profile saved to: {Path(path).resolve()} ({len(profiler.stages)} stages, {total['wall_ms']:.1f} ms)")
+
+
+def _print_saved(out_path: Path, formats: tuple[str, ...], export: ExportOptions) -> None:
+    for path in output_paths(out_path, formats, export):
+        print(f"OK: saved report to {path}")
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1 @@
+"""Failure analysis: group failed results by normalized failure-text signatures."""
@@ -0,0 +1,84 @@
+"""
+Failure signatures: group failed results that share a root cause in one linear pass.
+
+A failure's text (the bounded <failure>/<error> message and trace captured by the JUnit
+loader) is normalized so that run-specific details do not split a cause into many
+groups: UUIDs, hex addresses, file paths, quoted values and numbers become placeholders
+and whitespace is collapsed. The normalized text is hashed (blake2b, 8 bytes) into a
+signature. Bad builds repeat the same few messages thousands of times, so normalization
+is memoized per distinct raw text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from core.models.test_result import TestResultModel
+
+DEFAULT_EXAMPLES = 3
+NO_TEXT = "(no failure text)"
+_PATTERN_CHARS = 160
+
+# (guard, pattern, placeholder): a rule only runs when its guard substring occurs in the
+# text. Order matters: specific shapes first, bare numbers last.
+_RULES = (
+    ("-", re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<uuid>"),
+    ("0x", re.compile(r"\b0x[0-9a-fA-F]+\b"), "<addr>"),
+    ("/", re.compile(r"(?:[A-Za-z]:)?/[\w.\-]+(?:/[\w.\-]+)+/?"), "<path>"),
+    ("\\", re.compile(r"(?:[A-Za-z]:)?\\[\w.\-]+(?:\\[\w.\-]+)+\\?"), "<path>"),
+    ("'", re.compile(r"'[^'\n]*'"), "<str>"),
+    ('"', re.compile(r'"[^"\n]*"'), "<str>"),
+    ("", re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FailureCluster:
+    signature: str
+    pattern: str  # first line of the normalized text
+    count: int
+    example_ids: tuple[str, ...]  # first failing result ids, in result order
+
+
+def normalize_failure_text(text: str | None) -> str:
+    """'AssertionError: got 42 at 0x7f3a' -> 'AssertionError: got <n> at <addr>'."""
+    if not text:
+        return NO_TEXT
+    for guard, pattern, placeholder in _RULES:
+        if guard in text:
+            text = pattern.sub(placeholder, text)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line) or NO_TEXT
+
+
+def failure_signature(normalized: str) -> str:
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def cluster_failures(
+    results: Iterable[TestResultModel],
+    *,
+    max_examples: int = DEFAULT_EXAMPLES,
+) -> list[FailureCluster]:
+    """Failed results grouped by signature, largest cluster first (ties by first appearance)."""
+    memo: dict[str | None, str] = {}  # raw text -> signature
+    clusters: dict[str, list] = {}  # signature -> [pattern, count, example ids]
+    for r in results:
+        if r.status != "failed":
+            continue
+        sig = memo.get(r.failure_text)
+        if sig is None:
+            normalized = normalize_failure_text(r.failure_text)
+            sig = memo[r.failure_text] = failure_signature(normalized)
+            if sig not in clusters:
+                clusters[sig] = [normalized.split("\n", 1)[0][:_PATTERN_CHARS], 0, []]
+        c = clusters[sig]
+        c[1] += 1
+        if len(c[2]) < max_examples:
+            c[2].append(r.id)
+
+    ordered = sorted(clusters.items(), key=lambda kv: -kv[1][1])  # stable: first appearance breaks ties
+    return [FailureCluster(sig, pattern, n, tuple(ids)) for sig, (pattern, n, ids) in ordered]
@@ -0,0 +1 @@
+"""Run history: an append-only store of past readiness runs (deterministic, stdlib only)."""
@@ -0,0 +1,156 @@
+"""
+Per-test duration baselines: exponentially weighted mean and variance of `duration_sec`.
+
+Each test keeps (mean, variance, runs), updated in O(1) per result with the incremental
+EWMA/EWMV recurrences (alpha weights the newest run):
+
+    diff = x - mean
+    mean += alpha * diff
+    var = (1 - alpha) * (var + alpha * diff * diff)
+
+The state is stored per history name next to runs.jsonl (`durations/<name>-<hash>.json`) and
+holds one entry per test, not per run, so checking and updating a run costs time linear in
+the run's size no matter how many runs the history holds.
+
+A test is flagged when its duration in the current run exceeds mean + k * stddev (and the
+mean by at least `min_slowdown_sec`, so noise on tests that take milliseconds does not
+count), after at least `min_runs` timed runs. Flags are ranked by absolute slowdown.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.test_result import TestResultModel
+
+DURATIONS_SCHEMA_VERSION = 1
+DEFAULT_ALPHA = 0.2
+DEFAULT_K = 3.0
+DEFAULT_MIN_RUNS = 3
+DEFAULT_MIN_SLOWDOWN_SEC = 0.1
+
+
+@dataclass(slots=True)
+class DurationStats:
+    mean: float
+    var: float = 0.0
+    runs: int = 1
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.var)
+
+
+@dataclass(frozen=True, slots=True)
+class DurationRegression:
+    test_id: str
+    duration_sec: float
+    mean_sec: float
+    stddev_sec: float
+
+    @property
+    def slowdown_sec(self) -> float:
+        return self.duration_sec - self.mean_sec
+
+    @property
+    def ratio(self) -> float:
+        return self.duration_sec / self.mean_sec if self.mean_sec > 0 else math.inf
+
+
+def run_durations(results: Iterable[TestResultModel]) -> dict[str, float]:
+    """test id -> duration in this run (the last timed result wins for repeated ids)."""
+    return {r.id: r.duration_sec for r in results if r.duration_sec is not None}
+
+
+class DurationBaselines:
+    def __init__(self, *, alpha: float = DEFAULT_ALPHA):
+        if not 0.0 < alpha <= 1.0:
+            raise ValidationError(f"EWMA alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.tests: dict[str, DurationStats] = {}
+
+    def __len__(self) -> int:
+        return len(self.tests)
+
+    def get(self, test_id: str) -> DurationStats | None:
+        return self.tests.get(test_id)
+
+    def update(self, test_id: str, duration_sec: float) -> None:
+        s = self.tests.get(test_id)
+        if s is None:
+            self.tests[test_id] = DurationStats(mean=duration_sec)
+            return
+        a = self.alpha
+        diff = duration_sec - s.mean
+        s.mean += a * diff
+        s.var = (1.0 - a) * (s.var + a * diff * diff)
+        s.runs += 1
+
+    def update_run(self, durations: dict[str, float]) -> None:
+        for test_id, duration_sec in durations.items():
+            self.update(test_id, duration_sec)
+
+    def regressions(
+        self,
+        durations: dict[str, float],
+        *,
+        k: float = DEFAULT_K,
+        min_runs: int = DEFAULT_MIN_RUNS,
+        min_slowdown_sec: float = DEFAULT_MIN_SLOWDOWN_SEC,
+    ) -> list[DurationRegression]:
+        """Tests slower than their baseline by more than k stddev, largest slowdown first."""
+        out: list[DurationRegression] = []
+        for test_id, duration_sec in durations.items():
+            s = self.tests.get(test_id)
+            if s is None or s.runs < min_runs:
+                continue
+            slowdown = duration_sec - s.mean
+            if slowdown >= min_slowdown_sec and slowdown > k * s.stddev:
+                out.append(DurationRegression(test_id, duration_sec, s.mean, s.stddev))
+        out.sort(key=lambda r: (-r.slowdown_sec, r.test_id))
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": DURATIONS_SCHEMA_VERSION,
+            "alpha": self.alpha,
+            "tests": {t: [s.mean, s.var, s.runs] for t, s in sorted(self.tests.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any], source: str = "<durations>") -> DurationBaselines:
+        if not isinstance(raw, dict) or raw.get("schema_version") != DURATIONS_SCHEMA_VERSION:
+            raise ValidationError(f"{source}: not a duration baseline file (schema_version {DURATIONS_SCHEMA_VERSION})")
+        try:
+            baselines = cls(alpha=float(raw["alpha"]))
+            for test_id, (mean, var, runs) in raw["tests"].items():
+                if var < 0 or runs < 1:
+                    raise ValueError(f"test '{test_id}' has variance {var} and {runs} runs")
+                baselines.tests[str(test_id)] = DurationStats(float(mean), float(var), int(runs))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"{source}: malformed duration baselines ({e})") from e
+        return baselines
+
+    def save(self, path: str | Path) -> Path:
+        from core.reporting.exporter import AtomicWriter
+
+        # Atomic: a crash mid-write must not lose every baseline.
+        with AtomicWriter(path) as f:
+            f.write(json.dumps(self.to_dict(), separators=(",", ":")) + "\n")
+        return Path(path)
+
+    @classmethod
+    def load(cls, path: str | Path, *, alpha: float = DEFAULT_ALPHA) -> DurationBaselines:
+        """Baselines from `path`; a missing file gives empty baselines with `alpha`."""
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(alpha=alpha)
+        except (OSError, json.JSONDecodeError) as e:
+            raise IngestionError(f"Durations '{path}': unable to read ({e})") from e
+        return cls.from_dict(raw, f"Durations '{path}'")
@@ -0,0 +1,160 @@
+"""
+Per-test view over stored runs: recent executions, pass/fail flips and the last green run.
+
+Flakiness only looks at the last `window` runs (DEFAULT_FLIP_WINDOW), the way the regression
+measures compare a recent window: a test that flipped long ago and has been stable since is
+not flaky. Each test keeps the (run number, outcome) of its executions inside the window, so
+the state is bounded by window x tests executed in it, however long the history grows.
+
+The index is updated one record at a time and round-trips through to_dict/from_dict, so
+HistoryStore persists it next to runs.jsonl and only reads the runs appended since.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from core.history.store import RunRecord
+from core.models.errors import ValidationError
+
+INDEX_SCHEMA_VERSION = 1
+DEFAULT_FLIP_WINDOW = 20
+
+# Outcomes that count as an execution (skipped tests were not exercised).
+EXECUTED = frozenset({"passed", "failed"})
+_CODES = {"passed": "p", "failed": "f"}
+_OUTCOMES = {"p": "passed", "f": "failed"}
+
+
+@dataclass(slots=True)
+class CaseHistory:
+    recent: list[tuple[int, str]] = field(default_factory=list)  # (run number, outcome), oldest first
+
+    @property
+    def runs(self) -> int:
+        """Runs in the window in which the test was executed (passed/failed)."""
+        return len(self.recent)
+
+    @property
+    def flips(self) -> int:
+        """passed <-> failed transitions between consecutive executions in the window."""
+        return sum(1 for (_, a), (_, b) in zip(self.recent, self.recent[1:]) if a != b)
+
+    @property
+    def last_status(self) -> str | None:
+        return self.recent[-1][1] if self.recent else None
+
+
+class HistoryIndex:
+    """
+    Built in one pass over RunRecords (oldest first). Only records carrying per-test
+    outcomes (`tests`) contribute; a run is "green" when its metrics report no failures.
+    """
+
+    def __init__(self, *, window: int = DEFAULT_FLIP_WINDOW) -> None:
+        if window < 1:
+            raise ValidationError(f"Flip window must be >= 1 run, got {window}")
+        self.window = window
+        self.tests: dict[str, CaseHistory] = {}
+        self.runs = 0
+        self.last_green: dict[str, str] | None = None
+        self.last_green_run_id: str | None = None
+
+    @classmethod
+    def build(
+        cls,
+        records: Iterable[RunRecord],
+        *,
+        name: str | None = None,
+        window: int = DEFAULT_FLIP_WINDOW,
+    ) -> HistoryIndex:
+        """Index `records`; with `name`, only runs recorded under that name."""
+        index = cls(window=window)
+        for record in records:
+            if name is not None and record.name != name:
+                continue
+            index.add(record)
+        return index
+
+    @property
+    def window_runs(self) -> int:
+        """Stored runs the flip counts cover."""
+        return min(self.runs, self.window)
+
+    def add(self, record: RunRecord) -> None:
+        if not record.tests:
+            return
+        self.runs += 1
+        for test_id, status in record.tests.items():
+            if status not in EXECUTED:
+                continue
+            h = self.tests.get(test_id)
+            if h is None:
+                h = self.tests[test_id] = CaseHistory()
+            h.recent.append((self.runs, status))
+            if len(h.recent) > self.window:
+                del h.recent[0]
+        if int(record.metrics.get("failed", 0) or 0) == 0:
+            self.last_green = record.tests
+            self.last_green_run_id = record.run_id
+
+    def get(self, test_id: str) -> CaseHistory | None:
+        """The test's executions in the window; None when it has none."""
+        h = self.tests.get(test_id)
+        if h is None or not self._prune(h):
+            return None
+        return h
+
+    def status_in_last_green(self, test_id: str) -> str | None:
+        if self.last_green is None:
+            return None
+        return self.last_green.get(test_id)
+
+    def copy(self) -> HistoryIndex:
+        index = HistoryIndex(window=self.window)
+        index.runs = self.runs
+        index.tests = {t: CaseHistory(list(h.recent)) for t, h in self.tests.items()}
+        index.last_green = self.last_green
+        index.last_green_run_id = self.last_green_run_id
+        return index
+
+    def to_dict(self) -> dict[str, Any]:
+        """Tests without executions in the window are dropped."""
+        tests: dict[str, list[Any]] = {}
+        for test_id, h in self.tests.items():
+            if self._prune(h):
+                tests[test_id] = [[n for n, _ in h.recent], "".join(_CODES[s] for _, s in h.recent)]
+        return {
+            "schema_version": INDEX_SCHEMA_VERSION,
+            "window": self.window,
+            "runs": self.runs,
+            "last_green": self.last_green,
+            "last_green_run_id": self.last_green_run_id,
+            "tests": tests,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any], source: str = "<history index>") -> HistoryIndex:
+        if not isinstance(raw, dict) or raw.get("schema_version") != INDEX_SCHEMA_VERSION:
+            raise ValidationError(f"{source}: not a history index (schema_version {INDEX_SCHEMA_VERSION})")
+        try:
+            index = cls(window=int(raw["window"]))
+            index.runs = int(raw["runs"])
+            last_green = raw.get("last_green")
+            index.last_green = {str(t): str(s) for t, s in last_green.items()} if last_green is not None else None
+            index.last_green_run_id = raw.get("last_green_run_id")
+            for test_id, (numbers, codes) in raw["tests"].items():
+                if len(numbers) != len(codes):
+                    raise ValueError(f"test '{test_id}' has {len(numbers)} run numbers and {len(codes)} outcomes")
+                index.tests[str(test_id)] = CaseHistory([(int(n), _OUTCOMES[c]) for n, c in zip(numbers, codes)])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValidationError(f"{source}: malformed history index ({e})") from e
+        return index
+
+    def _prune(self, h: CaseHistory) -> bool:
+        """Drop executions older than the window; False when none are left."""
+        oldest = self.runs - self.window  # run numbers <= oldest are outside the window
+        if h.recent and h.recent[0][0] <= oldest:
+            h.recent = [e for e in h.recent if e[0] > oldest]
+        return bool(h.recent)
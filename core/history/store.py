@@ -0,0 +1,281 @@
+"""Append-only JSONL store of readiness runs (one line per run)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.readiness import ReadinessReport
+
+if TYPE_CHECKING:
+    from core.history.durations import DurationBaselines
+    from core.history.index import HistoryIndex
+
+HISTORY_SCHEMA_VERSION = 1
+RUNS_FILE = "runs.jsonl"
+DURATIONS_DIR = "durations"
+INDEX_DIR = "index"
+_ALL_RUNS_STEM = "@all"  # index over every run; "@" never survives name sanitizing
+_TAIL_BYTES = 64  # bytes before the indexed offset that must still match
+_RECORD_KEYS = frozenset(
+    {"schema_version", "run_id", "recorded_at", "name", "metrics", "score", "risk_level", "recommendation", "tests"}
+)
+_UNSAFE_NAME_RE = re.compile(r"[^\w.\-]")
+_NAME_HASH_CHARS = 12
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    """
+    One stored run: the metrics it was scored from plus the decision made at the time.
+    """
+
+    run_id: str
+    recorded_at: str  # ISO-8601, UTC
+    metrics: dict[str, Any]
+    score: int
+    risk_level: str
+    recommendation: str
+    name: str | None = None
+    tests: dict[str, str] = field(default_factory=dict)  # test id -> outcome in this run
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        out = {
+            "schema_version": HISTORY_SCHEMA_VERSION,
+            "run_id": self.run_id,
+            "recorded_at": self.recorded_at,
+            "name": self.name,
+            "metrics": self.metrics,
+            "score": self.score,
+            "risk_level": self.risk_level,
+            "recommendation": self.recommendation,
+            "tests": self.tests,
+        }
+        out.update(self.extra)
+        return out
+
+
+def record_from_report(
+    report: ReadinessReport,
+    *,
+    name: str | None = None,
+    recorded_at: datetime | None = None,
+    tests: dict[str, str] | None = None,
+    extra: dict[str, Any] | None = None,
+) -> RunRecord:
+    when = recorded_at or datetime.now(timezone.utc)
+    return RunRecord(
+        run_id=uuid.uuid4().hex,
+        recorded_at=when.isoformat(),
+        metrics=dict(report.metrics),
+        score=int(report.score.overall_score),
+        risk_level=report.score.risk_level.value,
+        recommendation=report.score.recommendation.value,
+        name=name,
+        tests=dict(tests or {}),
+        extra=dict(extra or {}),
+    )
+
+
+def _name_stem(name: str) -> str:
+    """
+    File stem for a history name: the name with unsafe characters replaced, plus a short
+    hash of the raw name, so names that sanitize alike ("pr/42", "pr_42") or match a
+    reserved stem ("default") still get their own file.
+    """
+    digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:_NAME_HASH_CHARS]
+    return f"{_UNSAFE_NAME_RE.sub('_', name)}-{digest}"
+
+
+class HistoryStore:
+    """
+    `<directory>/runs.jsonl`, appended one JSON line per run, plus per-name duration
+    baselines in `<directory>/durations/<name>-<hash>.json` (see core.history.durations)
+    and per-name history indexes in `<directory>/index/<name>-<hash>.json` (see
+    core.history.index); `<hash>` is a short digest of the raw name.
+
+    Appends are serialized with a lock and written as a single line, so concurrent runs in
+    one process (batch mode) never interleave records.
+    """
+
+    def __init__(self, directory: str | Path, *, flip_window: int | None = None):
+        self.directory = Path(directory)
+        self.path = self.directory / RUNS_FILE
+        self.flip_window = flip_window  # None: core.history.index.DEFAULT_FLIP_WINDOW
+        self._lock = threading.Lock()
+        self._indexes: dict[str | None, tuple[HistoryIndex, int]] = {}  # name -> (index, runs.jsonl offset)
+        self._durations: dict[str | None, DurationBaselines] = {}  # loaded per name on first use
+
+    def append(self, record: RunRecord) -> RunRecord:
+        line = json.dumps(record.to_dict(), sort_keys=True, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+        return record
+
+    def record_report(
+        self,
+        report: ReadinessReport,
+        *,
+        name: str | None = None,
+        tests: dict[str, str] | None = None,
+    ) -> RunRecord:
+        return self.append(record_from_report(report, name=name, tests=tests))
+
+    def iter_records(self) -> Iterator[RunRecord]:
+        """Stream stored runs in insertion order. A missing store yields nothing."""
+        try:
+            f = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            raise IngestionError(f"History '{self.path}': unable to read file ({e})") from e
+
+        with f:
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    yield self._parse_record(line, f"line {line_no}")
+
+    def load(self) -> list[RunRecord]:
+        return list(self.iter_records())
+
+    def index(self, name: str | None = None) -> HistoryIndex:
+        """
+        HistoryIndex over the stored runs (optionally only those recorded under `name`).
+
+        The index is saved in `index/<name>.json` with the runs.jsonl offset it covers, and
+        each call reads only the runs appended since (by any process). A run therefore costs
+        time in the size of the index (tests executed in the flip window), not in the length
+        of the history. A shorter or rewritten runs.jsonl is re-indexed from the start.
+        The caller gets its own copy.
+        """
+        with self._lock:
+            cached = self._indexes.get(name)
+            index, offset = cached if cached is not None else self._load_index(name)
+            if offset > self._size():  # runs.jsonl was truncated or replaced
+                index, offset = self._new_index(), 0
+            start = offset
+            for record, offset in self._read_from(offset):
+                if name is None or record.name == name:
+                    index.add(record)
+            if offset != start:
+                self._save_index(name, index, offset)
+            self._indexes[name] = (index, offset)
+            return index.copy()
+
+    def index_path(self, name: str | None = None) -> Path:
+        stem = _name_stem(name) if name else _ALL_RUNS_STEM
+        return self.directory / INDEX_DIR / f"{stem}.json"
+
+    def durations_path(self, name: str | None = None) -> Path:
+        stem = _name_stem(name) if name else "default"
+        return self.directory / DURATIONS_DIR / f"{stem}.json"
+
+    def durations(self, name: str | None = None) -> DurationBaselines:
+        """Duration baselines for runs recorded under `name` (read once per store instance)."""
+        from core.history.durations import DurationBaselines
+
+        with self._lock:
+            baselines = self._durations.get(name)
+            if baselines is None:
+                baselines = self._durations[name] = DurationBaselines.load(self.durations_path(name))
+            return baselines
+
+    def record_durations(self, durations: dict[str, float], *, name: str | None = None) -> None:
+        """Fold one run's test durations into the baselines for `name` and save them."""
+        baselines = self.durations(name)
+        with self._lock:
+            baselines.update_run(durations)
+            baselines.save(self.durations_path(name))
+
+    def _new_index(self) -> HistoryIndex:
+        from core.history.index import DEFAULT_FLIP_WINDOW, HistoryIndex
+
+        return HistoryIndex(window=self.flip_window or DEFAULT_FLIP_WINDOW)
+
+    def _load_index(self, name: str | None) -> tuple[HistoryIndex, int]:
+        """Saved index and its offset when it still matches runs.jsonl, else an empty one."""
+        from core.history.index import HistoryIndex
+
+        path = self.index_path(name)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            index = HistoryIndex.from_dict(raw["index"], f"History index '{path}'")
+            offset = int(raw["offset"])
+        except FileNotFoundError:
+            return self._new_index(), 0
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError, ValidationError):
+            return self._new_index(), 0  # a cache: rebuild rather than fail the run
+        fresh = self._new_index()
+        if index.window != fresh.window or raw.get("tail_sha256") != self._tail_digest(offset):
+            return fresh, 0
+        return index, offset
+
+    def _save_index(self, name: str | None, index: HistoryIndex, offset: int) -> None:
+        from core.reporting.exporter import AtomicWriter
+
+        payload = {"offset": offset, "tail_sha256": self._tail_digest(offset), "index": index.to_dict()}
+        with AtomicWriter(self.index_path(name)) as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+    def _size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _tail_digest(self, offset: int) -> str | None:
+        """sha256 of the bytes just before `offset` (None when runs.jsonl is shorter)."""
+        start = max(0, offset - _TAIL_BYTES)
+        try:
+            with self.path.open("rb") as f:
+                f.seek(start)
+                data = f.read(offset - start)
+        except FileNotFoundError:
+            data = b""
+        return hashlib.sha256(data).hexdigest() if len(data) == offset - start else None
+
+    def _read_from(self, offset: int) -> Iterator[tuple[RunRecord, int]]:
+        """(record, offset after its line) for complete lines from `offset` on."""
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            raise IngestionError(f"History '{self.path}': unable to read file ({e})") from e
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return  # an append in progress; read on the next call
+                at = offset
+                offset += len(line)
+                if line.strip():
+                    yield self._parse_record(line, f"byte {at}"), offset
+
+    def _parse_record(self, line: str | bytes, where: str) -> RunRecord:
+        try:
+            raw = json.loads(line)
+            return RunRecord(
+                run_id=str(raw["run_id"]),
+                recorded_at=str(raw["recorded_at"]),
+                metrics=dict(raw["metrics"]),
+                score=int(raw["score"]),
+                risk_level=str(raw["risk_level"]),
+                recommendation=str(raw["recommendation"]),
+                name=raw.get("name"),
+                tests=dict(raw.get("tests") or {}),
+                extra={k: v for k, v in raw.items() if k not in _RECORD_KEYS},
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise IngestionError(f"History '{self.path}': invalid record at {where} ({e})") from e
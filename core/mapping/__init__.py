@@ -0,0 +1 @@
+"""Case mapping helpers: suggest catalog cases for unmapped results and apply alias files."""
@@ -0,0 +1,59 @@
+"""
+Alias files: map result names that do not carry a catalog id to the case they belong to.
+
+The Suggested Mappings sidecar (report.aliases.csv) is an alias file: review it, clear
+`case_id` on rows that are wrong, and pass it back with --aliases. Only the `alias` and
+`case_id` columns are read; rows with an empty case_id are ignored.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import replace
+from pathlib import Path
+from typing import Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+
+
+def load_aliases(path: str | Path) -> dict[str, str]:
+    """alias -> case id."""
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or not {"alias", "case_id"} <= set(reader.fieldnames):
+                raise IngestionError(f"Aliases '{path}': expected columns alias, case_id")
+            aliases: dict[str, str] = {}
+            for row in reader:
+                alias, case_id = (row.get("alias") or "").strip(), (row.get("case_id") or "").strip()
+                if alias and case_id:
+                    aliases[alias] = case_id
+    except FileNotFoundError as e:
+        raise IngestionError(f"Aliases '{path}': file not found") from e
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise IngestionError(f"Aliases '{path}': unable to read ({e})") from e
+    return aliases
+
+
+def apply_aliases(
+    results: list[TestResultModel],
+    aliases: Mapping[str, str],
+    test_cases: Mapping[str, TestCaseModel],
+) -> list[TestResultModel]:
+    """
+    Results with unmapped ids re-pointed through `aliases` (matched on raw_name, then id).
+    Mapped results are left alone; an alias pointing outside the catalog is an error.
+    """
+    unknown = sorted({case_id for case_id in aliases.values() if case_id not in test_cases})
+    if unknown:
+        raise ValidationError(f"Aliases map to unknown case id(s): {', '.join(unknown[:5])}")
+    out: list[TestResultModel] = []
+    for r in results:
+        if r.id not in test_cases:
+            target = aliases.get(r.raw_name or "") or aliases.get(r.id)
+            if target is not None:
+                r = replace(r, id=target)
+        out.append(r)
+    return out
@@ -0,0 +1,234 @@
+"""
+Trigram index over a case catalog, for suggesting which case an unmapped result belongs to.
+
+Each case is indexed by the character trigrams of "<id> <title>" after normalization
+(camelCase and snake_case split into words, lowercased, punctuation and boilerplate such
+as "test" dropped), so renamed tests ("test_login_works") and ids missing a prefix
+("001_login") still share most trigrams with "TC-001 Login works". Postings are
+`array('i')` lists of case positions.
+
+Trigrams that occur in more than `max_df` cases carry almost no signal and would make
+every query touch most of the catalog, so they are left out of the index (and of the
+case sizes). A query then only visits a few short postings lists and scores candidates
+by Dice similarity: 2 * shared / (query trigrams + case trigrams).
+
+The index is built once per catalog: index_for() keeps recently used indexes keyed by a
+fingerprint of the catalog's ids and titles, and to_dict()/save()/load() cache it on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import re
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.test_case import TestCaseModel
+
+CASE_INDEX_SCHEMA_VERSION = 1
+DEFAULT_SUGGESTIONS = 3
+DEFAULT_MIN_SCORE = 0.3
+_CACHE_SIZE = 8
+
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+# Test-framework boilerplate in result names ("test_...", "..._spec") says nothing about the case.
+_NOISE_WORDS = frozenset({"test", "tests", "spec", "should"})
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    case_id: str
+    title: str
+    score: float  # Dice similarity of trigram sets, 0..1
+
+
+def normalize_name(text: str) -> str:
+    """'test_loginWorks[TC 1]' -> 'login works tc 1'."""
+    words = _NON_ALNUM_RE.sub(" ", _CAMEL_RE.sub(" ", text).lower()).split()
+    return " ".join(w for w in words if w not in _NOISE_WORDS)
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f" {normalize_name(text)} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def default_max_df(n_cases: int) -> int:
+    """Trigrams in more cases than this are left out of the index (see module docstring)."""
+    return max(256, n_cases // 20)
+
+
+def dice_top(
+    shared: Mapping[str, int],
+    sizes: Mapping[str, int],
+    query_size: int,
+    k: int,
+    min_score: float,
+) -> list[tuple[float, str]]:
+    """Best `k` (score, case id) by Dice similarity, best first, ties by id."""
+    scored = ((2.0 * n / (query_size + sizes[case_id]), case_id) for case_id, n in shared.items())
+    best = heapq.nsmallest(k, ((-score, case_id) for score, case_id in scored if score >= min_score))
+    return [(-neg, case_id) for neg, case_id in best]
+
+
+def catalog_key(test_cases: Mapping[str, TestCaseModel]) -> str:
+    """sha256 over the sorted (id, title) pairs: everything the index depends on."""
+    h = hashlib.sha256()
+    for case_id, tc in sorted(test_cases.items()):
+        h.update(f"{case_id}\x1f{tc.title}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+class CaseIndex:
+    def __init__(self, ids: list[str], titles: list[str], *, max_df: int | None = None, key: str = ""):
+        self.ids = ids
+        self.titles = titles
+        self.key = key
+        self.max_df = max_df if max_df is not None else default_max_df(len(ids))
+        self._postings: dict[str, array] = {}
+        self._sizes = array("i", bytes(4 * len(ids)))
+        self._stop: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(
+        cls,
+        test_cases: Mapping[str, TestCaseModel],
+        *,
+        max_df: int | None = None,
+        key: str | None = None,
+    ) -> CaseIndex:
+        cases = sorted(test_cases.items())
+        key = key if key is not None else catalog_key(test_cases)
+        index = cls([i for i, _ in cases], [tc.title for _, tc in cases], max_df=max_df, key=key)
+        postings: dict[str, array] = {}
+        for pos, (case_id, title) in enumerate(zip(index.ids, index.titles)):
+            for gram in trigrams(f"{case_id} {title}"):
+                p = postings.get(gram)
+                if p is None:
+                    p = postings[gram] = array("i")
+                p.append(pos)
+        index._set_postings(postings)
+        return index
+
+    def suggest(
+        self,
+        text: str,
+        k: int = DEFAULT_SUGGESTIONS,
+        *,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> list[Suggestion]:
+        """Up to `k` cases most similar to `text` (best first, ties by id)."""
+        query = trigrams(text) - self._stop
+        if not query or k <= 0:
+            return []
+        postings = self._postings
+        shared = Counter(chain.from_iterable(postings[g] for g in query if g in postings))
+        sizes, q = self._sizes, len(query)
+        scored = ((2.0 * n / (q + sizes[pos]), pos) for pos, n in shared.items())
+        best = heapq.nsmallest(k, ((-score, pos) for score, pos in scored if score >= min_score))
+        return [Suggestion(self.ids[pos], self.titles[pos], -neg) for neg, pos in best]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": CASE_INDEX_SCHEMA_VERSION,
+            "key": self.key,
+            "max_df": self.max_df,
+            "ids": self.ids,
+            "titles": self.titles,
+            "postings": {g: p.tolist() for g, p in self._postings.items()},
+            "stop": sorted(self._stop),
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any], source: str = "<case index>") -> CaseIndex:
+        if not isinstance(raw, dict) or raw.get("schema_version") != CASE_INDEX_SCHEMA_VERSION:
+            raise ValidationError(f"{source}: not a case index (schema_version {CASE_INDEX_SCHEMA_VERSION})")
+        try:
+            ids, titles = list(raw["ids"]), list(raw["titles"])
+            if len(ids) != len(titles):
+                raise ValueError("ids and titles differ in length")
+            index = cls(ids, titles, max_df=int(raw["max_df"]), key=str(raw["key"]))
+            postings = {str(g): array("i", p) for g, p in raw["postings"].items()}
+            if any(pos < 0 or pos >= len(ids) for p in postings.values() for pos in p):
+                raise ValueError("posting references an unknown case")
+            index._set_postings(postings, stop=set(raw["stop"]))
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            raise ValidationError(f"{source}: malformed case index ({e})") from e
+        return index
+
+    def save(self, path: str | Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.to_dict(), separators=(",", ":")) + "\n", encoding="utf-8")
+        return p
+
+    @classmethod
+    def load(cls, path: str | Path) -> CaseIndex:
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise IngestionError(f"Case index '{path}': file not found") from e
+        except (OSError, json.JSONDecodeError) as e:
+            raise IngestionError(f"Case index '{path}': unable to read ({e})") from e
+        return cls.from_dict(raw, f"Case index '{path}'")
+
+    def _set_postings(self, postings: dict[str, array], stop: set[str] | None = None) -> None:
+        # Trigrams above max_df are dropped from postings and from the case sizes alike.
+        if stop is None:
+            stop = {g for g, p in postings.items() if len(p) > self.max_df}
+        self._stop = stop
+        self._postings = {g: p for g, p in postings.items() if g not in stop}
+        sizes = self._sizes
+        for p in self._postings.values():
+            for pos in p:
+                sizes[pos] += 1
+
+
+_cache: dict[str, CaseIndex] = {}
+_cache_lock = threading.Lock()  # batch and server runs share the cache across threads
+
+
+def index_for(test_cases: Mapping[str, TestCaseModel]) -> CaseIndex:
+    """The index for this catalog, reused across runs while it stays among the recent ones."""
+    key = catalog_key(test_cases)
+    with _cache_lock:
+        index = _cache.pop(key, None)
+        if index is not None:
+            _cache[key] = index  # most recently used last
+            return index
+    # Built outside the lock so other catalogs' lookups do not wait; a concurrent build of the
+    # same catalog keeps whichever index was stored first.
+    built = CaseIndex.build(test_cases, key=key)
+    with _cache_lock:
+        index = _cache.pop(key, built)
+        _cache[key] = index
+        while len(_cache) > _CACHE_SIZE:
+            del _cache[next(iter(_cache))]
+    return index
+
+
+def suggest_all(
+    index: CaseIndex,
+    names: Iterable[str],
+    k: int = DEFAULT_SUGGESTIONS,
+    *,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> dict[str, list[Suggestion]]:
+    """Suggestions per distinct name, in first-seen order."""
+    out: dict[str, list[Suggestion]] = {}
+    for name in names:
+        if name not in out:
+            out[name] = index.suggest(name, k, min_score=min_score)
+    return out
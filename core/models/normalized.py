@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from core.models.test_case import TestCaseModel
@@ -8,7 +9,7 @@ from core.models.test_result import TestResultModel
 
 @dataclass(frozen=True, slots=True)
 class NormalizedData:
-    test_cases: dict[str, TestCaseModel]
+    test_cases: Mapping[str, TestCaseModel]  # a dict, or a disk-backed RunCatalog
     results: list[TestResultModel]
 
 
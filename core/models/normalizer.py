@@ -18,6 +18,18 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
     - Invalid duration_sec values
     - Empty/missing required fields
     """
+    return NormalizedData(
+        test_cases=normalize_test_cases(test_case_dicts),
+        results=normalize_results(result_dicts),
+    )
+
+
+def normalize_test_cases(test_case_dicts: list[dict]) -> dict[str, TestCaseModel]:
+    """
+    Normalize test case dictionaries into a catalog keyed by id.
+
+    The returned catalog holds immutable models and can be shared between runs.
+    """
     test_cases: dict[str, TestCaseModel] = {}
     for d in test_case_dicts:
         tc_id = _get_str_field(d, "id", required=True).strip()
@@ -38,7 +50,13 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
             priority=priority,
             component=component,
         )
+    return test_cases
 
+
+def normalize_results(result_dicts: list[dict]) -> list[TestResultModel]:
+    """
+    Normalize result dictionaries into typed results (same validation rules as normalize()).
+    """
     results: list[TestResultModel] = []
     for d in result_dicts:
         result_id = _get_str_field(d, "id", required=True).strip()
@@ -57,6 +75,7 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
                 raise ValidationError(f"Invalid duration_sec value: {d['duration_sec']}") from e
 
         raw_name = _none_if_blank(_get_str_field(d, "raw_name", required=False))
+        failure_text = _none_if_blank(_get_str_field(d, "failure_text", required=False))
 
         results.append(
             TestResultModel(
@@ -64,10 +83,10 @@ def normalize(test_case_dicts: list[dict], result_dicts: list[dict]) -> Normaliz
                 status=status,
                 duration_sec=duration_sec,
                 raw_name=raw_name,
+                failure_text=failure_text,
             )
         )
-
-    return NormalizedData(test_cases=test_cases, results=results)
+    return results
 
 
 def _get_str_field(d: dict, key: str, required: bool) -> str:
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from core.scoring.policy import ScoringPolicy
+    from core.scoring.subscores import SubScores
 
 
 class RiskLevel(str, Enum):
@@ -73,6 +77,7 @@ class ReadinessReport:
     assumptions: List[str]  # Explicit assumptions made
     signal_summary: dict[str, int]  # Count of signals by type
     metrics: dict  # Deterministic computed metrics used for scoring/reporting
+    dimensions: Optional[dict] = None  # Per-dimension sub-score basis (core.scoring.subscores)
 
     def __post_init__(self):
         """Validate readiness report."""
@@ -82,77 +87,60 @@ class ReadinessReport:
 
 def compute_release_readiness_score(metrics: dict) -> int:
     """
-    Compute a deterministic release readiness score (0..100).
+    Compute a deterministic release readiness score (0..100) with the default scoring policy.
 
-    Explainable penalty model:
+    Explainable penalty model (core.scoring.policy.DEFAULT_POLICY):
     - failure_rate penalty: 1 point per 1% failed (capped at 70)
     - skip_rate penalty: 0.5 points per 1% skipped (capped at 20)
     - unmapped_rate penalty: 0.5 points per 1% unmapped (capped at 20)
     where unmapped_rate = unmapped_results / total_results (0 if total_results==0)
     """
-    failure_rate = float(metrics.get("failure_rate", 0.0) or 0.0)
-    skip_rate = float(metrics.get("skip_rate", 0.0) or 0.0)
-    total_results = int(metrics.get("total_results", 0) or 0)
-    unmapped_results = int(metrics.get("unmapped_results", 0) or 0)
+    from core.scoring.policy import default_policy
 
-    unmapped_rate = (unmapped_results / total_results) if total_results > 0 else 0.0
-
-    failure_penalty = min(70, int(round(failure_rate * 100)))
-    skip_penalty = min(20, int(round(skip_rate * 50)))
-    unmapped_penalty = min(20, int(round(unmapped_rate * 50)))
-
-    score = 100 - failure_penalty - skip_penalty - unmapped_penalty
-    if score < 0:
-        score = 0
-    if score > 100:
-        score = 100
-    return int(score)
+    return default_policy().score(metrics)
 
 
 def classify_risk(score: int, metrics: dict) -> RiskLevel:
     """
-    Classify risk using score thresholds with simple metric-based escalations.
+    Classify risk using score thresholds with simple metric-based escalations (default policy).
     """
-    failure_rate = float(metrics.get("failure_rate", 0.0) or 0.0)
-    skip_rate = float(metrics.get("skip_rate", 0.0) or 0.0)
-    total_results = int(metrics.get("total_results", 0) or 0)
-    unmapped_results = int(metrics.get("unmapped_results", 0) or 0)
-    unmapped_rate = (unmapped_results / total_results) if total_results > 0 else 0.0
-
-    # Escalate to HIGH if major execution/traceability issues are present.
-    if failure_rate >= 0.2 or unmapped_rate >= 0.3:
-        return RiskLevel.HIGH
-
-    # Escalate LOW->MEDIUM if significant skipping is present.
-    if score >= 85 and (skip_rate > 0.1 or unmapped_rate > 0.05):
-        return RiskLevel.MEDIUM
+    from core.scoring.policy import default_policy
 
-    if score >= 85:
-        return RiskLevel.LOW
-    if score >= 70:
-        return RiskLevel.MEDIUM
-    return RiskLevel.HIGH
+    return default_policy().classify(score, metrics)
 
 
-def build_readiness_report(metrics: dict) -> ReadinessReport:
+def build_readiness_report(
+    metrics: dict,
+    *,
+    policy: ScoringPolicy | None = None,
+    dimensions: SubScores | None = None,
+) -> ReadinessReport:
     """
     Build a minimal deterministic readiness report from computed metrics.
+
+    `policy` (core.scoring.policy) decides score, risk level and recommendation; the default
+    policy is the built-in formula. `dimensions` (core.scoring.subscores) provides the
+    stability/regression/coverage sub-scores; without it, or for a dimension without
+    evidence, the sub-score equals the overall score.
     """
-    score_int = compute_release_readiness_score(metrics)
-    risk_level = classify_risk(score_int, metrics)
+    from core.scoring.policy import default_policy
+
+    evaluation = (policy or default_policy()).evaluate(metrics)
+    score_int = evaluation.score
+    risk_level = evaluation.risk_level
+    recommendation = evaluation.recommendation
 
-    if risk_level == RiskLevel.LOW:
-        recommendation = ReleaseRecommendation.APPROVE
-    elif risk_level == RiskLevel.MEDIUM:
-        recommendation = ReleaseRecommendation.CONDITIONAL
-    else:
-        recommendation = ReleaseRecommendation.REJECT
+    def _dimension(name: str) -> float:
+        if dimensions is None:
+            return float(score_int)
+        value = getattr(dimensions, name).score
+        return float(score_int) if value is None else float(value)
 
     readiness_score = ReadinessScore(
         overall_score=float(score_int),
-        stability_score=float(score_int),
-        regression_score=float(score_int),
-        coverage_score=float(score_int),
+        stability_score=_dimension("stability"),
+        regression_score=_dimension("regression"),
+        coverage_score=_dimension("coverage"),
         risk_level=risk_level,
         recommendation=recommendation,
     )
@@ -201,6 +189,16 @@ def build_readiness_report(metrics: dict) -> ReadinessReport:
     assumptions = [
         "Score/risk computed deterministically from current-run test metrics only (no LLM judging, no trend/history inputs)."
     ]
+    if policy is not None and policy.name != "default":
+        assumptions.append(f"Score/risk/recommendation computed with scoring policy '{policy.name}'.")
+    if dimensions is not None:
+        for name, dim in (
+            ("stability", dimensions.stability),
+            ("regression", dimensions.regression),
+            ("coverage", dimensions.coverage),
+        ):
+            if dim.score is None:
+                assumptions.append(f"{name.capitalize()} sub-score falls back to the overall score ({dim.basis}).")
 
     signal_summary = {
         "failed": failed,
@@ -215,5 +213,6 @@ def build_readiness_report(metrics: dict) -> ReadinessReport:
         assumptions=assumptions,
         signal_summary=signal_summary,
         metrics=dict(metrics),
+        dimensions=dimensions.to_dict() if dimensions is not None else None,
     )
 
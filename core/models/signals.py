@@ -48,7 +48,10 @@ class RegressionSignal(Signal):
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Union
+
+# Items shown per list-valued evidence line (e.g. flaky test ids) unless a caller asks otherwise.
+DEFAULT_EVIDENCE_ITEMS = 20
 
 
 class SignalType(str, Enum):
@@ -59,15 +62,44 @@ class SignalType(str, Enum):
     COVERAGE = "coverage"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class Fact:
+    """One evidence line kept as its raw value and formatted only when rendered.
+
+    Scalars render as `label: format(value, spec)`; list-like values render as a
+    comma-separated list capped to `max_items` with a "(+N more)" suffix.
+    """
+
+    label: str
+    value: Any
+    spec: str = ""
+
+    def render(self, max_items: int = DEFAULT_EVIDENCE_ITEMS) -> str:
+        if isinstance(self.value, (list, tuple, set, frozenset)):
+            items = sorted(self.value) if isinstance(self.value, (set, frozenset)) else self.value
+            text = ", ".join(str(v) for v in items[:max_items])
+            if len(items) > max_items:
+                text += f" (+{len(items) - max_items} more)"
+            return f"{self.label}: {text}"
+        return f"{self.label}: {format(self.value, self.spec)}"
+
+
+EvidenceItem = Union[str, Fact]
+
+
+@dataclass(slots=True)
 class Signal:
-    """Generic signal extracted from test results or artifacts."""
+    """Generic signal extracted from test results or artifacts.
+
+    Evidence items are plain strings or Facts; render_evidence() produces the
+    human-readable lines when a report actually shows them.
+    """
 
     signal_type: SignalType
     name: str
     value: float
     description: str
-    evidence: list[str]  # Traceable evidence items
+    evidence: list[EvidenceItem]  # Traceable evidence items
     metadata: Optional[dict[str, Any]] = None
 
     def __post_init__(self):
@@ -79,23 +111,30 @@ class Signal:
         if not self.evidence:
             raise ValueError("evidence cannot be empty")
 
+    def render_evidence(self, max_items: int = DEFAULT_EVIDENCE_ITEMS) -> list[str]:
+        """Evidence as text, with list-valued facts capped to `max_items` entries."""
+        return render_evidence(self.evidence, max_items)
+
 
-@dataclass
+@dataclass(slots=True)
 class StabilitySignal(Signal):
     """Stability-related signal."""
 
     def __post_init__(self):
         """Validate and set signal type."""
-        super().__post_init__()
+        Signal.__post_init__(self)  # zero-argument super() does not work in slotted dataclasses
         self.signal_type = SignalType.STABILITY
 
 
-@dataclass
+@dataclass(slots=True)
 class RegressionSignal(Signal):
     """Regression-related signal."""
 
     def __post_init__(self):
         """Validate and set signal type."""
-        super().__post_init__()
+        Signal.__post_init__(self)
         self.signal_type = SignalType.REGRESSION
 
+
+def render_evidence(evidence: Iterable[EvidenceItem], max_items: int = DEFAULT_EVIDENCE_ITEMS) -> list[str]:
+    return [item if isinstance(item, str) else item.render(max_items) for item in evidence]
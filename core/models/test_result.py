@@ -9,5 +9,6 @@ class TestResultModel:
     status: str
     duration_sec: float | None = None
     raw_name: str | None = None
+    failure_text: str | None = None  # bounded <failure>/<error> text, failed results only
 
 
@@ -0,0 +1,357 @@
+"""
+Persistent case catalog (SQLite) for catalogs too large to load into a dict per run.
+
+CatalogIndex.sync() mirrors a test cases CSV into a SQLite file and keeps it current:
+  - CSV unchanged (same size and mtime): nothing is read
+  - rows only appended (old bytes unchanged): only the new rows are parsed and inserted
+  - anything else: the CSV is streamed once; changed rows are rewritten and removed rows
+    deleted, so the database file is updated in place rather than rebuilt
+Rows follow the same rules as load_test_cases_csv() + normalize_test_cases().
+
+A run then opens a RunCatalog: a read-only Mapping[str, TestCaseModel] that prefetches
+only the ids present in the run's results. len() is the stored catalog size and the
+per-component case counts are precomputed at sync, so memory and time per run follow
+the run, not the catalog. Iterating a RunCatalog streams the whole catalog from disk.
+
+Mapping suggestions for unmapped results (core.mapping.suggest) use trigram postings
+stored in the same file: built by one catalog scan the first time they are needed, then
+kept current by sync() (appended rows add their trigrams, a full resync rebuilds them).
+A query reads only the postings of its own trigrams and the titles of the candidates.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.test_case import TestCaseModel
+from core.parsers.csv_loader import iter_test_cases_csv
+
+if TYPE_CHECKING:
+    from core.mapping.suggest import Suggestion
+
+CATALOG_INDEX_SCHEMA_VERSION = 1
+_LOOKUP_BATCH = 500  # ids per `IN (...)` query, below SQLite's host parameter limit
+_HASH_CHUNK = 1 << 20
+
+_COLUMNS = "id, title, priority, component, description"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    priority TEXT,
+    component TEXT,
+    description TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS components (component TEXT PRIMARY KEY, cases INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS grams (gram TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (gram, id)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS gram_df (gram TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;
+"""
+
+
+class CatalogIndex:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+            version = self._meta("schema_version")
+            if version is None:
+                with self._db:
+                    self._set_meta(schema_version=CATALOG_INDEX_SCHEMA_VERSION)
+            elif int(version) != CATALOG_INDEX_SCHEMA_VERSION:
+                raise ValidationError(
+                    f"Catalog index '{path}': schema_version {version} (expected {CATALOG_INDEX_SCHEMA_VERSION})"
+                )
+        except sqlite3.DatabaseError as e:
+            raise IngestionError(f"Catalog index '{path}': unable to open ({e})") from e
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> CatalogIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def total_cases(self) -> int:
+        return int(self._meta("total_cases") or 0)
+
+    def sync(self, csv_path: str | Path) -> str:
+        """Bring the index up to date with `csv_path`; returns "unchanged", "appended" or "rebuilt"."""
+        csv_path = Path(csv_path)
+        try:
+            st = csv_path.stat()
+        except FileNotFoundError as e:
+            raise IngestionError(f"CSV '{csv_path}': file not found") from e
+        except OSError as e:
+            raise IngestionError(f"CSV '{csv_path}': unable to read file ({e})") from e
+
+        source = str(csv_path.resolve())
+        old_size = int(self._meta("size") or -1)
+        same_source = self._meta("source") == source
+        if same_source and old_size == st.st_size and self._meta("mtime_ns") == str(st.st_mtime_ns):
+            return "unchanged"
+
+        rows = int(self._meta("rows") or 0)
+        digest = hashlib.sha256()
+        appended = (
+            same_source
+            and 0 < old_size < st.st_size
+            and self._meta("ends_with_newline") == "1"
+            and _hash_range(digest, csv_path, 0, old_size) == self._meta("sha256")
+        )
+        try:
+            with self._db:
+                if appended:
+                    rows += self._insert(iter_test_cases_csv(csv_path, offset=old_size, first_row=rows + 2))
+                    _hash_range(digest, csv_path, old_size, st.st_size)
+                else:
+                    if self.total_cases == 0:  # first build: nothing to compare against
+                        rows = self._insert(iter_test_cases_csv(csv_path))
+                    else:
+                        rows = self._resync(iter_test_cases_csv(csv_path))
+                        self._refresh_counts()
+                        if self._has_grams():
+                            self._build_grams()
+                    digest = hashlib.sha256()
+                    _hash_range(digest, csv_path, 0, st.st_size)
+                self._set_meta(
+                    source=source,
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    sha256=digest.hexdigest(),
+                    ends_with_newline=int(_ends_with_newline(csv_path, st.st_size)),
+                    rows=rows,
+                )
+        except sqlite3.DatabaseError as e:
+            raise IngestionError(f"Catalog index '{self.path}': update failed ({e})") from e
+        return "appended" if appended else "rebuilt"
+
+    def lookup(self, ids: Iterable[str]) -> dict[str, TestCaseModel]:
+        """Cases for the given ids that exist in the catalog (unknown ids are left out)."""
+        wanted = list(dict.fromkeys(ids))
+        found: dict[str, TestCaseModel] = {}
+        for i in range(0, len(wanted), _LOOKUP_BATCH):
+            batch = wanted[i : i + _LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            for row in self._db.execute(f"SELECT {_COLUMNS} FROM cases WHERE id IN ({marks})", batch):
+                found[row[0]] = _case(row)
+        return found
+
+    def iter_cases(self) -> Iterator[TestCaseModel]:
+        """Every case, in id order, streamed from disk."""
+        for row in self._db.execute(f"SELECT {_COLUMNS} FROM cases ORDER BY id"):
+            yield _case(row)
+
+    def component_counts(self) -> dict[str | None, int]:
+        """Cases per component (None for cases without one), as of the last sync."""
+        return {(c or None): n for c, n in self._db.execute("SELECT component, cases FROM components")}
+
+    def for_run(self, ids: Iterable[str]) -> RunCatalog:
+        return RunCatalog(self, ids)
+
+    def suggest(self, text: str, k: int = 3, *, min_score: float = 0.3) -> list[Suggestion]:
+        """Same results as CaseIndex.build(catalog).suggest(), from the stored postings."""
+        from core.mapping.suggest import Suggestion, default_max_df, dice_top, trigrams
+
+        if not self._has_grams():
+            with self._db:
+                self._build_grams()
+        db = self._db
+        stop = {g for (g,) in db.execute("SELECT gram FROM gram_df WHERE df > ?", (default_max_df(self.total_cases),))}
+        query = sorted(trigrams(text) - stop)
+        if not query or k <= 0:
+            return []
+        shared: Counter[str] = Counter()
+        for i in range(0, len(query), _LOOKUP_BATCH):
+            batch = query[i : i + _LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            shared.update(dict(db.execute(f"SELECT id, COUNT(*) FROM grams WHERE gram IN ({marks}) GROUP BY id", batch)))
+        titles = {case_id: tc.title for case_id, tc in self.lookup(shared).items()}
+        sizes = {case_id: len(trigrams(f"{case_id} {title}") - stop) for case_id, title in titles.items()}
+        best = dice_top(shared, sizes, len(query), k, min_score)
+        return [Suggestion(case_id, titles[case_id], score) for score, case_id in best]
+
+    def _has_grams(self) -> bool:
+        return self._meta("grams") == "1"
+
+    def _build_grams(self) -> None:
+        """(Re)build the trigram postings with one scan of the cases (inside a transaction)."""
+        db = self._db
+        db.execute("DELETE FROM grams")
+        db.execute("DELETE FROM gram_df")
+        self._add_grams(db.execute("SELECT id, title FROM cases"), update_df=False)
+        db.execute("INSERT INTO gram_df (gram, df) SELECT gram, COUNT(*) FROM grams GROUP BY gram")
+        self._set_meta(grams=1)
+
+    def _add_grams(self, cases: Iterable[tuple[str, str]], *, update_df: bool = True) -> None:
+        from core.mapping.suggest import trigrams
+
+        df: Counter[str] = Counter()
+
+        def rows() -> Iterator[tuple[str, str]]:
+            for case_id, title in cases:
+                grams = trigrams(f"{case_id} {title}")
+                if update_df:
+                    df.update(grams)
+                for g in grams:
+                    yield g, case_id
+
+        self._db.executemany("INSERT INTO grams (gram, id) VALUES (?, ?)", rows())
+        if update_df:
+            self._db.executemany(
+                "INSERT INTO gram_df (gram, df) VALUES (?, ?) ON CONFLICT(gram) DO UPDATE SET df = df + excluded.df",
+                df.items(),
+            )
+
+    def _insert(self, case_dicts: Iterable[dict]) -> int:
+        """Insert new cases and add them to the component counts (append-only path)."""
+        added: Counter[str] = Counter()
+        titles: list[tuple[str, str]] = []
+        with_grams = self._has_grams()
+        insert = self._db.execute
+        for d in case_dicts:
+            row = _row(d)
+            try:
+                insert(f"INSERT INTO cases ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)", row)
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Duplicate test case id: {row[0]}") from e
+            added[row[3] or ""] += 1
+            if with_grams:
+                titles.append((row[0], row[1]))
+        if titles:
+            self._add_grams(titles)
+        self._db.executemany(
+            "INSERT INTO components (component, cases) VALUES (?, ?) "
+            "ON CONFLICT(component) DO UPDATE SET cases = cases + excluded.cases",
+            added.items(),
+        )
+        self._set_meta(total_cases=self.total_cases + sum(added.values()))
+        return sum(added.values())
+
+    def _resync(self, case_dicts: Iterable[dict]) -> int:
+        db = self._db
+        db.execute("CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY) WITHOUT ROWID")
+        db.execute("DELETE FROM seen")
+        count = 0
+        for d in case_dicts:
+            row = _row(d)
+            try:
+                db.execute("INSERT INTO seen (id) VALUES (?)", (row[0],))
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Duplicate test case id: {row[0]}") from e
+            # Rewrite only rows whose content changed.
+            db.execute(
+                f"INSERT INTO cases ({_COLUMNS}) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET title = excluded.title, priority = excluded.priority, "
+                "component = excluded.component, description = excluded.description "
+                "WHERE (title, priority, component, description) IS NOT "
+                "(excluded.title, excluded.priority, excluded.component, excluded.description)",
+                row,
+            )
+            count += 1
+        db.execute("DELETE FROM cases WHERE id NOT IN (SELECT id FROM seen)")
+        db.execute("DELETE FROM seen")
+        return count
+
+    def _refresh_counts(self) -> None:
+        self._db.execute("DELETE FROM components")
+        self._db.execute(
+            "INSERT INTO components (component, cases) SELECT COALESCE(component, ''), COUNT(*) FROM cases GROUP BY 1"
+        )
+        (total,) = self._db.execute("SELECT COALESCE(SUM(cases), 0) FROM components").fetchone()
+        self._set_meta(total_cases=total)
+
+    def _meta(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, **values: object) -> None:
+        self._db.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+
+class RunCatalog(Mapping[str, TestCaseModel]):
+    """
+    The catalog as one run sees it: cases for the run's ids are prefetched in batches;
+    other ids are looked up on demand and remembered, hits and misses alike.
+    """
+
+    def __init__(self, index: CatalogIndex, ids: Iterable[str]):
+        self._index = index
+        wanted = set(ids)
+        self._cases: dict[str, TestCaseModel | None] = dict.fromkeys(wanted)
+        self._cases.update(index.lookup(wanted))
+        self._total = index.total_cases
+
+    def __getitem__(self, case_id: str) -> TestCaseModel:
+        if case_id in self._cases:
+            tc = self._cases[case_id]
+        else:
+            tc = self._cases[case_id] = self._index.lookup([case_id]).get(case_id)
+        if tc is None:
+            raise KeyError(case_id)
+        return tc
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[str]:
+        return (tc.id for tc in self._index.iter_cases())
+
+    def items(self):  # type: ignore[override]
+        # One ordered scan instead of a lookup per id.
+        return ((tc.id, tc) for tc in self._index.iter_cases())
+
+    def values(self):  # type: ignore[override]
+        return self._index.iter_cases()
+
+    def component_counts(self) -> dict[str | None, int]:
+        return self._index.component_counts()
+
+    def suggest_index(self) -> CatalogIndex:
+        """Suggestions from the stored trigram postings (no catalog scan per run)."""
+        return self._index
+
+
+def _row(d: dict) -> tuple:
+    return (d["id"], d["title"] or "", d["priority"], d["component"], d["description"])
+
+
+def _case(row: tuple) -> TestCaseModel:
+    case_id, title, priority, component, description = row
+    return TestCaseModel(id=case_id, title=title, priority=priority, component=component, description=description)
+
+
+def _hash_range(digest: Any, path: Path, start: int, stop: int) -> str:
+    """Feed bytes [start, stop) of `path` into `digest`; returns the hex digest so far."""
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = f.read(min(_HASH_CHUNK, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def _ends_with_newline(path: Path, size: int) -> bool:
+    if size == 0:
+        return False
+    with path.open("rb") as f:
+        f.seek(size - 1)
+        return f.read(1) == b"\n"
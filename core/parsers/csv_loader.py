@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import csv
+import io
 from pathlib import Path
+from typing import Iterator
 
 from core.models.errors import IngestionError
 
@@ -13,11 +15,28 @@ def load_test_cases_csv(path: str) -> list[dict]:
     Output keys are exactly:
       { "id": str, "title": str, "description": str|None, "priority": str|None, "component": str|None }
     """
+    return list(iter_test_cases_csv(path))
+
+
+def iter_test_cases_csv(path: str | Path, *, offset: int = 0, first_row: int = 2) -> Iterator[dict]:
+    """
+    Stream the rows of load_test_cases_csv() one at a time.
+
+    With `offset` (a byte position at a row boundary), only rows from there on are read;
+    the header is still taken from the first line. `first_row` is the CSV line number of
+    the first row read, for error messages (the header is line 1).
+    """
     csv_path = Path(path)
     try:
-        with csv_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
+        with csv_path.open("rb") as raw:
+            header_line = raw.readline().decode("utf-8")
+            headers = next(csv.reader([header_line]), [])
+            if offset > 0:
+                raw.seek(offset)
+            else:
+                raw.seek(len(header_line.encode("utf-8")))
+            f = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            reader = csv.DictReader(f, fieldnames=headers)
             header_map = {_canon(h): h for h in headers if h is not None}
 
             id_col = _pick_col(header_map, {"id", "test_id", "case_id"})
@@ -31,9 +50,7 @@ def load_test_cases_csv(path: str) -> list[dict]:
             prio_col = _pick_col(header_map, {"priority", "severity"})
             comp_col = _pick_col(header_map, {"component", "area", "module"})
 
-            out: list[dict] = []
-            # csv.DictReader line numbers start at 2 for first data row (header is line 1)
-            for row_idx, row in enumerate(reader, start=2):
+            for row_idx, row in enumerate(reader, start=first_row):
                 tc_id = _get_cell(row, id_col)
                 if tc_id == "":
                     raise IngestionError(f"CSV '{path}': empty id at row {row_idx}")
@@ -43,23 +60,21 @@ def load_test_cases_csv(path: str) -> list[dict]:
                 priority = _none_if_blank(_get_cell(row, prio_col)) if prio_col else None
                 component = _none_if_blank(_get_cell(row, comp_col)) if comp_col else None
 
-                out.append(
-                    {
-                        "id": tc_id,
-                        "title": title,
-                        "description": description,
-                        "priority": priority,
-                        "component": component,
-                    }
-                )
-
-            return out
+                yield {
+                    "id": tc_id,
+                    "title": title,
+                    "description": description,
+                    "priority": priority,
+                    "component": component,
+                }
     except IngestionError:
         raise
     except FileNotFoundError as e:
         raise IngestionError(f"CSV '{path}': file not found") from e
     except OSError as e:
         raise IngestionError(f"CSV '{path}': unable to read file ({e})") from e
+    except UnicodeDecodeError as e:
+        raise IngestionError(f"CSV '{path}': not valid UTF-8 ({e})") from e
     except csv.Error as e:
         raise IngestionError(f"CSV '{path}': invalid CSV ({e})") from e
 
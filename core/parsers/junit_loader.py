@@ -7,6 +7,8 @@ from xml.etree import ElementTree as ET
 from core.models.errors import IngestionError
 
 _TC_ID_RE = re.compile(r"\bTC-\d+\b")
+# Failure text kept per result: enough for the first lines of a message and stack trace.
+MAX_FAILURE_TEXT = 512
 
 
 def load_junit_results(path: str) -> list[dict]:
@@ -14,7 +16,11 @@ def load_junit_results(path: str) -> list[dict]:
     Load JUnit XML results into a list of dictionaries.
 
     Output keys are exactly:
-      { "id": str, "status": str, "duration_sec": float|None, "raw_name": str|None }
+      { "id": str, "status": str, "duration_sec": float|None, "raw_name": str|None,
+        "failure_text": str|None }
+
+    `failure_text` is the first <failure>/<error> of a failed testcase as "type: message"
+    followed by its text, cut to MAX_FAILURE_TEXT characters.
     """
     xml_path = Path(path)
     try:
@@ -26,8 +32,24 @@ def load_junit_results(path: str) -> list[dict]:
     except ET.ParseError as e:
         raise IngestionError(f"JUnit '{path}': invalid XML ({e})") from e
 
-    root = tree.getroot()
+    return _results_from_root(tree.getroot(), path)
+
+
+def load_junit_results_from_bytes(payload: bytes | str, source: str = "<payload>") -> list[dict]:
+    """
+    Same as load_junit_results(), for an in-memory XML document (e.g. an HTTP request body).
+
+    `source` is only used in error messages.
+    """
+    try:
+        root = ET.fromstring(payload)
+    except ET.ParseError as e:
+        raise IngestionError(f"JUnit '{source}': invalid XML ({e})") from e
+
+    return _results_from_root(root, source)
 
+
+def _results_from_root(root: ET.Element, path: str) -> list[dict]:
     out: list[dict] = []
     for tc in _iter_testcases(root):
         raw_name = (tc.attrib.get("name") or "").strip()
@@ -42,7 +64,7 @@ def load_junit_results(path: str) -> list[dict]:
                     f"JUnit '{path}': invalid testcase time value '{time_attr}' for name '{raw_name}'"
                 ) from e
 
-        status = _status_from_testcase(tc)
+        status, failure_text = _outcome_from_testcase(tc)
 
         m = _TC_ID_RE.search(raw_name)
         result_id = m.group(0) if m else raw_name
@@ -56,6 +78,7 @@ def load_junit_results(path: str) -> list[dict]:
                 "status": status,
                 "duration_sec": duration_sec,
                 "raw_name": raw_name if raw_name != "" else None,
+                "failure_text": failure_text,
             }
         )
 
@@ -69,21 +92,31 @@ def _iter_testcases(root: ET.Element):
             yield el
 
 
-def _status_from_testcase(tc: ET.Element) -> str:
-    has_failure_or_error = False
+def _outcome_from_testcase(tc: ET.Element) -> tuple[str, str | None]:
+    failure: ET.Element | None = None
     has_skipped = False
     for child in list(tc):
         t = _local_name(child.tag)
         if t in {"failure", "error"}:
-            has_failure_or_error = True
+            if failure is None:
+                failure = child
         elif t == "skipped":
             has_skipped = True
 
-    if has_failure_or_error:
-        return "failed"
+    if failure is not None:
+        return "failed", _failure_text(failure)
     if has_skipped:
-        return "skipped"
-    return "passed"
+        return "skipped", None
+    return "passed", None
+
+
+def _failure_text(el: ET.Element) -> str | None:
+    message = (el.attrib.get("message") or "")[:MAX_FAILURE_TEXT].strip()
+    kind = (el.attrib.get("type") or "").strip()
+    head = f"{kind}: {message}" if kind and message else kind or message
+    body = (el.text or "")[:MAX_FAILURE_TEXT].strip()
+    text = "\n".join(part for part in (head, body) if part)
+    return text[:MAX_FAILURE_TEXT] or None
 
 
 def _local_name(tag: str) -> str:
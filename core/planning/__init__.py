@@ -0,0 +1 @@
+"""CI planning from readiness inputs: duration-balanced test shards."""
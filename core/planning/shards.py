@@ -0,0 +1,161 @@
+"""
+Duration-aware shard planning: split a case catalog into N shards of similar wall-clock time.
+
+Each case gets an estimated duration (see estimate_durations()) and the cases are packed
+with LPT (longest processing time first): take the units longest first and give each to
+the shard with the smallest load so far (a heap). LPT's makespan is within 4/3 of optimal
+and the pass costs O(n log n).
+
+With component affinity, the cases of one component form a single unit so they land on
+the same shard (shared fixtures, warm caches). A component bigger than an even share
+(total / N) cannot stay together without holding back the makespan, so it is split into
+its cases; the plan reports how many components were split.
+"""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+from core.models.errors import ValidationError
+from core.models.test_case import TestCaseModel
+
+if TYPE_CHECKING:
+    from core.history.durations import DurationBaselines
+
+DEFAULT_DURATION_SEC = 1.0
+
+
+@dataclass(slots=True)
+class Shard:
+    index: int
+    load_sec: float = 0.0
+    tests: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class ShardPlan:
+    shards: list[Shard]
+    estimates: dict[str, float]  # case id -> estimated seconds
+    estimated: int  # cases with a measured (current or historical) duration
+    split_components: int = 0  # components spread over several shards (affinity only)
+
+    @property
+    def total_sec(self) -> float:
+        return sum(s.load_sec for s in self.shards)
+
+    @property
+    def makespan_sec(self) -> float:
+        return max((s.load_sec for s in self.shards), default=0.0)
+
+    @property
+    def lower_bound_sec(self) -> float:
+        """No plan can finish sooner: an even split, or the single longest case."""
+        if not self.shards:
+            return 0.0
+        return max(self.total_sec / len(self.shards), max(self.estimates.values(), default=0.0))
+
+    @property
+    def imbalance(self) -> float:
+        """Makespan over the mean shard load (1.0 is perfectly even)."""
+        return imbalance([s.load_sec for s in self.shards])
+
+
+def imbalance(loads: list[float]) -> float:
+    total = sum(loads)
+    return max(loads) * len(loads) / total if total > 0 else 1.0
+
+
+def estimate_durations(
+    case_ids: Iterable[str],
+    current: Mapping[str, float],
+    baselines: DurationBaselines | None = None,
+    *,
+    default_sec: float | None = None,
+) -> tuple[dict[str, float], int]:
+    """
+    Estimated seconds per case and how many of them were measured.
+
+    A case with both a history baseline and a current duration gets one more EWMA step
+    (the baseline mean moved toward the current duration, nothing is stored); either one
+    alone is used as is. Unmeasured cases get `default_sec`, else the median measured
+    estimate, else DEFAULT_DURATION_SEC.
+    """
+    estimates: dict[str, float] = {}
+    missing: list[str] = []
+    for case_id in case_ids:
+        base = baselines.get(case_id) if baselines is not None else None
+        now = current.get(case_id)
+        if base is not None and now is not None:
+            estimates[case_id] = base.mean + baselines.alpha * (now - base.mean)
+        elif base is not None:
+            estimates[case_id] = base.mean
+        elif now is not None:
+            estimates[case_id] = now
+        else:
+            missing.append(case_id)
+
+    measured = len(estimates)
+    if default_sec is None:
+        default_sec = statistics.median(estimates.values()) if estimates else DEFAULT_DURATION_SEC
+    for case_id in missing:
+        estimates[case_id] = default_sec
+    return estimates, measured
+
+
+def plan_shards(
+    test_cases: Mapping[str, TestCaseModel],
+    estimates: Mapping[str, float],
+    n_shards: int,
+    *,
+    affinity: bool = False,
+    measured: int | None = None,
+) -> ShardPlan:
+    """LPT plan of every catalog case over `n_shards` shards (see module docstring)."""
+    if n_shards < 1:
+        raise ValidationError(f"Shard count must be >= 1, got {n_shards}")
+    est = {case_id: float(estimates[case_id]) for case_id in test_cases}
+
+    # Units: (seconds, sort key, case ids). Ties break on the key for deterministic plans.
+    units: list[tuple[float, str, list[str]]] = []
+    if affinity:
+        by_component: dict[str, list[str]] = defaultdict(list)
+        for case_id, tc in test_cases.items():
+            if tc.component:
+                by_component[tc.component].append(case_id)
+            else:
+                units.append((est[case_id], case_id, [case_id]))
+        even_share = sum(est.values()) / n_shards
+        for component, ids in by_component.items():
+            load = sum(est[i] for i in ids)
+            if load > even_share and len(ids) > 1:
+                units.extend((est[i], i, [i]) for i in ids)
+            else:
+                units.append((load, component, sorted(ids)))
+    else:
+        units = [(sec, case_id, [case_id]) for case_id, sec in est.items()]
+    units.sort(key=lambda u: (-u[0], u[1]))
+
+    shards = [Shard(i) for i in range(n_shards)]
+    heap = [(0.0, i) for i in range(n_shards)]
+    for sec, _, ids in units:
+        load, i = heapq.heappop(heap)
+        shards[i].tests.extend(ids)
+        shards[i].load_sec = load + sec
+        heapq.heappush(heap, (shards[i].load_sec, i))
+
+    split = sum(1 for n in _components_per_shard(test_cases, shards).values() if n > 1) if affinity else 0
+    return ShardPlan(shards, est, measured if measured is not None else len(est), split)
+
+
+def _components_per_shard(test_cases: Mapping[str, TestCaseModel], shards: list[Shard]) -> dict[str, int]:
+    seen: dict[str, set[int]] = defaultdict(set)
+    for shard in shards:
+        for case_id in shard.tests:
+            component = test_cases[case_id].component
+            if component:
+                seen[component].add(shard.index)
+    return {c: len(s) for c, s in seen.items()}
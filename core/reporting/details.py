@@ -0,0 +1,334 @@
+"""Per-test / per-component detail tables (bounded in memory, full data in CSV sidecars)."""
+
+from __future__ import annotations
+
+import csv
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
+
+from core.models.normalized import NormalizedData
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+from core.reporting.exporter import AtomicWriter, ExportOptions, final_path
+
+if TYPE_CHECKING:
+    from core.history.durations import DurationRegression
+
+DEFAULT_TOP_N = 20
+
+FAILED_TESTS_COLUMNS = ("id", "raw_name", "mapped", "component", "priority", "duration_sec")
+COMPONENTS_COLUMNS = ("component", "cases", "results", "passed", "failed", "skipped", "failure_rate")
+SUGGESTED_MAPPINGS_COLUMNS = ("alias", "result_id", "results", "case_id", "title", "score", "alternatives")
+FAILURE_CLUSTERS_COLUMNS = ("signature", "failures", "share", "pattern", "example_ids")
+DURATION_REGRESSIONS_COLUMNS = ("id", "duration_sec", "ewma_sec", "stddev_sec", "slowdown_sec", "ratio")
+
+
+@dataclass(frozen=True, slots=True)
+class DetailTable:
+    """
+    A report detail table.
+
+    Only the first `top_n` rows are kept in `rows`; `total_rows` counts every row and
+    `sidecar_path` (if set) points to the CSV file holding the full table.
+    """
+
+    title: str
+    columns: tuple[str, ...]
+    rows: list[tuple[Any, ...]]
+    total_rows: int
+    sidecar_path: str | None = None
+
+
+# Every `name` passed to sidecar_path_for by the pipeline (batch runs check them for clashes).
+SIDECAR_NAMES = ("failed_tests", "components", "aliases", "failure_clusters", "duration_regressions")
+
+
+def sidecar_path_for(out_path: str | Path, name: str) -> Path:
+    """
+    Sidecar CSV path next to a report: reports/report.md -> reports/report.<name>.csv
+    """
+    p = Path(out_path)
+    return p.with_name(f"{p.stem}.{name}.csv")
+
+
+def build_detail_tables(
+    data: NormalizedData,
+    *,
+    out_path: str | Path | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    export: ExportOptions = ExportOptions(),
+) -> list[DetailTable]:
+    """
+    Build the standard detail tables (failed tests, components).
+
+    If out_path is given, full tables are streamed to sidecar CSVs next to it.
+    """
+    failed_sidecar = sidecar_path_for(out_path, "failed_tests") if out_path is not None else None
+    comp_sidecar = sidecar_path_for(out_path, "components") if out_path is not None else None
+    return [
+        build_failed_tests_table(data, top_n=top_n, sidecar_path=failed_sidecar, export=export),
+        build_components_table(data, top_n=top_n, sidecar_path=comp_sidecar, export=export),
+    ]
+
+
+def build_failed_tests_table(
+    data: NormalizedData,
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """
+    One row per failed result (mapped and unmapped), in result order.
+
+    Rows are written to the sidecar as they are visited; only the first `top_n` are retained.
+    """
+    kept: list[tuple[Any, ...]] = []
+    total = 0
+    with _sidecar_writer(sidecar_path, FAILED_TESTS_COLUMNS, export) as write_row:
+        for r in data.results:
+            if r.status != "failed":
+                continue
+            row = failed_test_row(r, data.test_cases.get(r.id))
+            write_row(row)
+            total += 1
+            if len(kept) < top_n:
+                kept.append(row)
+
+    return DetailTable(
+        title="Failed Tests",
+        columns=FAILED_TESTS_COLUMNS,
+        rows=kept,
+        total_rows=total,
+        sidecar_path=str(final_path(sidecar_path, export)) if sidecar_path is not None else None,
+    )
+
+
+def failed_test_row(r: TestResultModel, tc: TestCaseModel | None) -> tuple[Any, ...]:
+    """One Failed Tests row (FAILED_TESTS_COLUMNS) for a failed result; `tc` is None if unmapped."""
+    return (
+        r.id,
+        r.raw_name or "",
+        "yes" if tc is not None else "no",
+        (tc.component if tc is not None else None) or "",
+        (tc.priority if tc is not None else None) or "",
+        "" if r.duration_sec is None else r.duration_sec,
+    )
+
+
+def build_suggested_mappings_table(
+    data: NormalizedData,
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """
+    One row per distinct unmapped result name (raw_name, else id), in result order, with
+    the most similar catalog case and the runner-up candidates. The sidecar doubles as
+    an alias file (see core.mapping.aliases).
+    """
+    from core.mapping.suggest import index_for
+
+    counts: dict[str, list[Any]] = {}  # alias -> [first result id, results]
+    for r in data.results:
+        if r.id in data.test_cases:
+            continue
+        alias = r.raw_name or r.id
+        c = counts.get(alias)
+        if c is None:
+            counts[alias] = [r.id, 1]
+        else:
+            c[1] += 1
+
+    index = None
+    if counts:
+        stored = getattr(data.test_cases, "suggest_index", None)  # disk-backed catalogs (RunCatalog)
+        index = stored() if stored is not None else index_for(data.test_cases)
+    kept: list[tuple[Any, ...]] = []
+    with _sidecar_writer(sidecar_path, SUGGESTED_MAPPINGS_COLUMNS, export) as write_row:
+        for alias, (result_id, n) in counts.items():
+            best, *others = index.suggest(alias) or [None]
+            row = (
+                alias,
+                result_id,
+                n,
+                best.case_id if best else "",
+                best.title if best else "",
+                round(best.score, 3) if best else "",
+                "; ".join(f"{s.case_id} ({s.score:.2f})" for s in others),
+            )
+            write_row(row)
+            if len(kept) < top_n:
+                kept.append(row)
+
+    return DetailTable(
+        title="Suggested Mappings",
+        columns=SUGGESTED_MAPPINGS_COLUMNS,
+        rows=kept,
+        total_rows=len(counts),
+        sidecar_path=str(final_path(sidecar_path, export)) if sidecar_path is not None else None,
+    )
+
+
+def build_failure_clusters_table(
+    data: NormalizedData,
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """
+    Failed results grouped by failure signature (see core.failures.signatures), largest
+    cluster first; `share` is the cluster's fraction of all failed results.
+    """
+    from core.failures.signatures import cluster_failures
+
+    clusters = cluster_failures(data.results)
+    failed = sum(c.count for c in clusters)
+    kept: list[tuple[Any, ...]] = []
+    with _sidecar_writer(sidecar_path, FAILURE_CLUSTERS_COLUMNS, export) as write_row:
+        for c in clusters:
+            row = (c.signature, c.count, round(c.count / failed, 3), c.pattern, "; ".join(c.example_ids))
+            write_row(row)
+            if len(kept) < top_n:
+                kept.append(row)
+
+    return DetailTable(
+        title="Failure Clusters",
+        columns=FAILURE_CLUSTERS_COLUMNS,
+        rows=kept,
+        total_rows=len(clusters),
+        sidecar_path=str(final_path(sidecar_path, export)) if sidecar_path is not None else None,
+    )
+
+
+def build_duration_regressions_table(
+    regressions: list[DurationRegression],
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """Tests slower than their EWMA baseline (DurationBaselines.regressions() order)."""
+    kept: list[tuple[Any, ...]] = []
+    with _sidecar_writer(sidecar_path, DURATION_REGRESSIONS_COLUMNS, export) as write_row:
+        for r in regressions:
+            row = (
+                r.test_id,
+                r.duration_sec,
+                round(r.mean_sec, 3),
+                round(r.stddev_sec, 3),
+                round(r.slowdown_sec, 3),
+                round(r.ratio, 2) if r.mean_sec > 0 else "",
+            )
+            write_row(row)
+            if len(kept) < top_n:
+                kept.append(row)
+
+    return DetailTable(
+        title="Duration Regressions",
+        columns=DURATION_REGRESSIONS_COLUMNS,
+        rows=kept,
+        total_rows=len(regressions),
+        sidecar_path=str(final_path(sidecar_path, export)) if sidecar_path is not None else None,
+    )
+
+
+def build_components_table(
+    data: NormalizedData,
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """
+    Per-component counts over mapped results, worst components first
+    (most failures, then highest failure rate, then name).
+    """
+    return components_table_from_stats(
+        component_stats(data.test_cases, data.results),
+        top_n=top_n,
+        sidecar_path=sidecar_path,
+        export=export,
+    )
+
+
+def component_stats(
+    test_cases: Mapping[str, TestCaseModel],
+    results: Iterable[TestResultModel],
+) -> dict[str, list[int]]:
+    """
+    component -> [cases, results, passed, failed, skipped] over mapped results.
+
+    Additive per result, so stats from several shards can be summed slot by slot.
+    """
+    stats: dict[str, list[int]] = {}
+    precomputed = getattr(test_cases, "component_counts", None)  # disk-backed catalogs (RunCatalog)
+    if precomputed is not None:
+        for component, n in precomputed().items():
+            stats.setdefault(_component_key(component), [0, 0, 0, 0, 0])[0] += n
+    else:
+        for tc in test_cases.values():
+            stats.setdefault(_component_key(tc.component), [0, 0, 0, 0, 0])[0] += 1
+
+    status_slot = {"passed": 2, "failed": 3, "skipped": 4}
+    for r in results:
+        tc = test_cases.get(r.id)
+        if tc is None:
+            continue
+        s = stats.setdefault(_component_key(tc.component), [0, 0, 0, 0, 0])
+        s[1] += 1
+        slot = status_slot.get(r.status)
+        if slot is not None:
+            s[slot] += 1
+    return stats
+
+
+def components_table_from_stats(
+    stats: Mapping[str, list[int]],
+    *,
+    top_n: int = DEFAULT_TOP_N,
+    sidecar_path: str | Path | None = None,
+    export: ExportOptions = ExportOptions(),
+) -> DetailTable:
+    """Components table from component_stats() output (worst components first)."""
+
+    def _failure_rate(s: list[int]) -> float:
+        return s[3] / s[1] if s[1] > 0 else 0.0
+
+    ordered = sorted(stats.items(), key=lambda kv: (-kv[1][3], -_failure_rate(kv[1]), kv[0]))
+
+    kept: list[tuple[Any, ...]] = []
+    with _sidecar_writer(sidecar_path, COMPONENTS_COLUMNS, export) as write_row:
+        for name, s in ordered:
+            row = (name, s[0], s[1], s[2], s[3], s[4], round(_failure_rate(s), 3))
+            write_row(row)
+            if len(kept) < top_n:
+                kept.append(row)
+
+    return DetailTable(
+        title="Components",
+        columns=COMPONENTS_COLUMNS,
+        rows=kept,
+        total_rows=len(ordered),
+        sidecar_path=str(final_path(sidecar_path, export)) if sidecar_path is not None else None,
+    )
+
+
+def _component_key(component: str | None) -> str:
+    return component if component else "(none)"
+
+
+@contextmanager
+def _sidecar_writer(path: str | Path | None, columns: tuple[str, ...], export: ExportOptions) -> Iterator:
+    if path is None:
+        yield lambda row: None
+        return
+
+    with AtomicWriter(path, export, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        yield writer.writerow
@@ -0,0 +1,137 @@
+"""Intermediate report model shared by all output formats (Markdown, JSON, HTML)."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable
+
+from core.models.readiness import ReadinessReport
+from core.reporting.details import DetailTable
+
+SCHEMA_VERSION = 1
+
+# Output format name -> file suffix.
+FORMAT_SUFFIXES = {"md": ".md", "json": ".json", "html": ".html"}
+
+
+@dataclass(frozen=True, slots=True)
+class ReportExtension:
+    """
+    Optional report section contributed by an adapter layer (e.g. AI/LLM stability).
+
+    `markdown` is the pre-rendered section; `data` is its JSON-serializable form.
+    """
+
+    key: str
+    title: str
+    markdown: str
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ReportDocument:
+    """
+    Everything a renderer needs, computed once per run.
+
+    Renderers must not recompute metrics/scores; they only format this model.
+    """
+
+    report: ReadinessReport
+    generated_at: datetime
+    details: list[DetailTable] = field(default_factory=list)
+    extensions: list[ReportExtension] = field(default_factory=list)
+
+
+def build_report_document(
+    report: ReadinessReport,
+    *,
+    details: Iterable[DetailTable] = (),
+    extensions: Iterable[ReportExtension] = (),
+    generated_at: datetime | None = None,
+) -> ReportDocument:
+    return ReportDocument(
+        report=report,
+        generated_at=generated_at if generated_at is not None else datetime.utcnow(),
+        details=list(details),
+        extensions=list(extensions),
+    )
+
+
+def pinned_generated_at() -> datetime:
+    """
+    Timestamp used in deterministic mode: SOURCE_DATE_EPOCH (reproducible-builds convention) if set,
+    otherwise the Unix epoch. Keeps report bytes identical across runs with identical inputs.
+    """
+    raw = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    try:
+        epoch = int(raw) if raw else 0
+    except ValueError as e:
+        raise ValueError(f"SOURCE_DATE_EPOCH must be an integer (got '{raw}')") from e
+    return datetime.utcfromtimestamp(epoch)
+
+
+def parse_formats(value: str) -> tuple[str, ...]:
+    """
+    Parse a comma-separated format list ("json,md,html"), preserving order and dropping duplicates.
+
+    Raises ValueError for unknown formats.
+    """
+    out: list[str] = []
+    for part in value.split(","):
+        fmt = part.strip().lower()
+        if fmt == "":
+            continue
+        if fmt not in FORMAT_SUFFIXES:
+            raise ValueError(f"Unknown report format '{fmt}' (expected one of: {sorted(FORMAT_SUFFIXES)})")
+        if fmt not in out:
+            out.append(fmt)
+    if not out:
+        raise ValueError("At least one report format is required")
+    return tuple(out)
+
+
+def document_to_dict(doc: ReportDocument) -> dict[str, Any]:
+    """
+    Stable JSON-serializable form of a report document (see SCHEMA_VERSION).
+    """
+    report = doc.report
+    score = report.score
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": doc.generated_at.isoformat(timespec="seconds"),
+        "score": {
+            "overall": score.overall_score,
+            "stability": score.stability_score,
+            "regression": score.regression_score,
+            "coverage": score.coverage_score,
+            "risk_level": score.risk_level.value,
+            "recommendation": score.recommendation.value,
+        },
+        "metrics": dict(report.metrics),
+        "dimensions": report.dimensions,
+        "risks": [
+            {
+                "description": r.description,
+                "severity": r.severity.value,
+                "evidence": list(r.evidence),
+                "affected_tests": list(r.affected_tests) if r.affected_tests is not None else None,
+            }
+            for r in report.risks
+        ],
+        "data_availability": dict(report.data_availability),
+        "assumptions": list(report.assumptions),
+        "signal_summary": dict(report.signal_summary),
+        "details": [
+            {
+                "title": t.title,
+                "columns": list(t.columns),
+                "rows": [list(row) for row in t.rows],
+                "total_rows": t.total_rows,
+                "sidecar_path": t.sidecar_path,
+            }
+            for t in doc.details
+        ],
+        "extensions": {ext.key: ext.data for ext in doc.extensions},
+    }
@@ -1,14 +1,236 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Iterable, TextIO
 
+_CHUNK_SIZE = 1024 * 1024
 
-def save_markdown_report(path: str, content: str) -> None:
+
+@dataclass(frozen=True, slots=True)
+class ExportOptions:
+    """
+    How report artifacts are written.
+
+    gzip_output: write `<path>.gz` instead of `<path>` (deterministic gzip header).
+    deterministic: pin `generated_at` (see core.reporting.document.pinned_generated_at) and skip
+      the write when the file on disk already has identical content.
+    """
+
+    gzip_output: bool = False
+    deterministic: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class WriteResult:
+    path: Path
+    written: bool  # False when the write was skipped because the content was unchanged
+    sha256: str
+
+
+def final_path(path: str | Path, options: ExportOptions = ExportOptions()) -> Path:
+    """
+    Path the artifact actually lands at (adds `.gz` when gzip output is enabled).
+    """
+    p = Path(path)
+    return p.with_name(p.name + ".gz") if options.gzip_output else p
+
+
+class AtomicWriter:
+    """
+    Text file writer that never exposes a partially written file.
+
+    Content goes to a temp file in the target directory and is moved into place with
+    os.replace() on success (atomic for same-volume renames). On error the temp file is
+    removed and the previous file, if any, is left untouched. In deterministic mode over an
+    existing file, bytes are compared with that file as they arrive and the temp file is only
+    created at the first difference, so an unchanged report costs reads but no writes.
+
+    Usage:
+        w = AtomicWriter(path, options)
+        with w as f:
+            f.write(...)
+        w.result  # WriteResult
+    """
+
+    def __init__(self, path: str | Path, options: ExportOptions = ExportOptions(), *, newline: str | None = None):
+        self.path = final_path(path, options)
+        self.options = options
+        self.newline = newline
+        self.result: WriteResult | None = None
+        self._sink: _Sink | None = None
+        self._gz = None
+        self._text: TextIO | None = None
+
+    def __enter__(self) -> TextIO:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        compare = self.options.deterministic and self.path.is_file()
+        self._sink = _Sink(self.path, compare_with_existing=compare)
+        binary = self._sink
+        if self.options.gzip_output:
+            import gzip  # only gzip output pays for it
+
+            # mtime=0 and an empty filename keep the gzip bytes a pure function of the content.
+            self._gz = gzip.GzipFile(filename="", mode="wb", fileobj=self._sink, mtime=0)
+            binary = self._gz
+        self._text = io.TextIOWrapper(binary, encoding="utf-8", newline=self.newline)
+        return self._text
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        assert self._sink is not None and self._text is not None
+        sink = self._sink
+        try:
+            try:
+                self._text.flush()
+                self._text.detach()
+                if self._gz is not None:
+                    self._gz.close()
+                changed = sink.finish() if exc_type is None else True
+            finally:
+                sink.close()
+
+            if exc_type is not None:
+                sink.discard()
+                return
+
+            digest = sink.sha256.hexdigest()
+            if not changed:
+                self.result = WriteResult(path=self.path, written=False, sha256=digest)
+                return
+
+            assert sink.tmp_path is not None
+            _copy_mode(self.path, sink.tmp_path)
+            os.replace(sink.tmp_path, self.path)
+        except BaseException:
+            # A failed flush, gzip trailer, fsync or rename must not leave the temp file behind.
+            sink.discard()
+            raise
+        self.result = WriteResult(path=self.path, written=True, sha256=digest)
+
+
+class _Sink(io.RawIOBase):
+    """
+    Binary side of AtomicWriter: hashes every byte and writes it to the temp file.
+
+    With `compare_with_existing`, bytes are matched against the current file at `path`
+    instead, and the temp file is created (with the matching prefix copied from the
+    current file) at the first difference.
+    """
+
+    def __init__(self, path: Path, *, compare_with_existing: bool):
+        super().__init__()
+        self.path = path
+        self.sha256 = hashlib.sha256()
+        self.tmp_path: Path | None = None
+        self._tmp: BinaryIO | None = None
+        self._existing: BinaryIO | None = None
+        self._matched = 0  # bytes equal to the start of the existing file
+        if compare_with_existing:
+            self._existing = path.open("rb")
+        else:
+            self._open_tmp()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self.sha256.update(data)
+        if self._tmp is None:
+            assert self._existing is not None
+            if self._existing.read(len(data)) == data:
+                self._matched += len(data)
+                return len(data)
+            self._spill()
+        assert self._tmp is not None
+        self._tmp.write(data)
+        return len(data)
+
+    def finish(self) -> bool:
+        """Flush and fsync the temp file; False when the content equals the existing file."""
+        if self._tmp is None:
+            assert self._existing is not None
+            if self._existing.read(1) == b"":
+                return False
+            self._spill()  # the existing file is longer
+        assert self._tmp is not None
+        self._tmp.flush()
+        os.fsync(self._tmp.fileno())
+        return True
+
+    def close(self) -> None:
+        try:
+            for f in (self._existing, self._tmp):
+                if f is not None:
+                    f.close()
+        finally:
+            super().close()
+
+    def discard(self) -> None:
+        self.close()
+        if self.tmp_path is not None:
+            self.tmp_path.unlink(missing_ok=True)
+
+    def _open_tmp(self) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent)
+        self.tmp_path = Path(tmp)
+        self._tmp = os.fdopen(fd, "wb")
+
+    def _spill(self) -> None:
+        assert self._existing is not None
+        self._open_tmp()
+        assert self._tmp is not None
+        self._existing.seek(0)
+        remaining = self._matched
+        while remaining:
+            block = self._existing.read(min(_CHUNK_SIZE, remaining))
+            self._tmp.write(block)
+            remaining -= len(block)
+        self._existing.close()
+        self._existing = None
+
+
+def save_markdown_report(path: str, content: str, options: ExportOptions = ExportOptions()) -> WriteResult:
     """
     Save Markdown content to an explicit file path, creating parent dirs if needed.
+
+    The write is atomic (temp file + rename).
+    """
+    return write_report(path, [content], options)
+
+
+def write_markdown_report(path: str, chunks: Iterable[str], options: ExportOptions = ExportOptions()) -> WriteResult:
+    """
+    Stream Markdown chunks to an explicit file path, creating parent dirs if needed.
+
+    The report is never held in memory as a single string.
+    """
+    return write_report(path, chunks, options)
+
+
+def write_report(path: str, chunks: Iterable[str], options: ExportOptions = ExportOptions()) -> WriteResult:
+    """
+    Stream text chunks (any output format) atomically to an explicit file path, creating parent dirs if needed.
     """
-    file_path = Path(path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(content, encoding="utf-8")
+    writer = AtomicWriter(path, options)
+    with writer as f:
+        for chunk in chunks:
+            f.write(chunk)
+    assert writer.result is not None
+    return writer.result
 
 
+def _copy_mode(existing: Path, tmp: Path) -> None:
+    # mkstemp creates 0600 files; keep the previous file's mode, or a regular 0644 for new files.
+    try:
+        mode = existing.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    try:
+        os.chmod(tmp, mode)
+    except OSError:
+        pass
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from html import escape
+from typing import Any, Iterator
+
+from core.reporting.details import DetailTable
+from core.reporting.document import ReportDocument
+
+_STYLE = """
+body { font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 2rem; color: #222; }
+table { border-collapse: collapse; margin: 0.5rem 0 1rem; }
+th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }
+code { background: #f4f4f4; padding: 0 0.2rem; }
+.risk-high { color: #b00020; } .risk-medium { color: #b26a00; } .risk-low { color: #1b5e20; }
+.note { color: #666; font-style: italic; }
+""".strip()
+
+
+def iter_html_document(doc: ReportDocument) -> Iterator[str]:
+    """
+    Yield a self-contained HTML rendering of a report document (inline CSS, no external assets).
+    """
+    report = doc.report
+    score = int(report.score.overall_score)
+    risk = report.score.risk_level.value
+    recommendation = report.score.recommendation.value
+
+    yield "<!DOCTYPE html>\n"
+    yield '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+    yield "<title>Release Readiness Report</title>\n"
+    yield f"<style>\n{_STYLE}\n</style>\n"
+    yield "</head>\n<body>\n"
+
+    yield "<h1>Release Readiness Smoke Report</h1>\n"
+    yield "<ul>\n"
+    yield f"<li>Generated at (UTC): <code>{escape(doc.generated_at.isoformat(timespec='seconds'))}</code></li>\n"
+    yield f"<li>Readiness score: <strong>{score} / 100</strong></li>\n"
+    yield f'<li>Risk level: <strong class="risk-{escape(risk)}">{escape(risk)}</strong></li>\n'
+    yield f"<li>Recommendation: <strong>{escape(recommendation)}</strong></li>\n"
+    yield "</ul>\n"
+
+    yield "<h2>Metrics</h2>\n"
+    yield "<table>\n<tr><th>Metric</th><th>Value</th></tr>\n"
+    for k in sorted(report.metrics.keys()):
+        yield f"<tr><td><code>{escape(str(k))}</code></td><td>{escape(str(report.metrics[k]))}</td></tr>\n"
+    yield "</table>\n"
+
+    if report.dimensions is not None:
+        yield "<h2>Sub-scores</h2>\n"
+        yield "<table>\n<tr><th>Dimension</th><th>Score</th><th>Basis</th></tr>\n"
+        for name, value in (
+            ("stability", report.score.stability_score),
+            ("regression", report.score.regression_score),
+            ("coverage", report.score.coverage_score),
+        ):
+            basis = report.dimensions.get(name, {}).get("basis", "")
+            yield f"<tr><td>{name}</td><td>{value:g}</td><td>{escape(str(basis))}</td></tr>\n"
+        yield "</table>\n"
+
+    yield "<h2>Highlights</h2>\n"
+    if report.risks:
+        yield "<ul>\n"
+        for r in report.risks:
+            sev = r.severity.value
+            yield f'<li><strong class="risk-{escape(sev)}">{escape(sev)}</strong>: {escape(r.description)}<ul>'
+            for ev in r.evidence:
+                yield f"<li>{escape(ev)}</li>"
+            yield "</ul></li>\n"
+        yield "</ul>\n"
+    else:
+        yield '<p class="note">No highlights.</p>\n'
+
+    for table in doc.details:
+        yield from _iter_detail_table(table)
+
+    yield "<h2>Assumptions</h2>\n<ul>\n"
+    for a in report.assumptions:
+        yield f"<li>{escape(a)}</li>\n"
+    yield "</ul>\n"
+
+    for ext in doc.extensions:
+        yield f"<h2>{escape(ext.title)}</h2>\n"
+        yield _render_value(ext.data) + "\n"
+
+    yield "</body>\n</html>\n"
+
+
+def build_html_report(doc: ReportDocument) -> str:
+    return "".join(iter_html_document(doc))
+
+
+def _iter_detail_table(table: DetailTable) -> Iterator[str]:
+    yield f"<h2>{escape(table.title)}</h2>\n"
+    if table.total_rows == 0:
+        yield '<p class="note">None.</p>\n'
+        return
+
+    yield "<table>\n<tr>" + "".join(f"<th>{escape(c)}</th>" for c in table.columns) + "</tr>\n"
+    for row in table.rows:
+        yield "<tr>" + "".join(f"<td>{escape(str(v))}</td>" for v in row) + "</tr>\n"
+    yield "</table>\n"
+
+    if table.total_rows > len(table.rows):
+        note = f"Showing {len(table.rows)} of {table.total_rows} rows."
+        if table.sidecar_path:
+            note += f" Full table: {table.sidecar_path}."
+        yield f'<p class="note">{escape(note)}</p>\n'
+
+
+def _render_value(v: Any) -> str:
+    # Generic rendering for extension payloads: dict -> key/value table, list -> bullet list.
+    if isinstance(v, dict):
+        if not v:
+            return '<span class="note">none</span>'
+        rows = "".join(
+            f"<tr><td><code>{escape(str(k))}</code></td><td>{_render_value(val)}</td></tr>" for k, val in v.items()
+        )
+        return f"<table>{rows}</table>"
+    if isinstance(v, list):
+        if not v:
+            return '<span class="note">none</span>'
+        return "<ul>" + "".join(f"<li>{_render_value(item)}</li>" for item in v) + "</ul>"
+    if isinstance(v, float):
+        return escape(f"{v:.3f}")
+    if v is None:
+        return '<span class="note">n/a</span>'
+    return escape(str(v))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import json
+
+from core.reporting.document import ReportDocument, document_to_dict
+
+
+def build_json_report(doc: ReportDocument) -> str:
+    """
+    Render a report document as JSON (stable schema, sorted keys).
+
+    Consumers should check `schema_version` instead of parsing the Markdown report.
+    """
+    return json.dumps(document_to_dict(doc), indent=2, sort_keys=True, ensure_ascii=False, default=str) + "\n"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Iterable, Iterator
 
 from core.models.readiness import ReadinessReport
+from core.reporting.details import DetailTable
+from core.reporting.document import ReportDocument, ReportExtension, build_report_document
 
 
 def build_markdown_report(report: ReadinessReport) -> str:
@@ -11,45 +14,117 @@ def build_markdown_report(report: ReadinessReport) -> str:
 
     Includes: title, score/risk, metrics table, and highlights.
     """
-    generated_at = datetime.utcnow()
+    return "".join(iter_markdown_report(report))
+
+
+def iter_markdown_report(
+    report: ReadinessReport,
+    *,
+    details: Iterable[DetailTable] = (),
+    extensions: Iterable[ReportExtension] = (),
+    generated_at: datetime | None = None,
+) -> Iterator[str]:
+    """
+    Yield the Markdown report line by line (each chunk ends with a newline).
+    """
+    doc = build_report_document(report, details=details, extensions=extensions, generated_at=generated_at)
+    return iter_markdown_document(doc)
+
+
+def iter_markdown_document(doc: ReportDocument) -> Iterator[str]:
+    """
+    Yield the Markdown rendering of a report document line by line.
+
+    Detail tables are rendered after the highlights (top rows only, with a pointer to the
+    sidecar CSV). Extensions (e.g. the optional AI/LLM section) are appended at the end.
+    """
+    report = doc.report
+    generated_at = doc.generated_at
 
     score = int(report.score.overall_score)
     risk = report.score.risk_level.value
     recommendation = report.score.recommendation.value
 
-    lines: list[str] = []
-    lines.append("# Release Readiness Smoke Report")
-    lines.append("")
-    lines.append(f"- Generated at (UTC): `{generated_at.isoformat(timespec='seconds')}`")
-    lines.append(f"- Readiness score: **{score} / 100**")
-    lines.append(f"- Risk level: **{risk}**")
-    lines.append(f"- Recommendation: **{recommendation}**")
-    lines.append("")
-
-    lines.append("## Metrics")
-    lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("|---|---:|")
+    yield "# Release Readiness Smoke Report\n"
+    yield "\n"
+    yield f"- Generated at (UTC): `{generated_at.isoformat(timespec='seconds')}`\n"
+    yield f"- Readiness score: **{score} / 100**\n"
+    yield f"- Risk level: **{risk}**\n"
+    yield f"- Recommendation: **{recommendation}**\n"
+    yield "\n"
+
+    yield "## Metrics\n"
+    yield "\n"
+    yield "| Metric | Value |\n"
+    yield "|---|---:|\n"
     for k in sorted(report.metrics.keys()):
-        lines.append(f"| `{k}` | {report.metrics[k]} |")
-    lines.append("")
+        yield f"| `{k}` | {report.metrics[k]} |\n"
+    yield "\n"
 
-    lines.append("## Highlights")
-    lines.append("")
+    if report.dimensions is not None:
+        yield from _iter_subscores(report)
+
+    yield "## Highlights\n"
+    yield "\n"
     if report.risks:
         for r in report.risks:
             sev = r.severity.value
-            lines.append(f"- **{sev}**: {r.description}")
+            yield f"- **{sev}**: {r.description}\n"
             for ev in r.evidence:
-                lines.append(f"  - {ev}")
+                yield f"  - {ev}\n"
     else:
-        lines.append("_No highlights._")
-    lines.append("")
+        yield "_No highlights._\n"
+    yield "\n"
+
+    for table in doc.details:
+        yield from _iter_detail_table(table)
 
-    lines.append("## Assumptions")
-    lines.append("")
+    yield "## Assumptions\n"
+    yield "\n"
     for a in report.assumptions:
-        lines.append(f"- {a}")
-    lines.append("")
+        yield f"- {a}\n"
+
+    for ext in doc.extensions:
+        yield "\n"
+        yield ext.markdown.rstrip() + "\n"
+
+
+def _iter_detail_table(table: DetailTable) -> Iterator[str]:
+    yield f"## {table.title}\n"
+    yield "\n"
+    if table.total_rows == 0:
+        yield "_None._\n"
+        yield "\n"
+        return
+
+    yield "| " + " | ".join(table.columns) + " |\n"
+    yield "|" + "---|" * len(table.columns) + "\n"
+    for row in table.rows:
+        yield "| " + " | ".join(_cell(v) for v in row) + " |\n"
+    yield "\n"
+
+    if table.total_rows > len(table.rows):
+        note = f"_Showing {len(table.rows)} of {table.total_rows} rows."
+        if table.sidecar_path:
+            note += f" Full table: `{table.sidecar_path}`."
+        yield note + "_\n"
+        yield "\n"
+
+
+def _cell(v: object) -> str:
+    return str(v).replace("|", "\\|")
+
 
-    return "\n".join(lines)
+def _iter_subscores(report: ReadinessReport) -> Iterator[str]:
+    yield "## Sub-scores\n"
+    yield "\n"
+    yield "| Dimension | Score | Basis |\n"
+    yield "|---|---:|---|\n"
+    for name, value in (
+        ("stability", report.score.stability_score),
+        ("regression", report.score.regression_score),
+        ("coverage", report.score.coverage_score),
+    ):
+        basis = (report.dimensions or {}).get(name, {}).get("basis", "")
+        yield f"| {name} | {value:g} | {basis} |\n"
+    yield "\n"
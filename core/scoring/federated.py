@@ -0,0 +1,216 @@
+"""
+Federated aggregation: each CI node reduces its shard to a small ShardSummary file; a
+coordinator merges any number of summaries into the exact compute_metrics() output.
+
+A summary holds only mergeable state, so its size does not grow with the shard:
+  counts      ShardPartial (summed)
+  components  per-component [cases, results, passed, failed, skipped] (results slots summed)
+  executed    bitmap over the sorted catalog ids, cases that passed/failed (OR-ed) -> coverage
+  failed      the first `top_n` Failed Tests rows plus the total count (concatenated, truncated)
+and a catalog fingerprint: summaries built against different catalogs are refused.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+from core.reporting.details import DEFAULT_TOP_N, component_stats, failed_test_row
+from core.scoring.partials import ShardPartial, metrics_from_partial, partial_from_results
+
+SUMMARY_SCHEMA_VERSION = 1
+SUMMARY_KIND = "readiness-shard-summary"
+
+_EXECUTED = frozenset({"passed", "failed"})
+
+
+@dataclass(frozen=True, slots=True)
+class ShardSummary:
+    catalog_fingerprint: str
+    total_cases: int
+    counts: ShardPartial
+    components: dict[str, list[int]]
+    executed: int  # bitmap: bit i set <=> i-th catalog id (sorted) passed or failed
+    failed_rows: list[tuple[Any, ...]]
+    failed_total: int
+    shards: tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def executed_cases(self) -> int:
+        return self.executed.bit_count()
+
+    def metrics(self) -> dict:
+        return metrics_from_partial(self.total_cases, self.counts)
+
+    def to_dict(self) -> dict[str, Any]:
+        c = self.counts
+        width = (self.total_cases + 7) // 8
+        bitmap = zlib.compress(self.executed.to_bytes(width, "little"))
+        return {
+            "schema_version": SUMMARY_SCHEMA_VERSION,
+            "kind": SUMMARY_KIND,
+            "catalog": {"fingerprint": self.catalog_fingerprint, "total_cases": self.total_cases},
+            "shards": list(self.shards),
+            "counts": {
+                "total_results": c.total_results,
+                "mapped_results": c.mapped_results,
+                "passed": c.passed,
+                "failed": c.failed,
+                "skipped": c.skipped,
+            },
+            "components": self.components,
+            "executed": base64.b64encode(bitmap).decode("ascii"),
+            "failed": {"total": self.failed_total, "rows": [list(r) for r in self.failed_rows]},
+        }
+
+
+def catalog_fingerprint(test_cases: Mapping[str, TestCaseModel]) -> str:
+    """sha256 over the sorted (id, component) pairs: everything a summary's counts depend on."""
+    h = hashlib.sha256()
+    for test_id, tc in sorted(test_cases.items()):
+        h.update(f"{test_id}\x1f{tc.component or ''}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+def summarize_shard(
+    test_cases: Mapping[str, TestCaseModel],
+    results: list[TestResultModel],
+    *,
+    shard: str,
+    top_n: int = DEFAULT_TOP_N,
+    fingerprint: str | None = None,
+) -> ShardSummary:
+    """Reduce one shard of normalized results to a ShardSummary."""
+    position = {test_id: i for i, test_id in enumerate(sorted(test_cases))}
+    bits = bytearray((len(test_cases) + 7) // 8)
+    failed_rows: list[tuple[Any, ...]] = []
+    failed_total = 0
+    for r in results:
+        if r.status == "failed":
+            failed_total += 1
+            if len(failed_rows) < top_n:
+                failed_rows.append(failed_test_row(r, test_cases.get(r.id)))
+        if r.status in _EXECUTED:
+            i = position.get(r.id)
+            if i is not None:
+                bits[i >> 3] |= 1 << (i & 7)
+
+    return ShardSummary(
+        catalog_fingerprint=fingerprint or catalog_fingerprint(test_cases),
+        total_cases=len(test_cases),
+        counts=partial_from_results(test_cases, results),
+        components=component_stats(test_cases, results),
+        executed=int.from_bytes(bits, "little"),
+        failed_rows=failed_rows,
+        failed_total=failed_total,
+        shards=(shard,),
+    )
+
+
+def merge_summaries(summaries: Iterable[ShardSummary], *, top_n: int = DEFAULT_TOP_N) -> ShardSummary:
+    """
+    Combine summaries (in the given order). Raises ValidationError when they were built
+    against different catalogs or the same shard appears twice.
+    """
+    merged: ShardSummary | None = None
+    for s in summaries:
+        if merged is None:
+            merged = ShardSummary(
+                catalog_fingerprint=s.catalog_fingerprint,
+                total_cases=s.total_cases,
+                counts=s.counts,
+                components={k: list(v) for k, v in s.components.items()},
+                executed=s.executed,
+                failed_rows=list(s.failed_rows[:top_n]),
+                failed_total=s.failed_total,
+                shards=s.shards,
+            )
+            continue
+
+        if s.catalog_fingerprint != merged.catalog_fingerprint or s.total_cases != merged.total_cases:
+            raise ValidationError(
+                f"Shard summary {', '.join(s.shards)} was built against a different case catalog "
+                f"({s.catalog_fingerprint[:12]} != {merged.catalog_fingerprint[:12]})"
+            )
+        duplicates = set(s.shards) & set(merged.shards)
+        if duplicates:
+            raise ValidationError(f"Shard(s) merged twice: {', '.join(sorted(duplicates))}")
+
+        components = merged.components
+        for name, stats in s.components.items():
+            acc = components.get(name)
+            if acc is None:
+                components[name] = list(stats)
+                continue
+            for slot in range(1, 5):  # slot 0 (catalog cases) is identical in every summary
+                acc[slot] += stats[slot]
+
+        room = top_n - len(merged.failed_rows)
+        merged = ShardSummary(
+            catalog_fingerprint=merged.catalog_fingerprint,
+            total_cases=merged.total_cases,
+            counts=merged.counts + s.counts,
+            components=components,
+            executed=merged.executed | s.executed,
+            failed_rows=merged.failed_rows + list(s.failed_rows[: max(0, room)]),
+            failed_total=merged.failed_total + s.failed_total,
+            shards=merged.shards + s.shards,
+        )
+
+    if merged is None:
+        raise ValidationError("No shard summaries to merge")
+    return merged
+
+
+def summary_from_dict(raw: Mapping[str, Any], source: str = "<summary>") -> ShardSummary:
+    """Parse ShardSummary.to_dict() output. Raises ValidationError for malformed content."""
+    if not isinstance(raw, Mapping) or raw.get("kind") != SUMMARY_KIND:
+        raise ValidationError(f"{source}: not a shard summary (expected kind '{SUMMARY_KIND}')")
+    if raw.get("schema_version") != SUMMARY_SCHEMA_VERSION:
+        raise ValidationError(f"{source}: unsupported schema_version {raw.get('schema_version')!r}")
+    try:
+        catalog = raw["catalog"]
+        counts = raw["counts"]
+        failed = raw["failed"]
+        return ShardSummary(
+            catalog_fingerprint=str(catalog["fingerprint"]),
+            total_cases=int(catalog["total_cases"]),
+            counts=ShardPartial(
+                total_results=int(counts["total_results"]),
+                mapped_results=int(counts["mapped_results"]),
+                passed=int(counts["passed"]),
+                failed=int(counts["failed"]),
+                skipped=int(counts["skipped"]),
+            ),
+            components={str(k): [int(x) for x in v] for k, v in raw["components"].items()},
+            executed=int.from_bytes(zlib.decompress(base64.b64decode(raw["executed"])), "little"),
+            failed_rows=[tuple(r) for r in failed["rows"]],
+            failed_total=int(failed["total"]),
+            shards=tuple(str(x) for x in raw.get("shards", [])),
+        )
+    except (KeyError, TypeError, ValueError, AttributeError, zlib.error) as e:
+        raise ValidationError(f"{source}: malformed shard summary ({e})") from e
+
+
+def load_summary(path: str | Path) -> ShardSummary:
+    """Read a summary file written by write_report (plain or `.gz`)."""
+    p = Path(path)
+    try:
+        data = p.read_bytes()
+        if p.suffix == ".gz":
+            data = gzip.decompress(data)
+        raw = json.loads(data.decode("utf-8"))
+    except FileNotFoundError as e:
+        raise IngestionError(f"Shard summary '{path}': file not found") from e
+    except (OSError, EOFError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise IngestionError(f"Shard summary '{path}': unable to read ({e})") from e
+    return summary_from_dict(raw, f"Shard summary '{path}'")
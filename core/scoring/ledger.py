@@ -0,0 +1,209 @@
+"""
+Per-shard contributions with running totals, for re-scoring when one shard is re-run.
+
+Every shard's contribution (counts, component counts, per-test status counts for mapped
+ids, unmapped id counts and sampled failed rows) is kept next to the running totals.
+Replacing shard k subtracts its old contribution and adds the new one, so an update
+costs O(size of the old + new shard), independent of the other shards.
+
+Unmapped ids are a multiset: an id reported by two shards, or moving from one shard to
+another on a retry, is still one distinct unmapped id until no shard reports it.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping
+
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+from core.reporting.details import DEFAULT_TOP_N, failed_test_row
+from core.scoring.partials import ShardPartial, metrics_from_partial
+from core.scoring.subscores import RunAggregate
+
+_STATUS_SLOT = {"passed": 0, "failed": 1, "skipped": 2}
+
+
+@dataclass(frozen=True, slots=True)
+class ShardContribution:
+    counts: ShardPartial
+    components: dict[str, list[int]]  # component -> [results, passed, failed, skipped]
+    statuses: dict[str, list[int]]  # mapped id -> [passed, failed, skipped]
+    unmapped: Counter[str]
+    failed_rows: list[tuple[Any, ...]] = field(default_factory=list)  # first `top_n` in shard order
+    failed_total: int = 0
+
+
+def shard_contribution(
+    test_cases: Mapping[str, TestCaseModel],
+    results: Iterable[TestResultModel],
+    *,
+    top_n: int = DEFAULT_TOP_N,
+) -> ShardContribution:
+    """One pass over a shard's results."""
+    total = mapped = passed = failed = skipped = 0
+    components: dict[str, list[int]] = {}
+    statuses: dict[str, list[int]] = {}
+    unmapped: Counter[str] = Counter()
+    failed_rows: list[tuple[Any, ...]] = []
+    failed_total = 0
+    for r in results:
+        total += 1
+        tc = test_cases.get(r.id)
+        if r.status == "failed":
+            failed_total += 1
+            if len(failed_rows) < top_n:
+                failed_rows.append(failed_test_row(r, tc))
+        if tc is None:
+            unmapped[r.id] += 1
+            continue
+        mapped += 1
+        slot = _STATUS_SLOT.get(r.status)
+        c = components.get(tc.component or "(none)")
+        if c is None:
+            c = components[tc.component or "(none)"] = [0, 0, 0, 0]
+        c[0] += 1
+        if slot is None:
+            continue
+        if slot == 0:
+            passed += 1
+        elif slot == 1:
+            failed += 1
+        else:
+            skipped += 1
+        c[slot + 1] += 1
+        s = statuses.get(r.id)
+        if s is None:
+            s = statuses[r.id] = [0, 0, 0]
+        s[slot] += 1
+
+    return ShardContribution(
+        counts=ShardPartial(total, mapped, passed, failed, skipped),
+        components=components,
+        statuses=statuses,
+        unmapped=unmapped,
+        failed_rows=failed_rows,
+        failed_total=failed_total,
+    )
+
+
+class ShardLedger:
+    """
+    Running totals over named shards; put() adds or replaces a shard, remove() drops it.
+    """
+
+    def __init__(self, test_cases: Mapping[str, TestCaseModel], *, top_n: int = DEFAULT_TOP_N):
+        self.test_cases = test_cases
+        self.top_n = top_n
+        self._shards: dict[str, ShardContribution] = {}
+        self._counts = ShardPartial()
+        self._components: dict[str, list[int]] = {}
+        self._statuses: dict[str, list[int]] = {}
+        self._unmapped: Counter[str] = Counter()
+        self._executed = 0  # mapped ids with at least one passed/failed result
+
+        self._catalog_components: Counter[str] = Counter(tc.component or "(none)" for tc in test_cases.values())
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def __contains__(self, shard: object) -> bool:
+        return shard in self._shards
+
+    @property
+    def shards(self) -> list[str]:
+        return sorted(self._shards)
+
+    def put(self, shard: str, results: Iterable[TestResultModel]) -> ShardContribution:
+        """Add `shard`, replacing its previous contribution if it was already present."""
+        new = shard_contribution(self.test_cases, results, top_n=self.top_n)
+        old = self._shards.get(shard)
+        if old is not None:
+            self._apply(old, -1)
+        self._apply(new, +1)
+        self._shards[shard] = new
+        return new
+
+    def remove(self, shard: str) -> ShardContribution | None:
+        old = self._shards.pop(shard, None)
+        if old is not None:
+            self._apply(old, -1)
+        return old
+
+    def metrics(self) -> dict:
+        return metrics_from_partial(len(self.test_cases), self._counts)
+
+    @property
+    def executed_cases(self) -> int:
+        return self._executed
+
+    @property
+    def unmapped_ids(self) -> set[str]:
+        return set(self._unmapped)
+
+    def component_stats(self) -> dict[str, list[int]]:
+        """Same shape as core.reporting.details.component_stats(): [cases, results, passed, failed, skipped]."""
+        stats = {name: [n, 0, 0, 0, 0] for name, n in self._catalog_components.items()}
+        for name, c in self._components.items():
+            stats.setdefault(name, [0, 0, 0, 0, 0])[1:] = c
+        return stats
+
+    def failed_rows(self) -> tuple[list[tuple[Any, ...]], int]:
+        """First `top_n` failed rows (shards in name order) and the total failed result count."""
+        rows: list[tuple[Any, ...]] = []
+        total = 0
+        for name in sorted(self._shards):
+            c = self._shards[name]
+            total += c.failed_total
+            if len(rows) < self.top_n:
+                rows.extend(c.failed_rows[: self.top_n - len(rows)])
+        return rows, total
+
+    def run_aggregate(self) -> RunAggregate:
+        """Per-test outcomes over all shards (same result as subscores.aggregate_run)."""
+        outcomes: dict[str, str] = {}
+        flaky: set[str] = set()
+        for test_id, (passed, failed, _) in self._statuses.items():
+            if failed:
+                outcomes[test_id] = "failed"
+                if passed:
+                    flaky.add(test_id)
+            elif passed:
+                outcomes[test_id] = "passed"
+            else:
+                outcomes[test_id] = "skipped"
+        return RunAggregate(total_cases=len(self.test_cases), outcomes=outcomes, flaky_in_run=frozenset(flaky))
+
+    def _apply(self, c: ShardContribution, sign: int) -> None:
+        self._counts = self._counts + c.counts if sign > 0 else self._counts - c.counts
+
+        for name, slots in c.components.items():
+            acc = self._components.get(name)
+            if acc is None:
+                acc = self._components[name] = [0, 0, 0, 0]
+            for i, n in enumerate(slots):
+                acc[i] += sign * n
+            if not any(acc):
+                del self._components[name]
+
+        for test_id, slots in c.statuses.items():
+            acc = self._statuses.get(test_id)
+            if acc is None:
+                acc = self._statuses[test_id] = [0, 0, 0]
+            was_executed = acc[0] + acc[1] > 0
+            for i, n in enumerate(slots):
+                acc[i] += sign * n
+            now_executed = acc[0] + acc[1] > 0
+            if now_executed != was_executed:
+                self._executed += 1 if now_executed else -1
+            if not any(acc):
+                del self._statuses[test_id]
+
+        if sign > 0:
+            self._unmapped.update(c.unmapped)
+        else:
+            self._unmapped.subtract(c.unmapped)
+            for test_id in c.unmapped:
+                if self._unmapped[test_id] <= 0:
+                    del self._unmapped[test_id]
@@ -0,0 +1,102 @@
+"""Mergeable partial metrics: per-shard counts that sum to exactly the compute_metrics() output."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+from core.models.test_case import TestCaseModel
+from core.models.test_result import TestResultModel
+
+
+@dataclass(frozen=True, slots=True)
+class ShardPartial:
+    """
+    Counts contributed by one shard of results (mapping decided against the case catalog).
+
+    Partials are additive: metrics over several shards only need the sum of their partials.
+    """
+
+    total_results: int = 0
+    mapped_results: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    @property
+    def unmapped_results(self) -> int:
+        return self.total_results - self.mapped_results
+
+    def __add__(self, other: ShardPartial) -> ShardPartial:
+        return ShardPartial(
+            total_results=self.total_results + other.total_results,
+            mapped_results=self.mapped_results + other.mapped_results,
+            passed=self.passed + other.passed,
+            failed=self.failed + other.failed,
+            skipped=self.skipped + other.skipped,
+        )
+
+    def __sub__(self, other: ShardPartial) -> ShardPartial:
+        return ShardPartial(
+            total_results=self.total_results - other.total_results,
+            mapped_results=self.mapped_results - other.mapped_results,
+            passed=self.passed - other.passed,
+            failed=self.failed - other.failed,
+            skipped=self.skipped - other.skipped,
+        )
+
+
+def partial_from_results(
+    test_cases: Mapping[str, TestCaseModel],
+    results: Iterable[TestResultModel],
+) -> ShardPartial:
+    """
+    Count one shard. Only mapped results (result.id in test_cases) contribute status counts.
+    """
+    total = mapped = passed = failed = skipped = 0
+    for r in results:
+        total += 1
+        if r.id not in test_cases:
+            continue
+        mapped += 1
+        if r.status == "passed":
+            passed += 1
+        elif r.status == "failed":
+            failed += 1
+        elif r.status == "skipped":
+            skipped += 1
+    return ShardPartial(
+        total_results=total,
+        mapped_results=mapped,
+        passed=passed,
+        failed=failed,
+        skipped=skipped,
+    )
+
+
+def sum_partials(partials: Iterable[ShardPartial]) -> ShardPartial:
+    acc = ShardPartial()
+    for p in partials:
+        acc = acc + p
+    return acc
+
+
+def metrics_from_partial(total_cases: int, partial: ShardPartial) -> dict:
+    """
+    Metrics dict with the exact keys/values of compute_metrics().
+    """
+    mapped_count = partial.mapped_results
+    failure_rate = partial.failed / mapped_count if mapped_count > 0 else 0.0
+    skip_rate = partial.skipped / mapped_count if mapped_count > 0 else 0.0
+
+    return {
+        "total_cases": total_cases,
+        "total_results": partial.total_results,
+        "mapped_results": mapped_count,
+        "unmapped_results": partial.unmapped_results,
+        "passed": partial.passed,
+        "failed": partial.failed,
+        "skipped": partial.skipped,
+        "failure_rate": failure_rate,
+        "skip_rate": skip_rate,
+    }
@@ -0,0 +1,411 @@
+"""
+Declarative scoring policies: penalty weights, caps and risk rules as data (TOML/JSON).
+
+A policy is compiled once into a ScoringPolicy; evaluating it is a few float operations
+per metrics dict, so thousands of runs can be re-scored in one evaluate_many() call.
+DEFAULT_POLICY reproduces the built-in formula exactly.
+
+Policy shape (TOML; the same keys work as JSON):
+
+  name = "default"
+
+  [score]
+  start = 100
+  min = 0
+  max = 100
+
+  [[score.penalties]]          # penalty = min(cap, round(metric * 100 * points_per_percent))
+  metric = "failure_rate"
+  points_per_percent = 1.0
+  cap = 70
+
+  [[risk.rules]]               # first matching rule wins; `all` must all hold, `any` needs one
+  level = "high"
+  any = [{ metric = "failure_rate", op = ">=", value = 0.2 }]
+
+  [risk]
+  default = "high"             # when no rule matches
+
+  [recommendation]             # risk level -> recommendation
+  low = "approve"
+
+Metric names are keys of the compute_metrics() dict, plus `unmapped_rate`
+(unmapped_results / total_results) and, in risk rules, `score`; any other name is
+rejected, so a typo cannot silently disable a penalty or rule. Penalty weights and caps
+must not be negative.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from core.models.errors import IngestionError, ValidationError
+from core.models.readiness import ReleaseRecommendation, RiskLevel
+
+_OPS: dict[str, Callable[[float, float], bool]] = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Names policies may reference: the compute_metrics() keys plus the derived unmapped_rate.
+METRIC_NAMES = frozenset(
+    {
+        "total_cases",
+        "total_results",
+        "mapped_results",
+        "unmapped_results",
+        "passed",
+        "failed",
+        "skipped",
+        "failure_rate",
+        "skip_rate",
+        "unmapped_rate",
+    }
+)
+
+# score.start/min/max and `score` thresholds in risk rules must fall in this range.
+_SCORE_MIN, _SCORE_MAX = 0, 100
+
+DEFAULT_POLICY: dict[str, Any] = {
+    "name": "default",
+    "score": {
+        "start": 100,
+        "min": 0,
+        "max": 100,
+        "penalties": [
+            # 1 point per 1% failed (capped at 70)
+            {"metric": "failure_rate", "points_per_percent": 1.0, "cap": 70},
+            # 0.5 points per 1% skipped (capped at 20)
+            {"metric": "skip_rate", "points_per_percent": 0.5, "cap": 20},
+            # 0.5 points per 1% unmapped (capped at 20)
+            {"metric": "unmapped_rate", "points_per_percent": 0.5, "cap": 20},
+        ],
+    },
+    "risk": {
+        "rules": [
+            # Major execution/traceability issues are HIGH regardless of score.
+            {
+                "level": "high",
+                "any": [
+                    {"metric": "failure_rate", "op": ">=", "value": 0.2},
+                    {"metric": "unmapped_rate", "op": ">=", "value": 0.3},
+                ],
+            },
+            # Significant skipping/unmapping caps an otherwise LOW score at MEDIUM.
+            {
+                "level": "medium",
+                "all": [{"metric": "score", "op": ">=", "value": 85}],
+                "any": [
+                    {"metric": "skip_rate", "op": ">", "value": 0.1},
+                    {"metric": "unmapped_rate", "op": ">", "value": 0.05},
+                ],
+            },
+            {"level": "low", "all": [{"metric": "score", "op": ">=", "value": 85}]},
+            {"level": "medium", "all": [{"metric": "score", "op": ">=", "value": 70}]},
+        ],
+        "default": "high",
+    },
+    "recommendation": {"low": "approve", "medium": "conditional", "high": "reject"},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyResult:
+    score: int
+    risk_level: RiskLevel
+    recommendation: ReleaseRecommendation
+
+
+# (metric, op, value)
+_Condition = tuple[str, Callable[[float, float], bool], float]
+
+
+@dataclass(frozen=True, slots=True)
+class RiskRule:
+    """Compiled risk rule: `level` applies when every `all` and (if any) one `any` condition holds."""
+
+    level: RiskLevel
+    all: tuple[_Condition, ...]
+    any: tuple[_Condition, ...]
+
+
+class ScoringPolicy:
+    """
+    A compiled policy. Build with compile_policy() / load_policy(); evaluate with
+    evaluate(metrics) or evaluate_many(metrics_iterable).
+    """
+
+    __slots__ = ("name", "_start", "_min", "_max", "_penalties", "_rules", "_default", "_recommendation", "_inputs")
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        start: float,
+        min_score: float,
+        max_score: float,
+        penalties: tuple[tuple[str, float, float], ...],
+        rules: tuple[RiskRule, ...],
+        default: RiskLevel,
+        recommendation: Mapping[RiskLevel, ReleaseRecommendation],
+    ):
+        self.name = name
+        self._start = start
+        self._min = min_score
+        self._max = max_score
+        self._penalties = penalties  # (metric, factor, cap); factor = 100 * points_per_percent
+        self._rules = rules
+        self._default = default
+        self._recommendation = dict(recommendation)
+        referenced = {m for m, _, _ in penalties}
+        for r in rules:
+            referenced.update(m for m, _, _ in (*r.all, *r.any))
+        referenced.discard("score")
+        self._inputs = tuple(sorted(referenced))
+
+    @property
+    def score_bounds(self) -> tuple[float, float, float]:
+        """(start, min, max) of the score."""
+        return (self._start, self._min, self._max)
+
+    @property
+    def penalties(self) -> tuple[tuple[str, float, float], ...]:
+        """(metric, factor, cap) per penalty, in policy order; factor = 100 * points_per_percent."""
+        return self._penalties
+
+    @property
+    def rules(self) -> tuple[RiskRule, ...]:
+        return self._rules
+
+    @property
+    def default_level(self) -> RiskLevel:
+        return self._default
+
+    @property
+    def recommendations(self) -> dict[RiskLevel, ReleaseRecommendation]:
+        return dict(self._recommendation)
+
+    def score(self, metrics: Mapping[str, Any]) -> int:
+        return self._score(self._values(metrics))
+
+    def classify(self, score: int, metrics: Mapping[str, Any]) -> RiskLevel:
+        values = self._values(metrics)
+        values["score"] = float(score)
+        return self._classify(values)
+
+    def evaluate(self, metrics: Mapping[str, Any]) -> PolicyResult:
+        values = self._values(metrics)
+        score = self._score(values)
+        values["score"] = float(score)
+        risk = self._classify(values)
+        return PolicyResult(score=score, risk_level=risk, recommendation=self._recommendation[risk])
+
+    def evaluate_many(self, metrics_iter: Iterable[Mapping[str, Any]]) -> list[PolicyResult]:
+        """Score a batch of metrics dicts (e.g. historical runs) with the compiled policy."""
+        evaluate = self.evaluate
+        return [evaluate(m) for m in metrics_iter]
+
+    def _values(self, metrics: Mapping[str, Any]) -> dict[str, float]:
+        return {name: metric_value(metrics, name) for name in self._inputs}
+
+    def _score(self, values: Mapping[str, float]) -> int:
+        score = self._start
+        for metric, factor, cap in self._penalties:
+            score -= min(cap, int(round(values[metric] * factor)))
+        if score < self._min:
+            score = self._min
+        if score > self._max:
+            score = self._max
+        return int(score)
+
+    def _classify(self, values: Mapping[str, float]) -> RiskLevel:
+        for rule in self._rules:
+            if all(op(values[m], v) for m, op, v in rule.all) and (
+                not rule.any or any(op(values[m], v) for m, op, v in rule.any)
+            ):
+                return rule.level
+        return self._default
+
+
+def metric_value(metrics: Mapping[str, Any], name: str) -> float:
+    """
+    Numeric metric for policy evaluation; `unmapped_rate` is derived when absent.
+    Missing/None values count as 0; a name outside METRIC_NAMES raises ValidationError.
+    """
+    if name not in METRIC_NAMES:
+        raise ValidationError(f"Unknown policy metric '{name}' (expected one of {sorted(METRIC_NAMES)})")
+    if name == "unmapped_rate" and "unmapped_rate" not in metrics:
+        total_results = int(metrics.get("total_results", 0) or 0)
+        unmapped_results = int(metrics.get("unmapped_results", 0) or 0)
+        return (unmapped_results / total_results) if total_results > 0 else 0.0
+    return float(metrics.get(name, 0.0) or 0.0)
+
+
+def compile_policy(raw: Mapping[str, Any]) -> ScoringPolicy:
+    """
+    Validate a policy mapping (DEFAULT_POLICY shape) and compile it. Raises ValidationError.
+    """
+    if not isinstance(raw, Mapping):
+        raise ValidationError("Policy must be a table/object")
+    name = str(raw.get("name") or "custom")
+
+    score = _table(raw, "score", name)
+    penalties: list[tuple[str, float, float]] = []
+    for idx, p in enumerate(score.get("penalties") or [], start=1):
+        if not isinstance(p, Mapping):
+            raise ValidationError(f"Policy '{name}': score.penalties #{idx} must be a table")
+        metric = _metric_name(p.get("metric"), f"score.penalties #{idx}", name, allow_score=False)
+        points = _non_negative(p.get("points_per_percent"), f"score.penalties #{idx}.points_per_percent", name)
+        cap = _non_negative(p.get("cap", float("inf")), f"score.penalties #{idx}.cap", name)
+        penalties.append((metric, 100 * points, cap))
+
+    risk = _table(raw, "risk", name)
+    rules: list[RiskRule] = []
+    for idx, r in enumerate(risk.get("rules") or [], start=1):
+        if not isinstance(r, Mapping):
+            raise ValidationError(f"Policy '{name}': risk.rules #{idx} must be a table")
+        where = f"risk.rules #{idx}"
+        rules.append(
+            RiskRule(
+                level=_risk_level(r.get("level"), where, name),
+                all=tuple(_condition(c, where, name) for c in r.get("all") or []),
+                any=tuple(_condition(c, where, name) for c in r.get("any") or []),
+            )
+        )
+
+    rec_raw = raw.get("recommendation") or {}
+    if not isinstance(rec_raw, Mapping):
+        raise ValidationError(f"Policy '{name}': 'recommendation' must be a table")
+    recommendation: dict[RiskLevel, ReleaseRecommendation] = {}
+    for level in RiskLevel:
+        value = rec_raw.get(level.value)
+        try:
+            recommendation[level] = ReleaseRecommendation(value)
+        except ValueError as e:
+            allowed = [r.value for r in ReleaseRecommendation]
+            raise ValidationError(f"Policy '{name}': recommendation.{level.value} must be one of {allowed}") from e
+
+    start = _score_number(score.get("start", 100), "score.start", name)
+    min_score = _score_number(score.get("min", 0), "score.min", name)
+    max_score = _score_number(score.get("max", 100), "score.max", name)
+    if min_score > max_score:
+        raise ValidationError(f"Policy '{name}': score.min ({min_score}) must not exceed score.max ({max_score})")
+
+    return ScoringPolicy(
+        name=name,
+        start=start,
+        min_score=min_score,
+        max_score=max_score,
+        penalties=tuple(penalties),
+        rules=tuple(rules),
+        default=_risk_level(risk.get("default", "high"), "risk.default", name),
+        recommendation=recommendation,
+    )
+
+
+def load_policy(path: str | Path) -> ScoringPolicy:
+    """
+    Load and compile a policy file: `.toml` (stdlib tomllib; Python 3.11+) or `.json`.
+    """
+    p = Path(path)
+    try:
+        text = p.read_text(encoding="utf-8")
+    except FileNotFoundError as e:
+        raise IngestionError(f"Policy '{path}': file not found") from e
+    except OSError as e:
+        raise IngestionError(f"Policy '{path}': unable to read file ({e})") from e
+
+    if p.suffix.lower() == ".json":
+        try:
+            raw = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise IngestionError(f"Policy '{path}': invalid JSON ({e})") from e
+    else:
+        try:
+            import tomllib
+        except ModuleNotFoundError as e:  # Python 3.10
+            raise IngestionError(f"Policy '{path}': TOML policies need Python 3.11+ (use a .json policy)") from e
+        try:
+            raw = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise IngestionError(f"Policy '{path}': invalid TOML ({e})") from e
+
+    return compile_policy(raw)
+
+
+_DEFAULT: ScoringPolicy | None = None
+
+
+def default_policy() -> ScoringPolicy:
+    """DEFAULT_POLICY, compiled on first use."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = compile_policy(DEFAULT_POLICY)
+    return _DEFAULT
+
+
+def _table(raw: Mapping[str, Any], key: str, name: str) -> Mapping[str, Any]:
+    value = raw.get(key) or {}
+    if not isinstance(value, Mapping):
+        raise ValidationError(f"Policy '{name}': '{key}' must be a table")
+    return value
+
+
+def _number(value: Any, where: str, name: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValidationError(f"Policy '{name}': {where} must be a number (got {value!r})")
+    return value
+
+
+def _non_negative(value: Any, where: str, name: str) -> float:
+    number = _number(value, where, name)
+    if number < 0:
+        raise ValidationError(f"Policy '{name}': {where} must be >= 0 (got {number!r})")
+    return number
+
+
+def _score_number(value: Any, where: str, name: str) -> float:
+    number = _number(value, where, name)
+    if not _SCORE_MIN <= number <= _SCORE_MAX:
+        raise ValidationError(f"Policy '{name}': {where} must be within {_SCORE_MIN}-{_SCORE_MAX} (got {number!r})")
+    return number
+
+
+def _metric_name(value: Any, where: str, name: str, *, allow_score: bool) -> str:
+    if not isinstance(value, str) or value.strip() == "":
+        raise ValidationError(f"Policy '{name}': {where} needs a 'metric' name")
+    if value == "score":
+        if not allow_score:
+            raise ValidationError(f"Policy '{name}': {where} cannot use 'score' as a penalty metric")
+        return value
+    if value not in METRIC_NAMES:
+        allowed = sorted(METRIC_NAMES | {"score"} if allow_score else METRIC_NAMES)
+        raise ValidationError(f"Policy '{name}': {where} has unknown metric {value!r} (expected one of {allowed})")
+    return value
+
+
+def _risk_level(value: Any, where: str, name: str) -> RiskLevel:
+    try:
+        return RiskLevel(value)
+    except ValueError as e:
+        raise ValidationError(f"Policy '{name}': {where} level must be one of {[r.value for r in RiskLevel]}") from e
+
+
+def _condition(raw: Any, where: str, name: str) -> _Condition:
+    if not isinstance(raw, Mapping):
+        raise ValidationError(f"Policy '{name}': {where} conditions must be tables")
+    metric = _metric_name(raw.get("metric"), where, name, allow_score=True)
+    op = _OPS.get(raw.get("op"))
+    if op is None:
+        raise ValidationError(f"Policy '{name}': {where} op must be one of {list(_OPS)} (got {raw.get('op')!r})")
+    if metric == "score":
+        return (metric, op, _score_number(raw.get("value"), f"{where} score value", name))
+    return (metric, op, _number(raw.get("value"), f"{where} value", name))
@@ -0,0 +1,39 @@
+"""
+Regression measures over a multi-run TestResults history (used by the generic adapter).
+
+- failure rate trend: failure rate of the earlier runs minus that of the recent window,
+  in [-1, 1]; positive means failures went down (improving), 0 without enough runs
+- new failures: ids failing in the latest run that never failed in an earlier run
+"""
+
+from __future__ import annotations
+
+from core.models.test_results import TestResults, TestRun, TestStatus
+
+DEFAULT_RECENT_RUNS = 3
+
+_FAILING = (TestStatus.FAILED, TestStatus.ERROR)
+
+
+def calculate_failure_rate_trend(test_results: TestResults, recent_runs: int = DEFAULT_RECENT_RUNS) -> float:
+    runs = test_results.test_runs
+    if len(runs) < 2:
+        return 0.0
+    # Short histories are split in half so there is always an earlier window to compare against.
+    split = len(runs) - recent_runs if len(runs) > recent_runs else len(runs) // 2
+    trend = _failure_rate(runs[:split]) - _failure_rate(runs[split:])
+    return max(-1.0, min(1.0, trend))
+
+
+def identify_new_failures(test_results: TestResults) -> list[str]:
+    """Sorted ids failing in the latest run with no failure in any earlier run."""
+    *earlier, latest = test_results.test_runs
+    if not earlier:
+        return []
+    failed_before = {r.test_id for run in earlier for r in run.results if r.status in _FAILING}
+    return sorted({r.test_id for r in latest.results if r.status in _FAILING} - failed_before)
+
+
+def _failure_rate(runs: list[TestRun]) -> float:
+    total = sum(run.total_tests for run in runs)
+    return sum(run.failed_count for run in runs) / total if total else 0.0
@@ -0,0 +1,37 @@
+"""
+Stability measures over a multi-run TestResults history (used by the generic adapter).
+
+- pass rate consistency: 1 - (population std-dev of per-run pass rates / 0.5), the largest
+  possible std-dev of values in [0, 1]; a single run is perfectly consistent
+- flaky tests: ids that both passed and failed (or errored) across the runs
+"""
+
+from __future__ import annotations
+
+import math
+
+from core.models.test_results import TestResults, TestStatus
+
+_FAILING = (TestStatus.FAILED, TestStatus.ERROR)
+
+
+def calculate_pass_rate_consistency(test_results: TestResults) -> float:
+    rates = [run.pass_rate for run in test_results.test_runs]
+    if len(rates) < 2:
+        return 1.0
+    mean = sum(rates) / len(rates)
+    std = math.sqrt(sum((r - mean) ** 2 for r in rates) / len(rates))
+    return max(0.0, 1.0 - std / 0.5)
+
+
+def detect_flaky_tests(test_results: TestResults) -> list[str]:
+    """Sorted ids with at least one passing and one failing/erroring result."""
+    passed: set[str] = set()
+    failed: set[str] = set()
+    for run in test_results.test_runs:
+        for r in run.results:
+            if r.status == TestStatus.PASSED:
+                passed.add(r.test_id)
+            elif r.status in _FAILING:
+                failed.add(r.test_id)
+    return sorted(passed & failed)
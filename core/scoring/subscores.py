@@ -0,0 +1,167 @@
+"""
+Per-dimension sub-scores (0..100), each from its own evidence:
+
+- coverage:   catalog cases executed (passed/failed) in this run / catalog size
+- stability:  executed tests that never flipped passed<->failed (within this run or across the
+              last stored runs, core.history.index.DEFAULT_FLIP_WINDOW, and this run) / executed tests
+- regression: tests that passed in the last green run and still pass / those executed now
+
+Dimensions without evidence (empty catalog, no history, no green run) are left as None and
+fall back to the overall score in build_readiness_report, with an assumption saying so.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from core.models.normalized import NormalizedData
+from core.scoring.partials import ShardPartial, metrics_from_partial
+
+if TYPE_CHECKING:
+    from core.history.index import HistoryIndex
+
+
+@dataclass(frozen=True, slots=True)
+class RunAggregate:
+    """
+    One pass over the normalized results: per-test outcome for mapped results
+    (failed if any attempt failed, else passed if any passed, else skipped) and tests
+    that both passed and failed within the run.
+    """
+
+    total_cases: int
+    outcomes: dict[str, str]
+    flaky_in_run: frozenset[str] = field(default_factory=frozenset)
+
+    @property
+    def executed(self) -> list[str]:
+        return [t for t, s in self.outcomes.items() if s != "skipped"]
+
+
+@dataclass(frozen=True, slots=True)
+class DimensionScore:
+    score: float | None  # None: no evidence, caller falls back
+    basis: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"score": self.score, "basis": self.basis}
+
+
+@dataclass(frozen=True, slots=True)
+class SubScores:
+    stability: DimensionScore
+    regression: DimensionScore
+    coverage: DimensionScore
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stability": self.stability.to_dict(),
+            "regression": self.regression.to_dict(),
+            "coverage": self.coverage.to_dict(),
+        }
+
+
+def aggregate_run(data: NormalizedData) -> RunAggregate:
+    return measure_run(data)[1]
+
+
+def measure_run(data: NormalizedData) -> tuple[dict, RunAggregate]:
+    """compute_metrics(data) and aggregate_run(data) from a single pass over the results."""
+    test_cases = data.test_cases
+    total = mapped = passed = failed = skipped = 0
+    seen: dict[str, set[str]] = {}
+    for r in data.results:
+        total += 1
+        if r.id not in test_cases:
+            continue
+        mapped += 1
+        status = r.status
+        if status == "passed":
+            passed += 1
+        elif status == "failed":
+            failed += 1
+        elif status == "skipped":
+            skipped += 1
+        statuses = seen.get(r.id)
+        if statuses is None:
+            statuses = seen[r.id] = set()
+        statuses.add(status)
+
+    outcomes: dict[str, str] = {}
+    flaky: set[str] = set()
+    for test_id, statuses in seen.items():
+        if "failed" in statuses:
+            outcomes[test_id] = "failed"
+            if "passed" in statuses:
+                flaky.add(test_id)
+        elif "passed" in statuses:
+            outcomes[test_id] = "passed"
+        else:
+            outcomes[test_id] = "skipped"
+    partial = ShardPartial(total_results=total, mapped_results=mapped, passed=passed, failed=failed, skipped=skipped)
+    metrics = metrics_from_partial(len(test_cases), partial)
+    return metrics, RunAggregate(total_cases=len(test_cases), outcomes=outcomes, flaky_in_run=frozenset(flaky))
+
+
+def compute_subscores(run: RunAggregate, index: HistoryIndex | None = None) -> SubScores:
+    executed = run.executed
+    return SubScores(
+        stability=_stability(run, executed, index),
+        regression=_regression(run, executed, index),
+        coverage=coverage_score(len(executed), run.total_cases),
+    )
+
+
+def coverage_only(executed: int, total_cases: int, basis: str) -> SubScores:
+    """Sub-scores when only executed-case counts are known; the other dimensions give `basis`."""
+    return SubScores(
+        stability=DimensionScore(None, basis),
+        regression=DimensionScore(None, basis),
+        coverage=coverage_score(executed, total_cases),
+    )
+
+
+def coverage_score(executed: int, total_cases: int) -> DimensionScore:
+    """Coverage from the number of distinct catalog cases executed (passed/failed)."""
+    if total_cases == 0:
+        return DimensionScore(None, "no catalog cases")
+    never = total_cases - executed
+    return DimensionScore(
+        _pct(executed, total_cases),
+        f"{executed}/{total_cases} cases executed ({never} never executed or skipped)",
+    )
+
+
+def _stability(run: RunAggregate, executed: list[str], index: HistoryIndex | None) -> DimensionScore:
+    if index is None or index.runs == 0:
+        return DimensionScore(None, "no run history")
+    if not executed:
+        return DimensionScore(None, "no executed tests")
+    flaky = 0
+    for test_id in executed:
+        h = index.get(test_id)
+        flipped_now = h is not None and h.last_status is not None and h.last_status != run.outcomes[test_id]
+        if test_id in run.flaky_in_run or flipped_now or (h is not None and h.flips > 0):
+            flaky += 1
+    return DimensionScore(
+        _pct(len(executed) - flaky, len(executed)),
+        f"{flaky}/{len(executed)} executed tests flipped passed<->failed over the last {index.window_runs + 1} run(s)",
+    )
+
+
+def _regression(run: RunAggregate, executed: list[str], index: HistoryIndex | None) -> DimensionScore:
+    if index is None or index.last_green is None:
+        return DimensionScore(None, "no green run in history")
+    base = [t for t in executed if index.status_in_last_green(t) == "passed"]
+    if not base:
+        return DimensionScore(None, "no overlap with the last green run")
+    new_failures = sum(1 for t in base if run.outcomes[t] == "failed")
+    return DimensionScore(
+        _pct(len(base) - new_failures, len(base)),
+        f"{new_failures} new failure(s) among {len(base)} tests green in run {index.last_green_run_id}",
+    )
+
+
+def _pct(part: int, whole: int) -> float:
+    return round(100.0 * part / whole, 1)
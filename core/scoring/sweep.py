@@ -0,0 +1,353 @@
+"""
+What-if sweeps: how many stored runs would change decision under candidate weights/thresholds.
+
+Candidates are the baseline policy (DEFAULT_POLICY unless --policy names another) with five
+parameters swapped in:
+  failure / skip / unmapped penalty weights (points per 1%; caps stay the baseline's)
+  approve threshold     (score >= T -> low risk, unless capped at medium by skip/unmapped rates)
+  conditional threshold (score >= T -> medium risk)
+The metric-only escalations (by default failure_rate >= 0.2 or unmapped_rate >= 0.3 -> high;
+skip_rate > 0.1 or unmapped_rate > 0.05 caps low at medium) take the baseline's values, are
+fixed per run and computed once. The baseline must keep DEFAULT_POLICY's structure (same
+penalty metrics, rules, condition metrics and ops; only the numbers may differ): other
+policies are refused with a ValidationError rather than swept with the wrong rules.
+
+Evaluation is split so the grid stays cheap. Identical runs are grouped first; runs forced
+high reject under every candidate and are only counted. The rest are sorted by unmapped rate,
+so each unmapped weight splits them into at most 21 contiguous segments of equal penalty
+(penalties are monotone in the rate). For each failure x skip weight pair, one pass over the
+runs builds prefix score histograms (per escalation class x baseline decision), packed into
+one int per segment end; each unmapped weight then sums its segments' histograms, shifted by
+their penalty, in a few big-int operations. Every threshold pair is read off cumulative
+histogram counts in O(1).
+Cost: O(failure x skip weights x distinct runs + weight combos x (segments + threshold pairs)).
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from itertools import accumulate, product
+from typing import Any, Iterable, Mapping
+
+from core.models.errors import ValidationError
+from core.scoring.policy import RiskRule, ScoringPolicy, default_policy, metric_value
+
+DECISIONS = ("approve", "conditional", "reject")
+_APPROVE, _CONDITIONAL, _REJECT = 0, 1, 2
+
+# Escalation classes (fixed per run, independent of the swept parameters).
+_NORMAL, _CAPPED, _FORCED_HIGH = 0, 1, 2
+
+_BINS = 101  # clamped scores 0..100
+
+
+@dataclass(frozen=True, slots=True)
+class SweepGrid:
+    failure_weights: tuple[float, ...] = (1.0,)
+    skip_weights: tuple[float, ...] = (0.5,)
+    unmapped_weights: tuple[float, ...] = (0.5,)
+    approve_thresholds: tuple[float, ...] = (85,)
+    conditional_thresholds: tuple[float, ...] = (70,)
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.failure_weights)
+            * len(self.skip_weights)
+            * len(self.unmapped_weights)
+            * len(self.approve_thresholds)
+            * len(self.conditional_thresholds)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SweepRow:
+    failure_weight: float
+    skip_weight: float
+    unmapped_weight: float
+    approve_threshold: float
+    conditional_threshold: float
+    counts: tuple[int, int, int]  # approve, conditional, reject
+    flips: tuple[tuple[int, int, int], ...]  # flips[baseline][candidate]
+
+    @property
+    def flipped(self) -> int:
+        return sum(self.flips[b][c] for b in range(3) for c in range(3) if b != c)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "failure_weight": self.failure_weight,
+            "skip_weight": self.skip_weight,
+            "unmapped_weight": self.unmapped_weight,
+            "approve_threshold": self.approve_threshold,
+            "conditional_threshold": self.conditional_threshold,
+            **{d: n for d, n in zip(DECISIONS, self.counts)},
+            "flipped": self.flipped,
+            **{
+                f"{DECISIONS[b]}->{DECISIONS[c]}": self.flips[b][c]
+                for b in range(3)
+                for c in range(3)
+                if b != c
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    runs: int
+    baseline_counts: tuple[int, int, int]
+    rows: list[SweepRow]
+
+
+def sweep(
+    metrics_list: Iterable[Mapping[str, Any]],
+    grid: SweepGrid,
+    *,
+    baseline: ScoringPolicy | None = None,
+) -> SweepResult:
+    """
+    Evaluate every grid point against `metrics_list` (e.g. HistoryStore metrics).
+
+    Flips are counted against each run's decision under `baseline` (default policy if None).
+    Rows come in grid order (failure, skip, unmapped weight, approve, conditional threshold).
+    """
+    for axis in ("failure_weights", "skip_weights", "unmapped_weights"):
+        negative = [w for w in getattr(grid, axis) if w < 0]
+        if negative:
+            raise ValidationError(f"Sweep {axis.replace('_', ' ')} must be >= 0 (got {negative[0]!r})")
+    policy = baseline or default_policy()
+    fixed = _fixed_parts(policy)
+    groups: Counter[tuple[float, float, float, int, int]] = Counter()
+    for m in metrics_list:
+        fr = metric_value(m, "failure_rate")
+        sr = metric_value(m, "skip_rate")
+        ur = metric_value(m, "unmapped_rate")
+        if fr >= fixed.high_failure_rate or ur >= fixed.high_unmapped_rate:
+            cls = _FORCED_HIGH
+        elif sr > fixed.cap_skip_rate or ur > fixed.cap_unmapped_rate:
+            cls = _CAPPED
+        else:
+            cls = _NORMAL
+        base = DECISIONS.index(policy.evaluate(m).recommendation.value)
+        groups[(fr, sr, ur, cls, base)] += 1
+
+    keys = list(groups)
+    counts = [groups[k] for k in keys]
+    runs = sum(counts)
+    baseline_counts = [0, 0, 0]
+    forced_counts = [0, 0, 0]
+    for k, n in zip(keys, counts):
+        baseline_counts[k[4]] += n
+        if k[3] == _FORCED_HIGH:
+            forced_counts[k[4]] += n
+
+    # Forced-high runs reject under every candidate; only the others are scored. Sorted by
+    # unmapped rate, each unmapped weight splits them into contiguous equal-penalty segments.
+    scored = sorted((k for k in keys if k[3] != _FORCED_HIGH), key=lambda k: k[2])
+    scored_counts = [groups[k] for k in scored]
+    slots = [k[3] * 3 + k[4] for k in scored]  # histogram block: class x baseline decision
+
+    def _penalties(rates: list[float], weights: tuple[float, ...], cap: float) -> list[list[int]]:
+        out = []
+        for w in weights:
+            factor = 100 * w
+            out.append([min(cap, int(round(r * factor))) for r in rates])
+        return out
+
+    pf = _penalties([k[0] for k in scored], grid.failure_weights, fixed.failure_cap)
+    ps = _penalties([k[1] for k in scored], grid.skip_weights, fixed.skip_cap)
+    pu = _penalties([k[2] for k in scored], grid.unmapped_weights, fixed.unmapped_cap)
+    segments = [_segments(col) for col in pu]
+
+    # Packed histograms. Raw scores 100 - a - b - c (a, b, c: failure/skip/unmapped penalties,
+    # all >= 0) fall in [lo, hi]. A histogram is 6 blocks (escalation class _NORMAL/_CAPPED x
+    # baseline decision) of nf fields; field f of block k counts runs with raw score lo + f and
+    # lives at bits [bits * (k * nf + f), bits * (k * nf + f + 1)) of one int (an `array` of
+    # unsigned `bits`-wide items read with int.from_bytes in native byte order).
+    # Invariants that keep the lanes from overflowing into each other:
+    #  - `bits` is the narrowest item width with runs < 2**bits, and every field of every
+    #    histogram built below counts a subset of the runs, so no field ever carries;
+    #  - prefix histograms only grow field by field, so prefix[stop] - prefix[start] never
+    #    borrows across a lane;
+    #  - `>> bits * c` moves a whole segment down c fields (unmapped penalty c). Its fields
+    #    below c are empty, because before that penalty every raw score is at least
+    #    100 - max(a) - max(b) = lo + max(c) >= lo + c, so nothing crosses into the block below.
+    lo = 100 - sum(max(max(col, default=0) for col in t) for t in (pf, ps, pu))
+    hi = 100 - sum(min(min(col, default=0) for col in t) for t in (pf, ps, pu))
+    nf = hi - lo + 1
+    code = next(c for c in "BHIQ" if array(c).itemsize * 8 > runs.bit_length())
+    bits = array(code).itemsize * 8
+    nbytes = 6 * nf * array(code).itemsize
+
+    def _pos(t: int) -> int:
+        # Index into a block's `>= raw score` counts for a clamped-score threshold t in 0..101
+        # (scores are clamped to 0..100, so t == 0 counts every run and t > 100 none).
+        if t > 100:
+            return nf
+        return 0 if t == 0 else min(nf, max(0, t - lo))
+
+    thresholds = [
+        (ta, tc, _pos(ia), _pos(ic), _pos(max(ia, ic)), _pos(min(ia, ic)))
+        for ta, tc in product(grid.approve_thresholds, grid.conditional_thresholds)
+        for ia, ic in [(_threshold_index(ta), _threshold_index(tc))]
+    ]
+
+    # Segment ends are the only prefixes the unmapped axis reads.
+    cuts = [False] * (len(scored) + 1)
+    for segs in segments:
+        for _, start, stop in segs:
+            cuts[start] = cuts[stop] = True
+    offsets = [slot * nf + 100 - lo for slot in slots]
+
+    rows: list[SweepRow] = []
+    for (fi, fw), (si, sw) in product(enumerate(grid.failure_weights), enumerate(grid.skip_weights)):
+        # prefix[j]: packed histograms of the first j scored groups before the unmapped penalty.
+        hist = array(code, bytes(nbytes))
+        prefix = {0: 0}
+        for j, (off, n, a, b) in enumerate(zip(offsets, scored_counts, pf[fi], ps[si]), 1):
+            hist[off - a - b] += n
+            if cuts[j]:
+                prefix[j] = int.from_bytes(hist.tobytes(), sys.byteorder)
+
+        for ui, uw in enumerate(grid.unmapped_weights):
+            packed = 0
+            for c, start, stop in segments[ui]:
+                part = prefix[stop] - prefix[start]
+                packed += part >> (bits * c)
+            fields = array(code)
+            fields.frombytes(packed.to_bytes(nbytes, sys.byteorder))
+            # ge[block][i] = runs in block with raw score >= lo + i (i in 0..nf)
+            ge = [list(accumulate(reversed(fields[b * nf : (b + 1) * nf]), initial=0))[::-1] for b in range(6)]
+
+            for ta, tc, ia, ic, imax, imin in thresholds:
+                flips = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+                for base in range(3):
+                    normal = ge[_NORMAL * 3 + base]
+                    capped = ge[_CAPPED * 3 + base]
+                    approve = normal[ia]
+                    conditional = (normal[ic] - normal[imax]) + capped[imin]
+                    total = normal[0] + capped[0] + forced_counts[base]
+                    flips[base][_APPROVE] = approve
+                    flips[base][_CONDITIONAL] = conditional
+                    flips[base][_REJECT] = total - approve - conditional
+                rows.append(
+                    SweepRow(
+                        failure_weight=fw,
+                        skip_weight=sw,
+                        unmapped_weight=uw,
+                        approve_threshold=ta,
+                        conditional_threshold=tc,
+                        counts=tuple(sum(flips[b][c] for b in range(3)) for c in range(3)),
+                        flips=tuple(tuple(r) for r in flips),
+                    )
+                )
+
+    return SweepResult(runs=runs, baseline_counts=tuple(baseline_counts), rows=rows)
+
+
+@dataclass(frozen=True, slots=True)
+class _Fixed:
+    """Parts of the baseline policy every candidate keeps."""
+
+    failure_cap: float
+    skip_cap: float
+    unmapped_cap: float
+    high_failure_rate: float
+    high_unmapped_rate: float
+    cap_skip_rate: float
+    cap_unmapped_rate: float
+
+
+def _fixed_parts(policy: ScoringPolicy) -> _Fixed:
+    """
+    Caps and metric escalations of `policy`. Raises ValidationError unless the policy has
+    DEFAULT_POLICY's structure, which the histogram evaluation in sweep() relies on.
+    """
+    reference = default_policy()
+
+    def _refuse(reason: str) -> ValidationError:
+        return ValidationError(
+            f"Sweep baseline policy '{policy.name}' {reason}; swept policies must keep the default "
+            "policy's structure (only its numbers may differ)"
+        )
+
+    if policy.score_bounds != reference.score_bounds:
+        raise _refuse("must start at 100 and clamp scores to 0-100")
+    caps: dict[str, float] = {}
+    for metric, _, cap in policy.penalties:
+        if metric in caps:
+            raise _refuse(f"penalizes '{metric}' more than once")
+        if not (math.isinf(cap) or cap == int(cap)):
+            raise _refuse(f"has a fractional '{metric}' cap ({cap!r})")
+        caps[metric] = cap if math.isinf(cap) else int(cap)
+    if caps.keys() != {metric for metric, _, _ in reference.penalties}:
+        raise _refuse("must penalize exactly failure_rate, skip_rate and unmapped_rate")
+    if (
+        [_rule_shape(r) for r in policy.rules] != [_rule_shape(r) for r in reference.rules]
+        or policy.default_level != reference.default_level
+        or policy.recommendations != reference.recommendations
+    ):
+        raise _refuse("has different risk rules, default level or recommendations")
+
+    high, capped = policy.rules[0].any, policy.rules[1].any
+    return _Fixed(
+        failure_cap=caps["failure_rate"],
+        skip_cap=caps["skip_rate"],
+        unmapped_cap=caps["unmapped_rate"],
+        high_failure_rate=high[0][2],
+        high_unmapped_rate=high[1][2],
+        cap_skip_rate=capped[0][2],
+        cap_unmapped_rate=capped[1][2],
+    )
+
+
+def _rule_shape(rule: RiskRule) -> tuple[Any, ...]:
+    # Everything but the numbers: level plus (metric, op) of each condition, in order.
+    return (rule.level, [(m, op) for m, op, _ in rule.all], [(m, op) for m, op, _ in rule.any])
+
+
+def parse_axis(value: str) -> tuple[float, ...]:
+    """
+    Grid axis: "1.5" (single value), "0.5,1,2" (list) or "START:STOP:COUNT" (COUNT evenly
+    spaced values, both ends included).
+    """
+    value = value.strip()
+    if value.count(":") == 2:
+        start_s, stop_s, count_s = value.split(":")
+        try:
+            start, stop, count = float(start_s), float(stop_s), int(count_s)
+        except ValueError as e:
+            raise ValueError(f"invalid range '{value}' (expected START:STOP:COUNT)") from e
+        if count < 1:
+            raise ValueError(f"range '{value}': COUNT must be >= 1")
+        if count == 1:
+            return (start,)
+        step = (stop - start) / (count - 1)
+        return tuple(round(start + i * step, 10) for i in range(count))
+    try:
+        values = tuple(float(v) for v in value.split(",") if v.strip())
+    except ValueError as e:
+        raise ValueError(f"invalid value list '{value}'") from e
+    if not values:
+        raise ValueError("empty axis")
+    return values
+
+
+def _segments(penalties: list[int]) -> list[tuple[int, int, int]]:
+    """(penalty, start, stop) runs of equal values (monotone in the sorted rates)."""
+    out: list[tuple[int, int, int]] = []
+    start = 0
+    for i in range(1, len(penalties) + 1):
+        if i == len(penalties) or penalties[i] != penalties[start]:
+            out.append((penalties[start], start, i))
+            start = i
+    return out
+
+
+def _threshold_index(t: float) -> int:
+    # Scores are integers: `score >= t` <=> `score >= ceil(t)`; clamp into the histogram.
+    return min(_BINS, max(0, math.ceil(t)))
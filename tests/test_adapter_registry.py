@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from adapters.base import BaseAdapter
+from adapters.registry import AdapterRegistry, AdapterSpec, load_artifact
+from cli.main import main
+from core.models.errors import ValidationError
+from core.models.signals import SignalType, StabilitySignal
+from core.models.test_results import TestResult as RunResult
+from core.models.test_results import TestResults as ResultHistory
+from core.models.test_results import TestRun as HistoryRun
+from core.models.test_results import TestStatus as Status
+
+_FLOWS = [{"status": "completed", "steps": ["a", "b"]}, {"status": "abandoned", "steps": ["a", "a"]}]
+
+
+class _ThreadNameAdapter(BaseAdapter):
+    def extract_signals(self, test_results, optional_artifacts=None):
+        return [
+            StabilitySignal(
+                signal_type=SignalType.STABILITY,
+                name="thread",
+                value=float(len(optional_artifacts["pings"])),
+                description=threading.current_thread().name,
+                evidence=["ping"],
+            )
+        ]
+
+    def get_name(self) -> str:
+        return "pings"
+
+
+def _history(*runs: dict[str, Status]) -> ResultHistory:
+    return ResultHistory(
+        test_runs=[
+            HistoryRun(
+                run_id=f"run-{i}",
+                timestamp=datetime(2026, 1, i + 1),
+                results=[RunResult(test_id=t, status=s, duration_ms=10) for t, s in statuses.items()],
+            )
+            for i, statuses in enumerate(runs)
+        ]
+    )
+
+
+def test_selection_imports_only_adapters_whose_artifacts_are_present() -> None:
+    registry = AdapterRegistry()
+    assert registry.select({}) == []
+    assert [s.name for s in registry.select({"flows": _FLOWS})] == ["ai_agent"]
+    assert [s.name for s in registry.select({}, has_results=True)] == ["generic"]
+    with pytest.raises(ValidationError, match="transcripts"):
+        registry.select({"transcripts": []})
+    with pytest.raises(ValidationError, match="already registered"):
+        registry.register(AdapterSpec("ai_agent", "adapters.ai_agent.signal_extractor:AIAgentAdapter"))
+    with pytest.raises(ValidationError, match="not a BaseAdapter"):
+        AdapterSpec("bad", "core.models.errors:ValidationError").load()
+
+    outputs = registry.run({"flows": _FLOWS})
+    assert [o.name for o in outputs] == ["ai_agent"]
+    assert [s.name for s in outputs[0].signals] == ["flow_completion_rate", "flow_anomalies"]
+
+
+def test_independent_adapters_run_concurrently_in_registration_order() -> None:
+    registry = AdapterRegistry()
+    registry.register(AdapterSpec("pings", f"{__name__}:_ThreadNameAdapter", artifacts=("pings",)))
+    history = _history({"a": Status.PASSED}, {"a": Status.FAILED})
+
+    outputs = registry.run({"flows": _FLOWS, "pings": [1, 2, 3]}, history, workers=3)
+    assert [o.name for o in outputs] == ["generic", "ai_agent", "pings"]
+    assert outputs[2].signals[0].value == 3.0
+    assert outputs[2].signals[0].description.startswith("readiness-adapter")
+    assert {s.name for s in outputs[0].signals} >= {"test_flakiness", "new_failures"}
+
+
+def test_cli_artifact_adds_adapter_section(tmp_path) -> None:
+    flows = tmp_path / "flows.jsonl"
+    flows.write_text("".join(json.dumps(f) + "\n" for f in _FLOWS), encoding="utf-8")
+    out = tmp_path / "report.md"
+
+    assert main(["--demo", "--out", str(out), "--format", "md,json", "--artifact", f"flows={flows}"]) == 0
+    assert "## Adapter Signals (optional)" in out.read_text(encoding="utf-8")
+    doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    (ai_agent,) = doc["extensions"]["adapter_signals"]["adapters"]
+    assert ai_agent["name"] == "ai_agent"
+    assert ai_agent["signals"][0]["value"] == 50.0
+
+    with pytest.raises(SystemExit, match="KIND=PATH"):
+        main(["--demo", "--out", str(out), "--artifact", str(flows)])
+
+
+def test_load_artifact_rejects_unexpected_shapes(tmp_path) -> None:
+    path = tmp_path / "flows.json"
+    path.write_text(json.dumps(_FLOWS), encoding="utf-8")
+    assert load_artifact(path) == _FLOWS
+
+    path.write_text(json.dumps(_FLOWS[0]), encoding="utf-8")
+    assert load_artifact(path) == [_FLOWS[0]]  # a single record
+
+    for doc, message in (("42", "got int"), ('"flows"', "got str"), ('[{"a": 1}, 3]', "record 1 is int")):
+        path.write_text(doc, encoding="utf-8")
+        with pytest.raises(ValueError, match=message):
+            load_artifact(path)
+
+
+def test_cli_artifact_errors_exit_with_a_message(tmp_path) -> None:
+    conversation = tmp_path / "conv.json"
+    conversation.write_text(json.dumps({"status": "completed", "responses": ["a"]}), encoding="utf-8")
+    out = tmp_path / "report.md"
+    assert main(["--demo", "--out", str(out), "--format", "json", "--artifact", f"conversations={conversation}"]) == 0
+    doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    (ai_agent,) = doc["extensions"]["adapter_signals"]["adapters"]
+    assert ai_agent["signals"][0]["name"] == "conversation_completion_rate"
+
+    conversation.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(SystemExit, match="record 0 is int"):
+        main(["--demo", "--out", str(out), "--artifact", f"conversations={conversation}"])
+    with pytest.raises(SystemExit, match="file not found"):
+        main(["--demo", "--out", str(out), "--artifact", f"flows={tmp_path / 'missing.json'}"])
+
+
+def test_cli_adapter_workers_split_jsonl_artifacts_across_processes(tmp_path, monkeypatch) -> None:
+    from adapters.ai_agent import AIAgentAdapter
+
+    flows = tmp_path / "flows.jsonl"
+    flows.write_text("".join(json.dumps(f) + "\n" for f in _FLOWS * 50), encoding="utf-8")
+    calls: list[int] = []
+    accumulate_parallel = AIAgentAdapter._accumulate_parallel
+
+    def _spy(self, present, analyzers):
+        calls.append(self.workers)
+        return accumulate_parallel(self, present, analyzers)
+
+    monkeypatch.setattr(AIAgentAdapter, "_accumulate_parallel", _spy)
+
+    def _signals(out, *extra: str) -> list[dict]:
+        assert main(["--demo", "--out", str(out), "--format", "json", "--artifact", f"flows={flows}", *extra]) == 0
+        doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+        return doc["extensions"]["adapter_signals"]["adapters"][0]["signals"]
+
+    single = _signals(tmp_path / "single.md")
+    assert calls == []
+    assert _signals(tmp_path / "parallel.md", "--adapter-workers", "3") == single
+    assert calls == [3]
+
+    with pytest.raises(SystemExit, match="--adapter-workers must be >= 1"):
+        main(["--demo", "--out", str(tmp_path / "r.md"), "--artifact", f"flows={flows}", "--adapter-workers", "0"])
+    with pytest.raises(SystemExit, match="requires --artifact"):
+        main(["--demo", "--out", str(tmp_path / "r.md"), "--adapter-workers", "2"])
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from adapters.ai_agent import AIAgentAdapter, JsonlSource
+from core.models.errors import IngestionError
+
+
+def _artifacts(n: int, seed: int = 5) -> dict[str, list[dict]]:
+    rng = random.Random(seed)
+    conversations, intents, flows = [], [], []
+    for _ in range(n):
+        conversations.append(
+            {
+                "status": rng.choice(("completed", "abandoned")),
+                "responses": ["x" * rng.randint(1, 200) for _ in range(rng.randint(0, 3))],
+            }
+        )
+        intents.append({"predicted": rng.choice(("refund", "billing", "other")), "actual": rng.choice(("refund", "billing"))})
+        flows.append({"status": rng.choice(("completed", "stuck")), "steps": [rng.choice("abcd") for _ in range(rng.randint(0, 4))]})
+    return {"conversations": conversations, "intents": intents, "flows": flows}
+
+
+def _write_jsonl(path, records: list[dict]) -> JsonlSource:
+    with open(path, "w", encoding="utf-8") as f:
+        for i, r in enumerate(records):
+            f.write(json.dumps(r) + "\n")
+            if i % 97 == 0:
+                f.write("\n")  # blank lines are skipped
+    return JsonlSource(str(path))
+
+
+def test_small_artifacts_produce_expected_signals() -> None:
+    signals = AIAgentAdapter().extract_signals(
+        None,
+        {
+            "conversations": [{"status": "completed", "responses": ["a", "abc"]}, {"responses": []}],
+            "intents": [{"predicted": "a", "actual": "a"}, {"predicted": "b", "actual": "a"}],
+            "flows": [{"status": "completed", "steps": ["s1", "s1"]}],
+        },
+    )
+    by_name = {s.name: s.value for s in signals}
+    assert by_name["conversation_completion_rate"] == 50.0
+    assert by_name["response_consistency"] == 50.0  # lengths 1, 3: cv = 1 / 2
+    assert by_name["intent_classification_accuracy"] == 50.0
+    assert by_name["intent_distribution_diversity"] == 100.0
+    assert by_name["flow_anomalies"] == 0.0
+    assert [s.name for s in signals][0] == "conversation_completion_rate"
+
+
+def test_iterables_files_and_worker_pool_give_identical_signals(tmp_path) -> None:
+    artifacts = _artifacts(3000)
+    serial = AIAgentAdapter().extract_signals(None, artifacts)
+
+    streamed = AIAgentAdapter().extract_signals(None, {k: iter(v) for k, v in artifacts.items()})
+    sources = {k: _write_jsonl(tmp_path / f"{k}.jsonl", v) for k, v in artifacts.items()}
+    from_files = AIAgentAdapter().extract_signals(None, sources)
+    parallel = AIAgentAdapter(workers=3).extract_signals(None, {**sources, "flows": artifacts["flows"]})
+
+    assert len(serial) == 6
+    assert streamed == serial
+    assert from_files == serial
+    assert parallel == serial
+
+
+def test_jsonl_split_yields_every_record_once_in_order(tmp_path) -> None:
+    records = [{"i": i, "pad": "y" * (i % 17)} for i in range(500)]
+    source = _write_jsonl(tmp_path / "r.jsonl", records)
+
+    for parts in (1, 2, 7, 64):
+        slices = source.split(parts)
+        assert [r["i"] for s in slices for r in s] == list(range(500))
+
+
+def test_jsonl_source_reports_bad_lines(tmp_path) -> None:
+    path = tmp_path / "bad.jsonl"
+    path.write_text('{"status": "completed"}\n{not json\n', encoding="utf-8")
+    with pytest.raises(IngestionError, match="invalid JSON at byte 24"):
+        list(JsonlSource(str(path)))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import cli._batch as batch
+from cli._batch import run_manifest, summarize_outcomes
+from core.models.errors import IngestionError
+
+
+def test_manifest_runs_share_parsed_catalog_and_report_errors(tmp_path, monkeypatch) -> None:
+    samples = Path("samples").resolve()
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "defaults": {"cases": str(samples / "test_cases.csv")},
+                "runs": [
+                    {"name": "svc-a", "junit": str(samples / "junit.xml"), "out": "out/a.md"},
+                    {
+                        "name": "svc-b",
+                        "junit": str(samples / "junit.xml"),
+                        "out": "out/b.md",
+                        "transcript": str(samples / "llm_transcript.json"),
+                        "baseline": str(samples / "llm_transcript_baseline.json"),
+                    },
+                    {"name": "svc-c", "junit": "missing.xml", "out": "out/c.md"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    calls: list[str] = []
+    real_loader = batch.load_test_cases_csv
+
+    def _counting_loader(path: str) -> list[dict]:
+        calls.append(path)
+        return real_loader(path)
+
+    monkeypatch.setattr(batch, "load_test_cases_csv", _counting_loader)
+
+    outcomes = run_manifest(manifest, workers=3)
+    summary = summarize_outcomes(outcomes)
+
+    assert len(calls) == 1
+    assert [o.entry.name for o in outcomes] == ["svc-a", "svc-b", "svc-c"]
+    assert summary["runs_ok"] == 2
+    assert summary["runs_failed"] == 1
+    assert summary["by_recommendation"] == {"reject": 2}
+    assert (tmp_path / "out" / "a.md").is_file()
+    assert "Drift vs Baseline" in (tmp_path / "out" / "b.md").read_text(encoding="utf-8")
+    assert "file not found" in outcomes[2].error
+
+
+def test_manifest_rejects_runs_whose_report_or_sidecar_files_clash(tmp_path) -> None:
+    manifest = tmp_path / "manifest.json"
+
+    def _load(outs: list[str], **kwargs) -> list:
+        runs = [{"cases": "c.csv", "junit": "j.xml", "out": out} for out in outs]
+        manifest.write_text(json.dumps(runs), encoding="utf-8")
+        return batch.load_manifest(manifest, **kwargs)
+
+    assert len(_load(["out/a.md", "out/b.md"], formats=("md", "json"))) == 2
+    # a.md and a.html differ, but their JSON reports and sidecar CSVs are the same files.
+    with pytest.raises(IngestionError, match=r"run #2 reuses output path .*a\.json"):
+        _load(["out/a.md", "out/a.html"], formats=("md", "json"))
+    with pytest.raises(IngestionError, match=r"run #2 reuses output path .*a\.failed_tests\.csv"):
+        _load(["out/a.md", "out/a.html"])
+    with pytest.raises(IngestionError, match="run #1: formats 'md' and 'json'"):
+        _load(["out/a.json"], formats=("md", "json"))
+
+
+def test_manifest_rejects_runs_that_resolve_to_the_same_name(tmp_path) -> None:
+    manifest = tmp_path / "manifest.json"
+    runs = [{"cases": "c.csv", "junit": "j.xml", "out": out} for out in ("x/report.md", "y/report.md")]
+    manifest.write_text(json.dumps(runs), encoding="utf-8")
+    with pytest.raises(IngestionError, match="run #2 reuses name 'report'"):
+        batch.load_manifest(manifest)
+
+    runs[1]["name"] = "svc-y"
+    manifest.write_text(json.dumps(runs), encoding="utf-8")
+    assert [e.name for e in batch.load_manifest(manifest)] == ["report", "svc-y"]
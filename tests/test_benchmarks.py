@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from adapters.llm_readiness.load_transcript import load_transcript
+from benchmarks.__main__ import parse_sizes
+from benchmarks.baseline import compare_to_baseline, load_baseline, save_baseline
+from benchmarks.generators import write_cases_csv, write_junit_shards, write_transcript
+from benchmarks.harness import STAGES, BenchResult, run_suite
+from core.models.normalizer import normalize
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results
+
+
+def test_generators_are_deterministic_and_loadable(tmp_path) -> None:
+    a = write_cases_csv(tmp_path / "a.csv", 200, seed=7)
+    b = write_cases_csv(tmp_path / "b.csv", 200, seed=7)
+    assert a.read_bytes() == b.read_bytes()
+
+    shards = write_junit_shards(tmp_path / "junit", 500, catalog_size=200, shards=3, seed=7)
+    again = write_junit_shards(tmp_path / "junit2", 500, catalog_size=200, shards=3, seed=7)
+    assert [p.read_bytes() for p in shards] == [p.read_bytes() for p in again]
+
+    results = [r for p in shards for r in load_junit_results(str(p))]
+    data = normalize(load_test_cases_csv(str(a)), results)
+    assert len(data.test_cases) == 200
+    assert len(data.results) == 500
+    assert {r.status for r in data.results} == {"passed", "failed", "skipped"}
+
+    transcript = load_transcript(str(write_transcript(tmp_path / "t.json", 300, seed=7)))
+    assert len(transcript.turns) == 300
+
+
+def test_suite_runs_every_stage_and_flags_slowdowns(tmp_path) -> None:
+    results = run_suite([50], workdir=tmp_path, repeat=1)
+    assert [r.name for r in results] == list(STAGES)
+    assert all(r.records == 50 and r.seconds >= 0 and r.peak_kib is not None for r in results)
+
+    save_baseline(tmp_path / "baseline.json", results)
+    baseline = load_baseline(tmp_path / "baseline.json")
+    assert compare_to_baseline(results, baseline) == []
+
+    slow = [BenchResult(r.name, r.records, r.seconds * 2 + 0.05, r.peak_kib) for r in results]
+    regressions = compare_to_baseline(slow, baseline, tolerance=0.25)
+    assert {reg.name for reg in regressions if reg.metric == "seconds"} == set(STAGES)
+
+
+def test_parse_sizes_accepts_scientific_notation() -> None:
+    assert parse_sizes("1e3, 10000,1e7") == [1000, 10000, 10_000_000]
+    with pytest.raises(ValueError):
+        parse_sizes("0")
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cli.main import main
+from core.mapping.suggest import CaseIndex, index_for
+from core.models.errors import ValidationError
+from core.models.test_case import TestCaseModel as CaseModel
+
+_WORDS = ("login", "checkout", "refund", "invoice", "search", "profile", "password", "coupon", "shipping", "export")
+_TITLES = [f"{a.title()} with {b} and {c}" for a, b, c in itertools.combinations(_WORDS, 3)]
+_CATALOG = {f"TC-{i:03d}": CaseModel(id=f"TC-{i:03d}", title=t) for i, t in enumerate(_TITLES)}
+
+
+def test_renamed_tests_and_missing_prefixes_find_their_case() -> None:
+    index = CaseIndex.build(_CATALOG)
+    for i in (0, 42, 97, 119):
+        a, b, c = _TITLES[i].lower().replace(" with", "").replace(" and", "").split()
+        assert index.suggest(f"test_{a}_{b}_{c}")[0].case_id == f"TC-{i:03d}"
+        assert index.suggest(f"test{a.title()}{c.title()}{b.title()}")[0].case_id == f"TC-{i:03d}"
+        assert index.suggest(f"{i:03d}_{a}")[0].case_id == f"TC-{i:03d}"
+    assert index.suggest("zzzz") == []
+
+    scores = [s.score for s in index.suggest("login checkout", k=5)]
+    assert scores == sorted(scores, reverse=True) and len(scores) <= 5
+
+
+def test_index_is_cached_per_catalog_and_round_trips(tmp_path) -> None:
+    assert index_for(_CATALOG) is index_for(dict(_CATALOG))
+    changed = dict(_CATALOG, **{"TC-000": CaseModel(id="TC-000", title="Renamed")})
+    assert index_for(changed) is not index_for(_CATALOG)
+
+    catalogs = [dict(_CATALOG, **{f"TC-9{i}": CaseModel(id=f"TC-9{i}", title=f"Extra {i}")}) for i in range(4)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        indexes = list(pool.map(index_for, catalogs * 8))
+    for i in range(len(catalogs)):
+        assert all(x is indexes[i] for x in indexes[i :: len(catalogs)])
+
+    index = CaseIndex.build(_CATALOG, max_df=40)
+    reloaded = CaseIndex.load(index.save(tmp_path / "index.json"))
+    for name in ("test_refund_login_coupon", "search export", "TC-100"):
+        assert reloaded.suggest(name) == index.suggest(name)
+    with pytest.raises(ValidationError, match="malformed"):
+        CaseIndex.from_dict({**index.to_dict(), "postings": {"abc": [9999]}})
+
+
+def test_report_suggests_mappings_and_alias_file_maps_them(tmp_path) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text(
+        "id,title\nTC-001,Login works\nTC-002,Checkout works\nTC-003,Refund intent supported\n", encoding="utf-8"
+    )
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite name="s">'
+        '<testcase name="TC-001 test_login_works"/>'
+        '<testcase name="test_checkout_works"><failure message="x"/></testcase>'
+        '<testcase name="refund_intent_supported_v2"/>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+    out = tmp_path / "report.md"
+    assert main(["--cases", str(cases), "--junit", str(junit), "--out", str(out), "--format", "md,json"]) == 0
+
+    assert "## Suggested Mappings" in out.read_text(encoding="utf-8")
+    aliases = tmp_path / "report.aliases.csv"
+    with aliases.open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["alias"], r["case_id"]) for r in rows] == [
+        ("test_checkout_works", "TC-002"),
+        ("refund_intent_supported_v2", "TC-003"),
+    ]
+
+    out2 = tmp_path / "mapped.md"
+    args = ["--cases", str(cases), "--junit", str(junit), "--out", str(out2), "--format", "json"]
+    assert main([*args, "--aliases", str(aliases)]) == 0
+    metrics = json.loads(out2.with_suffix(".json").read_text(encoding="utf-8"))["metrics"]
+    assert metrics["unmapped_results"] == 0
+    assert metrics["failed"] == 1
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from cli.main import main
+from core.mapping.suggest import CaseIndex
+from core.models.errors import ValidationError
+from core.models.normalizer import normalize_test_cases
+from core.parsers.catalog_index import CatalogIndex
+from core.parsers.csv_loader import load_test_cases_csv
+from core.reporting.details import component_stats
+
+_HEADER = "id,title,priority,component,description\n"
+
+
+def _rows(start: int, stop: int) -> str:
+    return "".join(
+        f'TC-{i:04d},"Case {i}, step",{("P1", "P2", "")[i % 3]},{("auth", "billing", "")[i % 3]},desc {i}\n'
+        for i in range(start, stop)
+    )
+
+
+def _bump_mtime(path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_lookups_match_the_in_memory_catalog(tmp_path) -> None:
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text(_HEADER + _rows(0, 1200), encoding="utf-8")
+    expected = normalize_test_cases(load_test_cases_csv(str(csv_path)))
+
+    with CatalogIndex(tmp_path / "catalog.sqlite") as index:
+        assert index.sync(csv_path) == "rebuilt"
+        assert index.sync(csv_path) == "unchanged"
+        assert index.total_cases == 1200
+
+        ids = [f"TC-{i:04d}" for i in range(0, 1200, 7)] + ["TC-9999"]
+        run = index.for_run(ids)
+        assert len(run) == len(expected)
+        for case_id in ids[:-1]:
+            assert run[case_id] == expected[case_id]
+        assert "TC-9999" not in run and run.get("TC-9999") is None
+        assert run["TC-0001"] == expected["TC-0001"]  # not prefetched: looked up on demand
+        assert dict(run.items()) == expected
+
+        results = []
+        assert component_stats(run, results) == component_stats(expected, results)
+
+
+def test_appended_rows_are_synced_from_the_tail(tmp_path) -> None:
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text(_HEADER + _rows(0, 50), encoding="utf-8")
+    with CatalogIndex(tmp_path / "catalog.sqlite") as index:
+        index.sync(csv_path)
+        with csv_path.open("a", encoding="utf-8") as f:
+            f.write(_rows(50, 80))
+        assert index.sync(csv_path) == "appended"
+        assert index.total_cases == 80
+        assert index.lookup(["TC-0079"]) == {"TC-0079": normalize_test_cases(load_test_cases_csv(str(csv_path)))["TC-0079"]}
+
+        with csv_path.open("a", encoding="utf-8") as f:
+            f.write(_rows(10, 11))
+        with pytest.raises(ValidationError, match="Duplicate test case id: TC-0010"):
+            index.sync(csv_path)
+        assert index.total_cases == 80  # failed sync left the index as it was
+
+
+def test_edited_and_removed_rows_trigger_a_resync(tmp_path) -> None:
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text(_HEADER + _rows(0, 30), encoding="utf-8")
+    with CatalogIndex(tmp_path / "catalog.sqlite") as index:
+        index.sync(csv_path)
+        text = (_HEADER + _rows(0, 30)).replace("TC-0003,\"Case 3, step\"", "TC-0003,Renamed")
+        text = text.replace(_rows(5, 6), "")
+        csv_path.write_text(text, encoding="utf-8")
+        _bump_mtime(csv_path)
+
+        assert index.sync(csv_path) == "rebuilt"
+        assert index.total_cases == 29
+        run = index.for_run(["TC-0003", "TC-0005"])
+        assert run["TC-0003"].title == "Renamed"
+        assert "TC-0005" not in run
+        assert sum(index.component_counts().values()) == 29
+
+
+def test_file_mode_report_is_the_same_with_a_catalog_index(tmp_path) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text(_HEADER + _rows(0, 12), encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite name="s">'
+        '<testcase name="TC-0001 login"/>'
+        '<testcase name="TC-0002 pay"><failure message="x"/></testcase>'
+        '<testcase name="TC-0004 refund"><skipped/></testcase>'
+        '<testcase name="case_7_step"/>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+
+    def report(*extra: str) -> dict:
+        out = tmp_path / "report.md"
+        args = ["--cases", str(cases), "--junit", str(junit), "--out", str(out), "--format", "json"]
+        assert main(args + ["--deterministic", *extra]) == 0
+        return json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+
+    plain = report()
+    indexed = report("--catalog-index", str(tmp_path / "catalog.sqlite"))
+    assert indexed == plain
+    assert report("--catalog-index", str(tmp_path / "catalog.sqlite")) == plain
+
+
+def test_suggestions_come_from_stored_postings_without_a_catalog_scan(tmp_path, monkeypatch) -> None:
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text(_HEADER + _rows(0, 300), encoding="utf-8")
+    expected = CaseIndex.build(normalize_test_cases(load_test_cases_csv(str(csv_path))))
+    names = ("case_17_step", "test_case_250", "0042 case", "zzzz")
+
+    with CatalogIndex(tmp_path / "catalog.sqlite") as index:
+        index.sync(csv_path)
+        for name in names:
+            assert index.suggest(name) == expected.suggest(name)
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError("catalog was read in full")
+
+    monkeypatch.setattr(CatalogIndex, "iter_cases", _no_scan)
+    monkeypatch.setattr(CatalogIndex, "_build_grams", _no_scan)
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("TC-0999,Refund with coupon,billing,\n")
+    with CatalogIndex(tmp_path / "catalog.sqlite") as index:
+        assert index.sync(csv_path) == "appended"
+        assert index.suggest("test_refund_with_coupon")[0].case_id == "TC-0999"
+
+    junit = tmp_path / "junit.xml"
+    junit.write_text('<testsuite name="s"><testcase name="TC-0001"/><testcase name="case_17_step"/></testsuite>', encoding="utf-8")
+    out = tmp_path / "report.md"
+    args = ["--cases", str(csv_path), "--junit", str(junit), "--out", str(out), "--format", "json"]
+    assert main(args + ["--catalog-index", str(tmp_path / "catalog.sqlite")]) == 0
+    doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    table = next(t for t in doc["details"] if t["title"] == "Suggested Mappings")
+    assert table["rows"][0][3] == "TC-0017"
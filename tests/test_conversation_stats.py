@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+import statistics
+
+from adapters.ai_agent.conversation_analyzer import OTHER_GROUP, ConversationAnalyzer
+
+
+def _conversations(n: int, seed: int = 11):
+    rng = random.Random(seed)
+    for i in range(n):
+        yield {
+            "session_id": f"s-{rng.randint(0, 40):02d}",
+            "channel": rng.choice(("web", "voice", "chat")),
+            "status": rng.choice(("completed", "completed", "dropped")),
+            "responses": ["x" * rng.randint(1, 120) for _ in range(rng.randint(1, 3))],
+        }
+
+
+def test_single_pass_over_generator_matches_batch_statistics() -> None:
+    conversations = list(_conversations(2000))
+    signals = ConversationAnalyzer().analyze(None, iter(conversations))
+
+    lengths = [len(r) for c in conversations for r in c["responses"]]
+    mean = statistics.fmean(lengths)
+    consistency = max(0.0, 1.0 - min(1.0, statistics.pstdev(lengths) / mean))
+    by_name = {s.name: s for s in signals}
+    assert by_name["response_consistency"].metadata["avg_length"] == mean
+    assert abs(by_name["response_consistency"].value - consistency * 100.0) < 1e-9
+
+    web = [c for c in conversations if c["channel"] == "web"]
+    breakdown = by_name["conversation_completion_rate"].metadata["by_channel"]
+    assert sorted(breakdown) == ["chat", "voice", "web"]
+    assert breakdown["web"]["conversations"] == len(web)
+    assert breakdown["web"]["completion_rate"] == sum(c["status"] == "completed" for c in web) / len(web)
+
+
+def _sliced(analyzer: ConversationAnalyzer, conversations: list, seed: int = 2):
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(1, len(conversations)), 6))
+    merged = analyzer.new_stats()
+    for lo, hi in zip([0, *cuts], [*cuts, len(conversations)]):
+        merged = merged.merge(analyzer.accumulate(analyzer.new_stats(), conversations[lo:hi]))
+    return analyzer.finalize(merged)
+
+
+def test_group_cap_keeps_the_most_frequent_keys() -> None:
+    # Three sessions with a quarter of the conversations each, interleaved with one-off
+    # sessions whose ids sort first.
+    heavy = ("z-0", "z-1", "z-2")
+    conversations = [
+        {"session_id": heavy[i % 4] if i % 4 < 3 else f"a-{i:04d}", "status": "completed", "responses": ["x"]}
+        for i in range(1500)
+    ]
+    analyzer = ConversationAnalyzer(max_groups=5)
+
+    for signals in (analyzer.analyze(None, conversations), _sliced(analyzer, conversations)):
+        sessions = signals[0].metadata["by_session"]
+        assert len(sessions) == 6 and list(sessions)[-1] == OTHER_GROUP
+        assert set(heavy) <= set(sessions)
+        assert all(sessions[k]["conversations"] <= 375 for k in heavy)
+        assert sum(g["conversations"] for g in sessions.values()) == len(conversations)
+
+
+def test_merged_slices_match_a_single_pass_below_the_cap() -> None:
+    conversations = list(_conversations(1500))
+    analyzer = ConversationAnalyzer()
+    assert _sliced(analyzer, conversations) == analyzer.analyze(None, conversations)
+
+
+def test_breakdowns_only_appear_when_fields_are_present() -> None:
+    signals = ConversationAnalyzer().analyze(None, [{"status": "completed", "responses": ["hi"]}])
+    assert signals[0].metadata == {"completion_rate": 1.0, "total": 1}
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from cli.main import main
+from core.history.durations import DurationBaselines, run_durations
+from core.history.store import HistoryStore
+from core.models.errors import ValidationError
+from core.models.test_result import TestResultModel as ResultModel
+
+
+def test_ewma_tracks_mean_and_variance() -> None:
+    baselines = DurationBaselines(alpha=0.5)
+    for x in (1.0, 1.0, 1.0):
+        baselines.update("a", x)
+    assert baselines.get("a").mean == 1.0 and baselines.get("a").var == 0.0
+
+    baselines.update("a", 3.0)  # diff 2: mean 1 + 0.5*2, var 0.5 * (0 + 0.5*4)
+    s = baselines.get("a")
+    assert (s.mean, s.var, s.runs) == (2.0, 1.0, 4)
+
+    # A long steady history forgets an old outlier.
+    for _ in range(50):
+        baselines.update("a", 1.0)
+    assert baselines.get("a").mean == pytest.approx(1.0) and baselines.get("a").stddev < 1e-6
+
+
+def test_regressions_need_k_sigma_min_runs_and_min_slowdown() -> None:
+    baselines = DurationBaselines(alpha=0.2)
+    for x in (10.0, 11.0, 9.0, 10.0, 10.5, 9.5):
+        baselines.update("steady", x)
+        baselines.update("fast", x / 1000)
+    baselines.update("new", 1.0)
+
+    current = {"steady": 30.0, "fast": 0.03, "new": 50.0, "unknown": 5.0}
+    flagged = baselines.regressions(current, k=3.0)
+    assert [r.test_id for r in flagged] == ["steady"]  # "fast" +0.02s is noise; "new" has one run
+    assert flagged[0].ratio == pytest.approx(30.0 / flagged[0].mean_sec)
+
+    assert baselines.regressions({"steady": 11.0}) == []
+    assert [r.test_id for r in baselines.regressions(current, min_slowdown_sec=0.0)] == ["steady", "fast"]
+
+
+def test_baselines_round_trip_and_store_is_per_name(tmp_path) -> None:
+    store = HistoryStore(tmp_path)
+    store.record_durations({"a": 1.0, "b": 2.0}, name="nightly")
+    store.record_durations({"a": 3.0}, name="nightly")
+    store.record_durations({"a": 9.0}, name="pr/42")
+
+    reloaded = HistoryStore(tmp_path)
+    assert reloaded.durations("nightly").get("a").mean == pytest.approx(1.0 + 0.2 * 2.0)
+    assert reloaded.durations("nightly").get("b").runs == 1
+    assert reloaded.durations("pr/42").get("a").mean == 9.0
+    assert reloaded.durations_path("pr/42").name.startswith("pr_42-")
+    assert reloaded.durations_path("pr/42") != reloaded.durations_path("pr_42")
+    assert reloaded.durations_path("default") != reloaded.durations_path(None)
+    assert len(reloaded.durations("pr_42")) == 0
+    assert len(reloaded.durations("other")) == 0
+
+    with pytest.raises(ValidationError, match="malformed"):
+        DurationBaselines.from_dict({"schema_version": 1, "alpha": 0.2, "tests": {"a": [1.0, -1.0, 2]}})
+
+    results = [ResultModel(id="a", status="passed", duration_sec=1.0), ResultModel(id="b", status="skipped")]
+    assert run_durations(results) == {"a": 1.0}
+
+
+def test_report_flags_slowed_tests_from_history(tmp_path) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text("id,title\nTC-001,Login\nTC-002,Checkout\n", encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    out = tmp_path / "nightly.md"
+    history = tmp_path / "history"
+
+    def run(login_sec: float) -> dict:
+        junit.write_text(
+            f'<testsuite name="s"><testcase name="TC-001" time="{login_sec}"/>'
+            '<testcase name="TC-002" time="2.0"/></testsuite>',
+            encoding="utf-8",
+        )
+        args = ["--cases", str(cases), "--junit", str(junit), "--out", str(out), "--format", "json"]
+        assert main(args + ["--history", str(history)]) == 0
+        doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+        return next(t for t in doc["details"] if t["title"] == "Duration Regressions")
+
+    for sec in (1.0, 1.1, 0.9, 1.0):
+        assert run(sec)["total_rows"] == 0
+    table = run(3.5)
+    assert table["total_rows"] == 1
+    assert table["rows"][0][0] == "TC-001" and table["rows"][0][1] == 3.5
+    assert HistoryStore(history).durations_path("nightly").is_file()
+
+
+def test_history_name_flag_keeps_same_stem_runs_apart(tmp_path) -> None:
+    history = tmp_path / "history"
+    for service in ("svc-a", "svc-b"):
+        out = tmp_path / service / "report.md"
+        assert main(["--demo", "--out", str(out), "--history", str(history), "--history-name", service]) == 0
+
+    store = HistoryStore(history)
+    assert [r.name for r in store.load()] == ["svc-a", "svc-b"]
+    assert store.index("svc-a").runs == 1 and store.index("report").runs == 0
+    assert store.durations_path("svc-a") != store.durations_path("svc-b")
+    with pytest.raises(SystemExit, match="requires --history"):
+        main(["--demo", "--out", str(tmp_path / "r.md"), "--history-name", "svc-a"])
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from core.reporting.exporter import ExportOptions, write_report
+
+
+def test_write_report_is_atomic_on_error(tmp_path) -> None:
+    target = tmp_path / "report.md"
+    target.write_text("previous\n", encoding="utf-8")
+
+    def _chunks():
+        yield "partial"
+        raise RuntimeError("renderer failed")
+
+    with pytest.raises(RuntimeError):
+        write_report(str(target), _chunks())
+
+    assert target.read_text(encoding="utf-8") == "previous\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
+
+
+def test_deterministic_gzip_write_skips_unchanged_content(tmp_path) -> None:
+    options = ExportOptions(gzip_output=True, deterministic=True)
+    target = tmp_path / "report.md"
+
+    first = write_report(str(target), ["# Report\n"], options)
+    second = write_report(str(target), ["# Report\n"], options)
+    third = write_report(str(target), ["# Report v2\n"], options)
+
+    assert first.path.name == "report.md.gz"
+    assert first.written is True
+    assert second.written is False
+    assert second.sha256 == first.sha256
+    assert third.written is True
+    assert gzip.decompress(first.path.read_bytes()).decode("utf-8") == "# Report v2\n"
+
+
+@pytest.mark.parametrize("gzip_output", [False, True])
+def test_failed_fsync_removes_the_temp_file(tmp_path, monkeypatch, gzip_output) -> None:
+    target = tmp_path / "report.md"
+    options = ExportOptions(gzip_output=gzip_output)
+
+    def _fsync(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("core.reporting.exporter.os.fsync", _fsync)
+    with pytest.raises(OSError, match="disk full"):
+        write_report(str(target), ["# Report\n"], options)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_deterministic_write_creates_no_temp_file_for_unchanged_content(tmp_path, monkeypatch) -> None:
+    import tempfile
+
+    options = ExportOptions(deterministic=True)
+    target = tmp_path / "report.md"
+    chunks = ["# Report\n", "x" * 5000, "\n"]
+    first = write_report(str(target), chunks, options)
+
+    created: list[str] = []
+    real_mkstemp = tempfile.mkstemp
+
+    def _mkstemp(*args, **kwargs):
+        fd, path = real_mkstemp(*args, **kwargs)
+        created.append(path)
+        return fd, path
+
+    monkeypatch.setattr("core.reporting.exporter.tempfile.mkstemp", _mkstemp)
+    again = write_report(str(target), chunks, options)
+    assert (again.written, again.sha256) == (False, first.sha256)
+    assert created == []
+
+    # Same prefix then a difference, a shorter and a longer file are all rewritten in full.
+    for content in ("# Report\n" + "x" * 4000 + "y", "# Report\n", "# Report\n" + "x" * 5000 + "\nmore\n"):
+        result = write_report(str(target), [content[:7], content[7:]], options)
+        assert result.written is True
+        assert target.read_text(encoding="utf-8") == content
+    assert len(created) == 3
+    assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import json
+
+from cli.main import main
+from core.failures.signatures import NO_TEXT, cluster_failures, normalize_failure_text
+from core.models.test_result import TestResultModel as ResultModel
+from core.parsers.junit_loader import MAX_FAILURE_TEXT, load_junit_results
+
+
+def test_normalization_removes_run_specific_details() -> None:
+    a = "AssertionError: expected 200 got 503 at 0x7f3a12 in /srv/app/views.py:88 for 'user_1'"
+    b = "AssertionError: expected 200 got 500 at 0x55aa01 in /opt/build/views.py:91 for 'user_77'"
+    assert normalize_failure_text(a) == normalize_failure_text(b)
+    assert normalize_failure_text(a) == "AssertionError: expected <n> got <n> at <addr> in <path>:<n> for <str>"
+    assert normalize_failure_text("req 3f2b1c9e-1234-4abc-9def-0123456789ab timed out") == "req <uuid> timed out"
+    assert normalize_failure_text(None) == normalize_failure_text("  \n ") == NO_TEXT
+
+
+def test_failures_cluster_by_signature_in_result_order() -> None:
+    results = [
+        ResultModel(id=f"TC-{i}", status="failed", failure_text=f"TimeoutError: gave up after {i}s")
+        for i in range(5)
+    ]
+    results += [
+        ResultModel(id="TC-10", status="failed", failure_text="KeyError: 'price'"),
+        ResultModel(id="TC-11", status="passed"),
+        ResultModel(id="TC-12", status="failed"),
+        ResultModel(id="TC-13", status="failed", failure_text="KeyError: 'sku'"),
+    ]
+    clusters = cluster_failures(results, max_examples=2)
+    assert [(c.pattern, c.count, c.example_ids) for c in clusters] == [
+        ("TimeoutError: gave up after <n>s", 5, ("TC-0", "TC-1")),
+        ("KeyError: <str>", 2, ("TC-10", "TC-13")),
+        (NO_TEXT, 1, ("TC-12",)),
+    ]
+    assert len({c.signature for c in clusters}) == 3
+
+
+def test_junit_failure_text_is_captured_and_bounded(tmp_path) -> None:
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        '<testsuite name="s">'
+        '<testcase name="TC-001"><failure type="AssertionError" message="boom">trace line</failure></testcase>'
+        f'<testcase name="TC-002"><error message="{"x" * 5000}"/></testcase>'
+        '<testcase name="TC-003"><skipped/></testcase>'
+        "</testsuite>",
+        encoding="utf-8",
+    )
+    rows = load_junit_results(str(junit))
+    assert rows[0]["failure_text"] == "AssertionError: boom\ntrace line"
+    assert len(rows[1]["failure_text"]) == MAX_FAILURE_TEXT
+    assert rows[2]["failure_text"] is None
+
+
+def test_report_shows_top_clusters_with_full_table_in_sidecar(tmp_path) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text("id,title\n" + "".join(f"TC-{i:03d},Case {i}\n" for i in range(30)), encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    failures = [f'<testcase name="TC-{i:03d}"><failure message="db timeout after {i}ms"/></testcase>' for i in range(20)]
+    failures += [f'<testcase name="TC-{i:03d}"><error message="NullPointer at 0x{i:04x}"/></testcase>' for i in range(20, 25)]
+    junit.write_text('<testsuite name="s">' + "".join(failures) + '<testcase name="TC-029"/></testsuite>', encoding="utf-8")
+    out = tmp_path / "report.md"
+    assert main(["--cases", str(cases), "--junit", str(junit), "--out", str(out), "--format", "md,json", "--top-n", "1"]) == 0
+
+    assert "## Failure Clusters" in out.read_text(encoding="utf-8")
+    doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+    table = next(t for t in doc["details"] if t["title"] == "Failure Clusters")
+    assert table["total_rows"] == 2
+    assert [row[1:4] for row in table["rows"]] == [[20, 0.8, "db timeout after <n>ms"]]
+
+    with open(tmp_path / "report.failure_clusters.csv", newline="", encoding="utf-8") as f:
+        sidecar = list(csv.DictReader(f))
+    assert [(r["failures"], r["pattern"]) for r in sidecar] == [("20", "db timeout after <n>ms"), ("5", "NullPointer at <addr>")]
+    assert sidecar[1]["example_ids"] == "TC-020; TC-021; TC-022"
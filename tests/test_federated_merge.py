@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.generators import write_cases_csv, write_junit_shards
+from cli.main import main
+from core.models.errors import ValidationError
+from core.models.normalized import NormalizedData
+from core.models.normalizer import normalize_results, normalize_test_cases
+from core.parsers.csv_loader import load_test_cases_csv
+from core.parsers.junit_loader import load_junit_results
+from core.reporting.details import build_components_table, components_table_from_stats
+from core.scoring.federated import load_summary, merge_summaries, summarize_shard
+from core.scoring.scorer import compute_metrics
+from core.scoring.subscores import aggregate_run, compute_subscores
+
+
+def _inputs(tmp_path, n_results: int = 3000, shards: int = 3):
+    cases_path = write_cases_csv(tmp_path / "cases.csv", 400, seed=7)
+    shard_paths = write_junit_shards(tmp_path / "shards", n_results, catalog_size=400, shards=shards, seed=7)
+    test_cases = normalize_test_cases(load_test_cases_csv(str(cases_path)))
+    shard_results = [normalize_results(load_junit_results(str(p))) for p in shard_paths]
+    return cases_path, shard_paths, test_cases, shard_results
+
+
+def test_merged_summaries_match_single_pass_metrics(tmp_path) -> None:
+    _, shard_paths, test_cases, shard_results = _inputs(tmp_path)
+    summaries = [summarize_shard(test_cases, r, shard=p.name) for p, r in zip(shard_paths, shard_results)]
+    merged = merge_summaries(summaries)
+
+    data = NormalizedData(test_cases=test_cases, results=[r for rs in shard_results for r in rs])
+    assert merged.metrics() == compute_metrics(data)
+    assert merged.executed_cases == len(aggregate_run(data).executed)
+    assert merged.failed_total == compute_metrics(data)["failed"] + sum(
+        1 for r in data.results if r.status == "failed" and r.id not in test_cases
+    )
+
+    full = build_components_table(data, top_n=1000)
+    assert components_table_from_stats(merged.components, top_n=1000).rows == full.rows
+    assert compute_subscores(aggregate_run(data)).coverage.score == pytest.approx(
+        100.0 * merged.executed_cases / len(test_cases), abs=0.05
+    )
+
+
+def test_merge_refuses_other_catalog_and_duplicate_shards(tmp_path) -> None:
+    _, _, test_cases, shard_results = _inputs(tmp_path, n_results=200, shards=2)
+    a = summarize_shard(test_cases, shard_results[0], shard="a.xml")
+    b = summarize_shard(test_cases, shard_results[1], shard="b.xml")
+    smaller = dict(list(test_cases.items())[:-1])
+    other = summarize_shard(smaller, shard_results[1], shard="c.xml")
+
+    with pytest.raises(ValidationError, match="different case catalog"):
+        merge_summaries([a, other])
+    with pytest.raises(ValidationError, match="merged twice"):
+        merge_summaries([a, b, a])
+
+
+def test_partial_and_merge_subcommands_round_trip(tmp_path, capsys) -> None:
+    cases_path, shard_paths, test_cases, shard_results = _inputs(tmp_path)
+    summary_paths = []
+    for p in shard_paths:
+        out = tmp_path / "partials" / f"{p.stem}.json"
+        assert main(["partial", "--cases", str(cases_path), "--junit", str(p), "--out", str(out), "--gzip"]) == 0
+        summary_paths.append(f"{out}.gz")
+        assert (tmp_path / "partials" / f"{p.stem}.json.gz").stat().st_size < p.stat().st_size / 20
+
+    loaded = load_summary(summary_paths[0])
+    assert loaded.shards == (shard_paths[0].name,)
+
+    out = tmp_path / "report.md"
+    assert main(["merge", *summary_paths, "--out", str(out), "--format", "md,json"]) == 0
+    doc = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+
+    data = NormalizedData(test_cases=test_cases, results=[r for rs in shard_results for r in rs])
+    assert doc["metrics"] == compute_metrics(data)
+    assert "Merged from 3 shard summary file(s)." in doc["assumptions"]
+    assert "## Sub-scores" in out.read_text(encoding="utf-8")
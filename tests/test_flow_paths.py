@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from adapters.ai_agent import AIAgentAdapter, JsonlSource
+from adapters.ai_agent.flow_analyzer import FlowAnalyzer
+from adapters.ai_agent.flow_paths import FlowPathIndex
+from core.models.errors import ValidationError
+
+_STEPS = ("greet", "auth", "lookup", "refund", "escalate", "bye")
+
+
+def _flows(n: int, seed: int, *, refund_breaks: bool = False) -> list[dict]:
+    rng = random.Random(seed)
+    flows = []
+    for _ in range(n):
+        steps = [rng.choice(_STEPS) for _ in range(rng.randint(1, 5))]
+        completed = rng.random() < 0.8
+        if refund_breaks and steps[-1] == "refund":
+            completed = False
+        flows.append({"status": "completed" if completed else "abandoned", "steps": steps})
+    return flows
+
+
+def test_index_reports_failing_paths_dead_ends_and_loops() -> None:
+    index = FlowPathIndex()
+    index.add(["greet", "auth", "refund"], failed=True)
+    index.add(["greet", "auth", "refund"], failed=True)
+    index.add(["greet", "auth", "refund"], failed=False)
+    index.add(["greet", "lookup", "lookup", "bye"], failed=False)
+    index.add(["greet", "lookup", "lookup"], failed=True)
+
+    top = index.top_failing_paths(2)
+    assert [(p.path, p.failed, p.total) for p in top] == [
+        (("greet", "auth", "refund"), 2, 3),
+        (("greet", "lookup", "lookup"), 1, 1),
+    ]
+    assert [(s.step, s.count, s.flows) for s in index.dead_end_steps()] == [("refund", 2, 3), ("lookup", 1, 2)]
+    assert [(s.step, s.count) for s in index.loop_hotspots()] == [("lookup", 2)]
+    assert index.transitions()[("lookup", "lookup")] == (2, 1)
+    assert index.transitions()[("(start)", "greet")] == (5, 3)
+    assert len(index) == 7  # root + 6 distinct prefixes
+
+
+def test_merged_and_reloaded_indexes_match_a_single_pass(tmp_path) -> None:
+    flows = _flows(5000, seed=1)
+    whole, left, right = FlowPathIndex(), FlowPathIndex(), FlowPathIndex()
+    for i, f in enumerate(flows):
+        failed = f["status"] != "completed"
+        whole.add(f["steps"], failed)
+        (left if i < 1800 else right).add(f["steps"], failed)
+    left.merge_in(right)
+
+    reloaded = FlowPathIndex.load(whole.save(tmp_path / "flows.json"))
+    for index in (left, reloaded):
+        assert index.top_failing_paths(50) == whole.top_failing_paths(50)
+        assert index.dead_end_steps() == whole.dead_end_steps()
+        assert index.loop_hotspots() == whole.loop_hotspots()
+        assert index.transitions() == whole.transitions()
+
+
+def test_diff_flags_paths_that_started_failing() -> None:
+    baseline, current = FlowPathIndex(), FlowPathIndex()
+    for f in _flows(4000, seed=2):
+        baseline.add(f["steps"], f["status"] != "completed")
+    for f in _flows(4000, seed=3, refund_breaks=True):
+        current.add(f["steps"], f["status"] != "completed")
+
+    regressions = current.diff(baseline)
+    assert regressions
+    assert all(r.path[-1] == "refund" for r in regressions if r.kind == "failing_path")
+    assert baseline.diff(baseline) == []
+
+
+def test_flow_analyzer_path_index_is_opt_in_and_works_in_the_pool(tmp_path) -> None:
+    flows = _flows(3000, seed=4, refund_breaks=True)
+    default = FlowAnalyzer().analyze(None, flows)
+    assert "paths" not in default[0].metadata
+
+    baseline = FlowPathIndex()
+    for f in _flows(3000, seed=5):
+        baseline.add(f["steps"], f["status"] != "completed")
+    analyzer = FlowAnalyzer(baseline=baseline, top_k=3)
+    signals = analyzer.analyze(None, flows)
+    assert [s.name for s in signals] == ["flow_completion_rate", "flow_anomalies", "flow_path_regressions"]
+    assert signals[0].metadata["paths"]["dead_end_steps"][0]["step"] == "refund"
+    assert signals[2].value < 100.0
+    # Old signals are unchanged apart from the added metadata.
+    assert signals[1] == default[1]
+
+    path = tmp_path / "flows.jsonl"
+    path.write_text("".join(json.dumps(f) + "\n" for f in flows), encoding="utf-8")
+    adapter = AIAgentAdapter(workers=3)
+    adapter.flow_analyzer = analyzer
+    assert adapter.extract_signals(None, {"flows": JsonlSource(str(path))}) == signals
+
+
+def test_stats_merge_leaves_slices_unchanged_and_bad_transitions_are_rejected() -> None:
+    analyzer = FlowAnalyzer(index_paths=True)
+    flows = _flows(400, seed=6)
+    left = analyzer.accumulate(analyzer.new_stats(), flows[:150])
+    right = analyzer.accumulate(analyzer.new_stats(), flows[150:])
+    before = left.paths.to_dict()
+
+    merged = left.merge(right)
+    assert left.paths.to_dict() == before and left.total == 150
+    assert merged.paths is not left.paths and merged.paths.flows == 400
+    assert analyzer.finalize(merged) == analyzer.analyze(None, flows)
+
+    raw = left.paths.to_dict()
+    for bad in ([len(raw["steps"]) + 2, 1, 1, 0], [1, 2, 1, 0], [0, 0, 1, 0]):
+        with pytest.raises(ValidationError, match="unknown step"):
+            FlowPathIndex.from_dict({**raw, "transitions": [*raw["transitions"], bad]})
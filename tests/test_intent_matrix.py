@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from adapters.ai_agent import AIAgentAdapter, JsonlSource
+from adapters.ai_agent.intent_analyzer import IntentAnalyzer
+from adapters.ai_agent.intent_matrix import IntentConfusionMatrix
+from core.models.errors import ValidationError
+
+_INTENTS = tuple(f"intent_{i:02d}" for i in range(20))
+
+
+def _labeled(n: int, seed: int, *, confuse: tuple[str, str] | None = None) -> list[dict]:
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        actual = rng.choice(_INTENTS)
+        predicted = actual if rng.random() < 0.9 else rng.choice(_INTENTS)
+        if confuse is not None and actual == confuse[0] and rng.random() < 0.5:
+            predicted = confuse[1]
+        records.append({"actual": actual, "predicted": predicted})
+    return records
+
+
+def test_per_intent_scores_and_most_confused_pairs() -> None:
+    m = IntentConfusionMatrix()
+    for actual, predicted, n in [("refund", "refund", 8), ("refund", "billing", 2), ("billing", "billing", 5), ("other", "billing", 3)]:
+        m.add(actual, predicted, n)
+
+    scores = {s.intent: s for s in m.per_intent()}
+    assert (scores["refund"].precision, scores["refund"].recall) == (1.0, 0.8)
+    assert (scores["billing"].precision, scores["billing"].recall) == (0.5, 1.0)
+    assert scores["billing"].f1 == pytest.approx(2 / 3)
+    assert scores["other"].f1 == 0.0
+    assert m.accuracy == 13 / 18
+    assert [(c.actual, c.predicted, c.count) for c in m.most_confused(5)] == [("other", "billing", 3), ("refund", "billing", 2)]
+    assert m.count("refund", "billing") == 2 and m.count("refund", "missing") == 0
+
+
+def test_sharded_matrices_merge_to_the_single_pass_result(tmp_path) -> None:
+    records = _labeled(20_000, seed=1)
+    whole = IntentConfusionMatrix()
+    shards = [IntentConfusionMatrix() for _ in range(3)]
+    for i, r in enumerate(records):
+        whole.add(r["actual"], r["predicted"])
+        shards[i * 7 % 3].add(r["actual"], r["predicted"])
+    merged = shards[0]
+    for other in shards[1:]:
+        merged.merge_in(other)
+
+    reloaded = IntentConfusionMatrix.load(whole.save(tmp_path / "intents.json"))
+    for m in (merged, reloaded):
+        assert m.per_intent() == whole.per_intent()
+        assert m.most_confused(10) == whole.most_confused(10)
+        assert (m.total, m.correct) == (whole.total, whole.correct)
+    with pytest.raises(ValidationError, match="malformed"):
+        IntentConfusionMatrix.from_dict({"schema_version": 1, "labels": ["a"], "cells": [[0, 3, 1]]})
+
+
+def test_diff_reports_confusions_that_grew() -> None:
+    baseline, current = IntentConfusionMatrix(), IntentConfusionMatrix()
+    for r in _labeled(10_000, seed=2):
+        baseline.add(r["actual"], r["predicted"])
+    for r in _labeled(10_000, seed=3, confuse=("intent_03", "intent_07")):
+        current.add(r["actual"], r["predicted"])
+
+    shifts = current.diff(baseline)
+    assert [(s.actual, s.predicted) for s in shifts] == [("intent_03", "intent_07")]
+    assert shifts[0].current_rate > 0.4 > shifts[0].baseline_rate
+    assert baseline.diff(baseline) == []
+
+
+def test_intent_analyzer_reports_matrix_metrics_and_baseline_regressions(tmp_path) -> None:
+    records = _labeled(5000, seed=4, confuse=("intent_03", "intent_07"))
+    baseline = IntentConfusionMatrix()
+    for r in _labeled(5000, seed=5):
+        baseline.add(r["actual"], r["predicted"])
+
+    analyzer = IntentAnalyzer(baseline=baseline, top_k=3)
+    signals = analyzer.analyze(None, records)
+    assert [s.name for s in signals] == [
+        "intent_classification_accuracy",
+        "intent_confusion_regressions",
+        "intent_distribution_diversity",
+    ]
+    accuracy = signals[0].metadata
+    assert accuracy["weakest_intents"][0]["intent"] == "intent_03"
+    assert (accuracy["most_confused"][0]["actual"], accuracy["most_confused"][0]["predicted"]) == ("intent_03", "intent_07")
+    assert 90.0 < signals[1].value < 100.0
+
+    path = tmp_path / "intents.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    adapter = AIAgentAdapter(workers=3)
+    adapter.intent_analyzer = analyzer
+    assert adapter.extract_signals(None, {"intents": JsonlSource(str(path))}) == signals
+
+
+def test_stats_merge_is_pure_and_correct_matches_the_matrix() -> None:
+    analyzer = IntentAnalyzer()
+    records = [{"actual": 1, "predicted": "1"}, {"actual": "a", "predicted": "b"}, *_labeled(300, seed=6)]
+    left = analyzer.accumulate(analyzer.new_stats(), records[:100])
+    right = analyzer.accumulate(analyzer.new_stats(), records[100:])
+    before = left.matrix.to_dict()
+
+    merged = left.merge(right)
+    assert left.matrix.to_dict() == before and left.total == 100
+    assert merged.matrix is not left.matrix
+    assert merged.correct == merged.matrix.correct == analyzer.accumulate(analyzer.new_stats(), records).correct
+    assert analyzer.finalize(merged) == analyzer.analyze(None, records)
+
+
+def test_matrix_stores_only_cells_that_occur() -> None:
+    m = IntentConfusionMatrix()
+    for i in range(5000):
+        m.add(f"intent_{i}", f"intent_{i}")
+    m.add("intent_0", "intent_1")
+    assert len(m) == 5000 and len(m.to_dict()["cells"]) == 5001
+    assert [(c.actual, c.predicted, c.support) for c in m.most_confused()] == [("intent_0", "intent_1", 2)]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from cli._pipeline import run_from_files
+from cli._profile import StageProfiler
+
+
+def test_profiler_records_every_file_pipeline_stage(tmp_path) -> None:
+    profiler = StageProfiler(cprofile_dir=tmp_path / "cprof", appendix=True)
+    out = tmp_path / "report.md"
+
+    run_from_files(
+        cases_path="samples/test_cases.csv",
+        junit_path="samples/junit.xml",
+        out_path=out,
+        transcript_path="samples/llm_transcript.json",
+        baseline_transcript_path="samples/llm_transcript_baseline.json",
+        formats=("md", "json"),
+        profiler=profiler,
+    )
+    profiler.close()
+
+    names = [s.name for s in profiler.stages]
+    assert names == [
+        "load_csv",
+        "load_junit",
+        "normalize",
+        "transcript_analysis",
+        "baseline_transcript_analysis",
+        "drift",
+        "compute_metrics",
+        "subscores",
+        "build_readiness_report",
+        "detail_tables",
+        "build_document",
+        "render_md",
+        "render_json",
+    ]
+    assert all(s.wall_ms >= 0 and s.peak_alloc_kib is not None for s in profiler.stages)
+    assert len(list((tmp_path / "cprof").glob("*.prof"))) == len(names)
+
+    profiler.write_json(tmp_path / "profile.json")
+    data = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert [s["name"] for s in data["stages"]] == names
+    assert "## Appendix: Pipeline Profile" in out.read_text(encoding="utf-8")
+    assert "profile" in json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))["extensions"]
+
+
+def test_profiler_stages_are_flat() -> None:
+    profiler = StageProfiler(track_memory=False)
+    with pytest.raises(RuntimeError):
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                pass
+    assert [s.name for s in profiler.stages] == ["outer"]
+    assert profiler.stages[0].peak_alloc_kib is None
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import copy
+import random
+
+import pytest
+
+from core.history.store import HistoryStore
+from core.models.errors import ValidationError
+from core.models.readiness import build_readiness_report
+from core.scoring.policy import DEFAULT_POLICY, compile_policy
+from core.scoring.sweep import DECISIONS, SweepGrid, parse_axis, sweep
+
+
+def _random_metrics(rng: random.Random) -> dict:
+    total = rng.randint(0, 60)
+    mapped = rng.randint(0, total)
+    failed = rng.randint(0, mapped // 2)
+    skipped = rng.randint(0, (mapped - failed) // 3)
+    return {
+        "total_cases": mapped,
+        "total_results": total,
+        "mapped_results": mapped,
+        "unmapped_results": total - mapped,
+        "passed": mapped - failed - skipped,
+        "failed": failed,
+        "skipped": skipped,
+        "failure_rate": failed / mapped if mapped else 0.0,
+        "skip_rate": skipped / mapped if mapped else 0.0,
+    }
+
+
+def _candidate_policy(base: dict, fw: float, sw: float, uw: float, approve_at: float, conditional_at: float):
+    raw = copy.deepcopy(base)
+    weights = {"failure_rate": fw, "skip_rate": sw, "unmapped_rate": uw}
+    for penalty in raw["score"]["penalties"]:
+        penalty["points_per_percent"] = weights[penalty["metric"]]
+    rules = raw["risk"]["rules"]
+    rules[1]["all"][0]["value"] = approve_at
+    rules[2]["all"][0]["value"] = approve_at
+    rules[3]["all"][0]["value"] = conditional_at
+    return compile_policy(raw)
+
+
+def _assert_matches_brute_force(runs: list[dict], grid: SweepGrid, baseline: dict = DEFAULT_POLICY) -> None:
+    policy = compile_policy(baseline)
+    result = sweep(runs, grid, baseline=None if baseline is DEFAULT_POLICY else policy)
+    assert len(result.rows) == grid.size
+
+    base = [DECISIONS.index(r.recommendation.value) for r in policy.evaluate_many(runs)]
+    for row in result.rows:
+        policy = _candidate_policy(
+            baseline,
+            row.failure_weight, row.skip_weight, row.unmapped_weight, row.approve_threshold, row.conditional_threshold
+        )
+        flips = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        for b, r in zip(base, policy.evaluate_many(runs)):
+            flips[b][DECISIONS.index(r.recommendation.value)] += 1
+        assert row.flips == tuple(tuple(f) for f in flips), row
+
+
+def test_sweep_matches_brute_force_policy_evaluation() -> None:
+    rng = random.Random(11)
+    runs = [_random_metrics(rng) for _ in range(400)]
+    grid = SweepGrid(
+        failure_weights=(0.5, 1.0, 2.5),
+        skip_weights=(0.5, 1.5),
+        unmapped_weights=(0.0, 0.5),
+        approve_thresholds=(60, 85, 92.5),
+        conditional_thresholds=(50, 70, 90),
+    )
+    _assert_matches_brute_force(runs, grid)
+
+
+def test_sweep_handles_clamped_scores_and_edge_weights() -> None:
+    rng = random.Random(3)
+    runs = [_random_metrics(rng) for _ in range(300)]
+    grid = SweepGrid(
+        failure_weights=(0.0, 0.25, 4.0),
+        skip_weights=(0.0, 3.0),
+        unmapped_weights=(0.0, 0.25, 0.5, 5.0),
+        approve_thresholds=(0, 99.5, 100),
+        conditional_thresholds=(0.5, 50),
+    )
+    _assert_matches_brute_force(runs, grid)
+    assert sweep([], grid).runs == 0
+    forced = [{"failure_rate": 0.5, "skip_rate": 0.0}]
+    assert all(row.counts == (0, 0, 1) for row in sweep(forced, grid).rows)
+    with pytest.raises(ValidationError, match="unmapped weights must be >= 0"):
+        sweep(runs, SweepGrid(unmapped_weights=(0.5, -1.0)))
+
+
+def test_sweep_keeps_the_baseline_policys_caps_and_escalations() -> None:
+    raw = copy.deepcopy(DEFAULT_POLICY)
+    raw["name"] = "strict"
+    failure, skip, unmapped = raw["score"]["penalties"]
+    failure["cap"], skip["cap"] = 40, 35.0
+    del unmapped["cap"]  # uncapped
+    raw["score"]["penalties"] = [skip, unmapped, failure]
+    high, capped = raw["risk"]["rules"][0]["any"], raw["risk"]["rules"][1]["any"]
+    high[0]["value"], high[1]["value"] = 0.35, 0.15
+    capped[0]["value"], capped[1]["value"] = 0.02, 0.01
+
+    rng = random.Random(17)
+    runs = [_random_metrics(rng) for _ in range(300)]
+    grid = SweepGrid(
+        failure_weights=(0.5, 2.0),
+        skip_weights=(0.5, 4.0),
+        unmapped_weights=(0.0, 0.5, 3.0),
+        approve_thresholds=(60, 85),
+        conditional_thresholds=(40, 70),
+    )
+    _assert_matches_brute_force(runs, grid, baseline=raw)
+
+
+def test_sweep_refuses_baselines_with_another_structure() -> None:
+    def _variant(change) -> dict:
+        raw = copy.deepcopy(DEFAULT_POLICY)
+        change(raw)
+        return raw
+
+    variants = {
+        "clamp scores to 0-100": _variant(lambda r: r["score"].update(max=90)),
+        "exactly failure_rate": _variant(lambda r: r["score"]["penalties"].pop()),
+        "fractional": _variant(lambda r: r["score"]["penalties"][0].update(cap=70.5)),
+        "different risk rules": _variant(lambda r: r["risk"]["rules"][0]["any"][0].update(op=">")),
+        "or recommendations": _variant(lambda r: r["recommendation"].update(medium="reject")),
+    }
+    for message, raw in variants.items():
+        with pytest.raises(ValidationError, match=message):
+            sweep([], SweepGrid(), baseline=compile_policy(raw))
+
+
+def test_history_store_feeds_sweep(tmp_path) -> None:
+    store = HistoryStore(tmp_path / "history")
+    rng = random.Random(5)
+    for i in range(20):
+        store.record_report(build_readiness_report(_random_metrics(rng)), name=f"run-{i}")
+
+    records = store.load()
+    assert [r.name for r in records] == [f"run-{i}" for i in range(20)]
+
+    result = sweep((r.metrics for r in records), SweepGrid())
+    assert result.runs == 20
+    assert result.rows[0].flipped == 0
+    assert result.rows[0].counts == result.baseline_counts
+    assert parse_axis("0:1:3") == (0.0, 0.5, 1.0)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import csv
+
+from core.models.normalized import NormalizedData
+from core.models.readiness import build_readiness_report
+from core.models.test_case import TestCaseModel as CaseModel
+from core.models.test_result import TestResultModel as ResultModel
+from core.reporting.details import build_detail_tables
+from core.reporting.exporter import write_markdown_report
+from core.reporting.markdown_builder import iter_markdown_report
+from core.scoring.scorer import compute_metrics
+
+
+def _build_many_failures(n: int) -> NormalizedData:
+    test_cases = {
+        f"TC-{i:04d}": CaseModel(id=f"TC-{i:04d}", title=f"Case {i}", component=f"comp-{i % 3}") for i in range(n)
+    }
+    results = [ResultModel(id=f"TC-{i:04d}", status="failed", raw_name=f"test_{i}") for i in range(n)]
+    return NormalizedData(test_cases=test_cases, results=results)
+
+
+def test_detail_tables_keep_top_n_and_stream_full_sidecar(tmp_path) -> None:
+    data = _build_many_failures(50)
+    out = tmp_path / "report.md"
+
+    failed, components = build_detail_tables(data, out_path=out, top_n=5)
+
+    assert failed.total_rows == 50
+    assert len(failed.rows) == 5
+    assert components.total_rows == 3
+
+    with open(failed.sidecar_path, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "id"
+    assert len(rows) == 51
+
+    report = build_readiness_report(compute_metrics(data))
+    write_markdown_report(str(out), iter_markdown_report(report, details=[failed, components]))
+    md = out.read_text(encoding="utf-8")
+
+    assert "## Failed Tests" in md
+    assert "_Showing 5 of 50 rows." in md
+    assert md.count("| TC-") == 5
+    assert md.index("## Failed Tests") < md.index("## Assumptions")
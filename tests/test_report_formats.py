@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from cli._pipeline import output_paths, run_demo
+from cli.main import main
+from core.reporting.document import SCHEMA_VERSION, parse_formats
+
+
+def test_single_run_writes_json_md_html_from_same_document(tmp_path) -> None:
+    out = tmp_path / "report.md"
+    run_demo(
+        out,
+        transcript_path="samples/llm_transcript.json",
+        baseline_transcript_path="samples/llm_transcript_baseline.json",
+        formats=("json", "md", "html"),
+    )
+
+    payload = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    md = out.read_text(encoding="utf-8")
+    html = (tmp_path / "report.html").read_text(encoding="utf-8")
+
+    assert payload["schema_version"] == SCHEMA_VERSION
+    assert payload["score"]["risk_level"] == "high"
+    assert payload["metrics"]["unmapped_results"] == 1
+    assert payload["extensions"]["llm_readiness"]["drift"]["findings"]
+
+    # Same document -> same timestamp and score in every format.
+    assert f"`{payload['generated_at']}`" in md
+    assert f"**{int(payload['score']['overall'])} / 100**" in md
+    assert payload["generated_at"] in html
+    assert "AI/LLM Stability Signals (optional)" in html
+
+
+def test_parse_formats_rejects_unknown() -> None:
+    assert parse_formats("json, md,json") == ("json", "md")
+    with pytest.raises(ValueError):
+        parse_formats("pdf")
+
+
+def test_out_path_colliding_across_formats_is_rejected(tmp_path) -> None:
+    out = tmp_path / "report.json"
+    with pytest.raises(SystemExit, match="formats 'md' and 'json' would both be written"):
+        main(["--demo", "--out", str(out), "--format", "md,json"])
+    assert not out.exists()
+    assert output_paths(tmp_path / "report.txt", ("md", "json")) == [tmp_path / "report.txt", tmp_path / "report.json"]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from core.models.test_results import TestResult as RunResult
+from core.models.test_results import TestResults as ResultHistory
+from core.models.test_results import TestRun as HistoryRun
+from core.models.test_results import TestStatus as Status
+from core.scoring.regression import calculate_failure_rate_trend, identify_new_failures
+from core.scoring.stability import calculate_pass_rate_consistency, detect_flaky_tests
+
+
+def _history(*runs: dict[str, Status]) -> ResultHistory:
+    return ResultHistory(
+        test_runs=[
+            HistoryRun(
+                run_id=f"run-{i}",
+                timestamp=datetime(2026, 1, i + 1),
+                results=[RunResult(test_id=t, status=s, duration_ms=10) for t, s in statuses.items()],
+            )
+            for i, statuses in enumerate(runs)
+        ]
+    )
+
+
+def test_generic_scoring_over_run_history() -> None:
+    P, F = Status.PASSED, Status.FAILED
+    history = _history({"a": P, "b": F, "c": P}, {"a": F, "b": F, "c": P}, {"a": P, "b": P, "c": F})
+
+    assert detect_flaky_tests(history) == ["a", "b", "c"]
+    assert identify_new_failures(history) == ["c"]
+    assert calculate_failure_rate_trend(history) == pytest.approx(1 / 3 - 3 / 6)  # run 1 vs runs 2-3
+    assert calculate_pass_rate_consistency(_history({"a": P}, {"a": P})) == 1.0
+    assert 0.0 < calculate_pass_rate_consistency(history) < 1.0
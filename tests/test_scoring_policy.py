@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from core.models.errors import ValidationError
+from core.models.readiness import ReleaseRecommendation, RiskLevel, build_readiness_report
+from core.scoring.policy import DEFAULT_POLICY, compile_policy, default_policy, load_policy
+
+
+def _metrics(total_results: int, mapped: int, failed: int, skipped: int) -> dict:
+    return {
+        "total_cases": mapped,
+        "total_results": total_results,
+        "mapped_results": mapped,
+        "unmapped_results": total_results - mapped,
+        "passed": mapped - failed - skipped,
+        "failed": failed,
+        "skipped": skipped,
+        "failure_rate": failed / mapped if mapped else 0.0,
+        "skip_rate": skipped / mapped if mapped else 0.0,
+    }
+
+
+def _grid() -> list[dict]:
+    return [
+        _metrics(total, mapped, failed, skipped)
+        for total in range(0, 25, 3)
+        for mapped in range(0, total + 1, 2)
+        for failed in range(0, mapped + 1)
+        for skipped in range(0, mapped - failed + 1)
+    ]
+
+
+def test_sample_policy_file_matches_builtin_policy() -> None:
+    grid = _grid()
+    sample = load_policy("samples/scoring_policy.toml")
+    assert sample.evaluate_many(grid) == default_policy().evaluate_many(grid)
+
+
+def test_custom_policy_changes_score_and_risk(tmp_path) -> None:
+    strict = json.loads(json.dumps(DEFAULT_POLICY))
+    strict["name"] = "strict"
+    strict["score"]["penalties"][0]["points_per_percent"] = 3.0
+    strict["score"]["penalties"][0]["cap"] = 100
+    path = tmp_path / "strict.json"
+    path.write_text(json.dumps(strict), encoding="utf-8")
+    policy = load_policy(path)
+
+    metrics = _metrics(total_results=100, mapped=100, failed=10, skipped=0)
+    assert default_policy().evaluate(metrics).score == 90
+    result = policy.evaluate(metrics)
+    assert result.score == 70
+    assert result.risk_level == RiskLevel.MEDIUM
+    assert result.recommendation == ReleaseRecommendation.CONDITIONAL
+
+    report = build_readiness_report(metrics, policy=policy)
+    assert report.score.overall_score == 70.0
+    assert any("strict" in a for a in report.assumptions)
+
+
+def test_invalid_policy_is_rejected() -> None:
+    bad = json.loads(json.dumps(DEFAULT_POLICY))
+    bad["risk"]["rules"][0]["any"][0]["op"] = "=>"
+    with pytest.raises(ValidationError):
+        compile_policy(bad)
+
+
+@pytest.mark.parametrize(
+    ("path", "value", "where"),
+    [
+        (("score", "start"), 120, "score.start"),
+        (("score", "min"), -1, "score.min"),
+        (("score", "max"), 100.5, "score.max"),
+        (("risk", "rules", 2, "all", 0, "value"), 185, "risk.rules #3 score value"),
+    ],
+)
+def test_score_bounds_and_thresholds_must_be_within_0_100(path, value, where) -> None:
+    bad = json.loads(json.dumps(DEFAULT_POLICY))
+    target = bad
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    with pytest.raises(ValidationError, match=rf"{re.escape(where)} must be within 0-100"):
+        compile_policy(bad)
+
+    ok = json.loads(json.dumps(DEFAULT_POLICY))
+    ok["risk"]["rules"][0]["any"][0]["value"] = 250  # non-score metrics are not range-checked
+    compile_policy(ok)
+    ok["score"]["min"], ok["score"]["max"] = 60, 40
+    with pytest.raises(ValidationError, match="score.min"):
+        compile_policy(ok)
+
+
+def test_unknown_metrics_and_negative_penalties_are_rejected() -> None:
+    from core.scoring.policy import METRIC_NAMES, metric_value
+
+    assert set(_metrics(10, 8, 1, 1)) | {"unmapped_rate"} == METRIC_NAMES
+
+    typo = json.loads(json.dumps(DEFAULT_POLICY))
+    typo["score"]["penalties"][0]["metric"] = "failur_rate"
+    with pytest.raises(ValidationError, match="score.penalties #1 has unknown metric 'failur_rate'"):
+        compile_policy(typo)
+    typo = json.loads(json.dumps(DEFAULT_POLICY))
+    typo["risk"]["rules"][0]["any"][1]["metric"] = "unmaped_rate"
+    with pytest.raises(ValidationError, match="risk.rules #1 has unknown metric 'unmaped_rate'"):
+        compile_policy(typo)
+    with pytest.raises(ValidationError, match="Unknown policy metric"):
+        metric_value({}, "failur_rate")
+
+    for key in ("points_per_percent", "cap"):
+        bad = json.loads(json.dumps(DEFAULT_POLICY))
+        bad["score"]["penalties"][1][key] = -0.5
+        with pytest.raises(ValidationError, match=rf"score.penalties #2.{key} must be >= 0"):
+            compile_policy(bad)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from cli._server import ScoringService, make_server
+from cli.main import main
+
+
+@pytest.fixture()
+def server_url():
+    service = ScoringService.from_files(
+        {"default": "samples/test_cases.csv"},
+        {"golden": "samples/llm_transcript_baseline.json"},
+        max_concurrency=2,
+    )
+    server = make_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    try:
+        yield f"http://{host}:{port}", service
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _post(url: str, body: bytes) -> tuple[int, dict]:
+    req = urllib.request.Request(url, data=body, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_scores_junit_and_transcript_payloads(server_url) -> None:
+    url, _ = server_url
+
+    status, payload = _post(f"{url}/v1/score/junit", Path("samples/junit.xml").read_bytes())
+    assert status == 200
+    assert payload["score"]["risk_level"] == "high"
+    assert payload["metrics"]["unmapped_results"] == 1
+    assert payload["risks"]
+
+    status, payload = _post(
+        f"{url}/v1/score/transcript?baseline=golden", Path("samples/llm_transcript.json").read_bytes()
+    )
+    assert status == 200
+    assert any(f["severity"] == "high" for f in payload["drift"]["findings"])
+    assert payload["risk_level"] == "high"
+    assert payload["findings"][0]["severity"] == "high"
+    assert {f["source"] for f in payload["findings"]} == {"signal", "drift"}
+
+    status, payload = _post(f"{url}/v1/score/junit", b"<not-xml")
+    assert status == 400
+    status, payload = _post(f"{url}/v1/score/junit?catalog=missing", Path("samples/junit.xml").read_bytes())
+    assert status == 404
+
+
+def test_server_junit_response_matches_cli_json(server_url, tmp_path) -> None:
+    url, _ = server_url
+    out = tmp_path / "report.md"
+    argv = ["--cases", "samples/test_cases.csv", "--junit", "samples/junit.xml", "--out", str(out), "--format", "json"]
+    assert main(argv) == 0
+    expected = json.loads(out.with_suffix(".json").read_text(encoding="utf-8"))
+
+    status, payload = _post(f"{url}/v1/score/junit", Path("samples/junit.xml").read_bytes())
+    assert status == 200
+    titles = [d["title"] for d in payload["details"]]
+    assert titles == ["Failed Tests", "Components", "Failure Clusters", "Suggested Mappings"]
+    # The service writes no files: same document apart from the sidecar paths and timestamp.
+    for doc in (expected, payload):
+        doc.pop("generated_at")
+        for table in doc["details"]:
+            table.pop("sidecar_path")
+    assert payload == expected
+
+
+def test_server_rejects_requests_over_concurrency_limit(server_url) -> None:
+    url, service = server_url
+    assert service.try_acquire() and service.try_acquire()
+    try:
+        status, payload = _post(f"{url}/v1/score/junit", Path("samples/junit.xml").read_bytes())
+    finally:
+        service.release()
+        service.release()
+    assert status == 503
+    assert "Concurrency limit" in payload["error"]
+
+
+def _raw_post(url: str, headers: str) -> tuple[int, dict]:
+    host, port = url.removeprefix("http://").split(":")
+    with socket.create_connection((host, int(port)), timeout=10) as sock:
+        sock.sendall(f"POST /v1/score/junit HTTP/1.1\r\nHost: {host}\r\n{headers}\r\n".encode("ascii"))
+        with sock.makefile("rb") as f:
+            status = int(f.readline().split()[1])
+            length = 0
+            while (line := f.readline().strip()) != b"":
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            return status, json.loads(f.read(length))
+
+
+def test_server_rejects_missing_or_invalid_content_length(server_url) -> None:
+    url, _ = server_url
+    status, payload = _raw_post(url, "")
+    assert status == 411 and "Content-Length" in payload["error"]
+    for value in ("abc", "-1"):
+        status, payload = _raw_post(url, f"Content-Length: {value}\r\n")
+        assert status == 400 and "Invalid Content-Length" in payload["error"]
+    assert _post(f"{url}/v1/score/junit", Path("samples/junit.xml").read_bytes())[0] == 200
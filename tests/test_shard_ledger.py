@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+from core.models.normalized import NormalizedData
+from core.models.test_case import TestCaseModel as CaseModel
+from core.models.test_result import TestResultModel as ResultModel
+from core.reporting.details import component_stats
+from core.scoring.ledger import ShardLedger
+from core.scoring.scorer import compute_metrics
+from core.scoring.subscores import aggregate_run
+
+_CATALOG = {
+    f"TC-{i:03d}": CaseModel(id=f"TC-{i:03d}", title=f"case {i}", component=("auth", "payments", None)[i % 3])
+    for i in range(30)
+}
+
+
+def _random_shard(rng: random.Random) -> list[ResultModel]:
+    results = []
+    for _ in range(rng.randint(0, 25)):
+        test_id = f"TC-{rng.randint(0, 35):03d}"  # ids >= 30 are unmapped
+        results.append(ResultModel(id=test_id, status=rng.choice(("passed", "passed", "failed", "skipped"))))
+    return results
+
+
+def test_ledger_matches_full_recompute_after_puts_replaces_and_removes() -> None:
+    rng = random.Random(3)
+    ledger = ShardLedger(_CATALOG)
+    shards: dict[str, list[ResultModel]] = {}
+
+    for _ in range(300):
+        name = f"shard-{rng.randint(0, 5)}"
+        if rng.random() < 0.2:
+            ledger.remove(name)
+            shards.pop(name, None)
+        else:
+            shards[name] = _random_shard(rng)
+            ledger.put(name, shards[name])
+
+        data = NormalizedData(test_cases=_CATALOG, results=[r for n in sorted(shards) for r in shards[n]])
+        assert ledger.metrics() == compute_metrics(data)
+        assert ledger.component_stats() == component_stats(data.test_cases, data.results)
+        assert ledger.run_aggregate() == aggregate_run(data)
+        assert ledger.executed_cases == len(aggregate_run(data).executed)
+        assert ledger.unmapped_ids == {r.id for r in data.results if r.id not in _CATALOG}
+        assert ledger.failed_rows()[1] == sum(1 for r in data.results if r.status == "failed")
+
+
+def test_unmapped_id_moving_between_shards_stays_counted_once() -> None:
+    ledger = ShardLedger(_CATALOG)
+    ledger.put("a", [ResultModel(id="X-1", status="failed"), ResultModel(id="TC-001", status="passed")])
+    ledger.put("b", [ResultModel(id="TC-002", status="passed")])
+
+    # Retry of shard a no longer reports X-1; shard b now does.
+    ledger.put("a", [ResultModel(id="TC-001", status="passed")])
+    ledger.put("b", [ResultModel(id="TC-002", status="passed"), ResultModel(id="X-1", status="passed")])
+    assert ledger.unmapped_ids == {"X-1"}
+    assert ledger.metrics()["unmapped_results"] == 1
+    assert ledger.metrics()["failed"] == 0
+
+    ledger.remove("b")
+    assert ledger.unmapped_ids == set()
+    assert ledger.metrics()["unmapped_results"] == 0
+    assert ledger.executed_cases == 1
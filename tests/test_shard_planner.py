@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import csv
+
+import pytest
+
+from cli.main import main
+from core.history.durations import DurationBaselines
+from core.history.store import HistoryStore
+from core.models.errors import ValidationError
+from core.models.test_case import TestCaseModel as CaseModel
+from core.planning.shards import estimate_durations, plan_shards
+
+
+def _catalog(components: dict[str, str | None]) -> dict[str, CaseModel]:
+    return {i: CaseModel(id=i, title=i, component=c) for i, c in components.items()}
+
+
+def test_lpt_balances_and_covers_every_case_once() -> None:
+    cases = _catalog({f"T{i}": None for i in range(7)})
+    est = {"T0": 7, "T1": 6, "T2": 5, "T3": 4, "T4": 3, "T5": 2, "T6": 1}
+    plan = plan_shards(cases, est, 3)
+    assert sorted(t for s in plan.shards for t in s.tests) == sorted(cases)
+    assert [s.load_sec for s in plan.shards] == [10.0, 9.0, 9.0]  # 7+2+1, 6+3, 5+4
+    assert plan.makespan_sec == 10.0 and plan.lower_bound_sec == pytest.approx(28 / 3)
+    assert plan_shards(cases, est, 3).shards == plan.shards  # deterministic
+
+    with pytest.raises(ValidationError, match="Shard count"):
+        plan_shards(cases, est, 0)
+
+
+def test_affinity_keeps_components_together_unless_too_big() -> None:
+    cases = _catalog({"a1": "auth", "a2": "auth", "p1": "pay", "p2": "pay", "s1": "search", "big1": "big", "big2": "big"})
+    est = {"a1": 2, "a2": 2, "p1": 1, "p2": 2, "s1": 3, "big1": 6, "big2": 6}  # even share: 11s
+    plan = plan_shards(cases, est, 2, affinity=True)
+    shard_of = {t: s.index for s in plan.shards for t in s.tests}
+    assert shard_of["a1"] == shard_of["a2"] and shard_of["p1"] == shard_of["p2"]
+    assert shard_of["big1"] != shard_of["big2"]  # 12s > 11s: split
+    assert plan.split_components == 1
+    assert plan.makespan_sec == 12.0
+
+
+def test_estimates_blend_history_with_current_and_fill_gaps() -> None:
+    baselines = DurationBaselines(alpha=0.5)
+    baselines.update("a", 4.0)
+    baselines.update("b", 6.0)
+    estimates, measured = estimate_durations(["a", "b", "c", "d"], {"a": 8.0, "c": 2.0}, baselines)
+    assert estimates == {"a": 6.0, "b": 6.0, "c": 2.0, "d": 6.0}  # d: median of 6, 6, 2
+    assert measured == 3
+    assert estimate_durations(["x"], {}, None)[0] == {"x": 1.0}
+    assert estimate_durations(["x"], {}, None, default_sec=0.5)[0] == {"x": 0.5}
+
+
+def test_plan_shards_command_writes_plan_and_reports_makespans(tmp_path, capsys) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text("id,title,component\n" + "".join(f"TC-{i:03d},Case {i},c{i % 3}\n" for i in range(12)), encoding="utf-8")
+    slow = tmp_path / "shard-1.xml"
+    slow.write_text(
+        "<testsuite>" + "".join(f'<testcase name="TC-{i:03d}" time="{i + 1}"/>' for i in range(6, 12)) + "</testsuite>",
+        encoding="utf-8",
+    )
+    fast = tmp_path / "shard-2.xml"
+    fast.write_text(
+        "<testsuite>" + "".join(f'<testcase name="TC-{i:03d}" time="{i + 1}"/>' for i in range(6)) + "</testsuite>",
+        encoding="utf-8",
+    )
+    history = tmp_path / "history"
+    HistoryStore(history).record_durations({"TC-000": 30.0}, name="nightly")
+
+    out = tmp_path / "plan.csv"
+    args = ["plan-shards", "--cases", str(cases), "--shards", "2", "--junit", str(slow), "--junit", str(fast)]
+    assert main(args + ["--history", str(history), "--name", "nightly", "--out", str(out)]) == 0
+
+    printed = capsys.readouterr().out
+    assert "Current:   2 shard(s), makespan 57.0s" in printed
+    assert "Planned:   2 shard(s)" in printed
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(r["id"] for r in rows) == [f"TC-{i:03d}" for i in range(12)]
+    loads = [sum(float(r["estimated_sec"]) for r in rows if r["shard"] == s) for s in ("0", "1")]
+    assert max(loads) < 57.0
+    assert next(r for r in rows if r["id"] == "TC-000")["estimated_sec"] == "24.2"  # 30 + 0.2 * (1 - 30)
+
+    with pytest.raises(SystemExit, match="--shards must be >= 1"):
+        main(["plan-shards", "--cases", str(cases), "--shards", "0"])
+
+
+def test_plan_shards_reads_the_pipeline_history_name_by_default(tmp_path, capsys) -> None:
+    cases = tmp_path / "cases.csv"
+    cases.write_text("id,title\nTC-001,Login\nTC-002,Checkout\n", encoding="utf-8")
+    junit = tmp_path / "junit.xml"
+    junit.write_text('<testsuite><testcase name="TC-001" time="7"/><testcase name="TC-002" time="3"/></testsuite>')
+    history = tmp_path / "history"
+    args = ["--cases", str(cases), "--junit", str(junit), "--history", str(history)]
+    assert main(args + ["--out", str(tmp_path / "report.md")]) == 0
+
+    plan = ["plan-shards", "--cases", str(cases), "--shards", "2", "--history", str(history)]
+    assert main(plan + ["--out", str(tmp_path / "plan.csv")]) == 0
+    assert "(2 with measured durations)" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit, match="no duration baselines for history name 'nightly'"):
+        main(plan + ["--name", "nightly", "--out", str(tmp_path / "plan.csv")])
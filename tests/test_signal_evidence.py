@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from adapters.generic import GenericAdapter
+from adapters.registry import AdapterOutput, signals_extension
+from core.models.signals import Fact, RegressionSignal, SignalType, StabilitySignal
+from core.models.test_results import TestResult as RunResult
+from core.models.test_results import TestResults as ResultHistory
+from core.models.test_results import TestRun as HistoryRun
+from core.models.test_results import TestStatus as Status
+
+
+def _flaky_history(n_tests: int) -> ResultHistory:
+    runs = []
+    for i, status in enumerate((Status.PASSED, Status.FAILED, Status.PASSED)):
+        results = [RunResult(test_id=f"T-{t:05d}", status=status, duration_ms=1) for t in range(n_tests)]
+        runs.append(HistoryRun(run_id=f"run-{i}", timestamp=datetime(2026, 1, i + 1), results=results))
+    return ResultHistory(test_runs=runs)
+
+
+def test_facts_render_lazily_and_cap_list_values() -> None:
+    signal = RegressionSignal(
+        signal_type=SignalType.STABILITY,
+        name="x",
+        value=1.0,
+        description="d",
+        evidence=[Fact("Ids", ["a", "b", "c", "d"]), Fact("Rate", 0.125, ".1%"), Fact("Set", {"z", "y"}), "plain"],
+    )
+    assert signal.signal_type is SignalType.REGRESSION
+    assert not hasattr(signal, "__dict__")
+    assert signal.render_evidence(2) == ["Ids: a, b (+2 more)", "Rate: 12.5%", "Set: y, z", "plain"]
+
+
+def test_generic_adapter_keeps_ids_raw_until_the_report_renders_them() -> None:
+    signals = GenericAdapter().extract_signals(_flaky_history(5000))
+    flakiness = next(s for s in signals if s.name == "test_flakiness")
+
+    ids_fact = flakiness.evidence[-1]
+    assert isinstance(ids_fact, Fact) and len(ids_fact.value) == 5000
+    assert flakiness.value == 0.0
+
+    ext = signals_extension([AdapterOutput("generic", signals)], max_items=3)
+    (generic,) = ext.data["adapters"]
+    rendered = next(s for s in generic["signals"] if s["name"] == "test_flakiness")["evidence"]
+    assert rendered[-1] == "Flaky test IDs: T-00000, T-00001, T-00002 (+4997 more)"
+    assert isinstance(signals[0], StabilitySignal)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+
+from benchmarks.importtime import REPO_ROOT, measure_cold_start, measure_imports, measure_interpreter_start
+
+# Wall-clock budget relative to a bare interpreter start on the same machine, so slow CI
+# runners scale both sides; READINESS_STARTUP_BUDGET_SEC sets an absolute budget instead.
+_BUDGET_SEC = os.environ.get("READINESS_STARTUP_BUDGET_SEC")
+_BUDGET_FACTOR = 25.0
+
+# Project modules `--demo` may import (22 today); a new eager import shows up here first.
+_MAX_DEMO_MODULES = 26
+
+_LAZY_MODULES = (
+    "adapters.llm_readiness.drift",
+    "adapters.llm_readiness.reporting",
+    "adapters.registry",
+    "adapters.ai_agent.signal_extractor",
+    "cli._batch",
+    "cli._server",
+    "cli._watch",
+    "core.parsers.junit_loader",
+    "http.server",
+    "concurrent.futures",
+    "gzip",
+)
+
+
+def test_demo_does_not_import_optional_subsystems() -> None:
+    imported = {t.module for t in measure_imports(["--demo"])}
+
+    assert "cli._pipeline" in imported
+    assert "core.reporting.markdown_builder" in imported
+    assert not imported & set(_LAZY_MODULES)
+    assert "core.reporting.json_builder" not in imported
+    assert "core.reporting.html_builder" not in imported
+
+
+def test_transcript_run_imports_llm_layer_on_demand() -> None:
+    transcript = str(REPO_ROOT / "samples" / "llm_transcript.json")
+    imported = {t.module for t in measure_imports(["--demo", "--transcript", transcript])}
+
+    assert "adapters.llm_readiness.reporting" in imported
+    assert "cli._server" not in imported
+
+
+def test_artifact_run_imports_only_the_consuming_adapter(tmp_path) -> None:
+    flows = tmp_path / "flows.jsonl"
+    flows.write_text('{"status": "completed", "steps": ["a"]}\n', encoding="utf-8")
+    imported = {t.module for t in measure_imports(["--demo", "--artifact", f"flows={flows}"])}
+
+    assert "adapters.ai_agent.flow_analyzer" in imported
+    assert "adapters.generic.signal_extractor" not in imported
+    assert "adapters.llm_readiness.drift" not in imported
+
+
+def test_demo_imports_stay_within_module_budget() -> None:
+    imported = {t.module for t in measure_imports(["--demo"])}
+    project = sorted(m for m in imported if m.split(".")[0] in ("adapters", "cli", "core"))
+    assert len(project) <= _MAX_DEMO_MODULES, project
+
+
+def test_demo_cold_start_within_budget() -> None:
+    best = min(measure_cold_start(["--demo"], repeat=3))
+    if _BUDGET_SEC is not None:
+        budget = float(_BUDGET_SEC)
+    else:
+        budget = _BUDGET_FACTOR * min(measure_interpreter_start(repeat=3))
+    assert best <= budget, f"--demo cold start {best:.3f}s exceeds budget {budget:.3f}s"
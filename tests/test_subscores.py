@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from core.history.index import HistoryIndex
+from core.history.store import HistoryStore
+from core.models.normalized import NormalizedData
+from core.models.readiness import build_readiness_report
+from core.models.test_case import TestCaseModel as CaseModel
+from core.models.test_result import TestResultModel as ResultModel
+from core.scoring.scorer import compute_metrics
+from core.scoring.subscores import aggregate_run, compute_subscores, measure_run
+
+
+def _data(statuses: dict[str, str | list[str]], catalog: int = 4) -> NormalizedData:
+    cases = {f"TC-{i:03d}": CaseModel(id=f"TC-{i:03d}", title=f"case {i}") for i in range(1, catalog + 1)}
+    results = []
+    for test_id, status in statuses.items():
+        for s in [status] if isinstance(status, str) else status:
+            results.append(ResultModel(id=test_id, status=s))
+    return NormalizedData(test_cases=cases, results=results)
+
+
+def _record(store: HistoryStore, data: NormalizedData, name: str = "nightly") -> None:
+    report = build_readiness_report(compute_metrics(data))
+    store.record_report(report, name=name, tests=aggregate_run(data).outcomes)
+
+
+def test_coverage_counts_executed_catalog_cases() -> None:
+    data = _data({"TC-001": "passed", "TC-002": "failed", "TC-003": "skipped", "TC-404": "passed"})
+    scores = compute_subscores(aggregate_run(data))
+
+    assert scores.coverage.score == 50.0
+    assert scores.stability.score is None
+    assert scores.regression.score is None
+
+
+def test_without_history_dimensions_fall_back_with_assumptions() -> None:
+    data = _data({"TC-001": "passed", "TC-002": "failed"})
+    metrics = compute_metrics(data)
+    report = build_readiness_report(metrics, dimensions=compute_subscores(aggregate_run(data)))
+
+    assert report.score.coverage_score == 50.0
+    assert report.score.stability_score == report.score.overall_score
+    assert report.score.regression_score == report.score.overall_score
+    assert any("Stability sub-score falls back" in a for a in report.assumptions)
+    assert any("Regression sub-score falls back" in a for a in report.assumptions)
+    assert report.dimensions["coverage"]["basis"].startswith("2/4 cases executed")
+
+
+def test_stability_counts_flips_within_and_across_runs(tmp_path) -> None:
+    store = HistoryStore(tmp_path)
+    _record(store, _data({"TC-001": "passed", "TC-002": "passed", "TC-003": "passed", "TC-004": "passed"}))
+
+    # TC-002 flips against history, TC-003 flips within the run (retry passed).
+    run = aggregate_run(_data({"TC-001": "passed", "TC-002": "failed", "TC-003": ["failed", "passed"], "TC-004": "passed"}))
+    scores = compute_subscores(run, store.index("nightly"))
+
+    assert run.flaky_in_run == frozenset({"TC-003"})
+    assert scores.stability.score == 50.0
+
+
+def test_regression_compares_against_last_green_run(tmp_path) -> None:
+    store = HistoryStore(tmp_path)
+    _record(store, _data({"TC-001": "passed", "TC-002": "failed"}))
+    _record(store, _data({"TC-001": "passed", "TC-002": "passed", "TC-003": "passed"}))
+    _record(store, _data({"TC-001": "failed", "TC-002": "passed", "TC-003": "passed"}))
+    _record(store, _data({"TC-001": "failed"}), name="other")
+
+    index = store.index("nightly")
+    assert index.runs == 3
+    assert index.last_green == {"TC-001": "passed", "TC-002": "passed", "TC-003": "passed"}
+
+    run = aggregate_run(_data({"TC-001": "passed", "TC-002": "failed", "TC-003": "skipped", "TC-004": "failed"}))
+    scores = compute_subscores(run, index)
+
+    # TC-003 was skipped and TC-004 was not in the green run: base is TC-001, TC-002.
+    assert scores.regression.score == 50.0
+    assert "1 new failure(s) among 2 tests" in scores.regression.basis
+
+
+def test_store_index_includes_appends_after_first_load(tmp_path) -> None:
+    store = HistoryStore(tmp_path)
+    assert store.index().runs == 0
+    _record(store, _data({"TC-001": "passed"}))
+
+    assert store.index().runs == 1
+    assert HistoryIndex.build(HistoryStore(tmp_path).load()).runs == 1
+
+
+def test_measure_run_matches_separate_passes() -> None:
+    data = _data({"TC-001": "passed", "TC-002": ["failed", "passed"], "TC-003": "skipped", "TC-404": "failed"})
+    assert measure_run(data) == (compute_metrics(data), aggregate_run(data))
+
+
+def test_flips_outside_the_window_no_longer_count(tmp_path) -> None:
+    store = HistoryStore(tmp_path, flip_window=3)
+    _record(store, _data({"TC-001": "failed", "TC-002": "passed"}))
+    for _ in range(3):
+        _record(store, _data({"TC-001": "passed", "TC-002": "passed"}))
+
+    index = store.index("nightly")
+    assert index.runs == 4 and index.window_runs == 3
+    assert index.get("TC-001").flips == 0
+
+    scores = compute_subscores(aggregate_run(_data({"TC-001": "passed", "TC-002": "passed"})), index)
+    assert scores.stability.score == 100.0
+    assert "over the last 4 run(s)" in scores.stability.basis
+
+
+def test_store_index_is_persisted_and_reads_only_appended_runs(tmp_path) -> None:
+    store = HistoryStore(tmp_path)
+    _record(store, _data({"TC-001": "passed"}))
+    _record(store, _data({"TC-001": "failed"}))
+    assert store.index("nightly").get("TC-001").flips == 1
+    assert store.index_path("nightly").is_file()
+    assert store.index_path("a/b") != store.index_path("a_b")
+
+    # A new store resumes from the saved offset: an earlier line (same length) is never re-read.
+    lines = store.path.read_bytes().split(b"\n")
+    lines[0] = b"#" * len(lines[0])
+    store.path.write_bytes(b"\n".join(lines))
+    _record(store, _data({"TC-001": "passed"}))
+    index = HistoryStore(tmp_path).index("nightly")
+    assert index.runs == 3 and index.get("TC-001").flips == 2
+
+    # A rewritten runs.jsonl is re-indexed from the start.
+    store.path.unlink()
+    _record(store, _data({"TC-001": "passed"}))
+    assert HistoryStore(tmp_path).index("nightly").runs == 1
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import shutil
+
+import cli._watch as watch_mod
+from cli._watch import ShardWatcher
+from core.models.normalizer import normalize_test_cases
+from core.parsers.csv_loader import load_test_cases_csv
+
+_PASSING_SHARD = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="retry">
+  <testcase name="TC-002 test_checkout_ok" time="4.10" />
+</testsuite>
+"""
+
+
+def test_watcher_reparses_only_changed_shards(tmp_path, monkeypatch) -> None:
+    test_cases = normalize_test_cases(load_test_cases_csv("samples/test_cases.csv"))
+    shutil.copy("samples/junit.xml", tmp_path / "shard-1.xml")
+    (tmp_path / "shard-2.xml").write_text(_PASSING_SHARD.replace("TC-002", "TC-001"), encoding="utf-8")
+
+    parsed: list[str] = []
+    real_loader = watch_mod.load_junit_results
+
+    def _counting_loader(path: str) -> list[dict]:
+        parsed.append(os.path.basename(path))
+        return real_loader(path)
+
+    monkeypatch.setattr(watch_mod, "load_junit_results", _counting_loader)
+
+    watcher = ShardWatcher(tmp_path, test_cases)
+    assert [c.kind for c in watcher.poll()] == ["added", "added"]
+    assert watcher.metrics()["total_results"] == 5
+    assert watcher.metrics()["failed"] == 1
+
+    # No change -> nothing re-parsed.
+    parsed.clear()
+    assert watcher.poll() == []
+    assert parsed == []
+
+    # Replace shard-1 with a passing retry; shard-2 must not be re-parsed.
+    (tmp_path / "shard-1.xml").write_text(_PASSING_SHARD, encoding="utf-8")
+    changes = watcher.poll()
+    assert [(c.name, c.kind) for c in changes] == [("shard-1.xml", "replaced")]
+    assert parsed == ["shard-1.xml"]
+    assert watcher.metrics()["failed"] == 0
+    assert watcher.metrics()["unmapped_results"] == 0
+
+    # Partially written shard is reported and retried, keeping the previous partial.
+    (tmp_path / "shard-3.xml").write_text("<testsuite><testcase name=", encoding="utf-8")
+    assert [c.kind for c in watcher.poll()] == ["unreadable"]
+    assert watcher.shard_count == 2
+    assert watcher.poll() == []
+
+    (tmp_path / "shard-2.xml").unlink()
+    (tmp_path / "shard-3.xml").unlink()
+    assert [(c.name, c.kind) for c in watcher.poll()] == [("shard-2.xml", "removed")]
+    assert watcher.metrics()["total_results"] == 1